@@ -4,7 +4,7 @@ import warnings
 from typing import Any, cast
 
 import PIconnect.PIPoint as PIPoint_
-from PIconnect import AF, PIConsts
+from PIconnect import AF, PIConsts, _admission, _cancellation, _collective, _connections, _rpc
 from PIconnect._utils import InitialisationWarning
 from PIconnect.AFSDK import System
 
@@ -49,12 +49,25 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         password (str, optional): -//-
         todo: domain, auth
         timeout (int, optional): the maximum seconds an operation can take
+        hedge_percentile (float, optional): Defaults to None. If the server is a
+            collective, re-issue reads that have not completed within this
+            percentile of the recent read latencies to another member, see
+            :ref:`collectives`.
+        spread_reads (bool, optional): Defaults to False. If the server is a
+            collective, spread the points of bulk reads over its members.
 
     .. note::
         If the specified `server` is unknown a warning is thrown and the connection
         is redirected to the default server, as if no server was passed. The list
         of known servers is available in the `PIServer.servers` dictionary.
-    """
+
+    .. note::
+        Connections are shared between contexts with the same server and
+        credentials. Closing the last context keeps the connection open for
+        :data:`PIConfig.CONNECTION_IDLE_TIMEOUT <PIconnect.config.PIConfigContainer.CONNECTION_IDLE_TIMEOUT>`
+        seconds, so a next context does not have to connect and authenticate
+        again. A connection that was lost is reconnected when a context is opened.
+    """  # noqa: E501
 
     version = "0.2.2"
 
@@ -71,6 +84,8 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         domain: str | None = None,
         authentication_mode: PIConsts.AuthenticationMode = _DEFAULT_AUTH_MODE,
         timeout: int | None = None,
+        hedge_percentile: float | None = None,
+        spread_reads: bool = False,
     ) -> None:
         if server is None:
             if self.default_server is None:
@@ -107,38 +122,77 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
                 System.Net.NetworkCredential(cred[0], cred[1], *cred[2:]),
                 AF.PI.PIAuthenticationMode(int(authentication_mode)),
             )
+            fingerprint = _connections.credentials_fingerprint(
+                username, password, domain, int(authentication_mode)
+            )
         else:
             self._credentials = None
+            fingerprint = None
+        self._session_key = ("PI", self.connection.Name, fingerprint)
 
         if timeout:
             # System.TimeSpan(hours, minutes, seconds)
             self.connection.ConnectionInfo.OperationTimeOut = System.TimeSpan(0, 0, timeout)
+        if hedge_percentile is not None or spread_reads:
+            self.collective.hedge_percentile = hedge_percentile
+            self.collective.spread = spread_reads
 
     def __enter__(self):
         """Open connection context with the PI Server."""
-        if self._credentials:
-            self.connection.Connect(*self._credentials)
-        else:
-            # Don't force to retry connecting if previous attempt failed
-            force_connection = False
-            self.connection.Connect(force_connection)
+        _connections.pool.acquire(
+            self._session_key, self.connection, self._connect, self.connection.Disconnect
+        )
         return self
 
     def __exit__(self, *args: Any):
         """Close connection context with the PI Server."""
-        self.connection.Disconnect()
+        _connections.pool.release(self._session_key)
+
+    def _connect(self, force_connection: bool) -> None:
+        if self._credentials:
+            self.connection.Connect(*self._credentials)
+        else:
+            # Only force to retry connecting if a previous attempt failed when
+            # a live connection was lost
+            self.connection.Connect(force_connection)
 
     def __repr__(self) -> str:
         """Representation of the PIServer object."""
         return f"{self.__class__.__qualname__}(\\\\{self.server_name})"
 
+    @property
+    def collective(self) -> _collective.Collective:
+        """Direct connections to the members of the collective behind :attr:`connection`."""
+        return _collective.collective(self.connection)
+
     @property
     def server_name(self):
         """Name of the connected server."""
         return self.connection.Name
 
+    def rpc_metrics(self) -> _rpc.RpcMetrics:
+        """Return a context manager with the RPCs made to the server within a block.
+
+        Use the result as a context manager, or call a single function with
+        :meth:`RpcMetrics.measure <PIconnect._rpc.RpcMetrics.measure>`, to
+        count the RPCs and the time spent in them.
+
+        Example
+        -------
+        .. code-block:: python
+
+            with PI.PIServer() as server, server.rpc_metrics() as metrics:
+                server.search("SINUSOID*")
+            print(metrics.table())
+        """
+        return _rpc.RpcMetrics(self.connection)
+
     def search(
-        self, query: str | list[str], source: str | None = None
+        self,
+        query: str | list[str],
+        source: str | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
     ) -> list[PIPoint_.PIPoint]:
         """Search PIPoints on the PIServer.
 
@@ -146,6 +200,10 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
         ----------
             query (str or [str]): String or list of strings with queries
             source (str, optional): Defaults to None. Point source to limit the results
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which no further queries are sent to the server.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the search from another thread.
 
         Returns
         -------
@@ -155,14 +213,18 @@ class PIServer(object):  # pylint: disable=useless-object-inheritance
 
             Reject searches while not connected
         """
+        _cancel = _cancellation.token(timeout, cancel)
         if isinstance(query, list):
-            return [y for x in query for y in self.search(x, source)]
+            return [y for x in query for y in self.search(x, source, cancel=_cancel)]
+        if _cancel is not None:
+            _cancel.raise_if_cancelled()
         # elif not isinstance(query, str):
         #     raise TypeError('Argument query must be either a string or a list of strings,' +
         #                     'got type ' + str(type(query)))
-        return [
-            PIPoint_.PIPoint(pi_point)
-            for pi_point in AF.PI.PIPoint.FindPIPoints(
-                self.connection, str(query), source, None
-            )
-        ]
+        pi_points = _admission.call(
+            ("PI", self.connection.Name),
+            lambda: list(
+                AF.PI.PIPoint.FindPIPoints(self.connection, str(query), source, None)
+            ),
+        )
+        return [PIPoint_.PIPoint(pi_point) for pi_point in pi_points]
@@ -2,14 +2,29 @@
 
 import dataclasses
 import warnings
-from typing import Any, cast
-
-import pandas as pd
-
-from PIconnect import AF, PIAFAttribute, PIAFBase, PIConsts, _time
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from PIconnect import (
+    AF,
+    PIAFAttribute,
+    PIAFBase,
+    PIConsts,
+    _admission,
+    _cancellation,
+    _connections,
+    _results,
+    _rpc,
+    _time,
+)
 from PIconnect._utils import InitialisationWarning
 from PIconnect.AFSDK import System
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 _DEFAULT_EVENTFRAME_SEARCH_MODE = PIConsts.EventFrameSearchMode.STARTING_AFTER
 
 
@@ -120,16 +135,30 @@ class PIAFDatabase(object):
         return databases[database]
 
     def __enter__(self) -> "PIAFDatabase":
-        """Open the PI AF server connection context."""
-        self.server.Connect()
+        """Open the PI AF server connection context.
+
+        The connection is shared with other contexts on the same server, and is
+        only reconnected if it was lost.
+        """
+        _connections.pool.acquire(self._session_key, self.server, self._connect)
         return self
 
     def __exit__(self, *args: Any) -> None:
         """Close the PI AF server connection context."""
-        pass
-        # Disabled disconnecting because garbage collection sometimes impedes
-        # connecting to another server later
-        # self.server.Disconnect()
+        # Disconnecting is disabled because garbage collection sometimes impedes
+        # connecting to another server later, so the connection is only released
+        _connections.pool.release(self._session_key)
+
+    @property
+    def _session_key(self) -> tuple[str, str, None]:
+        return ("AF", self.server.Name, None)
+
+    def _connect(self, force_connection: bool) -> None:
+        self.server.Connect()
+
+    @property
+    def _server(self) -> tuple[str, str]:
+        return ("AF", self.server.Name)
 
     def __repr__(self) -> str:
         """Return a representation of the PI AF database connection."""
@@ -145,6 +174,24 @@ class PIAFDatabase(object):
         """Return the name of the connected PI AF database."""
         return self.database.Name
 
+    def rpc_metrics(self) -> _rpc.RpcMetrics:
+        """Return a context manager with the RPCs made to the PI AF server within a block.
+
+        Use the result as a context manager, or call a single function with
+        :meth:`RpcMetrics.measure <PIconnect._rpc.RpcMetrics.measure>`, to
+        tell whether a slow operation makes many RPCs or a few slow ones.
+
+        Example
+        -------
+        .. code-block:: python
+
+            with PI.PIAFDatabase() as database:
+                metrics = database.rpc_metrics()
+                attributes = metrics.measure(database.search, r"Plant1|Flow")
+            print(metrics.report())
+        """
+        return _rpc.RpcMetrics(self.server)
+
     @property
     def children(self) -> dict[str, "PIAFElement"]:
         """Return a dictionary of the direct child elements of the database."""
@@ -159,6 +206,38 @@ class PIAFDatabase(object):
         """Return a descendant of the database from an exact path."""
         return PIAFElement(self.database.Elements.get_Item(path))
 
+    def template_elements(
+        self, template: str, include_derived: bool = True, max_count: int = 1000
+    ) -> list["PIAFElement"]:
+        """Return the elements based on an element template, ordered by name.
+
+        Parameters
+        ----------
+            template (str): Name of the element template.
+            include_derived (bool, optional): Defaults to True. Also return the
+                elements based on templates derived from `template`.
+            max_count (int, optional): Defaults to 1000. Maximum number of
+                elements to return.
+
+        Raises
+        ------
+            KeyError: If the database has no element template named `template`.
+        """
+        element_template = self.database.ElementTemplates.get_Item(template)
+        if element_template is None:
+            raise KeyError(
+                f"Database {self.database_name} has no element template {template!r}"
+            )
+        elements = _admission.call(
+            self._server,
+            element_template.FindInstantiatedElements,
+            include_derived,
+            AF.AFSortField.Name,
+            AF.AFSortOrder.Ascending,
+            max_count,
+        )
+        return [PIAFElement(element) for element in elements]
+
     def search(self, query: str | list[str]) -> list[PIAFAttribute.PIAFAttribute]:
         """Search PIAFAttributes by element|attribute path strings.
 
@@ -190,26 +269,109 @@ class PIAFDatabase(object):
         max_count: int = 1000,
         search_mode: PIConsts.EventFrameSearchMode = _DEFAULT_EVENTFRAME_SEARCH_MODE,
         search_full_hierarchy: bool = False,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
     ) -> dict[str, "PIAFEventFrame"]:
-        """Search for event frames in the database."""
+        """Search for event frames in the database.
+
+        The search is not sent to the server if the `cancel` token was
+        cancelled, or if the `timeout` in seconds has already passed.
+        """
+        _cancel = _cancellation.token(timeout, cancel)
+        if _cancel is not None:
+            _cancel.raise_if_cancelled()
         _start_time = _time.to_af_time(start_time)
         _search_mode = AF.EventFrame.AFEventFrameSearchMode(int(search_mode))
-        return {
-            frame.Name: PIAFEventFrame(frame)
-            for frame in AF.EventFrame.AFEventFrame.FindEventFrames(
-                self.database,
-                None,
-                _start_time,
-                start_index,
-                max_count,
-                _search_mode,
-                None,
-                None,
-                None,
-                None,
-                search_full_hierarchy,
-            )
-        }
+        frames = _admission.call(
+            self._server,
+            AF.EventFrame.AFEventFrame.FindEventFrames,
+            self.database,
+            None,
+            _start_time,
+            start_index,
+            max_count,
+            _search_mode,
+            None,
+            None,
+            None,
+            None,
+            search_full_hierarchy,
+        )
+        return {frame.Name: PIAFEventFrame(frame) for frame in frames}
+
+    def event_frames_table(
+        self,
+        event_frames: "Iterable[PIAFEventFrame] | Mapping[str, PIAFEventFrame]",
+        attributes: Iterable[str] | None = None,
+    ) -> "pd.DataFrame":
+        """Return a table with one row per event frame and selected attribute values.
+
+        All event frames are fully loaded in a single call to the server. Attribute
+        values of event frames with captured values are read from the captured
+        values, the values of all other event frames are retrieved using a single
+        bulk call for the complete set of attributes.
+
+        Parameters
+        ----------
+            event_frames (iterable or dict of PIAFEventFrame): Event frames to
+                include in the table, for example the result of
+                :meth:`event_frames`.
+            attributes (iterable of str, optional): Names of the attributes to
+                include as columns. Defaults to the union of the attributes of
+                all event frames. Attributes that do not exist on an event frame
+                are returned as missing values.
+
+        Returns
+        -------
+            pandas.DataFrame: Table with the columns `name`, `start`, `end`, and
+                `duration`, followed by a column for each attribute. End times of
+                event frames that are still in progress are returned as `NaT`.
+        """
+        pd = _results.import_optional("pandas")
+        if isinstance(event_frames, Mapping):
+            event_frames = event_frames.values()
+        frames = System.Collections.Generic.List[AF.EventFrame.AFEventFrame]()
+        for event_frame in event_frames:
+            frames.Add(event_frame.event_frame)
+        _admission.call(self._server, AF.EventFrame.AFEventFrame.LoadEventFrames, frames)
+
+        if attributes is None:
+            names = list(dict.fromkeys(a.Name for frame in frames for a in frame.Attributes))
+        else:
+            names = list(attributes)
+
+        start = _time.timestamps_to_index(frame.StartTime.UtcTime for frame in frames)
+        end = _time.timestamps_to_index(frame.EndTime.UtcTime for frame in frames)
+        table = pd.DataFrame(
+            {
+                "name": [frame.Name for frame in frames],
+                "start": start,
+                "end": end,
+                "duration": end - start,
+            }
+        )
+
+        values: dict[str, list[Any]] = {name: [None] * len(table) for name in names}
+        pending: list[tuple[str, int]] = []
+        attribute_list = AF.Asset.AFAttributeList()
+        for row, frame in enumerate(frames):
+            for name in names:
+                attribute = frame.Attributes.get_Item(name)
+                if attribute is None:
+                    continue
+                if frame.AreValuesCaptured:
+                    values[name][row] = attribute.GetValue().Value
+                else:
+                    attribute_list.Add(attribute)
+                    pending.append((name, row))
+        if pending:
+            pending_values = _admission.call(self._server, attribute_list.GetValue)
+            for (name, row), value in zip(pending, pending_values, strict=True):
+                values[name][row] = value.Value
+
+        for name in names:
+            table[name] = values[name]
+        return table
 
 
 class PIAFElement(PIAFBase.PIAFBaseElement[AF.Asset.AFElement]):
@@ -233,6 +395,56 @@ class PIAFElement(PIAFBase.PIAFBaseElement[AF.Asset.AFElement]):
         """Return a descendant of the current element from an exact path."""
         return self.__class__(self.element.Elements.get_Item(path))
 
+    def recorded_values(
+        self,
+        start_time: _time.TimeLike,
+        end_time: _time.TimeLike,
+        attributes: Iterable[str] | None = None,
+        boundary_type: str = "inside",
+        time_query: _time.TimeQuery | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
+        """Return the recorded values of the attributes of the element as a wide frame.
+
+        The attributes are read with a single bulk call and aligned on the union
+        of their timestamps, with a column per attribute. See
+        :func:`PIBulk.element_recorded_values <PIconnect.PIBulk.element_recorded_values>`
+        for the parameters, and to read the attributes of multiple elements.
+        """
+        from PIconnect import PIBulk
+
+        return PIBulk._wide_frame(
+            PIBulk._element_attributes([self], attributes),
+            PIBulk._recorded_reader(start_time, end_time, boundary_type, time_query),
+            result_format,
+            by_element=False,
+        )
+
+    def interpolated_values(
+        self,
+        start_time: _time.TimeLike,
+        end_time: _time.TimeLike,
+        interval: str,
+        attributes: Iterable[str] | None = None,
+        time_query: _time.TimeQuery | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
+        """Return interpolated values of the attributes of the element as a wide frame.
+
+        The attributes are read with a single bulk call, with a column per
+        attribute. See :func:`PIBulk.element_interpolated_values
+        <PIconnect.PIBulk.element_interpolated_values>` for the parameters,
+        and to read the attributes of multiple elements.
+        """
+        from PIconnect import PIBulk
+
+        return PIBulk._wide_frame(
+            PIBulk._element_attributes([self], attributes),
+            PIBulk._interpolated_reader(start_time, end_time, interval, time_query),
+            result_format,
+            by_element=False,
+        )
+
 
 class PIAFEventFrame(PIAFBase.PIAFBaseElement[AF.EventFrame.AFEventFrame]):
     """Container for PI AF Event Frames in the database."""
@@ -257,19 +469,81 @@ class PIAFEventFrame(PIAFBase.PIAFBaseElement[AF.EventFrame.AFEventFrame]):
         return {c.Name: self.__class__(c) for c in self.element.EventFrames}
 
 
+#: Numpy data types for the .NET column types of a PI AF table.
+_TABLE_DTYPES: dict[str, str] = {
+    "Boolean": "bool",
+    "Byte": "uint8",
+    "Double": "float64",
+    "Int16": "int16",
+    "Int32": "int32",
+    "Int64": "int64",
+    "Single": "float32",
+}
+#: Nullable pandas data types, used when a column contains empty cells.
+_NULLABLE_TABLE_DTYPES: dict[str, str] = {
+    "Boolean": "boolean",
+    "Byte": "UInt8",
+    "Double": "float64",
+    "Int16": "Int16",
+    "Int32": "Int32",
+    "Int64": "Int64",
+    "Single": "float32",
+}
+
+
+def _table_column(values: list[Any], data_type: str) -> Any:
+    """Convert the values of a single table column to a typed array."""
+    nulls = [isinstance(value, System.DBNull) for value in values]
+    if any(nulls):
+        values = [None if null else value for null, value in zip(nulls, values, strict=True)]
+    if data_type == "DateTime":
+        ticks = np.array(
+            [_time.NAT_TICKS if value is None else value.Ticks for value in values],
+            dtype=np.int64,
+        )
+        return _time.ticks_to_datetime64(ticks)
+    if data_type in _NULLABLE_TABLE_DTYPES and any(nulls):
+        pd = _results.import_optional("pandas")
+        return pd.array(values, dtype=_NULLABLE_TABLE_DTYPES[data_type])
+    if data_type in _TABLE_DTYPES:
+        return np.array(values, dtype=_TABLE_DTYPES[data_type])
+    return np.array(values, dtype=object)
+
+
 class PIAFTable:
-    """Container for PI AF Tables in the database."""
+    """Container for PI AF Tables in the database.
+
+    The schema and contents of the table are read from the SDK only once and
+    cached, use :meth:`refresh` to reload them after the table has changed.
+    """
 
     def __init__(self, table: AF.Asset.AFTable) -> None:
         self._table = table
+        self._schema: dict[str, str] | None = None
+        self._data: "pd.DataFrame | None" = None
+        self._indexes: "dict[str, pd.Index]" = {}
+        self._change_state: int | None = None
+
+    def _current_change_state(self) -> int:
+        return self._table.ModifyDate.UtcTime.Ticks
+
+    @property
+    def _columns(self) -> dict[str, str]:
+        """Return the cached mapping of column names to their .NET data type names."""
+        if self._schema is None:
+            self._change_state = self._current_change_state()
+            self._schema = {
+                col.ColumnName: col.DataType.Name for col in self._table.Table.Columns
+            }
+        return self._schema
 
     @property
     def columns(self) -> list[str]:
         """Return the names of the columns in the table."""
-        return [col.ColumnName for col in self._table.Table.Columns]
+        return list(self._columns)
 
     @property
-    def _rows(self) -> list[System.Data.DataRow]:
+    def _rows(self) -> System.Data.DataRowCollection:
         return self._table.Table.Rows
 
     @property
@@ -280,9 +554,86 @@ class PIAFTable:
     @property
     def shape(self) -> tuple[int, int]:
         """Return the shape of the table."""
-        return (len(self._rows), len(self.columns))
+        if self._data is not None:
+            return self._data.shape
+        return (self._rows.Count, len(self._columns))
 
     @property
-    def data(self) -> pd.DataFrame:
-        """Return the data in the table as a pandas DataFrame."""
-        return pd.DataFrame([{col: row[col] for col in self.columns} for row in self._rows])
+    def data(self) -> "pd.DataFrame":
+        """Return the data in the table as a pandas DataFrame.
+
+        The cells of each row are read in a single call, after which every column
+        is converted to an array typed after the .NET type of the column. The
+        table is cached until :meth:`refresh` detects a change, and every access
+        returns a copy of the cached table, so changes to the returned DataFrame
+        do not affect later reads or :meth:`lookup`.
+        """
+        return self._cached_data().copy()
+
+    def _cached_data(self) -> "pd.DataFrame":
+        if self._data is None:
+            pd = _results.import_optional("pandas")
+            columns = self._columns
+            rows = [row.ItemArray for row in self._rows]
+            cells = zip(*rows, strict=True) if rows else ([] for _ in columns)
+            self._data = pd.DataFrame(
+                {
+                    name: _table_column(list(values), data_type)
+                    for (name, data_type), values in zip(columns.items(), cells, strict=True)
+                },
+                columns=list(columns),
+            )
+        return self._data
+
+    def lookup(self, column: str, key: Any) -> "pd.Series | pd.DataFrame":
+        """Return the row(s) of the table for which `column` equals `key`.
+
+        The index on `column` is built on first use and cached, so repeated
+        lookups do not scan or copy the table.
+
+        Parameters
+        ----------
+            column (str): Name of the key column.
+            key: Value to look up in the key column.
+
+        Returns
+        -------
+            pandas.Series or pandas.DataFrame: The matching row as a Series if
+                the key is unique, otherwise a DataFrame of all matching rows.
+
+        Raises
+        ------
+            KeyError: If `column` is not a column of the table, or `key` is not
+                found in the column.
+        """
+        if column not in self._indexes:
+            if column not in self._columns:
+                raise KeyError(f"Column {column!r} not found in table {self.name!r}")
+            pd = _results.import_optional("pandas")
+            self._indexes[column] = pd.Index(self._cached_data()[column])
+        return self._cached_data().iloc[self._indexes[column].get_loc(key)].copy()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Drop the cached schema and data if the table was modified since they were read.
+
+        The database of the table is refreshed first, so that changes made by
+        other users since the table was read are detected as well.
+
+        Parameters
+        ----------
+            force (bool, optional): Defaults to False. Drop the cache regardless
+                of the change state of the table.
+
+        Returns
+        -------
+            bool: True if the cache was dropped and will be reloaded on next access.
+        """
+        self._table.Database.Refresh()
+        change_state = self._current_change_state()
+        if not force and change_state == self._change_state:
+            return False
+        self._change_state = change_state
+        self._schema = None
+        self._data = None
+        self._indexes = {}
+        return True
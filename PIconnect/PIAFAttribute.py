@@ -85,6 +85,22 @@ class PIAFAttribute(PIData.PISeriesContainer):
     def _current_value(self) -> Any:
         return self.attribute.GetValue().Value
 
+    def _server(self) -> tuple[str, str]:
+        return ("AF", self.attribute.PISystem.Name)
+
+    def _value_type(self) -> str | None:
+        value_type = self.attribute.Type
+        return None if value_type is None else value_type.Name
+
+    def _state_set(self) -> PIData.DigitalStateSet | None:
+        """Return the enumeration set of the attribute, cached by its ID."""
+        enumeration_set = self.attribute.TypeQualifier
+        if self._value_type() != "AFEnumerationValue" or enumeration_set is None:
+            return None
+        return PIData._cached_state_set(
+            ("AF", str(enumeration_set.ID)), lambda: enumeration_set
+        )
+
     def _filtered_summaries(
         self,
         time_range: AF.Time.AFTimeRange,
@@ -111,6 +127,11 @@ class PIAFAttribute(PIData.PISeriesContainer):
         """Return a single value for this PI Point."""
         return self.attribute.Data.InterpolatedValue(time, self.attribute.DefaultUOM)
 
+    def _plot_values(
+        self, time_range: AF.Time.AFTimeRange, intervals: int
+    ) -> AF.Asset.AFValues:
+        return self.attribute.Data.PlotValues(time_range, intervals, self.attribute.DefaultUOM)
+
     def _recorded_value(
         self, time: AF.Time.AFTime, retrieval_mode: AF.Data.AFRetrievalMode
     ) -> AF.Asset.AFValue:
@@ -124,8 +145,8 @@ class PIAFAttribute(PIData.PISeriesContainer):
         time_range: AF.Time.AFTimeRange,
         boundary_type: AF.Data.AFBoundaryType,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
-        include_filtered_values = False
         return self.attribute.Data.RecordedValues(
             time_range,
             boundary_type,
@@ -139,9 +160,9 @@ class PIAFAttribute(PIData.PISeriesContainer):
         time_range: AF.Time.AFTimeRange,
         interval: AF.Time.AFTimeSpan,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
         """Query the pi af attribute, internal implementation."""
-        include_filtered_values = False
         return self.attribute.Data.InterpolatedValues(
             time_range,
             interval,
@@ -184,3 +205,11 @@ class PIAFAttribute(PIData.PISeriesContainer):
             update_mode,
             buffer_mode,
         )
+
+    def _update_values(
+        self,
+        values: AF.Asset.AFValues,
+        update_mode: AF.Data.AFUpdateOption,
+        buffer_mode: AF.Data.AFBufferOption,
+    ) -> Any:
+        return self.attribute.Data.UpdateValues(values, update_mode, buffer_mode)
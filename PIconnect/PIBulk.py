@@ -0,0 +1,701 @@
+"""PIBulk - Bulk data retrieval for lists of PI Points and PI AF Attributes."""
+
+import collections
+import concurrent.futures
+import dataclasses
+import warnings
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Any, TypeVar
+
+import numpy as np
+
+from PIconnect import (
+    AF,
+    PIAF,
+    PIConsts,
+    PIData,
+    PIPoint,
+    _admission,
+    _collective,
+    _results,
+    _time,
+)
+from PIconnect.PIAFAttribute import PIAFAttribute
+
+__all__ = [
+    "element_interpolated_values",
+    "element_recorded_values",
+    "plot_values",
+    "snapshot",
+    "window_summaries",
+]
+
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_PAGE_SIZE = 1000
+
+_Result = TypeVar("_Result")
+
+Window = PIAF.PIAFEventFrame | tuple[_time.TimeLike, _time.TimeLike]
+
+
+def _owner_key(sdk_object: Any, owner: str) -> tuple[str, ...]:
+    """Return the key of the SDK point or attribute that owns a bulk result."""
+    if owner == "PIPoint":
+        return (str(sdk_object.Server.Name), str(sdk_object.Name))
+    return (str(sdk_object.GetPath()),)
+
+
+def _member_key(sdk_object: Any, owner: str) -> tuple[str, ...]:
+    """Return the key of a point of a read that is spread over a collective.
+
+    The results are owned by the copies of the points on the members, which
+    are matched by name, as all points of the list are on the same server.
+    """
+    return (str(sdk_object.Name),)
+
+
+def _owner(result: Any, owner: str) -> Any:
+    """Return the SDK point or attribute of a bulk result, if it is known.
+
+    Values and lists of values carry their point or attribute in the `owner`
+    property, a dictionary of summaries carries it in each of its values.
+    """
+    sdk_object = getattr(result, owner, None)
+    if sdk_object is None and not hasattr(result, "Timestamp"):
+        for item in result:
+            return getattr(item.Value, owner, None)
+    return sdk_object
+
+
+@dataclasses.dataclass
+class _Group:
+    """The bulk list of the points or attributes of a single server."""
+
+    bulk_list: Any
+    owner: str
+    pi_server: Any = None
+    positions: list[int] = dataclasses.field(default_factory=list)
+
+
+class _BulkList:
+    """Split a list of data containers into the bulk lists of the SDK.
+
+    The PI Points of each server are collected in a
+    :afsdk:`AF.PI.PIPointList <T_OSIsoft_AF_PI_PIPointList.htm>` and the PI AF
+    Attributes of each PI System in a
+    :afsdk:`AF.Asset.AFAttributeList <T_OSIsoft_AF_Asset_AFAttributeList.htm>`,
+    so each bulk request takes at most one call per server. The results of all
+    lists are merged back in the order of the original containers.
+
+    Attributes
+    ----------
+        errors (dict): The error of each container without a result in the last
+            bulk call, by position of the container.
+    """
+
+    def __init__(self, containers: Iterable[PIData.PISeriesContainer]) -> None:
+        self.containers = list(containers)
+        self.errors: dict[int, Any] = {}
+        self._groups: dict[Hashable, _Group] = {}
+        for position, container in enumerate(self.containers):
+            if isinstance(container, PIPoint.PIPoint):
+                sdk_object, owner = container.pi_point, "PIPoint"
+            elif isinstance(container, PIAFAttribute):
+                sdk_object, owner = container.attribute, "Attribute"
+            else:
+                raise TypeError(
+                    "Bulk calls only support PIPoint and PIAFAttribute objects, got "
+                    + type(container).__qualname__
+                )
+            group = self._groups.get(container._server())
+            if group is None:
+                bulk_list = (
+                    AF.PI.PIPointList() if owner == "PIPoint" else AF.Asset.AFAttributeList()
+                )
+                group = self._groups[container._server()] = _Group(
+                    bulk_list, owner, getattr(sdk_object, "Server", None)
+                )
+            group.bulk_list.Add(sdk_object)
+            group.positions.append(position)
+
+    @property
+    def names(self) -> list[str]:
+        """Return the names of the containers in the original order."""
+        return [container.name for container in self.containers]
+
+    def call(
+        self,
+        point_call: Callable[[Any], Iterable[_Result]],
+        attribute_call: Callable[[Any], Iterable[_Result]],
+    ) -> list[_Result | None]:
+        """Execute a bulk call on all lists and return the results in container order.
+
+        The SDK leaves the points and attributes for which the call failed out
+        of the results, so the results are matched to the containers by their
+        point or attribute. The result of a container without a result is None,
+        its error is kept in :attr:`errors` and a warning lists all of them.
+        Each bulk call is made through the admission controller of its server.
+        The points of a server that is configured to spread reads are spread
+        over the members of its collective.
+        """
+        results: list[Any] = [None] * len(self.containers)
+        errors: dict[int, Any] = {}
+        for server, group in self._groups.items():
+            if group.owner == "PIPoint":
+                bulk_call, collective = point_call, _collective.lookup(group.pi_server)
+            else:
+                bulk_call, collective = attribute_call, None
+            if collective is not None and collective.spread and collective.members:
+                bulk_results = collective.fan_out(bulk_call, list(group.bulk_list))
+                key = _member_key
+            else:
+                bulk_results = _admission.call(
+                    server, _collective._consume, bulk_call, group.bulk_list
+                )
+                key = _owner_key
+            self._assign(results, errors, group, bulk_results, key)
+        self.errors = errors
+        if errors:
+            warnings.warn(
+                f"No results for {len(errors)} of {len(self.containers)} points and "
+                "attributes: "
+                + "; ".join(
+                    f"{self.containers[position].name}: {error}"
+                    for position, error in sorted(errors.items())
+                ),
+                UserWarning,
+                stacklevel=3,
+            )
+        return results
+
+    @staticmethod
+    def _assign(
+        results: list[Any],
+        errors: dict[int, Any],
+        group: _Group,
+        bulk_results: _collective.BulkResults[Any],
+        key: Callable[[Any, str], tuple[str, ...]],
+    ) -> None:
+        """Place the results of a bulk list at the positions of their containers.
+
+        The positions of the containers without a result are added to `errors`.
+        """
+        if len(bulk_results) == len(group.positions):
+            for position, result in zip(group.positions, bulk_results, strict=True):
+                results[position] = result
+            return
+        slots: dict[tuple[str, ...], collections.deque[int]] = collections.defaultdict(
+            collections.deque
+        )
+        for position, sdk_object in zip(group.positions, group.bulk_list, strict=True):
+            slots[key(sdk_object, group.owner)].append(position)
+        for result in bulk_results:
+            sdk_object = _owner(result, group.owner)
+            queue = None if sdk_object is None else slots.get(key(sdk_object, group.owner))
+            if queue:
+                results[queue.popleft()] = result
+        reported: dict[tuple[str, ...], Any] = {}
+        for sdk_object, error in bulk_results.errors:
+            reported.setdefault(key(sdk_object, group.owner), error)
+        for slot, queue in slots.items():
+            for position in queue:
+                errors[position] = reported.get(slot, "no result was returned")
+
+
+def _paging_config(page_size: int = _DEFAULT_PAGE_SIZE) -> AF.PI.PIPagingConfiguration:
+    return AF.PI.PIPagingConfiguration(AF.PI.PIPageType.TagCount, page_size)
+
+
+def plot_values(
+    containers: Sequence[PIData.PISeriesContainer],
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    intervals: int,
+    include_status: bool = False,
+    time_query: _time.TimeQuery | None = None,
+    result_format: _results.ResultFormat | None = None,
+) -> Any:
+    """Return values suitable for plotting of a set of points and attributes.
+
+    The values of all PI Points are retrieved with a single bulk call, as are
+    the values of all PI AF Attributes. See
+    :meth:`PISeriesContainer.plot_values <PIconnect.PIData.PISeriesContainer.plot_values>`
+    for the values that are returned for each interval.
+
+    Parameters
+    ----------
+        containers (list of PIPoint or PIAFAttribute): Points and attributes
+            for which to retrieve the values.
+        start_time (str or datetime): Start of the plot. This is parsed, together
+            with `end_time`, using
+            :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+        end_time (str or datetime): End of the plot.
+        intervals (int): Number of intervals to divide the time range in,
+            typically the width in pixels of the plot.
+        include_status (bool, optional): Defaults to False. Add a `status`
+            column with the packed :class:`PIConsts.ValueStatus` flags of each
+            value.
+        time_query (TimeQuery, optional): Defaults to None. Parse the times with
+            this :class:`TimeQuery`.
+        result_format (str, optional): Defaults to None, which uses
+            `PIConfig.RESULT_FORMAT`. Format of the result, see
+            :ref:`result_formats`.
+
+    Returns
+    -------
+        pandas.DataFrame: Tidy dataframe with a row per value and the columns
+            `name`, `timestamp` and `value`, followed by `status` if requested.
+    """  # noqa: E501
+    if intervals < 1:
+        raise ValueError(f"Number of intervals must be positive, got {intervals}")
+    bulk_list = _BulkList(containers)
+    time_range = _time.to_af_time_range(start_time, end_time, time_query)
+    args = (time_range, int(intervals), _paging_config())
+    results = [
+        [] if result is None else list(result)
+        for result in bulk_list.call(
+            lambda points: points.PlotValues(*args),
+            lambda attributes: attributes.Data.PlotValues(*args),
+        )
+    ]
+    container_idx = [
+        position for position, result in enumerate(results) for _ in range(len(result))
+    ]
+    ticks, values, status = PIData._unpack_values(
+        [value for result in results for value in result], include_status
+    )
+    columns: dict[str, Any] = {
+        "name": np.asarray(bulk_list.names, dtype=object)[
+            np.asarray(container_idx, dtype=np.intp)
+        ],
+        "timestamp": _time.ticks_to_datetime64(ticks),
+        "value": PIData._infer_values(values),
+    }
+    if status is not None:
+        columns["status"] = status
+    return _results.convert(_results.Columns(columns, times=("timestamp",)), result_format)
+
+
+def snapshot(
+    containers: Sequence[PIData.PISeriesContainer],
+    time: _time.TimeLike | None = None,
+    time_query: _time.TimeQuery | None = None,
+    result_format: _results.ResultFormat | None = None,
+) -> Any:
+    """Return the current, or interpolated, value of a set of points and attributes.
+
+    The values of all PI Points are retrieved with a single bulk call, as are
+    the values of all PI AF Attributes, instead of one or more calls for each
+    container.
+
+    Parameters
+    ----------
+        containers (list of PIPoint or PIAFAttribute): Points and attributes
+            for which to retrieve the value.
+        time (str or datetime, optional): Defaults to None. If given, the values
+            are interpolated at this time instead of returning the snapshot
+            values. This is parsed using
+            :afsdk:`AF.Time.AFTime <M_OSIsoft_AF_Time_AFTime__ctor_7.htm>`.
+        time_query (TimeQuery, optional): Defaults to None. Parse `time` with
+            this :class:`TimeQuery`.
+        result_format (str, optional): Defaults to None, which uses
+            `PIConfig.RESULT_FORMAT`. Format of the result, see
+            :ref:`result_formats`.
+
+    Returns
+    -------
+        pandas.DataFrame: Dataframe with the container names as index and the
+            columns `value`, `timestamp` and `status`, where `status` contains
+            the packed :class:`PIConsts.ValueStatus` flags of each value.
+    """
+    bulk_list = _BulkList(containers)
+    if time is None:
+        values = bulk_list.call(
+            lambda points: points.CurrentValue(),
+            lambda attributes: attributes.GetValue(),
+        )
+    else:
+        _at = _time.to_af_time(time, time_query)
+        values = bulk_list.call(
+            lambda points: points.InterpolatedValue(_at),
+            lambda attributes: attributes.GetValue(_at),
+        )
+    found = np.fromiter(
+        (position for position, value in enumerate(values) if value is not None),
+        dtype=np.intp,
+    )
+    ticks, raw_values, status = PIData._unpack_values(
+        [values[position] for position in found], include_status=True
+    )
+    timestamps = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ns]")
+    timestamps[found] = _time.ticks_to_datetime64(ticks)
+    statuses = np.full(len(values), PIConsts.ValueStatus.BAD, dtype=np.uint8)
+    statuses[found] = status
+    column = PIData._infer_values(raw_values)
+    if len(found) < len(values):
+        column = _results.align(column, found, len(values))
+    columns = _results.Columns(
+        {
+            "name": np.array(bulk_list.names, dtype=object),
+            "value": column,
+            "timestamp": timestamps,
+            "status": statuses,
+        },
+        index="name",
+        times=("timestamp",),
+    )
+    return _results.convert(columns, result_format)
+
+
+def _window_time_range(
+    window: Window, time_query: _time.TimeQuery | None
+) -> tuple[str, AF.Time.AFTimeRange]:
+    """Return the label and time range of a summary window."""
+    if isinstance(window, PIAF.PIAFEventFrame):
+        frame = window.event_frame
+        return frame.Name, AF.Time.AFTimeRange(frame.StartTime, frame.EndTime)
+    start_time, end_time = window
+    return "", _time.to_af_time_range(start_time, end_time, time_query)
+
+
+def window_summaries(
+    containers: Sequence[PIData.PISeriesContainer],
+    windows: Iterable[Window],
+    summary_types: PIConsts.SummaryType,
+    calculation_basis: PIConsts.CalculationBasis = PIConsts.CalculationBasis.TIME_WEIGHTED,
+    time_type: PIConsts.TimestampCalculation = PIConsts.TimestampCalculation.AUTO,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    include_status: bool = False,
+    time_query: _time.TimeQuery | None = None,
+    result_format: _results.ResultFormat | None = None,
+) -> Any:
+    """Return summaries of a set of points and attributes for each of a set of windows.
+
+    Each window is evaluated with a single bulk call per list of points or
+    attributes, instead of a call per container per window. At most
+    `max_workers` windows are evaluated concurrently.
+
+    Parameters
+    ----------
+        containers (list of PIPoint or PIAFAttribute): Points and attributes
+            to summarise.
+        windows (iterable of PIAFEventFrame or (start, end) tuples): Time ranges
+            over which to summarise. Event frames are summarised over their own
+            start and end time, tuples are parsed using
+            :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+        summary_types (int or PIConsts.SummaryType): Type(s) of summaries
+            of the data within each window.
+        calculation_basis (int or PIConsts.CalculationBasis, optional):
+            Event weighting within a window. See :ref:`event_weighting`
+            and :any:`CalculationBasis` for more information. Defaults to
+            CalculationBasis.TIME_WEIGHTED.
+        time_type (int or PIConsts.TimestampCalculation, optional):
+            Timestamp to return for each of the requested summaries. See
+            :ref:`summary_timestamps` and :any:`TimestampCalculation` for
+            more information. Defaults to TimestampCalculation.AUTO.
+        max_workers (int, optional): Maximum number of windows that are
+            evaluated concurrently. Defaults to 4.
+        include_status (bool, optional): Defaults to False. Add a `status`
+            column with the packed :class:`PIConsts.ValueStatus` flags of each
+            summary value.
+        time_query (TimeQuery, optional): Defaults to None. Parse the
+            (start, end) windows with this :class:`TimeQuery`, so relative
+            windows share a single reference time.
+        result_format (str, optional): Defaults to None, which uses
+            `PIConfig.RESULT_FORMAT`. Format of the result, see
+            :ref:`result_formats`.
+
+    Returns
+    -------
+        pandas.DataFrame: Tidy dataframe with one row per window, container and
+            summary type, with the columns `window` (the event frame name or the
+            position of the window), `start`, `end`, `name`, `summary`,
+            `timestamp` and `value`, followed by `status` if requested.
+    """
+    bulk_list = _BulkList(containers)
+    labels: list[str] = []
+    time_ranges: list[AF.Time.AFTimeRange] = []
+    for position, window in enumerate(windows):
+        label, time_range = _window_time_range(window, time_query)
+        labels.append(label or str(position))
+        time_ranges.append(time_range)
+    _summary_types = AF.Data.AFSummaryTypes(int(summary_types))
+    _calculation_basis = AF.Data.AFCalculationBasis(int(calculation_basis))
+    _time_type = AF.Data.AFTimestampCalculation(int(time_type))
+
+    def summarise(time_range: AF.Time.AFTimeRange) -> list[Any]:
+        args = (time_range, _summary_types, _calculation_basis, _time_type, _paging_config())
+        return bulk_list.call(
+            lambda points: points.Summary(*args),
+            lambda attributes: attributes.Data.Summary(*args),
+        )
+
+    window_idx: list[int] = []
+    container_idx: list[int] = []
+    summaries: list[str] = []
+    summary_values: list[AF.Asset.AFValue] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for window, results in enumerate(executor.map(summarise, time_ranges)):
+            for container, result in enumerate(results):
+                for summary in () if result is None else result:
+                    window_idx.append(window)
+                    container_idx.append(container)
+                    summaries.append(PIConsts.SummaryType(int(summary.Key)).name)
+                    summary_values.append(summary.Value)
+    ticks, values, status = PIData._unpack_values(summary_values, include_status)
+
+    starts = _time.ticks_to_datetime64(
+        np.fromiter((r.StartTime.UtcTime.Ticks for r in time_ranges), dtype=np.int64)
+    )
+    ends = _time.ticks_to_datetime64(
+        np.fromiter((r.EndTime.UtcTime.Ticks for r in time_ranges), dtype=np.int64)
+    )
+    windows_ = np.asarray(window_idx, dtype=np.intp)
+    columns: dict[str, Any] = {
+        "window": np.asarray(labels, dtype=object)[windows_],
+        "start": starts[windows_],
+        "end": ends[windows_],
+        "name": np.asarray(bulk_list.names, dtype=object)[
+            np.asarray(container_idx, dtype=np.intp)
+        ],
+        "summary": np.asarray(summaries, dtype=object),
+        "timestamp": _time.ticks_to_datetime64(ticks),
+        "value": PIData._infer_values(values),
+    }
+    if status is not None:
+        columns["status"] = status
+    return _results.convert(
+        _results.Columns(columns, times=("start", "end", "timestamp")), result_format
+    )
+
+
+def _element_attributes(
+    elements: Sequence[PIAF.PIAFElement], attributes: Iterable[str] | None
+) -> list[tuple[str, str, PIAFAttribute]]:
+    """Select the time series attributes of each element.
+
+    Attributes without a data reference hold a static value, they are skipped
+    based on their definition, without reading any data. Selected attribute
+    names that an element does not have are skipped as well.
+
+    Returns
+    -------
+        list of (str, str, PIAFAttribute): The element name, attribute name and
+            attribute of each selected attribute.
+
+    Raises
+    ------
+        ValueError: If two elements have the same name.
+    """
+    names = None if attributes is None else list(attributes)
+    selected: list[tuple[str, str, PIAFAttribute]] = []
+    seen: set[str] = set()
+    for element in elements:
+        if element.name in seen:
+            raise ValueError(
+                f"Element name {element.name!r} is not unique, the columns are "
+                "labelled by element name"
+            )
+        seen.add(element.name)
+        sdk_attributes = element.element.Attributes
+        if names is None:
+            candidates = list(sdk_attributes)
+        else:
+            candidates = [sdk_attributes.get_Item(name) for name in names]
+        for attribute in candidates:
+            if attribute is None or attribute.DataReferencePlugIn is None:
+                continue
+            selected.append(
+                (element.name, attribute.Name, PIAFAttribute(element.element, attribute))
+            )
+    return selected
+
+
+def _wide_frame(
+    selected: list[tuple[str, str, PIAFAttribute]],
+    read: Callable[[_BulkList], list[Any]],
+    result_format: _results.ResultFormat | None,
+    by_element: bool,
+) -> Any:
+    """Read the selected attributes in bulk and align them on their timestamps.
+
+    The index is the sorted union of the timestamps of all attributes, each
+    attribute is missing at the timestamps at which it has no value. With the
+    pandas format and `by_element` the columns are a
+    :class:`pandas.MultiIndex` of the element and attribute names, otherwise
+    the columns are labelled `element|attribute`, or by the attribute name
+    only if `by_element` is False.
+    """
+    attributes = [attribute for _, _, attribute in selected]
+    results = read(_BulkList(attributes)) if attributes else []
+    unaligned = [
+        attribute._to_columns([] if result is None else list(result))
+        for attribute, result in zip(attributes, results, strict=True)
+    ]
+    index = np.unique(
+        np.concatenate(
+            [columns["timestamp"] for columns in unaligned]
+            or [np.empty(0, dtype="datetime64[ns]")]
+        )
+    )
+    labels = [
+        f"{element}|{attribute}" if by_element else attribute
+        for element, attribute, _ in selected
+    ]
+    data: dict[str, Any] = {"timestamp": index}
+    for label, columns in zip(labels, unaligned, strict=True):
+        positions = np.searchsorted(index, columns["timestamp"])
+        data[label] = _results.align(columns["value"], positions, len(index))
+    result = _results.convert(
+        _results.Columns(data, index="timestamp", times=("timestamp",)), result_format
+    )
+    if by_element and _results.resolve(result_format) == "pandas":
+        pd = _results.import_optional("pandas")
+        result.columns = pd.MultiIndex.from_tuples(
+            [(element, attribute) for element, attribute, _ in selected],
+            names=["element", "attribute"],
+        )
+    return result
+
+
+def _recorded_reader(
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    boundary_type: str,
+    time_query: _time.TimeQuery | None,
+) -> Callable[[_BulkList], list[Any]]:
+    """Return a bulk read of the recorded values within a time range."""
+    time_range = _time.to_af_time_range(start_time, end_time, time_query)
+    args = (
+        time_range,
+        PIData._parse_boundary_type(boundary_type),
+        "",
+        False,
+        _paging_config(),
+    )
+    return lambda bulk_list: bulk_list.call(
+        lambda points: points.RecordedValues(*args),
+        lambda attributes: attributes.Data.RecordedValues(*args),
+    )
+
+
+def _interpolated_reader(
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    interval: str,
+    time_query: _time.TimeQuery | None,
+) -> Callable[[_BulkList], list[Any]]:
+    """Return a bulk read of the interpolated values within a time range."""
+    time_range = _time.to_af_time_range(start_time, end_time, time_query)
+    args = (time_range, _time.to_af_time_span(interval), "", False, _paging_config())
+    return lambda bulk_list: bulk_list.call(
+        lambda points: points.InterpolatedValues(*args),
+        lambda attributes: attributes.Data.InterpolatedValues(*args),
+    )
+
+
+def element_recorded_values(
+    elements: Sequence[PIAF.PIAFElement],
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    attributes: Iterable[str] | None = None,
+    boundary_type: str = "inside",
+    time_query: _time.TimeQuery | None = None,
+    result_format: _results.ResultFormat | None = None,
+) -> Any:
+    """Return the recorded values of the attributes of a set of elements as a wide frame.
+
+    All attributes of all elements are read with a single bulk call. The
+    values are aligned on the union of their timestamps, so each attribute
+    is missing at the timestamps of the values of the other attributes.
+    Attributes without a data reference are skipped, as they have no time
+    series. If an attribute has multiple values at the same timestamp only
+    the last is kept.
+
+    Parameters
+    ----------
+        elements (list of PIAFElement): Elements to read, for example the result
+            of :meth:`PIAFDatabase.template_elements
+            <PIconnect.PIAF.PIAFDatabase.template_elements>`. The element names
+            must be unique.
+        start_time (str or datetime): Containing the date, and possibly time,
+            from which to retrieve the values. This is parsed, together
+            with `end_time`, using
+            :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+        end_time (str or datetime): Containing the date, and possibly time,
+            until which to retrieve values.
+        attributes (list of str, optional): Defaults to None. Names of the
+            attributes to read, all attributes of each element if None.
+        boundary_type (str, optional): Defaults to `'inside'`. Key from the
+            `__boundary_types` dictionary of :class:`PIData.PISeriesContainer`
+            to describe how to handle the boundaries of the time range.
+        time_query (TimeQuery, optional): Defaults to None. Parse the times with
+            this :class:`TimeQuery`.
+        result_format (str, optional): Defaults to None, which uses
+            `PIConfig.RESULT_FORMAT`. Format of the result, see
+            :ref:`result_formats`.
+
+    Returns
+    -------
+        pandas.DataFrame: Dataframe with the timestamps as index and a column
+            for each attribute of each element, labelled by a
+            :class:`pandas.MultiIndex` of the `element` and `attribute` names.
+    """  # noqa: E501
+    return _wide_frame(
+        _element_attributes(elements, attributes),
+        _recorded_reader(start_time, end_time, boundary_type, time_query),
+        result_format,
+        by_element=True,
+    )
+
+
+def element_interpolated_values(
+    elements: Sequence[PIAF.PIAFElement],
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    interval: str,
+    attributes: Iterable[str] | None = None,
+    time_query: _time.TimeQuery | None = None,
+    result_format: _results.ResultFormat | None = None,
+) -> Any:
+    """Return interpolated values of the attributes of a set of elements as a wide frame.
+
+    All attributes of all elements are read with a single bulk call, and
+    share the timestamps of the interval. Attributes without a data reference
+    are skipped, as they have no time series.
+
+    Parameters
+    ----------
+        elements (list of PIAFElement): Elements to read, for example the result
+            of :meth:`PIAFDatabase.template_elements
+            <PIconnect.PIAF.PIAFDatabase.template_elements>`. The element names
+            must be unique.
+        start_time (str or datetime): Containing the date, and possibly time,
+            from which to retrieve the values. This is parsed, together
+            with `end_time`, using
+            :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+        end_time (str or datetime): Containing the date, and possibly time,
+            until which to retrieve values.
+        interval (str): String containing the interval at which to extract
+            data. This is parsed using
+            :afsdk:`AF.Time.AFTimeSpan.Parse <M_OSIsoft_AF_Time_AFTimeSpan_Parse_1.htm>`.
+        attributes (list of str, optional): Defaults to None. Names of the
+            attributes to read, all attributes of each element if None.
+        time_query (TimeQuery, optional): Defaults to None. Parse the times with
+            this :class:`TimeQuery`.
+        result_format (str, optional): Defaults to None, which uses
+            `PIConfig.RESULT_FORMAT`. Format of the result, see
+            :ref:`result_formats`.
+
+    Returns
+    -------
+        pandas.DataFrame: Dataframe with the timestamps as index and a column
+            for each attribute of each element, labelled by a
+            :class:`pandas.MultiIndex` of the `element` and `attribute` names.
+    """  # noqa: E501
+    return _wide_frame(
+        _element_attributes(elements, attributes),
+        _interpolated_reader(start_time, end_time, interval, time_query),
+        result_format,
+        by_element=True,
+    )
@@ -177,6 +177,30 @@ class SummaryType(enum.IntFlag):
     ALL_FOR_NON_NUMERIC = 8320
 
 
+class ValueStatus(enum.IntFlag):
+    """ValueStatus packs the quality flags of a value into a single integer.
+
+    The flags are derived from the properties of
+    :afsdk:`AF.Asset.AFValue <T_OSIsoft_AF_Asset_AFValue.htm>`, and can be or'ed
+    together like :class:`SummaryType`.
+
+    >>> status = ValueStatus.QUESTIONABLE | ValueStatus.ANNOTATED
+    >>> bool(status & ValueStatus.QUESTIONABLE)
+    True
+    """
+
+    #: The value is good and carries no additional flags
+    GOOD = 0
+    #: The value is not good, this includes system states and filtered values
+    BAD = 1
+    #: The value is questionable
+    QUESTIONABLE = 2
+    #: The value was substituted
+    SUBSTITUTED = 4
+    #: The value is annotated
+    ANNOTATED = 8
+
+
 class TimestampCalculation(enum.IntEnum):
     """
     TimestampCalculation defines the timestamp returned for a given summary calculation.
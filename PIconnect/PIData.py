@@ -1,32 +1,62 @@
 """Auxipublish-to-pypiliary classes for PI Point and PIAFAttribute objects."""
 
 import abc
+import concurrent.futures
+import dataclasses
 import datetime
-from typing import Any
+import threading
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
 
-import pandas as pd
+import numpy as np
 
 import PIconnect._typing.AF as _AFtyping
-from PIconnect import AF, PIConsts, _time
+from PIconnect import (
+    AF,
+    PIConfig,
+    PIConsts,
+    _admission,
+    _cancellation,
+    _profile,
+    _results,
+    _time,
+)
+
+try:
+    from pandas import Series as _Series
+except ImportError:  # pandas is optional, PISeries is only created by the pandas format
+    _Series = object
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 __all__ = [
+    "DigitalStateSet",
     "PISeries",
     "PISeriesContainer",
 ]
 
+_Result = TypeVar("_Result")
+
+#: Seconds between checks for cancellation while waiting for concurrent chunks.
+_POLL_SECONDS = 0.1
+
 _DEFAULT_CALCULATION_BASIS = PIConsts.CalculationBasis.TIME_WEIGHTED
 _DEFAULT_FILTER_EVALUATION = PIConsts.ExpressionSampleType.EXPRESSION_RECORDED_VALUES
 
 
-class PISeries(pd.Series):  # type: ignore
+class PISeries(_Series):  # type: ignore
     """Create a timeseries, derived from :class:`pandas.Series`.
 
+    The `tag` and `uom` of the series are stored in :attr:`pandas.Series.attrs`,
+    so they are kept by pandas operations that propagate the metadata.
+
     Parameters
     ----------
         tag (str): Name of the new series
-        timestamp (list[datetime]): List of datetime objects to
+        timestamp (list[datetime] or pandas.DatetimeIndex): Timestamps to
             create the new index
-        value (list): List of values for the timeseries, should be equally long
+        value (list or array): Values for the timeseries, should be equally long
             as the `timestamp` argument
         uom (str, optional): Defaults to None. Unit of measurement for the
             series
@@ -37,20 +67,337 @@ class PISeries(pd.Series):  # type: ignore
         composition where the Series is just an attribute
     """
 
-    version = "0.1.0"
+    version = "0.2.0"
 
     def __init__(
         self,
         tag: str,
-        timestamp: list[datetime.datetime],
-        value: list[Any],
+        timestamp: "list[datetime.datetime] | pd.DatetimeIndex",
+        value: Any,
         uom: str | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
-        pd.Series.__init__(self, *args, data=value, index=timestamp, name=tag, **kwargs)  # type: ignore
-        self.tag = tag
-        self.uom = uom
+        _Series.__init__(self, *args, data=value, index=timestamp, name=tag, **kwargs)  # type: ignore
+        self.attrs.update(tag=tag, uom=uom)
+
+    @property
+    def tag(self) -> str:
+        """Return the name of the point or attribute the series belongs to."""
+        return self.attrs.get("tag", self.name)
+
+    @tag.setter
+    def tag(self, tag: str) -> None:
+        self.attrs["tag"] = tag
+
+    @property
+    def uom(self) -> str | None:
+        """Return the unit of measurement of the series."""
+        return self.attrs.get("uom")
+
+    @uom.setter
+    def uom(self, uom: str | None) -> None:
+        self.attrs["uom"] = uom
+
+
+#: Data types of the values in a series, keyed by the PI point type or the name
+#: of the .NET type of a PI AF attribute.
+_VALUE_DTYPES: dict[str, str] = {
+    # PI point types
+    "Float16": "float64",
+    "Float32": "float64",
+    "Float64": "float64",
+    "Int16": "int32",
+    "Int32": "int32",
+    "Digital": "category",
+    "Timestamp": "datetime64[ns]",
+    # .NET types of PI AF attributes
+    "Boolean": "bool",
+    "Byte": "int32",
+    "Double": "float64",
+    "Int64": "int64",
+    "Single": "float64",
+    "AFEnumerationValue": "category",
+    "DateTime": "datetime64[ns]",
+}
+#: Types that are returned with missing values for values of another type.
+_NULLABLE_DTYPES = frozenset({"float64", "int32", "int64", "bool"})
+
+
+@dataclasses.dataclass(frozen=True)
+class DigitalStateSet:
+    """Digital state set, or AF enumeration set, used to decode digital values.
+
+    Parameters
+    ----------
+        name (str): Name of the state set.
+        codes (numpy.ndarray): Integer codes of the states.
+        names (list[str]): Names of the states, in the same order as `codes`.
+        enumeration_set (AF.Asset.AFEnumerationSet): The underlying SDK object,
+            used to create states for writing values.
+    """
+
+    name: str
+    codes: "np.ndarray[Any, np.dtype[np.int64]]"
+    names: list[str]
+    enumeration_set: AF.Asset.AFEnumerationSet = dataclasses.field(repr=False)
+
+    @classmethod
+    def from_enumeration_set(
+        cls, enumeration_set: AF.Asset.AFEnumerationSet
+    ) -> "DigitalStateSet":
+        """Read all states of an enumeration set from the SDK."""
+        states = [(state.Value, state.Name) for state in enumeration_set]
+        return cls(
+            name=enumeration_set.Name,
+            codes=np.array([code for code, _ in states], dtype=np.int64),
+            names=[name for _, name in states],
+            enumeration_set=enumeration_set,
+        )
+
+    def decode(self, values: Sequence[AF.Asset.AFEnumerationValue]) -> "pd.Categorical":
+        """Decode digital values to a categorical with the state names as categories.
+
+        Only the integer code of each value is read from the SDK, the mapping to
+        the state names is done once per unique code. Codes that are not part of
+        the state set, such as system states, are added as extra categories.
+        """
+        pd = _results.import_optional("pandas")
+        categorical = self.decode_codes(values)
+        return pd.Categorical.from_codes(categorical.codes, categories=categorical.categories)
+
+    def decode_codes(
+        self, values: Sequence[AF.Asset.AFEnumerationValue]
+    ) -> _results.Categorical:
+        """Decode digital values to category codes, without requiring pandas."""
+        codes = np.fromiter(
+            (value.Value for value in values), dtype=np.int64, count=len(values)
+        )
+        unique, first, inverse = np.unique(codes, return_index=True, return_inverse=True)
+        positions = dict(zip(self.codes.tolist(), range(len(self.names)), strict=True))
+        categories = list(self.names)
+        category_codes = np.empty(len(unique), dtype=np.int64)
+        for i, (code, index) in enumerate(zip(unique.tolist(), first.tolist(), strict=True)):
+            if code not in positions:
+                positions[code] = len(categories)
+                categories.append(str(values[index].Name))
+            category_codes[i] = positions[code]
+        return _results.Categorical(category_codes[inverse], categories)
+
+    def to_state(self, value: int | str) -> AF.Asset.AFEnumerationValue:
+        """Return the SDK state for a state code or name."""
+        if isinstance(value, str):
+            return self.enumeration_set.get_Item(value)
+        return self.enumeration_set.GetByValue(int(value))
+
+
+def _value_status(value: AF.Asset.AFValue) -> int:
+    """Pack the quality flags of a value into a :class:`PIConsts.ValueStatus` integer."""
+    return (
+        (not value.IsGood)
+        | (value.Questionable << 1)
+        | (value.Substituted << 2)
+        | (value.Annotated << 3)
+    )
+
+
+@_profile.timed("conversion", values=lambda unpacked: len(unpacked[0]))
+def _unpack_values(
+    pivalues: Iterable[AF.Asset.AFValue], include_status: bool = False
+) -> tuple["np.ndarray[Any, np.dtype[np.int64]]", list[Any], "np.ndarray[Any, Any] | None"]:
+    """Read the timestamps, values and optionally the status of SDK values in one pass.
+
+    Returns
+    -------
+        tuple: The UTC ticks of the timestamps, the raw values, and the packed
+            :class:`PIConsts.ValueStatus` flags as a uint8 array, or None if
+            `include_status` is False.
+    """
+    ticks: list[int] = []
+    values: list[Any] = []
+    if not include_status:
+        for value in pivalues:
+            ticks.append(value.Timestamp.UtcTime.Ticks)
+            values.append(value.Value)
+        return np.array(ticks, dtype=np.int64), values, None
+    status: list[int] = []
+    for value in pivalues:
+        ticks.append(value.Timestamp.UtcTime.Ticks)
+        values.append(value.Value)
+        status.append(_value_status(value))
+    return np.array(ticks, dtype=np.int64), values, np.array(status, dtype=np.uint8)
+
+
+def _summaries_columns(
+    summaries: Iterable[tuple[Any, Iterable[AF.Asset.AFValue]]],
+) -> _results.Columns:
+    """Combine the values of each summary type into columns with a column per type.
+
+    The columns are aligned on the sorted union of their timestamps, summary
+    types without a value at a timestamp are missing there.
+    """
+    unpacked = [
+        (PIConsts.SummaryType(int(key)).name, *_unpack_values(pivalues)[:2])
+        for key, pivalues in summaries
+    ]
+    ticks = np.unique(np.concatenate([t for _, t, _ in unpacked] or [np.empty(0, np.int64)]))
+    columns: dict[str, Any] = {"timestamp": _time.ticks_to_datetime64(ticks)}
+    for name, summary_ticks, summary_values in unpacked:
+        values = _infer_values(summary_values)
+        if len(summary_ticks) != len(ticks) or (summary_ticks != ticks).any():
+            aligned = np.ma.masked_all(len(ticks), dtype=values.dtype)
+            aligned[np.searchsorted(ticks, summary_ticks)] = values
+            values = aligned
+        columns[name] = values
+    return _results.Columns(columns, index="timestamp", times=("timestamp",))
+
+
+@_profile.timed("conversion")
+def _infer_values(values: list[Any]) -> "np.ndarray[Any, Any]":
+    """Convert values of unknown type to a numeric array, or an object array."""
+    array = np.array(values)
+    if array.dtype.kind in "biuf":
+        return array
+    return np.array(values, dtype=object)
+
+
+def _merge_summaries(results: Iterable[Any]) -> list[tuple[int, list[AF.Asset.AFValue]]]:
+    """Merge the summaries of consecutive chunks per summary type.
+
+    The chunks are aligned to whole intervals, so no interval is evaluated
+    twice. Values at the start of a chunk that are not later than the last
+    value of the previous chunk are dropped nonetheless, so an interval on the
+    edge of two chunks is never counted twice.
+    """
+    merged: dict[int, list[AF.Asset.AFValue]] = {}
+    for result in results:
+        for summary in result:
+            values = merged.setdefault(int(summary.Key), [])
+            if not values:
+                values.extend(summary.Value)
+                continue
+            last = values[-1].Timestamp.UtcTime.Ticks
+            values.extend(
+                value for value in summary.Value if value.Timestamp.UtcTime.Ticks > last
+            )
+    return list(merged.items())
+
+
+def _clip_chunk(
+    pivalues: Iterable[AF.Asset.AFValue],
+    time_range: AF.Time.AFTimeRange,
+    first: bool,
+    last: bool,
+) -> list[AF.Asset.AFValue]:
+    """Keep the values of a chunk that fall within its part of the time range.
+
+    Each chunk keeps the values from its start time up to, but excluding, its
+    end time, so values on the edge between two chunks are not duplicated. The
+    first and last chunk keep the values beyond the outer edges of the query,
+    as returned for the requested boundary type.
+    """
+    if first and last:
+        return list(pivalues)
+    start = time_range.StartTime.UtcTime.Ticks
+    end = time_range.EndTime.UtcTime.Ticks
+    return [
+        value
+        for value in pivalues
+        if (first or value.Timestamp.UtcTime.Ticks >= start)
+        and (last or value.Timestamp.UtcTime.Ticks < end)
+    ]
+
+
+_state_sets: dict[tuple[str, ...], DigitalStateSet] = {}
+_state_sets_lock = threading.Lock()
+
+
+def _cached_state_set(
+    key: tuple[str, ...], load: Callable[[], AF.Asset.AFEnumerationSet]
+) -> DigitalStateSet:
+    """Return the state set for `key`, loading it from the SDK only the first time."""
+    with _state_sets_lock:
+        if key not in _state_sets:
+            _state_sets[key] = DigitalStateSet.from_enumeration_set(load())
+        return _state_sets[key]
+
+
+def _is_typed(value: Any, dtype: str) -> bool:
+    """Return whether `value` is a value of the nullable `dtype`, numpy would coerce others."""
+    if dtype == "bool":
+        return isinstance(value, bool)
+    if dtype == "float64":
+        return isinstance(value, int | float)
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@_profile.timed("conversion")
+def _typed_values(
+    values: list[Any], value_type: str | None, state_set: DigitalStateSet | None = None
+) -> Any:
+    """Convert a list of values returned by the SDK to a typed array.
+
+    Values that do not match the type of the point or attribute, such as the
+    digital system states that replace values of numeric points when the
+    data is bad, are returned as missing values. Digital values are decoded
+    using `state_set` when available. If the type is not known the values are
+    returned as an object array.
+    """
+    dtype = _VALUE_DTYPES.get(value_type or "")
+    if dtype in _NULLABLE_DTYPES:
+        typed = [_is_typed(value, dtype) for value in values]
+        if all(typed):
+            try:
+                return np.fromiter(values, dtype=dtype, count=len(values))
+            except OverflowError:
+                pass
+        data = np.zeros(len(values), dtype=dtype)
+        mask = np.ones(len(values), dtype=bool)
+        for position, value in enumerate(values):
+            if not typed[position]:
+                continue
+            try:
+                data[position] = value
+            except OverflowError:
+                continue
+            mask[position] = False
+        if dtype == "float64":
+            data[mask] = np.nan
+            return data
+        return np.ma.MaskedArray(data, mask=mask)
+    if dtype == "category":
+        if state_set is not None:
+            try:
+                return state_set.decode_codes(values)
+            except (AttributeError, TypeError):
+                pass
+        return _results.Categorical.from_values([str(value) for value in values])
+    if dtype == "datetime64[ns]":
+        try:
+            return _time.ticks_to_datetime64(
+                np.fromiter((value.Ticks for value in values), dtype=np.int64)
+            )
+        except AttributeError:
+            pass
+    return np.array(values, dtype=object)
+
+
+_BOUNDARY_TYPES = {
+    "inside": AF.Data.AFBoundaryType.Inside,
+    "outside": AF.Data.AFBoundaryType.Outside,
+    "interpolate": AF.Data.AFBoundaryType.Interpolated,
+}
+
+
+def _parse_boundary_type(boundary_type: str) -> AF.Data.AFBoundaryType:
+    """Return the SDK boundary type for one of the names in `_BOUNDARY_TYPES`."""
+    _boundary_type = _BOUNDARY_TYPES.get(boundary_type.lower())
+    if _boundary_type is None:
+        raise ValueError(
+            "Argument boundary_type must be one of "
+            + ", ".join('"%s"' % x for x in sorted(_BOUNDARY_TYPES.keys()))
+        )
+    return _boundary_type
 
 
 class PISeriesContainer(abc.ABC):
@@ -63,21 +410,199 @@ class PISeriesContainer(abc.ABC):
 
     version = "0.1.0"
 
-    __boundary_types = {
-        "inside": AF.Data.AFBoundaryType.Inside,
-        "outside": AF.Data.AFBoundaryType.Outside,
-        "interpolate": AF.Data.AFBoundaryType.Interpolated,
-    }
+    __boundary_types = _BOUNDARY_TYPES
 
     @property
     def current_value(self) -> Any:
         """Return the current value of the attribute."""
-        return self._current_value()
+        return self._call(self._current_value)
 
     @abc.abstractmethod
     def _current_value(self) -> Any:
         pass
 
+    def _server(self) -> Hashable:
+        """Return the key of the server handling the calls, for admission control."""
+        return None
+
+    def _call(self, method: Callable[..., _Result], *args: Any, retry: bool = True) -> _Result:
+        """Call the SDK through the admission controller of the server."""
+        return _admission.call(self._server(), method, *args, retry=retry)
+
+    def _fetch(
+        self,
+        fetch: Callable[[AF.Time.AFTimeRange, bool, bool], _Result],
+        time_range: AF.Time.AFTimeRange,
+        cancel: _cancellation.CancellationToken | None,
+        chunk_size: str | datetime.timedelta | None = None,
+        interval: str | None = None,
+        max_workers: int = 1,
+    ) -> tuple[list[_Result], bool | None]:
+        """Fetch a time range, optionally in chunks, until the query is cancelled.
+
+        `fetch` is called with the time range of each chunk, and whether it is
+        the first and the last chunk. The SDK calls cannot be interrupted, so a
+        query with a deadline or token but without a `chunk_size` is split in
+        chunks of :data:`PIConfig.CANCEL_CHUNK_SIZE
+        <PIconnect.config.PIConfigContainer.CANCEL_CHUNK_SIZE>`, unless its
+        interval has no fixed length. A query that is fetched in a single call,
+        and is already cancelled, raises
+        :class:`QueryCancelledError <PIconnect._cancellation.QueryCancelledError>`.
+        With `max_workers` above 1 at most that many chunks are fetched
+        concurrently, see :meth:`_fetch_concurrently`.
+
+        Returns
+        -------
+            tuple: The results of the fetched chunks, and whether the query
+                was stopped before all chunks were fetched, or None if the
+                time range was fetched in a single call.
+        """
+        if chunk_size is None and cancel is not None and PIConfig.CANCEL_CHUNK_SIZE:
+            cancel.raise_if_cancelled()
+            try:
+                chunks = _time.split_time_range(
+                    time_range, PIConfig.CANCEL_CHUNK_SIZE, interval
+                )
+            except ValueError:
+                chunks = []
+            if len(chunks) > 1:
+                return self._fetch_chunks(fetch, chunks, cancel, max_workers)
+        if chunk_size is None:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            return [self._call(fetch, time_range, True, True)], None
+        chunks = _time.split_time_range(time_range, chunk_size, interval)
+        return self._fetch_chunks(fetch, chunks, cancel, max_workers)
+
+    def _fetch_chunks(
+        self,
+        fetch: Callable[[AF.Time.AFTimeRange, bool, bool], _Result],
+        chunks: list[tuple[int, int]],
+        cancel: _cancellation.CancellationToken | None,
+        max_workers: int,
+    ) -> tuple[list[_Result], bool]:
+        """Fetch the chunks in order, or concurrently, until the query is cancelled."""
+        if max_workers > 1 and len(chunks) > 1:
+            return self._fetch_concurrently(fetch, chunks, cancel, max_workers)
+        results: list[_Result] = []
+        for position, (start, end) in enumerate(chunks):
+            if cancel is not None and cancel.cancelled:
+                return results, True
+            results.append(
+                self._call(
+                    fetch,
+                    _time.ticks_to_af_time_range(start, end),
+                    position == 0,
+                    position == len(chunks) - 1,
+                )
+            )
+        return results, False
+
+    def _fetch_concurrently(
+        self,
+        fetch: Callable[[AF.Time.AFTimeRange, bool, bool], _Result],
+        chunks: list[tuple[int, int]],
+        cancel: _cancellation.CancellationToken | None,
+        max_workers: int,
+    ) -> tuple[list[_Result], bool]:
+        """Fetch chunks concurrently, returning the results in the order of the chunks.
+
+        Each chunk is sent through the admission controller of the server, so
+        the concurrency is also bounded by the limit of the server. When the
+        query is cancelled, or a chunk fails, the chunks that were not started
+        are skipped. The SDK calls cannot be interrupted, so the chunks that
+        are in progress are completed and returned.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(chunks)), thread_name_prefix="PIconnect-chunk"
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._call,
+                    fetch,
+                    _time.ticks_to_af_time_range(start, end),
+                    position == 0,
+                    position == len(chunks) - 1,
+                )
+                for position, (start, end) in enumerate(chunks)
+            ]
+            pending = set(futures)
+            try:
+                while pending and not (cancel is not None and cancel.cancelled):
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        timeout=_POLL_SECONDS,
+                        return_when=concurrent.futures.FIRST_EXCEPTION,
+                    )
+                    for future in done:
+                        future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+        results = [future.result() for future in futures if not future.cancelled()]
+        return results, len(results) < len(futures)
+
+    @staticmethod
+    def _flag_partial(columns: _results.Columns, partial: bool | None) -> _results.Columns:
+        if partial is not None:
+            columns.attrs["partial"] = partial
+        return columns
+
+    def _value_type(self) -> str | None:
+        """Return the name of the data type of the values, if known.
+
+        This is the PI point type for PI Points, or the name of the .NET type
+        for PI AF Attributes. Used to determine the dtype of returned series.
+        """
+        return None
+
+    def _state_set(self) -> DigitalStateSet | None:
+        """Return the digital state set of the values, if they are digital."""
+        return None
+
+    @property
+    def digital_states(self) -> DigitalStateSet | None:
+        """Return the cached digital state set, or None if the values are not digital."""
+        return self._state_set()
+
+    def _to_columns(
+        self, pivalues: Iterable[AF.Asset.AFValue], include_status: bool = False
+    ) -> _results.Columns:
+        """Convert values returned by the SDK to typed columns in a single pass.
+
+        The columns are `timestamp` and `value`, followed by the packed
+        :class:`PIConsts.ValueStatus` flags in the `status` column if
+        `include_status` is True.
+        """
+        ticks, values, status = _unpack_values(pivalues, include_status)
+        columns: dict[str, Any] = {
+            "timestamp": _time.ticks_to_datetime64(ticks),
+            "value": _typed_values(values, self._value_type(), self._state_set()),
+        }
+        if status is not None:
+            columns["status"] = status
+        return _results.Columns(
+            columns,
+            index="timestamp",
+            times=("timestamp",),
+            attrs={"tag": self.name, "uom": self.units_of_measurement},
+        )
+
+    def _to_series(
+        self,
+        pivalues: Iterable[AF.Asset.AFValue],
+        include_status: bool = False,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
+        """Convert values returned by the SDK to the requested result format.
+
+        With the pandas format this is a typed PISeries, or a
+        :class:`pandas.DataFrame` with the `value` and `status` columns if
+        `include_status` is True.
+        """
+        columns = self._to_columns(pivalues, include_status)
+        return _results.convert(columns, result_format, series=not include_status)
+
     def filtered_summaries(
         self,
         start_time: _time.TimeLike,
@@ -89,7 +614,13 @@ class PISeriesContainer(abc.ABC):
         filter_evaluation: PIConsts.ExpressionSampleType = _DEFAULT_FILTER_EVALUATION,
         filter_interval: str | None = None,
         time_type: PIConsts.TimestampCalculation = PIConsts.TimestampCalculation.AUTO,
-    ) -> pd.DataFrame:
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        chunk_size: str | datetime.timedelta | None = None,
+        result_format: _results.ResultFormat | None = None,
+        max_workers: int = 1,
+    ) -> Any:
         """Return one or more summary values for each interval within a time range.
 
         Parameters
@@ -126,44 +657,61 @@ class PISeriesContainer(abc.ABC):
                 Timestamp to return for each of the requested summaries. See
                 :ref:`summary_timestamps` and :any:`TimestampCalculation` for
                 more information. Defaults to TimestampCalculation.AUTO.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            chunk_size (str or timedelta, optional): Defaults to None. Fetch the
+                time range in chunks of at most this length, so the query can
+                be stopped between chunks. A stopped query returns the chunks
+                that were fetched, with `attrs["partial"]` set to True. The
+                chunks are aligned to whole intervals, which must have a fixed
+                length.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+            max_workers (int, optional): Defaults to 1. Number of chunks that
+                are evaluated concurrently. Without a `chunk_size` the time
+                range is split in this many chunks, aligned to whole intervals,
+                which must have a fixed length. See :ref:`sharded_summaries`.
 
         Returns
         -------
             pandas.DataFrame: Dataframe with the unique timestamps as row index
                 and the summary name as column name.
         """
-        time_range = _time.to_af_time_range(start_time, end_time)
-        _interval = AF.Time.AFTimeSpan.Parse(interval)
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
+        if chunk_size is None and max_workers > 1:
+            chunk_size = _time.even_chunk_size(time_range, max_workers)
+        _interval = _time.to_af_time_span(interval)
         _filter_expression = self._normalize_filter_expression(filter_expression)
         _summary_types = AF.Data.AFSummaryTypes(int(summary_types))
         _calculation_basis = AF.Data.AFCalculationBasis(int(calculation_basis))
         _filter_evaluation = AF.Data.AFSampleType(int(filter_evaluation))
-        _filter_interval = AF.Time.AFTimeSpan.Parse(filter_interval)
+        _filter_interval = _time.to_af_time_span(filter_interval)
         _time_type = AF.Data.AFTimestampCalculation(int(time_type))
-        pivalues = self._filtered_summaries(
+        results, partial = self._fetch(
+            lambda chunk, first, last: self._filtered_summaries(
+                chunk,
+                _interval,
+                _filter_expression,
+                _summary_types,
+                _calculation_basis,
+                _filter_evaluation,
+                _filter_interval,
+                _time_type,
+            ),
             time_range,
-            _interval,
-            _filter_expression,
-            _summary_types,
-            _calculation_basis,
-            _filter_evaluation,
-            _filter_interval,
-            _time_type,
+            _cancellation.token(timeout, cancel),
+            chunk_size,
+            interval,
+            max_workers,
         )
-        df = pd.DataFrame()
-        for summary in pivalues:
-            key = PIConsts.SummaryType(int(summary.Key)).name
-            timestamps, values = zip(
-                *[
-                    (_time.timestamp_to_index(value.Timestamp.UtcTime), value.Value)
-                    for value in summary.Value
-                ],
-                strict=True,
-            )
-            df = df.join(  # type: ignore
-                pd.DataFrame(data={key: values}, index=timestamps), how="outer"
-            )
-        return df
+        columns = _summaries_columns(_merge_summaries(results))
+        return _results.convert(self._flag_partial(columns, partial), result_format)
 
     @abc.abstractmethod
     def _filtered_summaries(
@@ -179,7 +727,14 @@ class PISeriesContainer(abc.ABC):
     ) -> _AFtyping.Data.SummariesDict:
         pass
 
-    def interpolated_value(self, time: _time.TimeLike) -> PISeries:
+    def interpolated_value(
+        self,
+        time: _time.TimeLike,
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
         """Return a PISeries with an interpolated value at the given time.
 
         Parameters
@@ -191,6 +746,16 @@ class PISeriesContainer(abc.ABC):
             time (str, datetime): String containing the date, and possibly time,
                 for which to retrieve the value. This is parsed, using
                 :afsdk:`AF.Time.AFTime <M_OSIsoft_AF_Time_AFTime__ctor_7.htm>`.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
 
         Returns
         -------
@@ -199,14 +764,12 @@ class PISeriesContainer(abc.ABC):
         """
         from . import _time as time_module
 
-        _time = time_module.to_af_time(time)
-        pivalue = self._interpolated_value(_time)
-        return PISeries(  # type: ignore
-            tag=self.name,
-            value=pivalue.Value,
-            timestamp=[time_module.timestamp_to_index(pivalue.Timestamp.UtcTime)],
-            uom=self.units_of_measurement,
-        )
+        _time = time_module.to_af_time(time, time_query)
+        _cancel = _cancellation.token(timeout, cancel)
+        if _cancel is not None:
+            _cancel.raise_if_cancelled()
+        pivalue = self._call(self._interpolated_value, _time)
+        return self._to_series([pivalue], result_format=result_format)
 
     @abc.abstractmethod
     def _interpolated_value(self, time: AF.Time.AFTime) -> AF.Asset.AFValue:
@@ -218,7 +781,14 @@ class PISeriesContainer(abc.ABC):
         end_time: _time.TimeLike,
         interval: str,
         filter_expression: str = "",
-    ) -> PISeries:
+        include_filtered_values: bool = False,
+        include_status: bool = False,
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        chunk_size: str | datetime.timedelta | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
         """Return a PISeries of interpolated data.
 
         Data is returned between *start_time* and *end_time* at a fixed
@@ -230,8 +800,9 @@ class PISeriesContainer(abc.ABC):
         values, see OSIsoft PI documentation for more information.
 
         The AF SDK allows for inclusion of filtered data, with filtered
-        values marked as such. At this point PIconnect does not support this
-        and filtered values are always left out entirely.
+        values marked as such. By default filtered values are left out
+        entirely, with *include_filtered_values* they are returned as missing
+        values with the :attr:`PIConsts.ValueStatus.BAD` status.
 
         Parameters
         ----------
@@ -249,27 +820,53 @@ class PISeriesContainer(abc.ABC):
             filter_expression (str, optional): Defaults to ''. Query on which
                 data to include in the results. See :ref:`filtering_values`
                 for more information on filter queries.
+            include_filtered_values (bool, optional): Defaults to False. Return
+                values that do not pass the `filter_expression` as well.
+            include_status (bool, optional): Defaults to False. Also return the
+                status of each value, see :ref:`value_status`.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            chunk_size (str or timedelta, optional): Defaults to None. Fetch the
+                time range in chunks of at most this length, so the query can
+                be stopped between chunks. A stopped query returns the chunks
+                that were fetched, with `attrs["partial"]` set to True. The
+                chunks are aligned to whole intervals, which must have a fixed
+                length.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
 
         Returns
         -------
-            PISeries: Timeseries of the values returned by the SDK
+            PISeries: Timeseries of the values returned by the SDK. If
+                `include_status` is True a DataFrame with the columns `value`
+                and `status` is returned instead.
         """
-        time_range = _time.to_af_time_range(start_time, end_time)
-        _interval = AF.Time.AFTimeSpan.Parse(interval)
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
+        _interval = _time.to_af_time_span(interval)
         _filter_expression = self._normalize_filter_expression(filter_expression)
-        pivalues = self._interpolated_values(time_range, _interval, _filter_expression)
-
-        timestamps: list[datetime.datetime] = []
-        values: list[Any] = []
-        for value in pivalues:
-            timestamps.append(_time.timestamp_to_index(value.Timestamp.UtcTime))
-            values.append(value.Value)
-        return PISeries(  # type: ignore
-            tag=self.name,
-            timestamp=timestamps,
-            value=values,
-            uom=self.units_of_measurement,
+        results, partial = self._fetch(
+            lambda chunk, first, last: _clip_chunk(
+                self._interpolated_values(
+                    chunk, _interval, _filter_expression, include_filtered_values
+                ),
+                chunk,
+                first,
+                last,
+            ),
+            time_range,
+            _cancellation.token(timeout, cancel),
+            chunk_size,
+            interval,
         )
+        pivalues = [value for result in results for value in result]
+        columns = self._flag_partial(self._to_columns(pivalues, include_status), partial)
+        return _results.convert(columns, result_format, series=not include_status)
 
     @abc.abstractmethod
     def _interpolated_values(
@@ -277,6 +874,7 @@ class PISeriesContainer(abc.ABC):
         time_range: AF.Time.AFTimeRange,
         interval: AF.Time.AFTimeSpan,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
         pass
 
@@ -289,11 +887,85 @@ class PISeriesContainer(abc.ABC):
     def _normalize_filter_expression(self, filter_expression: str) -> str:
         return filter_expression
 
+    def plot_values(
+        self,
+        start_time: _time.TimeLike,
+        end_time: _time.TimeLike,
+        intervals: int,
+        include_status: bool = False,
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
+        """Return a PISeries of values suitable for plotting.
+
+        The time range is divided in *intervals* intervals, typically the
+        width in pixels of the plot. For each interval the SDK returns the
+        first and last recorded value, and the minimum and maximum value, as
+        well as any exceptional values, such as bad values. This preserves the
+        shape of the trend, while the number of values is bounded by the
+        number of intervals instead of by the density of the data.
+
+        Parameters
+        ----------
+            start_time (str or datetime): Containing the date, and possibly time,
+                from which to retrieve the values. This is parsed, together
+                with `end_time`, using
+                :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+            end_time (str or datetime): Containing the date, and possibly time,
+                until which to retrieve values. This is parsed, together
+                with `start_time`, using
+                :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
+            intervals (int): Number of intervals to divide the time range in.
+            include_status (bool, optional): Defaults to False. Also return the
+                status of each value, see :ref:`value_status`.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+
+        Returns
+        -------
+            PISeries: Timeseries of the values returned by the SDK. If
+                `include_status` is True a DataFrame with the columns `value`
+                and `status` is returned instead.
+
+        Raises
+        ------
+            ValueError: If `intervals` is not a positive number.
+        """
+        if intervals < 1:
+            raise ValueError(f"Number of intervals must be positive, got {intervals}")
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
+        results, _ = self._fetch(
+            lambda chunk, first, last: self._plot_values(chunk, int(intervals)),
+            time_range,
+            _cancellation.token(timeout, cancel),
+        )
+        return self._to_series(results[0], include_status, result_format)
+
+    @abc.abstractmethod
+    def _plot_values(
+        self, time_range: AF.Time.AFTimeRange, intervals: int
+    ) -> AF.Asset.AFValues:
+        pass
+
     def recorded_value(
         self,
         time: _time.TimeLike,
         retrieval_mode: PIConsts.RetrievalMode = PIConsts.RetrievalMode.AUTO,
-    ) -> PISeries:
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
         """Return a PISeries with the recorded value at or close to the given time.
 
         Parameters
@@ -304,6 +976,16 @@ class PISeriesContainer(abc.ABC):
             retrieval_mode (int or :any:`PIConsts.RetrievalMode`): Flag determining
                 which value to return if no value available at the exact requested
                 time.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
 
         Returns
         -------
@@ -312,15 +994,13 @@ class PISeriesContainer(abc.ABC):
         """
         from . import _time as time_module
 
-        _time = time_module.to_af_time(time)
+        _time = time_module.to_af_time(time, time_query)
         _retrieval_mode = AF.Data.AFRetrievalMode(int(retrieval_mode))
-        pivalue = self._recorded_value(_time, _retrieval_mode)
-        return PISeries(  # type: ignore
-            tag=self.name,
-            value=pivalue.Value,
-            timestamp=[time_module.timestamp_to_index(pivalue.Timestamp.UtcTime)],
-            uom=self.units_of_measurement,
-        )
+        _cancel = _cancellation.token(timeout, cancel)
+        if _cancel is not None:
+            _cancel.raise_if_cancelled()
+        pivalue = self._call(self._recorded_value, _time, _retrieval_mode)
+        return self._to_series([pivalue], result_format=result_format)
 
     @abc.abstractmethod
     def _recorded_value(
@@ -334,7 +1014,14 @@ class PISeriesContainer(abc.ABC):
         end_time: _time.TimeLike,
         boundary_type: str = "inside",
         filter_expression: str = "",
-    ):
+        include_filtered_values: bool = False,
+        include_status: bool = False,
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        chunk_size: str | datetime.timedelta | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
         """Return a PISeries of recorded data.
 
         Data is returned between the given *start_time* and *end_time*,
@@ -353,8 +1040,9 @@ class PISeriesContainer(abc.ABC):
         values, see OSIsoft PI documentation for more information.
 
         The AF SDK allows for inclusion of filtered data, with filtered values
-        marked as such. At this point PIconnect does not support this and
-        filtered values are always left out entirely.
+        marked as such. By default filtered values are left out entirely, with
+        *include_filtered_values* they are returned as missing values with the
+        :attr:`PIConsts.ValueStatus.BAD` status.
 
         Parameters
         ----------
@@ -372,38 +1060,60 @@ class PISeriesContainer(abc.ABC):
             filter_expression (str, optional): Defaults to ''. Query on which
                 data to include in the results. See :ref:`filtering_values`
                 for more information on filter queries.
+            include_filtered_values (bool, optional): Defaults to False. Return
+                values that do not pass the `filter_expression` as well.
+            include_status (bool, optional): Defaults to False. Also return the
+                status of each value, see :ref:`value_status`.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            chunk_size (str or timedelta, optional): Defaults to None. Fetch the
+                time range in chunks of at most this length, so the query can
+                be stopped between chunks. A stopped query returns the chunks
+                that were fetched, with `attrs["partial"]` set to True.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
 
         Returns
         -------
-            PISeries: Timeseries of the values returned by the SDK
+            PISeries: Timeseries of the values returned by the SDK. If
+                `include_status` is True a DataFrame with the columns `value`
+                and `status` is returned instead.
 
         Raises
         ------
             ValueError: If the provided `boundary_type` is not a valid key a
                 `ValueError` is raised.
         """
-        time_range = _time.to_af_time_range(start_time, end_time)
-        _boundary_type = self.__boundary_types.get(boundary_type.lower())
-        if _boundary_type is None:
-            raise ValueError(
-                "Argument boundary_type must be one of "
-                + ", ".join('"%s"' % x for x in sorted(self.__boundary_types.keys()))
-            )
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
+        _boundary_type = _parse_boundary_type(boundary_type)
         _filter_expression = self._normalize_filter_expression(filter_expression)
 
-        pivalues = self._recorded_values(time_range, _boundary_type, _filter_expression)
-
-        timestamps: list[datetime.datetime] = []
-        values: list[Any] = []
-        for value in pivalues:
-            timestamps.append(_time.timestamp_to_index(value.Timestamp.UtcTime))
-            values.append(value.Value)
-        return PISeries(  # type: ignore
-            tag=self.name,
-            timestamp=timestamps,
-            value=values,
-            uom=self.units_of_measurement,
+        inside = AF.Data.AFBoundaryType.Inside
+        results, partial = self._fetch(
+            lambda chunk, first, last: _clip_chunk(
+                self._recorded_values(
+                    chunk,
+                    _boundary_type if first or last else inside,
+                    _filter_expression,
+                    include_filtered_values,
+                ),
+                chunk,
+                first,
+                last,
+            ),
+            time_range,
+            _cancellation.token(timeout, cancel),
+            chunk_size,
         )
+        pivalues = [value for result in results for value in result]
+        columns = self._flag_partial(self._to_columns(pivalues, include_status), partial)
+        return _results.convert(columns, result_format, series=not include_status)
 
     @abc.abstractmethod
     def _recorded_values(
@@ -411,6 +1121,7 @@ class PISeriesContainer(abc.ABC):
         time_range: AF.Time.AFTimeRange,
         boundary_type: AF.Data.AFBoundaryType,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
         """Abstract implementation for recorded values.
 
@@ -427,7 +1138,11 @@ class PISeriesContainer(abc.ABC):
         summary_types: PIConsts.SummaryType,
         calculation_basis: PIConsts.CalculationBasis = PIConsts.CalculationBasis.TIME_WEIGHTED,
         time_type: PIConsts.TimestampCalculation = PIConsts.TimestampCalculation.AUTO,
-    ) -> pd.DataFrame:
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        result_format: _results.ResultFormat | None = None,
+    ) -> Any:
         """Return one or more summary values over a single time range.
 
         Parameters
@@ -450,27 +1165,35 @@ class PISeriesContainer(abc.ABC):
                 Timestamp to return for each of the requested summaries. See
                 :ref:`summary_timestamps` and :any:`TimestampCalculation` for
                 more information. Defaults to TimestampCalculation.AUTO.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
 
         Returns
         -------
             pandas.DataFrame: Dataframe with the unique timestamps as row index
                 and the summary name as column name.
         """
-        time_range = _time.to_af_time_range(start_time, end_time)
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
         _summary_types = AF.Data.AFSummaryTypes(int(summary_types))
         _calculation_basis = AF.Data.AFCalculationBasis(int(calculation_basis))
         _time_type = AF.Data.AFTimestampCalculation(int(time_type))
-        pivalues = self._summary(time_range, _summary_types, _calculation_basis, _time_type)
-        df = pd.DataFrame()
-        for summary in pivalues:
-            key = PIConsts.SummaryType(int(summary.Key)).name
-            value = summary.Value
-            timestamp = _time.timestamp_to_index(value.Timestamp.UtcTime)
-            value = value.Value
-            df = df.join(  # type: ignore
-                pd.DataFrame(data={key: value}, index=[timestamp]), how="outer"
-            )
-        return df
+        (pivalues,), _ = self._fetch(
+            lambda chunk, first, last: self._summary(
+                chunk, _summary_types, _calculation_basis, _time_type
+            ),
+            time_range,
+            _cancellation.token(timeout, cancel),
+        )
+        columns = _summaries_columns((summary.Key, [summary.Value]) for summary in pivalues)
+        return _results.convert(columns, result_format)
 
     @abc.abstractmethod
     def _summary(
@@ -490,7 +1213,13 @@ class PISeriesContainer(abc.ABC):
         summary_types: PIConsts.SummaryType,
         calculation_basis: PIConsts.CalculationBasis = PIConsts.CalculationBasis.TIME_WEIGHTED,
         time_type: PIConsts.TimestampCalculation = PIConsts.TimestampCalculation.AUTO,
-    ) -> pd.DataFrame:
+        time_query: _time.TimeQuery | None = None,
+        timeout: float | None = None,
+        cancel: _cancellation.CancellationToken | None = None,
+        chunk_size: str | datetime.timedelta | None = None,
+        result_format: _results.ResultFormat | None = None,
+        max_workers: int = 1,
+    ) -> Any:
         """Return one or more summary values for each interval within a time range.
 
         Parameters
@@ -516,34 +1245,51 @@ class PISeriesContainer(abc.ABC):
                 Timestamp to return for each of the requested summaries. See
                 :ref:`summary_timestamps` and :any:`TimestampCalculation` for
                 more information. Defaults to TimestampCalculation.AUTO.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
+            timeout (float, optional): Defaults to None. Number of seconds after
+                which the query is stopped, see :ref:`cancelling_queries`.
+            cancel (CancellationToken, optional): Defaults to None. Token to
+                stop the query from another thread.
+            chunk_size (str or timedelta, optional): Defaults to None. Fetch the
+                time range in chunks of at most this length, so the query can
+                be stopped between chunks. A stopped query returns the chunks
+                that were fetched, with `attrs["partial"]` set to True. The
+                chunks are aligned to whole intervals, which must have a fixed
+                length.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+            max_workers (int, optional): Defaults to 1. Number of chunks that
+                are evaluated concurrently. Without a `chunk_size` the time
+                range is split in this many chunks, aligned to whole intervals,
+                which must have a fixed length. See :ref:`sharded_summaries`.
 
         Returns
         -------
             pandas.DataFrame: Dataframe with the unique timestamps as row index
                 and the summary name as column name.
         """
-        time_range = _time.to_af_time_range(start_time, end_time)
-        _interval = AF.Time.AFTimeSpan.Parse(interval)
+        time_range = _time.to_af_time_range(start_time, end_time, time_query)
+        if chunk_size is None and max_workers > 1:
+            chunk_size = _time.even_chunk_size(time_range, max_workers)
+        _interval = _time.to_af_time_span(interval)
         _summary_types = AF.Data.AFSummaryTypes(int(summary_types))
         _calculation_basis = AF.Data.AFCalculationBasis(int(calculation_basis))
         _time_type = AF.Data.AFTimestampCalculation(int(time_type))
-        pivalues = self._summaries(
-            time_range, _interval, _summary_types, _calculation_basis, _time_type
+        results, partial = self._fetch(
+            lambda chunk, first, last: self._summaries(
+                chunk, _interval, _summary_types, _calculation_basis, _time_type
+            ),
+            time_range,
+            _cancellation.token(timeout, cancel),
+            chunk_size,
+            interval,
+            max_workers,
         )
-        df = pd.DataFrame()
-        for summary in pivalues:
-            key = PIConsts.SummaryType(int(summary.Key)).name
-            timestamps, values = zip(
-                *[
-                    (_time.timestamp_to_index(value.Timestamp.UtcTime), value.Value)
-                    for value in summary.Value
-                ],
-                strict=True,
-            )
-            df = df.join(  # type: ignore
-                pd.DataFrame(data={key: values}, index=timestamps), how="outer"
-            )
-        return df
+        columns = _summaries_columns(_merge_summaries(results))
+        return _results.convert(self._flag_partial(columns, partial), result_format)
 
     @abc.abstractmethod
     def _summaries(
@@ -568,28 +1314,39 @@ class PISeriesContainer(abc.ABC):
         time: _time.TimeLike | None = None,
         update_mode: PIConsts.UpdateMode = PIConsts.UpdateMode.NO_REPLACE,
         buffer_mode: PIConsts.BufferMode = PIConsts.BufferMode.BUFFER_IF_POSSIBLE,
+        time_query: _time.TimeQuery | None = None,
     ) -> None:
         """Update value for existing PI object.
 
         Parameters
         ----------
             value: value type should be in cohesion with PI object or
-                it will raise PIException: [-10702] STATE Not Found
+                it will raise PIException: [-10702] STATE Not Found. Values of
+                digital objects can be passed as the state code or state name.
             time (datetime, optional): it is not possible to set future value,
                 it raises PIException: [-11046] Target Date in Future.
+                Naive datetimes are interpreted in
+                :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+            time_query (TimeQuery, optional): Defaults to None. Parse the times,
+                and resolve relative times, with this :class:`TimeQuery`
+                so a batch of requests shares a single reference time.
 
         You can combine update_mode and time to change already stored value.
-        """
+        """  # noqa: E501
         from . import _time as time_module
 
+        state_set = self._state_set()
+        if state_set is not None and isinstance(value, int | str):
+            value = state_set.to_state(value)
+
         if time is not None:
-            _value = AF.Asset.AFValue(value, time_module.to_af_time(time))
+            _value = AF.Asset.AFValue(value, time_module.to_af_time(time, time_query))
         else:
             _value = AF.Asset.AFValue(value)
 
         _update_mode = AF.Data.AFUpdateOption(int(update_mode))
         _buffer_mode = AF.Data.AFBufferOption(int(buffer_mode))
-        self._update_value(_value, _update_mode, _buffer_mode)
+        self._call(self._update_value, _value, _update_mode, _buffer_mode, retry=False)
 
     @abc.abstractmethod
     def _update_value(
@@ -599,3 +1356,61 @@ class PISeriesContainer(abc.ABC):
         buffer_mode: AF.Data.AFBufferOption,
     ) -> None:
         pass
+
+    def update_values(
+        self,
+        values: "pd.Series",
+        update_mode: PIConsts.UpdateMode = PIConsts.UpdateMode.NO_REPLACE,
+        buffer_mode: PIConsts.BufferMode = PIConsts.BufferMode.BUFFER_IF_POSSIBLE,
+    ) -> None:
+        """Write a series of values to the PI object in a single call.
+
+        The timestamps in the index of `values` are converted to AFTime in a
+        single vectorised step, see :func:`_time.to_af_times`, so writing many
+        values does not require parsing a string for every value.
+
+        Parameters
+        ----------
+            values (pandas.Series): Values to write, indexed by their timestamps.
+                Naive timestamps are interpreted in
+                :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+                Values of digital objects can be passed as the state code or
+                state name.
+            update_mode (int or PIConsts.UpdateMode, optional): Defaults to
+                UpdateMode.NO_REPLACE. How to handle values that already exist
+                at the same timestamps.
+            buffer_mode (int or PIConsts.BufferMode, optional): Defaults to
+                BufferMode.BUFFER_IF_POSSIBLE. Whether to write through the
+                PI Buffer Subsystem.
+
+        Raises
+        ------
+            ValueError: If the SDK reports that any of the values could not be
+                written.
+        """  # noqa: E501
+        state_set = self._state_set()
+        _values = AF.Asset.AFValues()
+        for value, time in zip(values.tolist(), _time.to_af_times(values.index), strict=True):
+            if state_set is not None and isinstance(value, int | str):
+                value = state_set.to_state(value)
+            _values.Add(AF.Asset.AFValue(value, time))
+
+        _update_mode = AF.Data.AFUpdateOption(int(update_mode))
+        _buffer_mode = AF.Data.AFBufferOption(int(buffer_mode))
+        errors = self._call(
+            self._update_values, _values, _update_mode, _buffer_mode, retry=False
+        )
+        if errors is not None and errors.HasErrors:
+            raise ValueError(
+                f"Failed to write {errors.Errors.Count} of {len(values)} values to {self.name}"
+            )
+
+    @abc.abstractmethod
+    def _update_values(
+        self,
+        values: AF.Asset.AFValues,
+        update_mode: AF.Data.AFUpdateOption,
+        buffer_mode: AF.Data.AFBufferOption,
+    ) -> Any:
+        """Write the values and return the errors reported by the SDK, if any."""
+        pass
@@ -0,0 +1,251 @@
+"""PIExport - Parallel, resumable export of recorded values to partitioned Parquet files."""
+
+import concurrent.futures
+import dataclasses
+import datetime
+import json
+import os
+import pathlib
+import urllib.parse
+from collections.abc import Sequence
+from typing import Any, Literal
+
+import numpy as np
+
+from PIconnect import PIData, _results, _time
+
+__all__ = ["ExportResult", "export"]
+
+Partition = Literal["hour", "day", "month"]
+
+#: numpy datetime unit of each partitioning scheme.
+_PARTITION_UNITS: dict[str, str] = {"hour": "h", "day": "D", "month": "M"}
+MANIFEST = "_manifest.json"
+
+
+@dataclasses.dataclass
+class ExportResult:
+    """Summary of an export.
+
+    Attributes
+    ----------
+        files (int): Number of Parquet files written by this run.
+        rows (int): Number of values written by this run.
+        skipped (int): Number of partitions skipped because an earlier run
+            already exported them.
+    """
+
+    files: int = 0
+    rows: int = 0
+    skipped: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class _Unit:
+    """Export of a single container for a single partition."""
+
+    name: str
+    key: str
+    start: datetime.datetime
+    end: datetime.datetime
+    last: bool
+
+    @property
+    def id(self) -> str:
+        return f"{self.name}/{self.key}"
+
+
+def _partitions(
+    start: np.datetime64, end: np.datetime64, partition: Partition
+) -> list[tuple[str, np.datetime64, np.datetime64]]:
+    """Split a time range in UTC partitions, clipped to the time range."""
+    unit = _PARTITION_UNITS[partition]
+    floors = np.arange(
+        start.astype(f"datetime64[{unit}]"),
+        end.astype(f"datetime64[{unit}]") + np.timedelta64(1, unit),
+    )
+    partitions: list[tuple[str, np.datetime64, np.datetime64]] = []
+    for floor in floors:
+        lower = max(start, floor.astype("datetime64[ns]"))
+        upper = min(end, (floor + np.timedelta64(1, unit)).astype("datetime64[ns]"))
+        if lower < upper:
+            partitions.append((str(floor), lower, upper))
+    return partitions
+
+
+def _argument(time: _time.TimeLike) -> str:
+    """Return a time as passed to the export, to compare the parameters of two runs."""
+    return time.isoformat() if isinstance(time, datetime.datetime) else str(time)
+
+
+def _to_datetime(time: np.datetime64) -> datetime.datetime:
+    microseconds = time.astype("datetime64[us]").astype(datetime.datetime)
+    return microseconds.replace(tzinfo=datetime.timezone.utc)
+
+
+class _Manifest:
+    """Checkpoint of the partitions that were exported, stored next to the data."""
+
+    def __init__(
+        self, path: pathlib.Path, parameters: dict[str, Any], time_range: list[str]
+    ) -> None:
+        self.path = path
+        self.parameters = parameters
+        self.time_range = time_range
+        self.done: dict[str, int] = {}
+        if path.exists():
+            stored = json.loads(path.read_text())
+            if stored["parameters"] != parameters:
+                raise ValueError(
+                    f"{path.parent} contains an export with other parameters, "
+                    "use another directory or remove the manifest to start over"
+                )
+            # Relative times resolve to other times on every run, so a resumed
+            # export keeps the time range of the first run
+            self.time_range = stored["range"]
+            self.done = stored["done"]
+
+    def complete(self, unit: _Unit, rows: int) -> None:
+        """Mark a unit as exported, replacing the manifest atomically."""
+        self.done[unit.id] = rows
+        temporary = self.path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps(
+                {"parameters": self.parameters, "range": self.time_range, "done": self.done}
+            )
+        )
+        os.replace(temporary, self.path)
+
+
+def _export_unit(
+    container: PIData.PISeriesContainer,
+    unit: _Unit,
+    path: pathlib.Path,
+    include_status: bool,
+) -> int:
+    """Read the values of a single partition and write them to a Parquet file."""
+    parquet = _results.import_optional("pyarrow.parquet")
+    columns = container.recorded_values(
+        unit.start,
+        unit.end,
+        boundary_type="inside",
+        include_status=include_status,
+        result_format="numpy",
+    )
+    # Values on the edge between two partitions belong to the later partition
+    if not unit.last:
+        end = np.datetime64(unit.end.replace(tzinfo=None), "ns")
+        columns = columns.take(columns["timestamp"] < end)
+    rows = len(columns)
+    if rows:
+        table = _results.convert(columns, "arrow")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        parquet.write_table(table, temporary)
+        os.replace(temporary, path)
+    return rows
+
+
+def export(
+    containers: Sequence[PIData.PISeriesContainer],
+    start_time: _time.TimeLike,
+    end_time: _time.TimeLike,
+    directory: str | os.PathLike[str],
+    partition: Partition = "day",
+    max_workers: int = 4,
+    include_status: bool = False,
+) -> ExportResult:
+    """Export the recorded values of points or attributes to partitioned Parquet files.
+
+    The time range is split in UTC partitions, and each partition of each
+    container is read and written by one of `max_workers` workers, so at most
+    that many partitions are held in memory at once. The values are written to
+    `<directory>/tag=<name>/<partition>=<key>/data.parquet`, with the name
+    URL-quoted, and each partition is recorded in a manifest as soon as it is
+    written. Running the same export again skips the partitions that were
+    already exported, so an interrupted export resumes where it stopped.
+    Relative times, such as `'*-7d'`, are resolved by the first run only, a
+    resumed export keeps the time range stored in the manifest.
+
+    Parameters
+    ----------
+        containers (list of PIPoint or PIAFAttribute): Points and attributes to
+            export, for example the result of :meth:`PIServer.search`.
+        start_time (str or datetime): Start of the export.
+        end_time (str or datetime): End of the export.
+        directory (str or path): Directory to write the files and manifest to.
+        partition (str, optional): Defaults to `'day'`. Length of the
+            partitions, one of `'hour'`, `'day'` or `'month'`.
+        max_workers (int, optional): Defaults to 4. Number of partitions that
+            are exported concurrently.
+        include_status (bool, optional): Defaults to False. Also export the
+            packed :class:`PIConsts.ValueStatus` flags of each value.
+
+    Returns
+    -------
+        ExportResult: The number of files and values written, and the number
+            of partitions skipped.
+
+    Raises
+    ------
+        ValueError: If `directory` contains the manifest of an export with
+            other containers, times or partitioning.
+    """
+    if partition not in _PARTITION_UNITS:
+        raise ValueError(f"Unknown partition {partition!r}, use hour, day or month")
+    directory = pathlib.Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    time_range = _time.TimeQuery().time_range(start_time, end_time)
+    resolved = _time.ticks_to_datetime64(
+        np.array(
+            [time_range.StartTime.UtcTime.Ticks, time_range.EndTime.UtcTime.Ticks],
+            dtype=np.int64,
+        )
+    )
+    by_name = {container.name: container for container in containers}
+    manifest = _Manifest(
+        directory / MANIFEST,
+        {
+            "names": sorted(by_name),
+            "start": _argument(start_time),
+            "end": _argument(end_time),
+            "partition": partition,
+            "include_status": include_status,
+        },
+        [str(time) for time in resolved],
+    )
+    start, end = (np.datetime64(time, "ns") for time in manifest.time_range)
+
+    partitions = _partitions(start, end, partition)
+    units = [
+        _Unit(name, key, _to_datetime(lower), _to_datetime(upper), upper == end)
+        for name in by_name
+        for key, lower, upper in partitions
+    ]
+    result = ExportResult()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[concurrent.futures.Future[int], _Unit] = {}
+        for unit in units:
+            if unit.id in manifest.done:
+                result.skipped += 1
+                continue
+            path = (
+                directory
+                / f"tag={urllib.parse.quote(unit.name, safe='')}"
+                / f"{partition}={unit.key}"
+                / "data.parquet"
+            )
+            future = executor.submit(
+                _export_unit, by_name[unit.name], unit, path, include_status
+            )
+            futures[future] = unit
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                rows = future.result()
+                manifest.complete(futures[future], rows)
+                result.rows += rows
+                result.files += bool(rows)
+        except BaseException:
+            executor.shutdown(cancel_futures=True)
+            raise
+    return result
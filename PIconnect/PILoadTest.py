@@ -0,0 +1,493 @@
+"""PILoadTest - Load tests with many concurrent clients of the PI and PI AF servers.
+
+A load test runs a :class:`Workload`, a weighted mix of operations such as
+searches, snapshots, reads and writes, from many concurrent clients, the way a
+service that handles many requests at once uses PIconnect. The clients are
+threads, or tasks of an asyncio event loop that run the blocking operations in
+a thread pool. The :class:`LoadTestResult` reports the throughput, the latency
+percentiles per operation and the peak memory, to verify that connection
+pooling, caching and the admission control scale with the number of clients.
+
+Load tests run against the servers that are installed, which can be a
+:class:`~PIconnect.PISimulator.Simulator` or a :class:`~PIconnect.PIReplay.Replay`
+passed as the `backend` of :func:`run`.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import dataclasses
+import random
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, Literal, Protocol
+
+import numpy as np
+
+from PIconnect import PI, PIBulk, PIConsts, PIPoint, _results
+
+__all__ = ["LoadTestResult", "Operation", "Workload", "mixed_workload", "run"]
+
+#: Ways to run the concurrent clients of a load test.
+Mode = Literal["threads", "async"]
+
+#: Latency percentiles in the report of a load test.
+PERCENTILES = (50, 95, 99)
+
+_ROW = "{:<20}{:>10}{:>8}{:>10}{:>10}{:>10}{:>10}"
+
+
+class Backend(Protocol):
+    """Servers that are installed for the duration of a load test."""
+
+    def install(self, default: bool = True) -> contextlib.AbstractContextManager[Any]: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Operation:
+    """A single kind of request of a workload.
+
+    Attributes
+    ----------
+        name (str): Name of the operation in the report.
+        function (callable): Function that makes the request. It is called
+            with the random number generator of the client, to choose the
+            points or attributes of the request.
+        weight (float): Defaults to 1.0. Relative frequency of the operation
+            in the workload.
+    """
+
+    name: str
+    function: Callable[[random.Random], Any]
+    weight: float = 1.0
+
+
+@dataclasses.dataclass
+class Workload:
+    """Weighted mix of operations, with an optional setup before the load test.
+
+    Attributes
+    ----------
+        operations (list of Operation): Operations of the workload.
+        setup (callable, optional): Defaults to None. Called once before the
+            clients start, after the backend is installed, for example to
+            search the points that the operations read.
+    """
+
+    operations: list[Operation]
+    setup: Callable[[], None] | None = None
+
+    def choose(self, rng: random.Random) -> Operation:
+        """Return a random operation, with the probability of its weight."""
+        return rng.choices(self.operations, [op.weight for op in self.operations])[0]
+
+
+def mixed_workload(
+    query: str = "*",
+    server: str | None = None,
+    start_time: str = "*-1h",
+    end_time: str = "*",
+    interval: str = "10m",
+    snapshot_size: int = 10,
+    weights: dict[str, float] | None = None,
+) -> Workload:
+    """Return a workload of searches, snapshots, recorded values, summaries and writes.
+
+    The points found by `query` when the load test starts are read and
+    written by the operations:
+
+    - `search`: search the points with `query`.
+    - `snapshot`: read the current values of `snapshot_size` points in bulk.
+    - `recorded`: read the recorded values of a point.
+    - `summaries`: read the average and maximum per `interval` of a point.
+    - `write`: write a value of 0 or 1 to a point at the current time. Writes
+      overwrite data on the server, so they are only made if `write` is given
+      a weight.
+
+    Every request opens a connection context with the server, which reuses
+    the pooled connection.
+
+    Parameters
+    ----------
+        query (str, optional): Defaults to `'*'`. Query of the points.
+        server (str, optional): Defaults to None, which uses the default
+            server. Name of the PI Data Archive.
+        start_time (str, optional): Defaults to `'*-1h'`. Start of the reads.
+        end_time (str, optional): Defaults to `'*'`. End of the reads.
+        interval (str, optional): Defaults to `'10m'`. Interval of the summaries.
+        snapshot_size (int, optional): Defaults to 10. Number of points per snapshot.
+        weights (dict, optional): Defaults to None, which gives every read the
+            same weight and leaves out the writes. Weight per operation name,
+            operations with a weight of 0 or missing from the dictionary are
+            left out.
+
+    Example
+    -------
+    .. code-block:: python
+
+        workload = PILoadTest.mixed_workload("SINUSOID*", weights={"recorded": 3, "write": 1})
+    """
+    points: list[PIPoint.PIPoint] = []
+
+    def setup() -> None:
+        with PI.PIServer(server) as pi_server:
+            points[:] = pi_server.search(query)
+        if not points:
+            raise ValueError(f"No points found for {query!r}")
+
+    def search(rng: random.Random) -> Any:
+        with PI.PIServer(server) as pi_server:
+            return pi_server.search(query)
+
+    def snapshot(rng: random.Random) -> Any:
+        with PI.PIServer(server):
+            return PIBulk.snapshot(rng.sample(points, min(snapshot_size, len(points))))
+
+    def recorded(rng: random.Random) -> Any:
+        with PI.PIServer(server):
+            return rng.choice(points).recorded_values(start_time, end_time)
+
+    def summaries(rng: random.Random) -> Any:
+        summary_types = PIConsts.SummaryType.AVERAGE | PIConsts.SummaryType.MAXIMUM
+        with PI.PIServer(server):
+            return rng.choice(points).summaries(start_time, end_time, interval, summary_types)
+
+    def write(rng: random.Random) -> None:
+        with PI.PIServer(server):
+            rng.choice(points).update_value(rng.randint(0, 1))
+
+    functions = {
+        "search": search,
+        "snapshot": snapshot,
+        "recorded": recorded,
+        "summaries": summaries,
+        "write": write,
+    }
+    if weights is None:
+        weights = {name: 0.0 if name == "write" else 1.0 for name in functions}
+    unknown = set(weights) - set(functions)
+    if unknown:
+        raise ValueError(f"Unknown operations {sorted(unknown)}, expected {list(functions)}")
+    operations = [
+        Operation(name, function, weights[name])
+        for name, function in functions.items()
+        if weights.get(name, 0) > 0
+    ]
+    return Workload(operations, setup)
+
+
+@dataclasses.dataclass
+class LoadTestResult:
+    """Throughput and latencies of a load test.
+
+    Attributes
+    ----------
+        clients (int): Number of concurrent clients.
+        seconds (float): Wall time of the load test.
+        latencies (dict): Latencies in seconds of the successful requests,
+            per operation.
+        errors (dict): Number of failed requests per operation.
+        peak_memory (int or None): Peak of the memory allocated by Python
+            during the load test in bytes, or None if it was not traced.
+    """
+
+    clients: int
+    seconds: float
+    latencies: dict[str, "np.ndarray[Any, np.dtype[np.float64]]"]
+    errors: dict[str, int]
+    peak_memory: int | None = None
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests, including the failed requests."""
+        return sum(len(latencies) for latencies in self.latencies.values()) + sum(
+            self.errors.values()
+        )
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of requests per second."""
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def percentiles(self, operation: str | None = None) -> dict[int, float]:
+        """Return the latency percentiles in milliseconds.
+
+        Parameters
+        ----------
+            operation (str, optional): Defaults to None, which combines all
+                operations. Name of the operation.
+        """
+        if operation is None:
+            latencies = np.concatenate([np.empty(0), *self.latencies.values()])
+        else:
+            latencies = self.latencies.get(operation, np.empty(0))
+        if not len(latencies):
+            return dict.fromkeys(PERCENTILES, float("nan"))
+        values = np.percentile(1000 * latencies, PERCENTILES)
+        return {
+            percentile: float(value)
+            for percentile, value in zip(PERCENTILES, values, strict=True)
+        }
+
+    def _rows(self) -> list[tuple[str, int, int, float, dict[int, float]]]:
+        names = sorted(set(self.latencies) | set(self.errors))
+        rows = []
+        for name in [*names, None]:
+            if name is None:
+                requests, errors = self.requests, sum(self.errors.values())
+            else:
+                errors = self.errors.get(name, 0)
+                requests = len(self.latencies.get(name, ())) + errors
+            throughput = requests / self.seconds if self.seconds else 0.0
+            rows.append(
+                (name or "total", requests, errors, throughput, self.percentiles(name))
+            )
+        return rows
+
+    def table(self, result_format: _results.ResultFormat | None = None) -> Any:
+        """Return the requests, errors, throughput and latency percentiles per operation.
+
+        Parameters
+        ----------
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+
+        Returns
+        -------
+            pandas.DataFrame: Dataframe indexed by the `operation`, with a
+                last row for the `total`, and the number of `requests` and
+                `errors`, the `throughput` in requests per second and the
+                latency percentiles `p50`, `p95` and `p99` in milliseconds.
+        """
+        rows = self._rows()
+        columns = {
+            "operation": np.array([row[0] for row in rows], dtype=object),
+            "requests": np.array([row[1] for row in rows], dtype=np.int64),
+            "errors": np.array([row[2] for row in rows], dtype=np.int64),
+            "throughput": np.array([row[3] for row in rows], dtype=np.float64),
+        }
+        for percentile in PERCENTILES:
+            columns[f"p{percentile}"] = np.array(
+                [row[4][percentile] for row in rows], dtype=np.float64
+            )
+        attrs = {
+            "clients": self.clients,
+            "seconds": self.seconds,
+            "peak_memory": self.peak_memory,
+        }
+        return _results.convert(
+            _results.Columns(columns, index="operation", attrs=attrs), result_format
+        )
+
+    def report(self) -> str:
+        """Return a table of the throughput and latency percentiles per operation."""
+        memory = (
+            ""
+            if self.peak_memory is None
+            else f", peak memory {self.peak_memory / 2**20:.1f} MiB"
+        )
+        lines = [
+            f"{self.requests} requests from {self.clients} clients in {self.seconds:.3f} s, "
+            f"{self.throughput:.1f} requests/s{memory}",
+            "",
+            _ROW.format(
+                "operation", "requests", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"
+            ),
+        ]
+        for name, requests, errors, throughput, percentiles in self._rows():
+            lines.append(
+                _ROW.format(
+                    name,
+                    requests,
+                    errors,
+                    f"{throughput:.1f}",
+                    *(f"{percentiles[percentile]:.2f}" for percentile in PERCENTILES),
+                )
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Return the report of the load test."""
+        return self.report()
+
+
+class _Clients:
+    """State shared by the clients of a load test."""
+
+    def __init__(
+        self, workload: Workload, requests: int | None, deadline: float | None, seed: int
+    ) -> None:
+        self.workload = workload
+        self.deadline = deadline
+        self.seed = seed
+        self._remaining = requests
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {op.name: [] for op in workload.operations}
+        self.errors: dict[str, int] = {}
+
+    def next_request(self) -> bool:
+        """Return whether a client makes another request."""
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return False
+        if self._remaining is None:
+            return True
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            return True
+
+    def request(self, rng: random.Random) -> None:
+        """Make a single request and record its latency, or its failure."""
+        operation = self.workload.choose(rng)
+        start = time.perf_counter()
+        try:
+            operation.function(rng)
+        except Exception:
+            with self._lock:
+                self.errors[operation.name] = self.errors.get(operation.name, 0) + 1
+            return
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.latencies[operation.name].append(latency)
+
+    def client(self, number: int) -> None:
+        rng = random.Random(self.seed * 1_000_003 + number)
+        while self.next_request():
+            self.request(rng)
+
+    def run_threads(self, clients: int) -> None:
+        threads = [
+            threading.Thread(
+                target=self.client, args=(number,), name=f"PIconnect-load-{number}"
+            )
+            for number in range(clients)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    async def _task(self, number: int) -> None:
+        loop = asyncio.get_running_loop()
+        rng = random.Random(self.seed * 1_000_003 + number)
+        while self.next_request():
+            await loop.run_in_executor(None, self.request, rng)
+
+    async def _tasks(self, clients: int) -> None:
+        loop = asyncio.get_running_loop()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=clients, thread_name_prefix="PIconnect-load"
+        ) as executor:
+            loop.set_default_executor(executor)
+            await asyncio.gather(*(self._task(number) for number in range(clients)))
+
+    def run_async(self, clients: int) -> None:
+        asyncio.run(self._tasks(clients))
+
+
+@contextlib.contextmanager
+def _traced_memory(trace: bool) -> Iterator[list[int | None]]:
+    """Trace the peak memory allocated by Python within the block, if requested."""
+    peak: list[int | None] = [None]
+    if not trace:
+        yield peak
+        return
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        yield peak
+        peak[0] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def run(
+    workload: Workload | Sequence[Operation],
+    clients: int = 10,
+    requests: int | None = None,
+    duration: float | None = None,
+    mode: Mode = "threads",
+    backend: Backend | None = None,
+    trace_memory: bool = True,
+    seed: int = 0,
+) -> LoadTestResult:
+    """Run a workload from many concurrent clients, and return the throughput and latencies.
+
+    Each client makes one request after the other, choosing the operation of
+    each request at random by the weights of the workload, until `requests`
+    requests are made by all clients together, or until `duration` has passed.
+    Failed requests are counted per operation and do not stop the load test.
+
+    Parameters
+    ----------
+        workload (Workload or list of Operation): Operations of the load test,
+            see :func:`mixed_workload`.
+        clients (int, optional): Defaults to 10. Number of concurrent clients.
+        requests (int, optional): Defaults to None. Total number of requests.
+        duration (float, optional): Defaults to None. Maximum duration of the
+            load test in seconds. At least one of `requests` and `duration`
+            must be given.
+        mode (str, optional): Defaults to `'threads'`. Run each client in its
+            own thread, or as a task of an asyncio event loop with `'async'`,
+            which runs the requests in a pool of a thread per client.
+        backend (Simulator or Replay, optional): Defaults to None, which uses
+            the installed servers. Servers to install as the default servers
+            for the duration of the load test.
+        trace_memory (bool, optional): Defaults to True. Trace the peak memory
+            allocated by Python with :mod:`tracemalloc`, which slows down the
+            requests.
+        seed (int, optional): Defaults to 0. Seed of the random choices of the
+            clients.
+
+    Example
+    -------
+    .. code-block:: python
+
+        simulator = PISimulator.Simulator(latency=0.02)
+        simulator.add_tags(PISimulator.TagSpec(f"Tag{n:03d}") for n in range(100))
+        result = PILoadTest.run(
+            PILoadTest.mixed_workload(), clients=200, duration=30.0, backend=simulator
+        )
+        print(result.report())
+    """
+    if requests is None and duration is None:
+        raise ValueError("Either the number of requests or the duration must be given")
+    if clients < 1:
+        raise ValueError(f"The number of clients must be positive, got {clients}")
+    if mode not in ("threads", "async"):
+        raise ValueError(f"Unknown mode {mode!r}, expected 'threads' or 'async'")
+    if not isinstance(workload, Workload):
+        workload = Workload(list(workload))
+    if not workload.operations:
+        raise ValueError("The workload has no operations")
+    with contextlib.ExitStack() as stack:
+        if backend is not None:
+            stack.enter_context(backend.install())
+        if workload.setup is not None:
+            workload.setup()
+        peak = stack.enter_context(_traced_memory(trace_memory))
+        start = time.perf_counter()
+        deadline = None if duration is None else start + duration
+        state = _Clients(workload, requests, deadline, seed)
+        if mode == "async":
+            state.run_async(clients)
+        else:
+            state.run_threads(clients)
+        seconds = time.perf_counter() - start
+    return LoadTestResult(
+        clients=clients,
+        seconds=seconds,
+        latencies={
+            name: np.array(latencies, dtype=np.float64)
+            for name, latencies in state.latencies.items()
+        },
+        errors=state.errors,
+        peak_memory=peak[0],
+    )
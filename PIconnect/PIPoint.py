@@ -1,9 +1,12 @@
 """PIPoint."""
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 import PIconnect._typing.AF as _AFtyping
-from PIconnect import AF, PIData, _time
+from PIconnect import AF, PIData, _collective, _time
+
+_Result = TypeVar("_Result")
 
 
 class PIPoint(PIData.PISeriesContainer):
@@ -48,7 +51,7 @@ class PIPoint(PIData.PISeriesContainer):
     @property
     def last_update(self):
         """Return the time at which the last value for this PI Point was recorded."""
-        return _time.timestamp_to_index(self.pi_point.CurrentValue().Timestamp.UtcTime)
+        return _time.timestamp_to_index(self._reader.CurrentValue().Timestamp.UtcTime)
 
     @property
     def name(self) -> str:
@@ -67,15 +70,48 @@ class PIPoint(PIData.PISeriesContainer):
         return self.raw_attributes["engunits"]
 
     def __load_attributes(self) -> None:
-        """Load the raw attributes of the PI Point from the server."""
+        """Load the raw attributes of the PI Point from the server, once."""
         if not self.__attributes_loaded:
             self.pi_point.LoadAttributes([])
             self.__attributes_loaded = True
-        self.__raw_attributes = {att.Key: att.Value for att in self.pi_point.GetAttributes([])}
+            self.__raw_attributes = {
+                att.Key: att.Value for att in self.pi_point.GetAttributes([])
+            }
+
+    def _server(self) -> tuple[str, str]:
+        return ("PI", self.pi_point.Server.Name)
+
+    def _call(self, method: Callable[..., _Result], *args: Any, retry: bool = True) -> _Result:
+        """Call the SDK, hedging reads if configured for the collective of the server."""
+        collective = _collective.lookup(self.pi_point.Server)
+        if retry and collective is not None and collective.hedge_percentile is not None:
+            return collective.hedged(method, *args)
+        return super()._call(method, *args, retry=retry)
+
+    @property
+    def _reader(self) -> AF.PI.PIPoint:
+        """SDK point to read from, which may be on another member of the collective."""
+        return _collective.resolve(self.pi_point)
+
+    def _value_type(self) -> str | None:
+        point_type = self.raw_attributes.get("pointtype")
+        return None if point_type is None else str(point_type)
+
+    def _state_set(self) -> PIData.DigitalStateSet | None:
+        """Return the digital state set of the point, cached per server."""
+        if self._value_type() != "Digital":
+            return None
+        name = self.raw_attributes.get("digitalset")
+        if not name:
+            return None
+        server = self.pi_point.Server
+        return PIData._cached_state_set(
+            (server.Name, str(name)), lambda: server.StateSets.get_Item(str(name))
+        )
 
     def _current_value(self) -> Any:
         """Return the last recorded value for this PI Point (internal use only)."""
-        return self.pi_point.CurrentValue().Value
+        return self._reader.CurrentValue().Value
 
     def _filtered_summaries(
         self,
@@ -88,7 +124,7 @@ class PIPoint(PIData.PISeriesContainer):
         filter_interval: AF.Time.AFTimeSpan,
         time_type: AF.Data.AFTimestampCalculation,
     ) -> _AFtyping.Data.SummariesDict:
-        return self.pi_point.FilteredSummaries(
+        return self._reader.FilteredSummaries(
             time_range,
             interval,
             filter_expression,
@@ -101,36 +137,41 @@ class PIPoint(PIData.PISeriesContainer):
 
     def _interpolated_value(self, time: AF.Time.AFTime) -> AF.Asset.AFValue:
         """Return a single value for this PI Point."""
-        return self.pi_point.InterpolatedValue(time)
+        return self._reader.InterpolatedValue(time)
 
     def _interpolated_values(
         self,
         time_range: AF.Time.AFTimeRange,
         interval: AF.Time.AFTimeSpan,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
-        include_filtered_values = False
-        return self.pi_point.InterpolatedValues(
+        return self._reader.InterpolatedValues(
             time_range, interval, filter_expression, include_filtered_values
         )
 
     def _normalize_filter_expression(self, filter_expression: str) -> str:
         return filter_expression.replace("%tag%", self.tag)
 
+    def _plot_values(
+        self, time_range: AF.Time.AFTimeRange, intervals: int
+    ) -> AF.Asset.AFValues:
+        return self._reader.PlotValues(time_range, intervals)
+
     def _recorded_value(
         self, time: AF.Time.AFTime, retrieval_mode: AF.Data.AFRetrievalMode
     ) -> AF.Asset.AFValue:
         """Return a single recorded value for this PI Point."""
-        return self.pi_point.RecordedValue(time, AF.Data.AFRetrievalMode(int(retrieval_mode)))
+        return self._reader.RecordedValue(time, AF.Data.AFRetrievalMode(int(retrieval_mode)))
 
     def _recorded_values(
         self,
         time_range: AF.Time.AFTimeRange,
         boundary_type: AF.Data.AFBoundaryType,
         filter_expression: str,
+        include_filtered_values: bool,
     ) -> AF.Asset.AFValues:
-        include_filtered_values = False
-        return self.pi_point.RecordedValues(
+        return self._reader.RecordedValues(
             time_range, boundary_type, filter_expression, include_filtered_values
         )
 
@@ -141,7 +182,7 @@ class PIPoint(PIData.PISeriesContainer):
         calculation_basis: AF.Data.AFCalculationBasis,
         time_type: AF.Data.AFTimestampCalculation,
     ) -> _AFtyping.Data.SummaryDict:
-        return self.pi_point.Summary(time_range, summary_types, calculation_basis, time_type)
+        return self._reader.Summary(time_range, summary_types, calculation_basis, time_type)
 
     def _summaries(
         self,
@@ -151,7 +192,7 @@ class PIPoint(PIData.PISeriesContainer):
         calculation_basis: AF.Data.AFCalculationBasis,
         time_type: AF.Data.AFTimestampCalculation,
     ) -> _AFtyping.Data.SummariesDict:
-        return self.pi_point.Summaries(
+        return self._reader.Summaries(
             time_range, interval, summary_types, calculation_basis, time_type
         )
 
@@ -162,3 +203,11 @@ class PIPoint(PIData.PISeriesContainer):
         buffer_mode: AF.Data.AFBufferOption,
     ) -> None:
         return self.pi_point.UpdateValue(value, update_mode, buffer_mode)
+
+    def _update_values(
+        self,
+        values: AF.Asset.AFValues,
+        update_mode: AF.Data.AFUpdateOption,
+        buffer_mode: AF.Data.AFBufferOption,
+    ) -> Any:
+        return self.pi_point.UpdateValues(values, update_mode, buffer_mode)
@@ -0,0 +1,827 @@
+"""PIReplay - Record responses of PI and PI AF servers, and replay them without a server.
+
+A :class:`Recorder` records the reads of PI Points and PI AF Attributes, the
+searches for PI Points and the elements of PI AF databases that are visited,
+on a machine with access to the servers. The recording is written to a
+compressed file, from which a :class:`Replay` serves the same responses
+without the PI AF SDK, so recorded workloads can be profiled and benchmarked
+on any machine.
+
+Only the responses to the reads are replayed, a read that was not recorded
+raises a :class:`ReplayError`.
+"""
+
+import collections
+import contextlib
+import datetime
+import functools
+import gzip
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import PIconnect.PIAFAttribute as PIAFAttribute
+import PIconnect.PIAFBase as PIAFBase
+import PIconnect.PIPoint as PIPoint
+from PIconnect import AF, PI, PIAF, PIData, PISimulator, _time
+from PIconnect._typing import AF as _mock_AF
+from PIconnect._typing import _values
+from PIconnect._typing import dotnet as _mock_System
+
+__all__ = ["Recorder", "Replay", "ReplayError", "record"]
+
+#: Version of the format of the recordings.
+FORMAT_VERSION = 1
+
+#: Read hooks of the data containers that are recorded, with the kind of their result.
+HOOKS = {
+    "_current_value": "raw",
+    "_filtered_summaries": "summaries",
+    "_interpolated_value": "value",
+    "_interpolated_values": "values",
+    "_plot_values": "values",
+    "_recorded_value": "value",
+    "_recorded_values": "values",
+    "_summaries": "summaries",
+    "_summary": "summary",
+}
+
+_recorder: "Recorder | None" = None
+_recorder_lock = threading.Lock()
+
+
+class ReplayError(LookupError):
+    """Raised when a replayed read was not recorded."""
+
+
+def _now() -> int:
+    """Return the current time of the servers in UTC ticks, as parsed by the SDK."""
+    try:
+        return int(AF.Time.AFTime("*").UtcTime.Ticks)
+    except AttributeError:
+        return _time._datetime_to_ticks(datetime.datetime.now(datetime.timezone.utc))
+
+
+def _element_path(element: Any) -> str:
+    names = []
+    while element is not None:
+        names.append(str(element.Name))
+        element = element.Parent
+    return "\\".join(reversed(names))
+
+
+def _attribute_path(attribute: Any) -> str:
+    names = []
+    while attribute is not None:
+        names.append(str(attribute.Name))
+        attribute = attribute.Parent
+    return "|".join(reversed(names))
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a value of the SDK as a JSON value."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "Ticks"):
+        return {"ticks": int(value.Ticks)}
+    if hasattr(value, "UtcTime"):
+        return {"ticks": int(value.UtcTime.Ticks)}
+    if hasattr(value, "Name") and hasattr(value, "Value"):
+        return {"state": str(value.Name), "code": int(value.Value)}
+    return str(value)
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if "ticks" in value:
+        return _mock_System.DateTime(value["ticks"], _mock_System.DateTimeKind.Utc)
+    return _values.AFEnumerationValue(value["state"], value["code"])
+
+
+def _encode_values(values: Iterable[Any]) -> dict[str, list[Any]]:
+    """Encode SDK values as columns, the status is omitted if all values are good."""
+    ticks, encoded, status = [], [], []
+    for value in values:
+        ticks.append(int(value.Timestamp.UtcTime.Ticks))
+        encoded.append(_encode_value(value.Value))
+        status.append(PIData._value_status(value))
+    columns = {"ticks": ticks, "values": encoded}
+    if any(status):
+        columns["status"] = status
+    return columns
+
+
+def _decode_values(columns: dict[str, list[Any]]) -> _values.AFValues:
+    values = _values.AFValues()
+    status = columns.get("status") or [0] * len(columns["ticks"])
+    for ticks, value, flags in zip(columns["ticks"], columns["values"], status, strict=True):
+        timestamp = _mock_AF.Time.AFTime(
+            _mock_System.DateTime(ticks, _mock_System.DateTimeKind.Utc)
+        )
+        af_value = _values.AFValue(_decode_value(value), timestamp)
+        if flags:
+            af_value.IsGood = not flags & 1
+            af_value.Questionable = bool(flags & 2)
+            af_value.Substituted = bool(flags & 4)
+            af_value.Annotated = bool(flags & 8)
+        values.Add(af_value)
+    return values
+
+
+def _encode_result(kind: str, result: Any) -> Any:
+    if kind == "raw":
+        return _encode_value(result)
+    if kind == "value":
+        return _encode_values([result])
+    if kind == "values":
+        return _encode_values(result)
+    if kind == "summary":
+        return [[int(item.Key), _encode_values([item.Value])] for item in result]
+    return [[int(item.Key), _encode_values(item.Value)] for item in result]
+
+
+def _decode_result(kind: str, result: Any) -> Any:
+    if kind == "raw":
+        return _decode_value(result)
+    if kind == "value":
+        return _decode_values(result)[0]
+    if kind == "values":
+        return _decode_values(result)
+    decoded = [
+        (_mock_AF.Data.AFSummaryTypes(key), _decode_values(values)) for key, values in result
+    ]
+    if kind == "summary":
+        return _mock_AF.Data.SummaryDict([(key, values[0]) for key, values in decoded])
+    return _mock_AF.Data.SummariesDict(decoded)
+
+
+def _encode_argument(argument: Any) -> Any:
+    """Encode an argument of a read, times in UTC ticks and enumerations as integers.
+
+    Intervals are encoded by their length in ticks if it is fixed, so an
+    interval parsed by the SDK matches the same interval parsed by the mocks.
+    """
+    if argument is None or isinstance(argument, (bool, str, float)):
+        return argument
+    type_name = type(argument).__name__
+    if type_name == "AFTimeRange":
+        return {
+            "range": [
+                int(argument.StartTime.UtcTime.Ticks),
+                int(argument.EndTime.UtcTime.Ticks),
+            ]
+        }
+    if type_name == "AFTime":
+        return {"time": int(argument.UtcTime.Ticks)}
+    if type_name == "AFTimeSpan":
+        expression = str(argument)
+        try:
+            return {"span": _time.length_to_ticks(expression.lstrip("+"))}
+        except (ValueError, ImportError):
+            return {"span": expression}
+    try:
+        return int(argument)
+    except (TypeError, ValueError):
+        return str(argument)
+
+
+def _split_times(arguments: list[Any]) -> tuple[list[int], str]:
+    """Split encoded arguments in their times and a key of the other arguments."""
+    times: list[int] = []
+    rest: list[Any] = []
+    for argument in arguments:
+        if isinstance(argument, dict) and "range" in argument:
+            times.extend(argument["range"])
+            rest.append("range")
+        elif isinstance(argument, dict) and "time" in argument:
+            times.append(argument["time"])
+            rest.append("time")
+        else:
+            rest.append(argument)
+    return times, json.dumps(rest)
+
+
+def _states(enumeration_set: Any) -> list[Any]:
+    return [str(enumeration_set.Name), [[str(s.Name), int(s.Value)] for s in enumeration_set]]
+
+
+class Recorder:
+    """Recording of the reads, searches and visited PI AF elements within a block.
+
+    While the recorder is active, the responses to the reads of all PI Points
+    and PI AF Attributes are recorded, from all threads, together with the
+    points found by :meth:`PIServer.search <PIconnect.PIServer.search>`, the
+    elements of PI AF databases that are visited and the attributes whose
+    values are read. The recording is written to `path` at the end of the
+    block, see :func:`record`.
+
+    Recording adds calls to the server, to load the point attributes of the
+    points found and the attributes of the elements visited.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = path
+        self.data: dict[str, Any] = {
+            "version": FORMAT_VERSION,
+            "now": 0,
+            "pi": {},
+            "af": {},
+            "calls": [],
+        }
+        self._lock = threading.RLock()
+        self._database: tuple[str, str] | None = None
+        self._patches: list[tuple[Any, str, Any]] = []
+
+    def __enter__(self) -> "Recorder":
+        """Start recording the reads of all threads."""
+        global _recorder
+        with _recorder_lock:
+            if _recorder is not None:
+                raise RuntimeError("Another recording is already active")
+            _recorder = self
+        self.data["now"] = _now()
+        for container in (PIPoint.PIPoint, PIAFAttribute.PIAFAttribute):
+            for hook in HOOKS:
+                self._patch(container, hook, _recorded_hook(hook, getattr(container, hook)))
+        self._patch(PI.PIServer, "search", _recorded_search(PI.PIServer.search))
+        self._patch(
+            PIAF.PIAFDatabase, "__init__", _recorded_database(PIAF.PIAFDatabase.__init__)
+        )
+        self._patch(
+            PIAF.PIAFDatabase,
+            "template_elements",
+            _recorded_template(PIAF.PIAFDatabase.template_elements),
+        )
+        base = PIAFBase.PIAFBaseElement
+        self._patch(base, "__init__", _recorded_element(base.__init__))
+        self._patch(base, "attributes", property(_recorded_attributes(base.attributes.fget)))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop recording and write the recording to `path`, if given."""
+        global _recorder
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches = []
+        with _recorder_lock:
+            _recorder = None
+        if self.path is not None:
+            self.save(self.path)
+
+    def _patch(self, owner: Any, name: str, replacement: Any) -> None:
+        self._patches.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, replacement)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the recording to a gzip compressed JSON file."""
+        with self._lock, gzip.open(path, "wt", encoding="utf-8") as file:
+            json.dump(self.data, file, separators=(",", ":"))
+
+    @property
+    def calls(self) -> int:
+        """Return the number of reads recorded."""
+        return len(self.data["calls"])
+
+    def _server(self, name: str) -> dict[str, Any]:
+        return self.data["pi"].setdefault(
+            name, {"points": {}, "state_sets": {}, "searches": []}
+        )
+
+    def _database_data(self, system: str, database: str) -> dict[str, Any]:
+        databases = self.data["af"].setdefault(system, {})
+        return databases.setdefault(database, {"elements": {}, "templates": {}})
+
+    def add_point(self, point: PIPoint.PIPoint) -> list[str]:
+        """Record the point attributes of a PI Point, and return its source."""
+        server_name = str(point.pi_point.Server.Name)
+        source = ["PI", server_name, point.tag]
+        with self._lock:
+            server = self._server(server_name)
+            if point.tag in server["points"]:
+                return source
+        attributes = {
+            str(key): _encode_value(value) for key, value in point.raw_attributes.items()
+        }
+        state_set = point._state_set()
+        with self._lock:
+            server["points"][point.tag] = attributes
+            if state_set is not None:
+                server["state_sets"][state_set.name] = _states(state_set.enumeration_set)[1]
+        return source
+
+    def add_search(
+        self,
+        server: PI.PIServer,
+        query: str,
+        source: str | None,
+        points: list[PIPoint.PIPoint],
+    ) -> None:
+        """Record the PI Points found by a search."""
+        for point in points:
+            self.add_point(point)
+        with self._lock:
+            self._server(server.server_name)["searches"].append(
+                [query, source, [point.tag for point in points]]
+            )
+
+    def _element_database(self, element: Any) -> tuple[str, str]:
+        database = getattr(element, "Database", None)
+        if database is not None:
+            return str(database.PISystem.Name), str(database.Name)
+        return self._database or ("", "")
+
+    def add_element(self, element: Any) -> dict[str, Any]:
+        """Record an element of a PI AF database, and return its recorded data."""
+        system, database = self._element_database(element)
+        path = _element_path(element)
+        with self._lock:
+            elements = self._database_data(system, database)["elements"]
+            if path not in elements:
+                elements[path] = {"description": str(element.Description), "attributes": {}}
+            return elements[path]
+
+    def add_attribute(self, element: Any, attribute: Any) -> list[str]:
+        """Record an attribute of an element, and return its source."""
+        system, database = self._element_database(element)
+        path = _attribute_path(attribute)
+        source = ["AF", system, database, f"{_element_path(element)}|{path}"]
+        recorded = self.add_element(element)
+        with self._lock:
+            if path in recorded["attributes"]:
+                return source
+        type_name = None if attribute.Type is None else str(attribute.Type.Name)
+        qualifier = attribute.TypeQualifier
+        plug_in = attribute.DataReferencePlugIn
+        pi_point = None
+        if plug_in is not None and str(plug_in.Name) == "PI Point":
+            point = attribute.DataReference.PIPoint
+            if point is not None:
+                pi_point = [str(point.Server.Name), str(point.Name)]
+        data = {
+            "description": str(attribute.Description),
+            "type": type_name,
+            "uom": None if attribute.DefaultUOM is None else str(attribute.DefaultUOM),
+            "states": (
+                _states(qualifier)
+                if type_name == "AFEnumerationValue" and qualifier is not None
+                else None
+            ),
+            "data_reference": None if plug_in is None else str(plug_in.Name),
+            "point": pi_point,
+        }
+        with self._lock:
+            recorded["attributes"][path] = data
+        return source
+
+    def add_template(
+        self, database: PIAF.PIAFDatabase, template: str, elements: list[Any]
+    ) -> None:
+        """Record the elements based on an element template."""
+        paths = [_element_path(element.element) for element in elements]
+        with self._lock:
+            templates = self._database_data(database.server_name, database.database_name)[
+                "templates"
+            ]
+            templates[template] = paths
+
+    def add_call(
+        self, source: list[str], hook: str, args: tuple[Any, ...], result: Any
+    ) -> None:
+        """Record the response to a read."""
+        call = [source, hook, [_encode_argument(argument) for argument in args]]
+        call.append(_encode_result(HOOKS[hook], result))
+        with self._lock:
+            self.data["calls"].append(call)
+
+
+def record(path: str | os.PathLike[str] | None = None) -> Recorder:
+    """Record the responses of the PI and PI AF servers within a `with` block.
+
+    Parameters
+    ----------
+        path (str or path, optional): Defaults to None. File to write the
+            recording to at the end of the block, as gzip compressed JSON, such
+            as `'workload.json.gz'`. If None, the recording is kept in
+            :attr:`Recorder.data` only.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with PIReplay.record("workload.json.gz"), PI.PIServer() as server:
+            points = server.search("SINUSOID*")
+            data = [point.recorded_values("*-1d", "*") for point in points]
+    """
+    return Recorder(path)
+
+
+def _recorded_hook(hook: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: PIData.PISeriesContainer, *args: Any) -> Any:
+        result = method(self, *args)
+        recorder = _recorder
+        if recorder is not None:
+            if isinstance(self, PIPoint.PIPoint):
+                source = recorder.add_point(self)
+            else:
+                source = recorder.add_attribute(self.element, self.attribute)
+            recorder.add_call(source, hook, args, result)
+        return result
+
+    return wrapper
+
+
+def _recorded_search(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(
+        self: PI.PIServer, query: Any, source: str | None = None, **kwargs: Any
+    ) -> Any:
+        points = method(self, query, source, **kwargs)
+        recorder = _recorder
+        if recorder is not None and not isinstance(query, list):
+            recorder.add_search(self, str(query), source, points)
+        return points
+
+    return wrapper
+
+
+def _recorded_database(method: Callable[..., None]) -> Callable[..., None]:
+    @functools.wraps(method)
+    def wrapper(self: PIAF.PIAFDatabase, *args: Any, **kwargs: Any) -> None:
+        method(self, *args, **kwargs)
+        recorder = _recorder
+        if recorder is not None:
+            with recorder._lock:
+                recorder._database = (self.server_name, self.database_name)
+                recorder._database_data(self.server_name, self.database_name)
+
+    return wrapper
+
+
+def _recorded_template(method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: PIAF.PIAFDatabase, template: str, *args: Any, **kwargs: Any) -> Any:
+        elements = method(self, template, *args, **kwargs)
+        recorder = _recorder
+        if recorder is not None:
+            recorder.add_template(self, template, elements)
+        return elements
+
+    return wrapper
+
+
+def _recorded_element(method: Callable[..., None]) -> Callable[..., None]:
+    @functools.wraps(method)
+    def wrapper(self: PIAFBase.PIAFBaseElement[Any], element: Any) -> None:
+        method(self, element)
+        recorder = _recorder
+        if recorder is not None and isinstance(self, PIAF.PIAFElement) and element is not None:
+            recorder.add_element(element)
+
+    return wrapper
+
+
+def _recorded_attributes(getter: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(getter)
+    def wrapper(self: PIAFBase.PIAFBaseElement[Any]) -> Any:
+        attributes = getter(self)
+        recorder = _recorder
+        if recorder is not None and isinstance(self, PIAF.PIAFElement):
+            for attribute in attributes.values():
+                recorder.add_attribute(self.element, attribute.attribute)
+        return attributes
+
+    return wrapper
+
+
+class ReplayPIPoint(_mock_AF.PI.PIPoint):
+    """PI Point of a replayed server, serving the recorded responses of its reads."""
+
+    def __init__(
+        self, server: "ReplayPIServer", name: str, attributes: dict[str, Any]
+    ) -> None:
+        self.Name = name
+        self.Server = server
+        self._source = ["PI", server.Name, name]
+        self._attributes = attributes
+
+    def _response(self, hook: str, *args: Any) -> Any:
+        return self.Server._replay.response(self._source, hook, args)
+
+    def CurrentValue(self) -> _values.AFValue:  # type: ignore[override]
+        """Return the recorded current value, at the time of the recording."""
+        return self.Server._replay.current_value(self._source)
+
+    def GetAttributes(self, names: list[str], /) -> Any:  # type: ignore[override]
+        """Return the recorded point attributes."""
+        return _mock_AF.PI.Generic.PropertyDict(
+            [(key, _decode_value(value)) for key, value in self._attributes.items()]
+        )
+
+    def LoadAttributes(self, params: list[str], /) -> None:  # type: ignore[override]
+        """Do nothing, the point attributes are recorded."""
+
+    def InterpolatedValue(self, time: Any, /) -> Any:  # type: ignore[override]
+        """Return the recorded interpolated value."""
+        return self._response("_interpolated_value", time)
+
+    def InterpolatedValues(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded interpolated values."""
+        return self._response("_interpolated_values", *args)
+
+    def PlotValues(self, time_range: Any, intervals: int, /) -> Any:  # type: ignore[override]
+        """Return the recorded values for plotting."""
+        return self._response("_plot_values", time_range, intervals)
+
+    def RecordedValue(self, time: Any, retrieval_mode: Any, /) -> Any:  # type: ignore[override]
+        """Return the recorded single value."""
+        return self._response("_recorded_value", time, retrieval_mode)
+
+    def RecordedValues(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded values, a `max_count` must be the default."""
+        return self._response("_recorded_values", *args[:4])
+
+    def FilteredSummaries(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded filtered summaries."""
+        return self._response("_filtered_summaries", *args)
+
+    def Summaries(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded summaries."""
+        return self._response("_summaries", *args)
+
+    def Summary(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded summary."""
+        return self._response("_summary", *args)
+
+
+class ReplayPIServer(_mock_AF.PI.PIServer):
+    """PI Data Archive of a replay, with the recorded points and searches."""
+
+    def __init__(self, replay: "Replay", name: str, data: dict[str, Any]) -> None:
+        super().__init__(name)
+        self._replay = replay
+        self.RpcMetrics = []
+        state_sets = []
+        for set_name, states in data["state_sets"].items():
+            state_set = _values.AFEnumerationSet(set_name, [])
+            state_set._values = [_values.AFEnumerationValue(n, code) for n, code in states]
+            state_sets.append(state_set)
+        self.StateSets = _mock_AF.PI.PIStateSets(state_sets)
+        self._points = {  # type: ignore[assignment]
+            name: ReplayPIPoint(self, name, attributes)
+            for name, attributes in data["points"].items()
+        }
+        self._searches = {(query, source): tags for query, source, tags in data["searches"]}
+
+
+class ReplayAFData(_mock_AF.Data.AFData):
+    """Data methods of a replayed attribute, serving the recorded responses."""
+
+    def __init__(self, replay: "Replay", source: list[str]) -> None:
+        self._replay = replay
+        self._source = source
+
+    def _response(self, hook: str, *args: Any) -> Any:
+        return self._replay.response(self._source, hook, args)
+
+    def FilteredSummaries(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded filtered summaries."""
+        return self._response("_filtered_summaries", *args)
+
+    def InterpolatedValue(self, time: Any, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return the recorded interpolated value."""
+        return self._response("_interpolated_value", time)
+
+    def InterpolatedValues(  # type: ignore[override]
+        self, time_range: Any, interval: Any, uom: Any, *args: Any
+    ) -> Any:
+        """Return the recorded interpolated values."""
+        return self._response("_interpolated_values", time_range, interval, *args)
+
+    def PlotValues(self, time_range: Any, intervals: int, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return the recorded values for plotting."""
+        return self._response("_plot_values", time_range, intervals)
+
+    def RecordedValue(self, time: Any, retrieval_mode: Any, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return the recorded single value."""
+        return self._response("_recorded_value", time, retrieval_mode)
+
+    def RecordedValues(  # type: ignore[override]
+        self, time_range: Any, boundary_type: Any, uom: Any, *args: Any
+    ) -> Any:
+        """Return the recorded values."""
+        return self._response("_recorded_values", time_range, boundary_type, *args)
+
+    def Summaries(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded summaries."""
+        return self._response("_summaries", *args)
+
+    def Summary(self, *args: Any) -> Any:  # type: ignore[override]
+        """Return the recorded summary."""
+        return self._response("_summary", *args)
+
+
+class ReplayAFAttribute(_mock_AF.Asset.AFAttribute):
+    """Attribute of a replayed element, with the recorded properties."""
+
+    def __init__(
+        self,
+        replay: "Replay",
+        system: "ReplayPISystem",
+        source: list[str],
+        data: dict[str, Any],
+        parent: "ReplayAFAttribute | None" = None,
+    ) -> None:
+        self.Attributes = _mock_AF.Asset.AFAttributes([])
+        self.Data = ReplayAFData(replay, source)
+        self.DataReferencePlugIn = (
+            None
+            if data["data_reference"] is None
+            else _mock_AF.AFPlugIn(data["data_reference"])
+        )
+        point = None
+        if data["point"] is not None:
+            server = replay.pi_servers.get(data["point"][0])
+            point = None if server is None else server._points.get(data["point"][1])
+        self.DataReference = _mock_AF.Asset.AFDataReference(
+            data["data_reference"] or "", self, point
+        )
+        self.DefaultUOM = data["uom"]
+        self.Description = data["description"]
+        self.Element: PISimulator.SimulatedAFElement | None = None
+        self.Name = source[-1].rsplit("|", 1)[-1]
+        self.Parent = parent
+        self.Type = None if data["type"] is None else _mock_System.Type(data["type"])
+        self.TypeQualifier = None
+        if data["states"] is not None:
+            set_name, states = data["states"]
+            self.TypeQualifier = _values.AFEnumerationSet(set_name, [])
+            self.TypeQualifier._values = [
+                _values.AFEnumerationValue(name, code) for name, code in states
+            ]
+        self._system = system
+
+    @property
+    def PISystem(self) -> "ReplayPISystem":  # type: ignore[override]
+        """Return the replayed PI AF server of the attribute."""
+        return self._system
+
+    def GetValue(self, time: Any = None, /) -> _values.AFValue:  # type: ignore[override]
+        """Return the recorded current value, at the time of the recording."""
+        return self.Data._replay.current_value(self.Data._source)
+
+
+class ReplayPISystem(_mock_AF.PISystem):
+    """PI AF server of a replay, with the recorded databases and elements."""
+
+    def __init__(self, replay: "Replay", name: str, data: dict[str, Any]) -> None:
+        super().__init__(name)
+        self.Databases = PISimulator._SimulatedDatabases()  # type: ignore[assignment]
+        for database_name, database in data.items():
+            self.Databases.append(self._database(replay, database_name, database))
+
+    def _database(
+        self, replay: "Replay", name: str, data: dict[str, Any]
+    ) -> PISimulator.SimulatedAFDatabase:
+        elements: dict[str, PISimulator.SimulatedAFElement] = {}
+        roots: list[PISimulator.SimulatedAFElement] = []
+
+        def element(path: str) -> PISimulator.SimulatedAFElement:
+            if path not in elements:
+                parent_path, _, element_name = path.rpartition("\\")
+                parent = element(parent_path) if parent_path else None
+                elements[path] = PISimulator.SimulatedAFElement(element_name, parent)
+                siblings = roots if parent is None else parent.Elements._values
+                siblings.append(elements[path])
+            return elements[path]
+
+        for path, recorded in sorted(data["elements"].items()):
+            af_element = element(path)
+            af_element.Description = recorded["description"]
+            attributes: dict[str, ReplayAFAttribute] = {}
+            for attribute_path, attribute in sorted(recorded["attributes"].items()):
+                parent_path = attribute_path.rpartition("|")[0]
+                parent = attributes.get(parent_path)
+                source = ["AF", self.Name, name, f"{path}|{attribute_path}"]
+                attributes[attribute_path] = child = ReplayAFAttribute(
+                    replay, self, source, attribute, parent
+                )
+                child.Element = af_element
+                siblings = af_element.Attributes if parent is None else parent.Attributes
+                siblings._values.append(child)
+        templates = [
+            _mock_AF.Asset.AFElementTemplate(template, [element(path) for path in paths])
+            for template, paths in data["templates"].items()
+        ]
+        return PISimulator.SimulatedAFDatabase(name, roots, templates)
+
+
+class Replay:
+    """Replay of a recording, serving the recorded responses without the PI AF SDK.
+
+    Relative times, such as `'*-1d'`, are relative to the start of the
+    recording. A read is answered by the recorded read of the same point or
+    attribute with the same arguments, whose times differ by at most
+    `tolerance`, so reads with relative times that were evaluated slightly
+    later during recording are matched too.
+
+    Parameters
+    ----------
+        recording (str, path or dict): Recording file written by
+            :func:`record`, or the :attr:`Recorder.data` of a recording.
+        tolerance (str or timedelta, optional): Defaults to `'1m'`. Maximum
+            difference between the times of a read and the recorded read.
+
+    Example
+    -------
+    .. code-block:: python
+
+        replay = PIReplay.Replay("workload.json.gz")
+        with replay.install(), PI.profile() as profile, PI.PIServer() as server:
+            points = server.search("SINUSOID*")
+            data = [point.recorded_values("*-1d", "*") for point in points]
+        print(profile.report())
+    """
+
+    def __init__(
+        self,
+        recording: str | os.PathLike[str] | dict[str, Any],
+        tolerance: str | datetime.timedelta = "1m",
+    ) -> None:
+        if not isinstance(recording, dict):
+            with gzip.open(recording, "rt", encoding="utf-8") as file:
+                recording = json.load(file)
+        if recording.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording format {recording.get('version')!r}")
+        self.now: int = recording["now"]
+        self.tolerance = _time.length_to_ticks(tolerance)
+        #: Number of replayed reads per hook.
+        self.calls: collections.Counter[str] = collections.Counter()
+        #: Number of reads per hook that were not recorded.
+        self.misses: collections.Counter[str] = collections.Counter()
+        self._lock = threading.Lock()
+        self._responses: dict[str, list[tuple[list[int], str, Any]]] = {}
+        for source, hook, args, result in recording["calls"]:
+            times, rest = _split_times(args)
+            key = json.dumps([source, hook, rest])
+            self._responses.setdefault(key, []).append((times, hook, result))
+        self.pi_servers = {
+            name: ReplayPIServer(self, name, data) for name, data in recording["pi"].items()
+        }
+        self.af_servers = {
+            name: ReplayPISystem(self, name, data) for name, data in recording["af"].items()
+        }
+
+    def response(self, source: list[str], hook: str, args: tuple[Any, ...]) -> Any:
+        """Return the recorded response to a read.
+
+        Raises
+        ------
+            ReplayError: If the read was not recorded.
+        """
+        encoded = [_encode_argument(argument) for argument in args]
+        times, rest = _split_times(encoded)
+        candidates = self._responses.get(json.dumps([source, hook, rest]), [])
+        distances = [
+            max((abs(a - b) for a, b in zip(times, recorded, strict=True)), default=0)
+            for recorded, _, _ in candidates
+        ]
+        if not distances or min(distances) > self.tolerance:
+            with self._lock:
+                self.misses[hook] += 1
+            raise ReplayError(f"No recorded response to {hook}{tuple(encoded)} of {source}")
+        with self._lock:
+            self.calls[hook] += 1
+        _, _, result = candidates[distances.index(min(distances))]
+        return _decode_result(HOOKS[hook], result)
+
+    def current_value(self, source: list[str]) -> _values.AFValue:
+        """Return the recorded current value, the timestamp is the time of the recording."""
+        timestamp = _mock_AF.Time.AFTime(
+            _mock_System.DateTime(self.now, _mock_System.DateTimeKind.Utc)
+        )
+        return _values.AFValue(self.response(source, "_current_value", ()), timestamp)
+
+    @contextlib.contextmanager
+    def install(self, default: bool = True) -> Iterator["Replay"]:
+        """Make the recorded servers available to PIconnect within a block.
+
+        Parameters
+        ----------
+            default (bool, optional): Defaults to True. Also make the first
+                recorded servers the default servers.
+
+        Raises
+        ------
+            RuntimeError: If PIconnect uses the actual PI AF SDK.
+        """
+        with PISimulator._install(
+            list(self.pi_servers.values()),
+            list(self.af_servers.values()),
+            functools.partial(PISimulator._parse_time, now=self.now),
+            default,
+        ):
+            yield self
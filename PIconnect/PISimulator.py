@@ -0,0 +1,1216 @@
+"""PISimulator - Simulated PI Data Archive and PI AF servers for offline load tests.
+
+Without the PI AF SDK, PIconnect runs against the mock classes of
+:mod:`PIconnect._typing`, which return empty or static data. A
+:class:`Simulator` replaces these with servers that behave like a real PI
+Data Archive and PI AF server: each tag has a deterministic synthetic archive
+with a configurable event rate, PI AF databases hold hierarchies of elements
+of configurable size, and every call to the server takes a configurable
+latency, fails at a configurable rate and is subject to an `ArcMaxCollect`
+style limit on the number of values returned. The parallel, chunked and bulk
+reads of PIconnect can thus be load-tested on any platform.
+
+The archives are a function of the time only, so the same read always
+returns the same values, regardless of the current time or the order of the
+reads.
+"""
+
+import collections
+import contextlib
+import dataclasses
+import datetime
+import hashlib
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+import numpy as np
+
+from PIconnect import AF, PI, PIAF, _admission, _time
+from PIconnect._typing import AF as _mock_AF
+from PIconnect._typing import Time as _mock_Time
+from PIconnect._typing import _values
+from PIconnect._typing import dotnet as _mock_System
+
+__all__ = [
+    "PIConnectionException",
+    "PIException",
+    "SimulatedPIPoint",
+    "Simulator",
+    "TagSpec",
+]
+
+_DAY_TICKS = _time.length_to_ticks("1d")
+_RELATIVE_TIME = re.compile(
+    r"^(?P<base>\*|today|t|yesterday|y)?\s*(?:(?P<sign>[+-])\s*(?P<length>\S.*))?$",
+    re.IGNORECASE,
+)
+#: Summary types that the simulator evaluates, in the order of the flags.
+_SUMMARY_TYPES = (
+    _mock_AF.Data.AFSummaryTypes.Total,
+    _mock_AF.Data.AFSummaryTypes.Average,
+    _mock_AF.Data.AFSummaryTypes.Minimum,
+    _mock_AF.Data.AFSummaryTypes.Maximum,
+    _mock_AF.Data.AFSummaryTypes.Range,
+    _mock_AF.Data.AFSummaryTypes.StdDev,
+    _mock_AF.Data.AFSummaryTypes.PopulationStdDev,
+    _mock_AF.Data.AFSummaryTypes.Count,
+    _mock_AF.Data.AFSummaryTypes.PercentGood,
+)
+#: .NET type of the attributes that reference a point of each point type.
+_ATTRIBUTE_TYPES = {
+    "Float32": "Single",
+    "Float64": "Double",
+    "Int32": "Int32",
+    "Digital": "AFEnumerationValue",
+}
+
+
+class PIException(Exception):
+    """Raised by the simulator when a read exceeds the `arc_max_collect` limit.
+
+    Named after the exception of the SDK, so it is handled as a permanent
+    error by the admission control.
+    """
+
+
+class PIConnectionException(ConnectionError):
+    """Failure injected by the simulator, handled as a transient error."""
+
+
+@dataclasses.dataclass(frozen=True)
+class TagSpec:
+    """Definition of the synthetic archive of a simulated tag.
+
+    The values follow a sine wave with random noise, digital tags switch
+    between the first two states of their digital set every half period.
+
+    Attributes
+    ----------
+        name (str): Name of the tag.
+        interval (str or timedelta): Defaults to `'1m'`. Average time between
+            two events, see :func:`~PIconnect._time.length_to_ticks`.
+        jitter (float): Defaults to 0. Fraction of the interval by which the
+            events are shifted randomly, between 0 and 1.
+        point_type (str): Defaults to `'Float64'`. One of `'Float32'`,
+            `'Float64'`, `'Int32'` or `'Digital'`.
+        amplitude (float): Defaults to 1. Amplitude of the sine wave.
+        period (str or timedelta): Defaults to `'1d'`. Period of the sine wave.
+        offset (float): Defaults to 0. Mean of the values.
+        noise (float): Defaults to 0.1. Maximum deviation from the sine wave.
+        units (str): Defaults to `''`. Engineering units of the tag.
+        digital_set (str): Defaults to `'Modes'`. Name of the digital state
+            set of a digital tag, on the simulated server.
+    """
+
+    name: str
+    interval: str | datetime.timedelta = "1m"
+    jitter: float = 0.0
+    point_type: str = "Float64"
+    amplitude: float = 1.0
+    period: str | datetime.timedelta = "1d"
+    offset: float = 0.0
+    noise: float = 0.1
+    units: str = ""
+    digital_set: str = "Modes"
+
+
+def _seed(*parts: object) -> int:
+    """Return a stable 63 bit seed of the parts, independent of the hash seed of Python."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+def _uniform(
+    seed: int, keys: "np.ndarray[Any, np.dtype[np.int64]]", stream: int
+) -> "np.ndarray[Any, np.dtype[np.float64]]":
+    """Return deterministic uniform numbers in [0, 1) for each key, using splitmix64."""
+    x = keys.astype(np.uint64) ^ np.uint64(seed) ^ np.uint64(stream << 56)
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) * 2.0**-53
+
+
+def _af_time(ticks: int) -> _mock_AF.Time.AFTime:
+    return _mock_AF.Time.AFTime(
+        _mock_System.DateTime(int(ticks), _mock_System.DateTimeKind.Utc)
+    )
+
+
+def _af_values(ticks: Iterable[int], values: Iterable[Any]) -> _mock_AF.Asset.AFValues:
+    result = _mock_AF.Asset.AFValues()
+    result.extend(
+        _mock_AF.Asset.AFValue(value, _af_time(tick))
+        for tick, value in zip(ticks, values, strict=True)
+    )
+    return result
+
+
+class _Archive:
+    """Deterministic synthetic archive of a single tag.
+
+    Event `k` is at `phase + k * interval`, shifted by up to `jitter` times
+    the interval, so the events in a time range are found without a search.
+    """
+
+    def __init__(
+        self,
+        spec: TagSpec,
+        seed: int,
+        states: list[_mock_AF.Asset.AFEnumerationValue] | None = None,
+    ) -> None:
+        self.spec = spec
+        self.interval = _time.length_to_ticks(spec.interval)
+        self.period = _time.length_to_ticks(spec.period)
+        if self.interval <= 0 or self.period <= 0:
+            raise ValueError(f"The interval and period of tag {spec.name!r} must be positive")
+        if not 0 <= spec.jitter < 1:
+            raise ValueError(f"The jitter of tag {spec.name!r} must be between 0 and 1")
+        self.seed = _seed(seed, spec.name)
+        self.phase = self.seed % self.interval
+        self.states = states or []
+
+    @property
+    def digital(self) -> bool:
+        return self.spec.point_type == "Digital"
+
+    def _index(self, ticks: int) -> int:
+        """Return the number of the event within whose interval `ticks` falls."""
+        return (ticks - self.phase) // self.interval
+
+    def times(self, keys: "np.ndarray[Any, np.dtype[np.int64]]") -> "np.ndarray[Any, Any]":
+        """Return the ticks of the events with the given numbers."""
+        shift = (self.spec.jitter * self.interval * _uniform(self.seed, keys, 1)).astype(
+            np.int64
+        )
+        return self.phase + keys * self.interval + shift
+
+    def raw(self, keys: Any, ticks: Any) -> "np.ndarray[Any, Any]":
+        """Return the values of the events as floats, or state codes for digital tags."""
+        phase = (np.asarray(ticks) % self.period) / self.period
+        wave = np.sin(2 * np.pi * phase)
+        if self.digital:
+            return (phase >= 0.5).astype(np.int64)
+        noise = self.spec.noise * (2 * _uniform(self.seed, np.asarray(keys), 2) - 1)
+        return self.spec.offset + self.spec.amplitude * wave + noise
+
+    def to_values(self, raw: "np.ndarray[Any, Any]") -> list[Any]:
+        """Convert raw values to the values returned by the SDK."""
+        if self.digital:
+            return [self.states[code % len(self.states)] for code in raw.tolist()]
+        if self.spec.point_type == "Int32":
+            return np.rint(raw).astype(np.int64).tolist()
+        return raw.tolist()
+
+    def estimate(self, start: int, end: int) -> int:
+        """Return an upper bound of the number of events in a time range."""
+        return max(0, self._index(end) - self._index(start) + 1)
+
+    def events(self, start: int, end: int) -> tuple[Any, Any]:
+        """Return the numbers and ticks of the events from `start` up to `end`, inclusive."""
+        keys = np.arange(self._index(start), self._index(end) + 1, dtype=np.int64)
+        ticks = self.times(keys)
+        keep = (ticks >= start) & (ticks <= end)
+        return keys[keep], ticks[keep]
+
+    def at_or_before(self, ticks: int) -> int:
+        """Return the number of the last event at or before `ticks`."""
+        key = self._index(ticks)
+        return key if int(self.times(np.array([key]))[0]) <= ticks else key - 1
+
+    def at_or_after(self, ticks: int) -> int:
+        """Return the number of the first event at or after `ticks`."""
+        key = self.at_or_before(ticks)
+        return key if int(self.times(np.array([key]))[0]) == ticks else key + 1
+
+    def event(self, key: int) -> _mock_AF.Asset.AFValue:
+        keys = np.array([key], dtype=np.int64)
+        ticks = self.times(keys)
+        return _af_values(ticks.tolist(), self.to_values(self.raw(keys, ticks)))[0]
+
+    def interpolate(self, ticks: "np.ndarray[Any, np.dtype[np.int64]]") -> list[Any]:
+        """Return the values at `ticks`, stepped for digital tags and linear otherwise."""
+        if not len(ticks):
+            return []
+        keys = (ticks - self.phase) // self.interval
+        before = self.times(keys)
+        keys = np.where(before > ticks, keys - 1, keys)
+        before = self.times(keys)
+        after = self.times(keys + 1)
+        low = self.raw(keys, before)
+        if self.digital:
+            return self.to_values(low)
+        high = self.raw(keys + 1, after)
+        fraction = (ticks - before) / (after - before)
+        return self.to_values(low + fraction * (high - low))
+
+
+def _range(time_range: _mock_AF.Time.AFTimeRange) -> tuple[int, int]:
+    return time_range.StartTime.UtcTime.Ticks, time_range.EndTime.UtcTime.Ticks
+
+
+def _interval(interval: _mock_AF.Time.AFTimeSpan) -> int:
+    if interval.expression is None:
+        raise ValueError("The simulator requires an interval")
+    ticks = _time.length_to_ticks(interval.expression)
+    if ticks <= 0:
+        raise ValueError(f"Interval {interval.expression!r} must be positive")
+    return ticks
+
+
+class _Reader:
+    """Reads of the archive of a simulated tag, shared by PI Points and AF Attributes."""
+
+    def __init__(self, archive: _Archive, simulator: "Simulator") -> None:
+        self.archive = archive
+        self.simulator = simulator
+
+    @property
+    def name(self) -> str:
+        return self.archive.spec.name
+
+    def current_value(self) -> _mock_AF.Asset.AFValue:
+        self.simulator.request("CurrentValue")
+        return self.archive.event(self.archive.at_or_before(self.simulator.now_ticks()))
+
+    def recorded_value(
+        self, af_time: _mock_AF.Time.AFTime, retrieval_mode: Any
+    ) -> _mock_AF.Asset.AFValue:
+        self.simulator.request("RecordedValue")
+        ticks = af_time.UtcTime.Ticks
+        mode = _mock_AF.Data.AFRetrievalMode(int(retrieval_mode))
+        if mode in (
+            _mock_AF.Data.AFRetrievalMode.AtOrAfter,
+            _mock_AF.Data.AFRetrievalMode.After,
+        ):
+            key = self.archive.at_or_after(
+                ticks + (mode == _mock_AF.Data.AFRetrievalMode.After)
+            )
+        else:
+            key = self.archive.at_or_before(
+                ticks - (mode == _mock_AF.Data.AFRetrievalMode.Before)
+            )
+        value = self.archive.event(key)
+        if (
+            mode == _mock_AF.Data.AFRetrievalMode.Exact
+            and value.Timestamp.UtcTime.Ticks != ticks
+        ):
+            return _mock_AF.Asset.AFValue(None, af_time)
+        return value
+
+    def interpolated_value(self, af_time: _mock_AF.Time.AFTime) -> _mock_AF.Asset.AFValue:
+        self.simulator.request("InterpolatedValue")
+        ticks = af_time.UtcTime.Ticks
+        return _af_values([ticks], self.archive.interpolate(np.array([ticks])))[0]
+
+    def recorded_values(
+        self, time_range: _mock_AF.Time.AFTimeRange, boundary_type: Any, max_count: int = 0
+    ) -> _mock_AF.Asset.AFValues:
+        self.simulator.request("RecordedValues")
+        start, end = _range(time_range)
+        self.simulator.check_limit(self.name, self.archive.estimate(start, end) - 2)
+        keys, ticks = self.archive.events(start, end)
+        self.simulator.check_limit(self.name, len(keys))
+        values = self.archive.to_values(self.archive.raw(keys, ticks))
+        ticks = ticks.tolist()
+        boundary = _mock_AF.Data.AFBoundaryType(int(boundary_type))
+        if boundary == _mock_AF.Data.AFBoundaryType.Interpolated:
+            inside = [i for i, tick in enumerate(ticks) if start < tick < end]
+            edges = np.array([start, end], dtype=np.int64)
+            low, high = self.archive.interpolate(edges)
+            ticks = [start, *(ticks[i] for i in inside), end]
+            values = [low, *(values[i] for i in inside), high]
+        elif boundary == _mock_AF.Data.AFBoundaryType.Outside:
+            first, last = self.archive.at_or_before(start), self.archive.at_or_after(end)
+            outside = np.array([first, last], dtype=np.int64)
+            edge_ticks = self.archive.times(outside)
+            low, high = self.archive.to_values(self.archive.raw(outside, edge_ticks))
+            if not ticks or ticks[0] != start:
+                ticks, values = [int(edge_ticks[0]), *ticks], [low, *values]
+            if ticks[-1] != end:
+                ticks, values = [*ticks, int(edge_ticks[1])], [*values, high]
+        if max_count:
+            ticks, values = ticks[:max_count], values[:max_count]
+        return _af_values(ticks, values)
+
+    def interpolated_values(
+        self, time_range: _mock_AF.Time.AFTimeRange, interval: _mock_AF.Time.AFTimeSpan
+    ) -> _mock_AF.Asset.AFValues:
+        self.simulator.request("InterpolatedValues")
+        start, end = _range(time_range)
+        step = _interval(interval)
+        self.simulator.check_limit(self.name, (end - start) // step + 1)
+        ticks = np.arange(start, end + 1, step, dtype=np.int64)
+        return _af_values(ticks.tolist(), self.archive.interpolate(ticks))
+
+    def plot_values(
+        self, time_range: _mock_AF.Time.AFTimeRange, intervals: int
+    ) -> _mock_AF.Asset.AFValues:
+        """Return the first, last, minimum and maximum value of each interval."""
+        self.simulator.request("PlotValues")
+        start, end = _range(time_range)
+        self.simulator.check_limit(self.name, self.archive.estimate(start, end) - 2)
+        keys, ticks = self.archive.events(start, end)
+        raw = self.archive.raw(keys, ticks)
+        edges = np.searchsorted(ticks, np.linspace(start, end, int(intervals) + 1)[1:-1])
+        selected: set[int] = set()
+        for low, high in zip([0, *edges.tolist()], [*edges.tolist(), len(keys)], strict=True):
+            if high > low:
+                bucket = raw[low:high]
+                selected.update(
+                    {low, high - 1, low + int(np.argmin(bucket)), low + int(np.argmax(bucket))}
+                )
+        positions = np.array(sorted(selected), dtype=np.intp)
+        return _af_values(ticks[positions].tolist(), self.archive.to_values(raw[positions]))
+
+    def summaries(
+        self,
+        time_range: _mock_AF.Time.AFTimeRange,
+        interval: _mock_AF.Time.AFTimeSpan | None,
+        summary_types: Any,
+        time_type: Any,
+    ) -> list[tuple[_mock_AF.Data.AFSummaryTypes, _mock_AF.Asset.AFValues]]:
+        """Evaluate event weighted summaries per interval, stamped at the interval edges.
+
+        The total is the average multiplied by the length of the interval in
+        days, like the time weighted total of the SDK.
+        """
+        self.simulator.request("Summaries")
+        start, end = _range(time_range)
+        self.simulator.check_limit(self.name, self.archive.estimate(start, end) - 2)
+        keys, ticks = self.archive.events(start, end)
+        raw = self.archive.raw(keys, ticks).astype(np.float64)
+        step = end - start if interval is None else _interval(interval)
+        edges = (
+            np.arange(start, end, step, dtype=np.int64) if end > start else np.array([start])
+        )
+        bounds = np.searchsorted(ticks, [*edges.tolist(), end + 1], side="left")
+        at_end = _mock_AF.Data.AFTimestampCalculation(int(time_type)) == (
+            _mock_AF.Data.AFTimestampCalculation.MostRecentTime
+        )
+        stamps = [min(edge + step, end) if at_end else edge for edge in edges.tolist()]
+        selected = [kind for kind in _SUMMARY_TYPES if int(summary_types) & int(kind)]
+        results: dict[_mock_AF.Data.AFSummaryTypes, list[Any]] = {
+            kind: [] for kind in selected
+        }
+        for position, edge in enumerate(edges.tolist()):
+            bucket = raw[bounds[position] : bounds[position + 1]]
+            days = (min(edge + step, end) - edge) / _DAY_TICKS
+            for kind in selected:
+                results[kind].append(_summary(kind, bucket, days))
+        return [(kind, _af_values(stamps, values)) for kind, values in results.items()]
+
+
+def _summary(
+    kind: _mock_AF.Data.AFSummaryTypes, values: "np.ndarray[Any, Any]", days: float
+) -> Any:
+    types = _mock_AF.Data.AFSummaryTypes
+    if kind == types.Count:
+        return len(values)
+    if kind == types.PercentGood:
+        return 100.0
+    if not len(values) or (kind == types.StdDev and len(values) < 2):
+        return None
+    if kind == types.Total:
+        return float(values.mean()) * days
+    if kind == types.Average:
+        return float(values.mean())
+    if kind == types.Minimum:
+        return float(values.min())
+    if kind == types.Maximum:
+        return float(values.max())
+    if kind == types.Range:
+        return float(values.max() - values.min())
+    return float(values.std(ddof=1 if kind == types.StdDev else 0))
+
+
+class SimulatedPIPoint(_mock_AF.PI.PIPoint):
+    """PI Point of a simulated server, reading from its synthetic archive."""
+
+    def __init__(self, server: "SimulatedPIServer", reader: _Reader) -> None:
+        self.Name = reader.name
+        self.Server = server
+        self.reader = reader
+        self.updates: list[Any] = []
+
+    def CurrentValue(self) -> _mock_AF.Asset.AFValue:  # type: ignore[override]
+        """Return the last event before the current time of the simulator."""
+        return self.reader.current_value()
+
+    def GetAttributes(self, names: list[str], /) -> Any:  # type: ignore[override]
+        """Return the point attributes, defined by the tag specification."""
+        spec = self.reader.archive.spec
+        return _mock_AF.PI.Generic.PropertyDict(
+            [
+                ("pointtype", spec.point_type),
+                ("engunits", spec.units),
+                ("descriptor", f"Simulated {spec.point_type} tag"),
+                ("digitalset", spec.digital_set if spec.point_type == "Digital" else ""),
+                ("creationdate", _mock_System.DateTime(0, _mock_System.DateTimeKind.Utc)),
+            ]
+        )
+
+    def LoadAttributes(self, params: list[str], /) -> None:  # type: ignore[override]
+        """Load the point attributes, a call to the server."""
+        self.reader.simulator.request("LoadAttributes")
+
+    def InterpolatedValue(self, time: Any, /) -> Any:  # type: ignore[override]
+        """Return the interpolated value at a time."""
+        return self.reader.interpolated_value(time)
+
+    def InterpolatedValues(  # type: ignore[override]
+        self, time_range: Any, interval: Any, filter_expression: str, include: bool, /
+    ) -> Any:
+        """Return interpolated values, filter expressions are ignored."""
+        return self.reader.interpolated_values(time_range, interval)
+
+    def PlotValues(self, time_range: Any, intervals: int, /) -> Any:  # type: ignore[override]
+        """Return the values for plotting."""
+        return self.reader.plot_values(time_range, intervals)
+
+    def RecordedValue(self, time: Any, retrieval_mode: Any, /) -> Any:  # type: ignore[override]
+        """Return a single recorded value."""
+        return self.reader.recorded_value(time, retrieval_mode)
+
+    def RecordedValues(  # type: ignore[override]
+        self,
+        time_range: Any,
+        boundary_type: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        max_count: int = 0,
+        /,
+    ) -> Any:
+        """Return the recorded values, filter expressions are ignored."""
+        return self.reader.recorded_values(time_range, boundary_type, max_count)
+
+    def Summaries(  # type: ignore[override]
+        self, time_range: Any, interval: Any, summary_type: Any, basis: Any, time_type: Any, /
+    ) -> Any:
+        """Return the summaries per interval."""
+        return _mock_AF.Data.SummariesDict(
+            self.reader.summaries(time_range, interval, summary_type, time_type)
+        )
+
+    def FilteredSummaries(  # type: ignore[override]
+        self,
+        time_range: Any,
+        interval: Any,
+        filter_expression: str,
+        summary_type: Any,
+        basis: Any,
+        sample_type: Any,
+        sample_interval: Any,
+        time_type: Any,
+        /,
+    ) -> Any:
+        """Return the summaries per interval, filter expressions are ignored."""
+        return self.Summaries(time_range, interval, summary_type, basis, time_type)
+
+    def Summary(  # type: ignore[override]
+        self, time_range: Any, summary_type: Any, basis: Any, time_type: Any
+    ) -> Any:
+        """Return the summaries of the whole time range."""
+        summaries = self.reader.summaries(time_range, None, summary_type, time_type)
+        return _mock_AF.Data.SummaryDict([(kind, values[0]) for kind, values in summaries])
+
+    def UpdateValue(self, value: Any, update_mode: Any, buffer_option: Any, /) -> None:  # type: ignore[override]
+        """Accept an update, which does not change the synthetic archive."""
+        self.reader.simulator.request("UpdateValue")
+        self.updates.append(value)
+
+    def UpdateValues(self, values: Any, update_mode: Any, buffer_option: Any, /) -> Any:  # type: ignore[override]
+        """Accept updates, which do not change the synthetic archive."""
+        self.reader.simulator.request("UpdateValues")
+        self.updates.extend(values)
+        return None
+
+
+class SimulatedPIServer(_mock_AF.PI.PIServer):
+    """PI Data Archive of a simulator, with the points of its tags."""
+
+    def __init__(self, simulator: "Simulator") -> None:
+        super().__init__(simulator.name)
+        self.RpcMetrics = simulator.rpc_metrics
+        self._points: dict[str, SimulatedPIPoint] = {}  # type: ignore[assignment]
+
+
+def _simulator_of(items: Sequence[Any]) -> "Simulator | None":
+    """Return the simulator of the first point or attribute of a bulk list."""
+    reader = getattr(items[0], "reader", None) if len(items) else None
+    return None if reader is None else reader.simulator
+
+
+@contextlib.contextmanager
+def _bulk(items: Sequence[Any], name: str, paging_config: Any) -> Iterator[None]:
+    simulator = _simulator_of(items)
+    if simulator is None:
+        yield
+        return
+    with simulator.bulk(name, len(items), paging_config):
+        yield
+
+
+class SimulatedPIPointList(_mock_AF.PI.PIPointList):
+    """Bulk list of simulated PI Points, which is called once per page of points."""
+
+    def CurrentValue(self) -> list[_mock_AF.Asset.AFValue]:
+        """Return the current value of each point."""
+        with _bulk(self, "PIPointList.CurrentValue", None):
+            return super().CurrentValue()
+
+    def InterpolatedValue(self, time: Any, /) -> list[_mock_AF.Asset.AFValue]:
+        """Return the interpolated value of each point at a time."""
+        with _bulk(self, "PIPointList.InterpolatedValue", None):
+            return super().InterpolatedValue(time)
+
+    def InterpolatedValues(
+        self,
+        time_range: Any,
+        interval: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: Any,
+        /,
+    ) -> list[_mock_AF.Asset.AFValues]:
+        """Return the interpolated values of each point."""
+        with _bulk(self, "PIPointList.InterpolatedValues", paging_config):
+            return super().InterpolatedValues(
+                time_range, interval, filter_expression, include_filtered_values, paging_config
+            )
+
+    def PlotValues(self, time_range: Any, intervals: int, paging_config: Any, /) -> Any:
+        """Return the values for plotting of each point."""
+        with _bulk(self, "PIPointList.PlotValues", paging_config):
+            return super().PlotValues(time_range, intervals, paging_config)
+
+    def RecordedValues(
+        self,
+        time_range: Any,
+        boundary_type: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: Any,
+        /,
+    ) -> list[_mock_AF.Asset.AFValues]:
+        """Return the recorded values of each point."""
+        with _bulk(self, "PIPointList.RecordedValues", paging_config):
+            return super().RecordedValues(
+                time_range,
+                boundary_type,
+                filter_expression,
+                include_filtered_values,
+                paging_config,
+            )
+
+    def Summary(
+        self,
+        time_range: Any,
+        summary_type: Any,
+        calculation_basis: Any,
+        time_type: Any,
+        paging_config: Any,
+        /,
+    ) -> Any:
+        """Return the summaries of each point."""
+        with _bulk(self, "PIPointList.Summary", paging_config):
+            return super().Summary(
+                time_range, summary_type, calculation_basis, time_type, paging_config
+            )
+
+
+class SimulatedAFListData(_mock_AF.Data.AFListData):
+    """Bulk data methods of simulated attributes, called once per page of attributes."""
+
+    def __init__(self, attributes: Sequence[Any]) -> None:
+        super().__init__(attributes)
+        self._list = attributes
+
+    def Summary(
+        self,
+        time_range: Any,
+        summary_type: Any,
+        calculation_basis: Any,
+        time_type: Any,
+        paging_config: Any,
+        /,
+    ) -> Any:
+        """Return the summaries of each attribute."""
+        with _bulk(self._list, "AFListData.Summary", paging_config):
+            return super().Summary(
+                time_range, summary_type, calculation_basis, time_type, paging_config
+            )
+
+    def InterpolatedValues(
+        self,
+        time_range: Any,
+        interval: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: Any,
+        /,
+    ) -> Any:
+        """Return the interpolated values of each attribute."""
+        with _bulk(self._list, "AFListData.InterpolatedValues", paging_config):
+            return super().InterpolatedValues(
+                time_range, interval, filter_expression, include_filtered_values, paging_config
+            )
+
+    def PlotValues(self, time_range: Any, intervals: int, paging_config: Any, /) -> Any:
+        """Return the values for plotting of each attribute."""
+        with _bulk(self._list, "AFListData.PlotValues", paging_config):
+            return super().PlotValues(time_range, intervals, paging_config)
+
+    def RecordedValues(
+        self,
+        time_range: Any,
+        boundary_type: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: Any,
+        /,
+    ) -> Any:
+        """Return the recorded values of each attribute."""
+        with _bulk(self._list, "AFListData.RecordedValues", paging_config):
+            return super().RecordedValues(
+                time_range,
+                boundary_type,
+                filter_expression,
+                include_filtered_values,
+                paging_config,
+            )
+
+
+class SimulatedAFAttributeList(_mock_AF.Asset.AFAttributeList):
+    """Bulk list of simulated attributes."""
+
+    @property
+    def Data(self) -> SimulatedAFListData:  # type: ignore[override]
+        """Return the bulk data methods for the attributes in the list."""
+        return SimulatedAFListData(self)
+
+    def GetValue(self, time: Any = None, /) -> _mock_AF.Asset.AFValues:
+        """Return the value of each attribute in a single call."""
+        with _bulk(self, "AFAttributeList.GetValue", None):
+            return super().GetValue(time)
+
+
+class SimulatedAFData(_mock_AF.Data.AFData):
+    """Data methods of a simulated attribute, reading from the archive of its tag."""
+
+    def __init__(self, reader: _Reader) -> None:
+        self.reader = reader
+
+    def FilteredSummaries(
+        self,
+        time_range: Any,
+        interval: Any,
+        filter_expression: str,
+        summary_types: Any,
+        calculation_basis: Any,
+        filter_evaluation: Any,
+        filter_interval: Any,
+        time_type: Any,
+        /,
+    ) -> Any:  # type: ignore[override]  # noqa: E501
+        """Return the summaries per interval, filter expressions are ignored."""
+        return self.Summaries(
+            time_range, interval, summary_types, calculation_basis, time_type
+        )
+
+    def InterpolatedValue(self, time: Any, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return the interpolated value at a time."""
+        return self.reader.interpolated_value(time)
+
+    def InterpolatedValues(  # type: ignore[override]
+        self,
+        time_range: Any,
+        interval: Any,
+        uom: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        /,
+    ) -> Any:
+        """Return interpolated values, filter expressions are ignored."""
+        return self.reader.interpolated_values(time_range, interval)
+
+    def PlotValues(self, time_range: Any, intervals: int, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return the values for plotting."""
+        return self.reader.plot_values(time_range, intervals)
+
+    def RecordedValue(self, time: Any, retrieval_mode: Any, uom: Any, /) -> Any:  # type: ignore[override]
+        """Return a single recorded value."""
+        return self.reader.recorded_value(time, retrieval_mode)
+
+    def RecordedValues(  # type: ignore[override]
+        self,
+        time_range: Any,
+        boundary_type: Any,
+        uom: Any,
+        filter_expression: str,
+        include_filtered_values: bool,
+        /,
+    ) -> Any:
+        """Return the recorded values, filter expressions are ignored."""
+        return self.reader.recorded_values(time_range, boundary_type)
+
+    def Summaries(  # type: ignore[override]
+        self, time_range: Any, interval: Any, summary_type: Any, basis: Any, time_type: Any, /
+    ) -> Any:
+        """Return the summaries per interval."""
+        return _mock_AF.Data.SummariesDict(
+            self.reader.summaries(time_range, interval, summary_type, time_type)
+        )
+
+    def Summary(  # type: ignore[override]
+        self, time_range: Any, summary_type: Any, basis: Any, time_type: Any, /
+    ) -> Any:
+        """Return the summaries of the whole time range."""
+        summaries = self.reader.summaries(time_range, None, summary_type, time_type)
+        return _mock_AF.Data.SummaryDict([(kind, values[0]) for kind, values in summaries])
+
+    def UpdateValue(self, value: Any, update_option: Any, buffer_option: Any, /) -> None:  # type: ignore[override]
+        """Accept an update, which does not change the synthetic archive."""
+        self.reader.simulator.request("UpdateValue")
+
+    def UpdateValues(self, values: Any, update_option: Any, buffer_option: Any, /) -> Any:  # type: ignore[override]
+        """Accept updates, which do not change the synthetic archive."""
+        self.reader.simulator.request("UpdateValues")
+        return None
+
+
+class SimulatedAFAttribute(_mock_AF.Asset.AFAttribute):
+    """Attribute of a simulated element, with a PI Point data reference to its tag."""
+
+    def __init__(
+        self, name: str, point: SimulatedPIPoint, system: "SimulatedPISystem"
+    ) -> None:
+        spec = point.reader.archive.spec
+        self.Attributes = _mock_AF.Asset.AFAttributes([])
+        self.Data = SimulatedAFData(point.reader)
+        self.DataReference = _mock_AF.Asset.AFDataReference("PI Point", self, point)
+        self.DataReferencePlugIn = _mock_AF.AFPlugIn("PI Point")
+        self.DefaultUOM = _mock_AF.UnitsOfMeasure.UOM()
+        self.Description = f"{name} of {spec.name}"
+        self.Element: SimulatedAFElement | None = None
+        self.Name = name
+        self.Parent = None
+        self.Type = _mock_System.Type(_ATTRIBUTE_TYPES.get(spec.point_type, "Double"))
+        self.TypeQualifier = (
+            point.Server.StateSets.get_Item(spec.digital_set)
+            if spec.point_type == "Digital"
+            else None
+        )
+        self.reader = point.reader
+        self._system = system
+
+    @property
+    def PISystem(self) -> "SimulatedPISystem":  # type: ignore[override]
+        """Return the simulated PI AF server of the attribute."""
+        return self._system
+
+    def GetValue(self, time: Any = None, /) -> _mock_AF.Asset.AFValue:  # type: ignore[override]
+        """Return the current value, or the last recorded value at or before `time`."""
+        if time is None:
+            return self.reader.current_value()
+        return self.reader.recorded_value(time, _mock_AF.Data.AFRetrievalMode.AtOrBefore)
+
+
+class SimulatedAFElements(_mock_AF.Asset.AFElements):
+    """Child elements of a simulated element or database, found by name or path."""
+
+    def get_Item(self, name: str | int) -> _mock_AF.Asset.AFElement | None:  # type: ignore[override]
+        """Return the element at a position or a backslash separated path, or None."""
+        if isinstance(name, int):
+            return self._values[name]
+        first, _, rest = name.strip("\\").partition("\\")
+        element = next((element for element in self._values if element.Name == first), None)
+        if element is None or not rest:
+            return element
+        return element.Elements.get_Item(rest)
+
+
+class SimulatedAFElement(_mock_AF.Asset.AFElement):
+    """Element of a simulated PI AF database."""
+
+    def __init__(self, name: str, parent: "SimulatedAFElement | None" = None) -> None:
+        self.Attributes = _mock_AF.Asset.AFAttributes([])
+        self.Categories = _mock_AF.AFCategories([])
+        self.Description = f"Simulated element {name}"
+        self.Elements = SimulatedAFElements([])
+        self.Name = name
+        self.Parent = parent
+
+
+class SimulatedAFDatabase(_mock_AF.AFDatabase):
+    """PI AF database of a simulator, with a hierarchy of elements."""
+
+    def __init__(self, name: str, elements: list[SimulatedAFElement], templates: Any) -> None:
+        self.Name = name
+        self.Elements = SimulatedAFElements(elements)  # type: ignore[arg-type]
+        self.Tables = _mock_AF.Asset.AFTables([])
+        self.ElementTemplates = _mock_AF.Asset.AFElementTemplates(templates)
+
+
+class _SimulatedDatabases(list[SimulatedAFDatabase]):
+    """Databases of a simulated PI AF server, the first one is the default."""
+
+    @property
+    def DefaultDatabase(self) -> SimulatedAFDatabase | None:
+        return self[0] if self else None
+
+
+class SimulatedPISystem(_mock_AF.PISystem):
+    """PI AF server of a simulator, with the databases added to it."""
+
+    def __init__(self, simulator: "Simulator") -> None:
+        super().__init__(simulator.name)
+        self.Databases = _SimulatedDatabases()  # type: ignore[assignment]
+        self.RpcMetrics = simulator.rpc_metrics
+
+
+class Simulator:
+    """Simulated PI Data Archive and PI AF server, for load tests without a PI system.
+
+    The simulator has a PI Data Archive and a PI AF server, both named
+    `name`, which are used by :class:`~PIconnect.PIServer` and
+    :class:`~PIconnect.PIAFDatabase` while the simulator is installed, see
+    :meth:`install`. Tags are added with :meth:`add_tags`, PI AF databases
+    with :meth:`add_database`.
+
+    Every call to the servers is a simulated RPC, which is counted in
+    :attr:`calls` and in the client RPC metrics of the servers, takes
+    `latency` seconds plus up to `latency_jitter` seconds, and fails with a
+    :class:`PIConnectionException` at the `failure_rate`. A bulk call is a
+    single RPC per page of its paging configuration. Reads of more than
+    `arc_max_collect` values fail with a :class:`PIException`, like the
+    `ArcMaxCollect` tuning parameter of a PI Data Archive.
+
+    Parameters
+    ----------
+        name (str, optional): Defaults to `'Simulated'`. Name of the servers.
+        now (datetime, optional): Defaults to None. Fixed current time of the
+            servers, which is used for relative times such as `'*-1d'` and
+            for current values. If None, the actual current time is used.
+        latency (float, optional): Defaults to 0. Time taken by each RPC, in
+            seconds.
+        latency_jitter (float, optional): Defaults to 0. Maximum random extra
+            time taken by each RPC, in seconds.
+        failure_rate (float, optional): Defaults to 0. Fraction of the RPCs
+            that fail.
+        arc_max_collect (int, optional): Defaults to 150000. Maximum number of
+            values returned by a single read of a tag.
+        seed (int, optional): Defaults to 0. Seed of the archives, the
+            latency jitter and the failures.
+
+    Example
+    -------
+    .. code-block:: python
+
+        from PIconnect import PIBulk, PISimulator
+
+        simulator = PISimulator.Simulator(latency=0.05, failure_rate=0.01)
+        simulator.add_tags(PISimulator.TagSpec(f"Tag{i}", interval="10s") for i in range(100))
+        with simulator.install(), PIconnect.PIServer() as server:
+            points = server.search("Tag*")
+            data = PIBulk.plot_values(points, "*-7d", "*", intervals=100)
+        print(simulator.calls)
+    """
+
+    def __init__(
+        self,
+        name: str = "Simulated",
+        now: datetime.datetime | None = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        arc_max_collect: int = 150_000,
+        seed: int = 0,
+    ) -> None:
+        self.name = name
+        self.now = now
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.arc_max_collect = arc_max_collect
+        self.seed = seed
+        #: Number of RPCs per name.
+        self.calls: collections.Counter[str] = collections.Counter()
+        #: Number of RPCs that failed.
+        self.failures = 0
+        #: Cumulative client RPC metrics, shared by both servers.
+        self.rpc_metrics: list[Any] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.pi_server = SimulatedPIServer(self)
+        self.af_server = SimulatedPISystem(self)
+
+    def add_tags(self, specs: Iterable[TagSpec | str]) -> list[SimulatedPIPoint]:
+        """Add tags to the PI Data Archive, given by specification or by name.
+
+        Returns
+        -------
+            list of SimulatedPIPoint: The SDK points of the tags.
+        """
+        points = []
+        for spec in specs:
+            if isinstance(spec, str):
+                spec = TagSpec(spec)
+            if spec.point_type not in _ATTRIBUTE_TYPES:
+                raise ValueError(
+                    f"Unsupported point type {spec.point_type!r} of {spec.name!r}"
+                )
+            states = (
+                list(self.pi_server.StateSets.get_Item(spec.digital_set))
+                if spec.point_type == "Digital"
+                else None
+            )
+            reader = _Reader(_Archive(spec, self.seed, states), self)
+            point = SimulatedPIPoint(self.pi_server, reader)
+            self.pi_server._points[spec.name] = point
+            points.append(point)
+        return points
+
+    def add_database(
+        self,
+        name: str,
+        levels: Sequence[int] = (3, 4),
+        attributes: Sequence[TagSpec | str] = ("Flow", "Level", "Temperature"),
+        template: str = "Asset",
+    ) -> SimulatedAFDatabase:
+        """Add a PI AF database with a hierarchy of elements to the PI AF server.
+
+        The first level of the hierarchy has `levels[0]` elements, named
+        `Element_1`, `Element_2`, ..., each of which has `levels[1]` child
+        elements, named `Element_1_1`, `Element_1_2`, ..., and so on. The
+        elements of the last level are based on the element template
+        `template` and have the `attributes`, each of which references its
+        own tag, named `<database>.<element>.<attribute>`. The first database
+        added is the default database.
+
+        Parameters
+        ----------
+            name (str): Name of the database.
+            levels (list of int, optional): Defaults to `(3, 4)`. Number of
+                child elements of each element, per level.
+            attributes (list of TagSpec or str, optional): Attributes of the
+                elements of the last level. The name of a :class:`TagSpec` is
+                the name of the attribute, its other fields define the tags.
+            template (str, optional): Defaults to `'Asset'`. Name of the element
+                template of the elements of the last level.
+        """
+        specs = [TagSpec(spec) if isinstance(spec, str) else spec for spec in attributes]
+        roots: list[SimulatedAFElement] = []
+        parents: list[SimulatedAFElement | None] = [None]
+        for count in levels:
+            children = []
+            for parent in parents:
+                prefix = "Element" if parent is None else parent.Name
+                siblings = roots if parent is None else parent.Elements._values
+                for number in range(1, count + 1):
+                    element = SimulatedAFElement(f"{prefix}_{number}", parent)
+                    siblings.append(element)
+                    children.append(element)
+            parents = children
+        leaves = [element for element in parents if element is not None]
+        for element in leaves:
+            tags = [
+                dataclasses.replace(spec, name=f"{name}.{element.Name}.{spec.name}")
+                for spec in specs
+            ]
+            for spec, point in zip(specs, self.add_tags(tags), strict=True):
+                attribute = SimulatedAFAttribute(spec.name, point, self.af_server)
+                attribute.Element = element
+                element.Attributes._values.append(attribute)
+        database = SimulatedAFDatabase(
+            name, roots, [_mock_AF.Asset.AFElementTemplate(template, leaves)]
+        )
+        self.af_server.Databases.append(database)
+        return database
+
+    @contextlib.contextmanager
+    def install(self, default: bool = True) -> Iterator["Simulator"]:
+        """Make the servers of the simulator available to PIconnect within a block.
+
+        The servers are added to :attr:`PIServer.servers <PIconnect.PIServer.servers>`
+        and :attr:`PIAFDatabase.servers <PIconnect.PIAFDatabase.servers>`, and
+        the bulk lists of the SDK are replaced by simulated ones. Times given
+        as a string are parsed by the simulator.
+
+        Parameters
+        ----------
+            default (bool, optional): Defaults to True. Also make the servers
+                the default servers.
+
+        Raises
+        ------
+            RuntimeError: If PIconnect uses the actual PI AF SDK.
+        """  # noqa: E501
+        with _install(
+            [self.pi_server],
+            [self.af_server],
+            self.parse_time,
+            default,
+            SimulatedPIPointList,
+            SimulatedAFAttributeList,
+        ):
+            yield self
+
+    def now_ticks(self) -> int:
+        """Return the current time of the simulator, in UTC .NET ticks."""
+        now = self.now or datetime.datetime.now(datetime.timezone.utc)
+        return _time._datetime_to_ticks(now)
+
+    def request(self, name: str) -> None:
+        """Make a simulated RPC, which waits for its latency and fails at the failure rate.
+
+        Calls made on behalf of a bulk call are part of the RPCs of the bulk
+        call, so they take no time and do not fail.
+        """
+        if getattr(self._local, "bulk", False):
+            return
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            failed = self._random.random() < self.failure_rate
+            self.calls[name] += 1
+            self.failures += failed
+            self._add_rpc_metric(name, 1000 * delay)
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            raise PIConnectionException(f"Simulated failure of {name} on {self.name}")
+
+    def _add_rpc_metric(self, name: str, milliseconds: float) -> None:
+        for metric in self.rpc_metrics:
+            if metric.Name == name:
+                metric.Count += 1
+                metric.Milliseconds += milliseconds
+                return
+        self.rpc_metrics.append(_values.AFRpcMetric(name, 1, milliseconds))
+
+    @contextlib.contextmanager
+    def bulk(self, name: str, count: int, paging_config: Any) -> Iterator[None]:
+        """Make a bulk call of `count` points or attributes, which is an RPC per page."""
+        page_size = getattr(paging_config, "PageSize", None) or count or 1
+        for _ in range(max(1, -(-count // page_size))):
+            self.request(name)
+        self._local.bulk = True
+        try:
+            yield
+        finally:
+            self._local.bulk = False
+
+    def check_limit(self, name: str, count: int) -> None:
+        """Raise a :class:`PIException` if a read of `count` values exceeds the limit."""
+        if count > self.arc_max_collect:
+            raise PIException(
+                f"[-11091] Event collection for {name} exceeded the maximum allowed "
+                f"({self.arc_max_collect}), use more restrictive search criteria or "
+                "increase ArcMaxCollect"
+            )
+
+    def parse_time(self, af_time: _mock_Time.AFTime) -> _mock_System.DateTime:
+        """Parse a time given as a string, relative to the current time of the simulator.
+
+        Supported are `'*'`, `'t'` or `'today'` and `'y'` or `'yesterday'`,
+        each optionally followed by an offset such as `'-1d'` or `'+8h'`, a bare
+        offset relative to the other end of a time range, and ISO 8601 times.
+        Naive times are in :data:`PIConfig.DEFAULT_TIMEZONE
+        <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+        """
+        return _parse_time(af_time, self.now_ticks())
+
+
+def _parse_time(af_time: _mock_Time.AFTime, now: int) -> _mock_System.DateTime:
+    """Parse a time given as a string, relative to `now` in UTC .NET ticks."""
+    expression = (af_time.expression or "").strip()
+    match = _RELATIVE_TIME.match(expression) if expression else None
+    if match is None:
+        try:
+            parsed = datetime.datetime.fromisoformat(expression)
+        except ValueError:
+            parsed = datetime.datetime.strptime(expression, "%d-%m-%Y")
+        return _mock_System.DateTime(
+            _time._datetime_to_ticks(parsed), _mock_System.DateTimeKind.Utc
+        )
+    base_name = (match.group("base") or "").lower()
+    if not base_name and af_time.relative_time is not None:
+        ticks = af_time.relative_time.UtcTime.Ticks
+    else:
+        ticks = now
+        if base_name in ("t", "today", "y", "yesterday"):
+            ticks -= ticks % _DAY_TICKS
+        if base_name in ("y", "yesterday"):
+            ticks -= _DAY_TICKS
+    if match.group("sign") is not None:
+        length = _time.length_to_ticks(match.group("length"))
+        ticks += length if match.group("sign") == "+" else -length
+    return _mock_System.DateTime(ticks, _mock_System.DateTimeKind.Utc)
+
+
+@contextlib.contextmanager
+def _install(
+    pi_servers: Sequence[_mock_AF.PI.PIServer],
+    af_servers: Sequence[_mock_AF.PISystem],
+    time_parser: Callable[[_mock_Time.AFTime], _mock_System.DateTime],
+    default: bool,
+    point_list: type[_mock_AF.PI.PIPointList] | None = None,
+    attribute_list: type[_mock_AF.Asset.AFAttributeList] | None = None,
+) -> Iterator[None]:
+    """Make PI and PI AF servers available to PIconnect within a block.
+
+    The servers are used instead of the mock servers of the SDK, the first
+    server of each kind is the default if `default` is set. Times given as a
+    string are parsed by `time_parser`. If given, `point_list` and
+    `attribute_list` replace the bulk lists of the SDK.
+    """
+    if AF is not _mock_AF:
+        raise RuntimeError("Simulated servers can only be installed without the PI AF SDK")
+    saved = (
+        PI.PIServer.servers,
+        PI.PIServer.default_server,
+        PIAF.PIAFDatabase.servers,
+        PIAF.PIAFDatabase.default_server,
+        _mock_Time.time_parser,
+        _mock_AF.PI.PIPointList,
+        _mock_AF.Asset.AFAttributeList,
+    )
+    af_specs: dict[str, PIAF.ServerSpec] = {
+        server.Name: {
+            "server": server,
+            "databases": {database.Name: database for database in server.Databases},
+        }
+        for server in af_servers
+    }
+    PI.PIServer.servers = {**PI.PIServer.servers, **{s.Name: s for s in pi_servers}}
+    PIAF.PIAFDatabase.servers = {**PIAF.PIAFDatabase.servers, **af_specs}
+    if default and pi_servers:
+        PI.PIServer.default_server = pi_servers[0]
+    if default and af_servers:
+        PIAF.PIAFDatabase.default_server = af_specs[af_servers[0].Name]
+    _mock_Time.time_parser = time_parser
+    if point_list is not None:
+        _mock_AF.PI.PIPointList = point_list  # type: ignore[misc]
+    if attribute_list is not None:
+        _mock_AF.Asset.AFAttributeList = attribute_list  # type: ignore[misc]
+    for kind, servers in (("PI", pi_servers), ("AF", af_servers)):
+        for server in servers:
+            _admission._controllers.pop((kind, server.Name), None)
+    try:
+        yield
+    finally:
+        (
+            PI.PIServer.servers,
+            PI.PIServer.default_server,
+            PIAF.PIAFDatabase.servers,
+            PIAF.PIAFDatabase.default_server,
+            _mock_Time.time_parser,
+            _mock_AF.PI.PIPointList,
+            _mock_AF.Asset.AFAttributeList,
+        ) = saved
@@ -0,0 +1,300 @@
+"""PISync - Incremental reads of recorded values with persisted high-water marks."""
+
+import datetime
+import hashlib
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+
+from PIconnect import AF, PIBulk, PIData, _results, _time
+from PIconnect.PIAFAttribute import PIAFAttribute
+
+__all__ = ["Sync"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS marks (
+    name TEXT PRIMARY KEY,
+    ticks INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recent (
+    name TEXT NOT NULL,
+    ticks INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (name, ticks, digest)
+);
+"""
+
+#: Containers whose reads start within this many ticks share a bulk read.
+_MIN_GROUP_TICKS = _time.length_to_ticks("1h")
+
+
+def _to_datetime(ticks: int) -> datetime.datetime:
+    epoch = datetime.datetime(1, 1, 1, tzinfo=datetime.timezone.utc)
+    return epoch + datetime.timedelta(microseconds=ticks // 10)
+
+
+def _digest(value: Any, status: int) -> str:
+    """Return a short fingerprint of a value and its status, to detect edits."""
+    return hashlib.blake2b(f"{value}|{status}".encode(), digest_size=8).hexdigest()
+
+
+def _key(container: PIData.PISeriesContainer) -> str:
+    """Return the key of the high-water mark, the tag of a point or the path of an attribute.
+
+    Attributes of different elements often share their name, so they are
+    identified by their full path, which includes the element.
+    """
+    if isinstance(container, PIAFAttribute):
+        return str(container.attribute.GetPath())
+    return container.name
+
+
+def _groups(starts: list[int], width: int) -> list[list[int]]:
+    """Group positions by start time, so each group starts within `width` ticks."""
+    groups: list[list[int]] = []
+    group_start = 0
+    for position in sorted(range(len(starts)), key=starts.__getitem__):
+        if not groups or starts[position] - group_start > width:
+            groups.append([])
+            group_start = starts[position]
+        groups[-1].append(position)
+    return groups
+
+
+class Sync:
+    """Incremental reads of the recorded values of points and attributes.
+
+    For each point or attribute the timestamp of the last recorded value that
+    was read is stored as its high-water mark in a SQLite database, together
+    with a fingerprint of the values read within the `lookback` before the
+    mark. Each :meth:`pull` reads the values from `lookback` before the mark
+    up to the end time, using bulk reads, and returns only the values that are
+    new or were edited since the previous pull. Values that arrive late, or
+    are edited, within the lookback are thus returned again, values deleted
+    from the archive are not reported.
+
+    Parameters
+    ----------
+        path (str or path): SQLite database with the high-water marks, created
+            if it does not exist. Use `':memory:'` for a sync that is not
+            persisted.
+        lookback (str or timedelta, optional): Defaults to `'1h'`. Length of
+            time before the high-water mark that is read again to pick up late
+            and edited values, see :func:`~PIconnect._time.length_to_ticks`.
+        start_time (str or datetime, optional): Defaults to `'*-1d'`. Start of
+            the first read of a point or attribute without a high-water mark.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with PI.PIServer() as server, PISync.Sync("sync.db", lookback="2h") as sync:
+            points = server.search("SINUSOID*")
+            delta = sync.pull(points)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        lookback: str | datetime.timedelta = "1h",
+        start_time: _time.TimeLike = "*-1d",
+    ) -> None:
+        self.lookback = _time.length_to_ticks(lookback)
+        if self.lookback < 0:
+            raise ValueError(f"Lookback {lookback!r} must not be negative")
+        self.start_time = start_time
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._pending: list[tuple[str, int, list[tuple[int, str]]]] = []
+
+    def __enter__(self) -> "Sync":
+        """Open the sync context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the database of the sync."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database, discarding a pull that was not committed."""
+        self._pending = []
+        self._db.close()
+
+    def marks(self) -> dict[str, datetime.datetime]:
+        """Return the high-water mark of each point and attribute as a UTC datetime."""
+        rows = self._db.execute("SELECT name, ticks FROM marks ORDER BY name")
+        return {name: _to_datetime(ticks) for name, ticks in rows}
+
+    def reset(self, names: Iterable[str] | None = None) -> None:
+        """Remove the high-water marks of `names`, or of all points and attributes.
+
+        The next pull of these points and attributes starts at `start_time`.
+        """
+        with self._db:
+            if names is None:
+                self._db.execute("DELETE FROM marks")
+                self._db.execute("DELETE FROM recent")
+                return
+            rows = [(name,) for name in names]
+            self._db.executemany("DELETE FROM marks WHERE name = ?", rows)
+            self._db.executemany("DELETE FROM recent WHERE name = ?", rows)
+
+    def pull(
+        self,
+        containers: Sequence[PIData.PISeriesContainer],
+        end_time: _time.TimeLike = "*",
+        include_status: bool = False,
+        time_query: _time.TimeQuery | None = None,
+        result_format: _results.ResultFormat | None = None,
+        commit: bool = True,
+    ) -> Any:
+        """Return the recorded values that are new since the previous pull.
+
+        Points and attributes whose reads start close together share a single
+        bulk read. A value that was edited within the lookback is returned
+        again with the same timestamp, so the receiver should replace the
+        values it has for that name and timestamp. A point or attribute whose
+        read fails is reported with a warning and keeps its high-water mark, so
+        its values are returned by the next pull.
+
+        Parameters
+        ----------
+            containers (list of PIPoint or PIAFAttribute): Points and attributes
+                to read, identified by the tag of a point or the full path of
+                an attribute, which includes its element.
+            end_time (str or datetime, optional): Defaults to `'*'`. End of the
+                reads.
+            include_status (bool, optional): Defaults to False. Add a `status`
+                column with the packed :class:`PIConsts.ValueStatus` flags of
+                each value.
+            time_query (TimeQuery, optional): Defaults to None. Parse
+                `start_time` and `end_time` with this :class:`TimeQuery`.
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+            commit (bool, optional): Defaults to True. Store the new high-water
+                marks immediately. If False, they are only stored by
+                :meth:`commit`, so the same values are returned again if the
+                receiver fails before committing.
+
+        Returns
+        -------
+            pandas.DataFrame: Tidy dataframe with a row per new or edited value
+                and the columns `name`, `timestamp` and `value`, followed by
+                `status` if requested.
+
+        Raises
+        ------
+            ValueError: If a point or attribute is given more than once.
+        """
+        time_query = time_query or _time.TimeQuery()
+        end = _time.to_af_time(end_time, time_query).UtcTime.Ticks
+        first_start: int | None = None
+        names = [_key(container) for container in containers]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Points and attributes are pulled more than once: {duplicates}")
+        marks: dict[str, int] = dict(self._db.execute("SELECT name, ticks FROM marks"))
+        starts: list[int] = []
+        for name in names:
+            if name in marks:
+                starts.append(marks[name] - self.lookback)
+            else:
+                if first_start is None:
+                    first_start = _time.to_af_time(self.start_time, time_query).UtcTime.Ticks
+                starts.append(first_start)
+
+        ticks: list[Any] = []
+        values: list[Any] = []
+        status: list[Any] = []
+        name_idx: list[int] = []
+        pending: list[tuple[str, int, list[tuple[int, str]]]] = []
+        for group in _groups(starts, max(self.lookback, _MIN_GROUP_TICKS)):
+            time_range = _time.ticks_to_af_time_range(min(starts[p] for p in group), end)
+            results = self._read([containers[position] for position in group], time_range)
+            for position, pivalues in zip(group, results, strict=True):
+                if pivalues is None:
+                    # The read failed, keep the mark to read it again on the next pull
+                    continue
+                name = names[position]
+                delta, state = self._delta(name, pivalues, starts[position], marks.get(name))
+                ticks.append(delta[0])
+                values.extend(delta[1])
+                status.append(delta[2])
+                name_idx.extend([position] * len(delta[0]))
+                if state is not None:
+                    pending.append(state)
+
+        self._pending = pending
+        if commit:
+            self.commit()
+        columns: dict[str, Any] = {
+            "name": np.asarray(names, dtype=object)[np.asarray(name_idx, dtype=np.intp)],
+            "timestamp": _time.ticks_to_datetime64(
+                np.concatenate(ticks or [np.empty(0, np.int64)])
+            ),
+            "value": PIData._infer_values(values),
+        }
+        if include_status:
+            columns["status"] = np.concatenate(status or [np.empty(0, np.uint8)])
+        return _results.convert(_results.Columns(columns, times=("timestamp",)), result_format)
+
+    @staticmethod
+    def _read(
+        containers: list[PIData.PISeriesContainer], time_range: AF.Time.AFTimeRange
+    ) -> list[Any]:
+        """Read the recorded values of a group of containers with bulk reads."""
+        args = (time_range, AF.Data.AFBoundaryType.Inside, "", False, PIBulk._paging_config())
+        return PIBulk._BulkList(containers).call(
+            lambda points: points.RecordedValues(*args),
+            lambda attributes: attributes.Data.RecordedValues(*args),
+        )
+
+    def _delta(
+        self, name: str, pivalues: Any, start: int, mark: int | None
+    ) -> tuple[tuple[Any, list[Any], Any], tuple[str, int, list[tuple[int, str]]] | None]:
+        """Select the new and edited values of a container from the values read.
+
+        Returns
+        -------
+            tuple: The ticks, values and status of the delta, and the new
+                high-water mark and recent fingerprints of the container, or
+                None if it has neither a mark nor values.
+        """
+        ticks, values, status = PIData._unpack_values(pivalues, include_status=True)
+        assert status is not None
+        keep = ticks >= start
+        ticks, status = ticks[keep], status[keep]
+        values = [value for value, kept in zip(values, keep, strict=True) if kept]
+        digests = [_digest(v, s) for v, s in zip(values, status.tolist(), strict=True)]
+        known = set(
+            self._db.execute("SELECT ticks, digest FROM recent WHERE name = ?", (name,))
+        )
+        new = np.array(
+            [key not in known for key in zip(ticks.tolist(), digests, strict=True)], dtype=bool
+        )
+        delta = (ticks[new], [v for v, n in zip(values, new, strict=True) if n], status[new])
+        if mark is None and not len(ticks):
+            return delta, None
+        mark = max([mark or 0, *ticks.tolist()])
+        recent = [
+            (tick, digest)
+            for tick, digest in zip(ticks.tolist(), digests, strict=True)
+            if tick >= mark - self.lookback
+        ]
+        return delta, (name, mark, recent)
+
+    def commit(self) -> None:
+        """Store the high-water marks of the last pull."""
+        with self._db:
+            for name, mark, recent in self._pending:
+                self._db.execute("INSERT OR REPLACE INTO marks VALUES (?, ?)", (name, mark))
+                self._db.execute("DELETE FROM recent WHERE name = ?", (name,))
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO recent VALUES (?, ?, ?)",
+                    [(name, tick, digest) for tick, digest in recent],
+                )
+        self._pending = []
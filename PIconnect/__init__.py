@@ -1,11 +1,15 @@
 """PIconnect - Connector to the OSISoft PI and PI-AF databases."""
 
+from PIconnect._cancellation import CancellationToken, QueryCancelledError
+from PIconnect._profile import profile
 from PIconnect.AFSDK import AF, AF_SDK_VERSION
 from PIconnect.config import PIConfig
 from PIconnect.PI import PIServer
 from PIconnect.PIAF import PIAFDatabase
 
-from . import _version
+from . import _time, _version
+
+TimeQuery = _time.TimeQuery
 
 __version__ = _version.get_versions()["version"]
 __sdk_version = tuple(int(x) for x in AF.PISystems().Version.split("."))
@@ -13,8 +17,12 @@ __sdk_version = tuple(int(x) for x in AF.PISystems().Version.split("."))
 __all__ = [
     "AF",
     "AF_SDK_VERSION",
+    "CancellationToken",
     "PIAFDatabase",
     "PIConfig",
     "PIServer",
+    "QueryCancelledError",
+    "TimeQuery",
     "__sdk_version",
+    "profile",
 ]
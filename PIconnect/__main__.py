@@ -0,0 +1,79 @@
+"""Command line interface of PIconnect, available as the `piconnect` command."""
+
+import argparse
+import datetime
+import pathlib
+import sys
+from collections.abc import Sequence
+
+from PIconnect import PI, PIExport
+
+
+def _time(value: str) -> str | datetime.datetime:
+    """Parse ISO 8601 timestamps, other values are passed to PI as time strings."""
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="piconnect", description="Connector to the OSIsoft PI and PI-AF databases."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser(
+        "export",
+        help="export recorded values to partitioned Parquet files",
+        description="Export recorded values to partitioned Parquet files. Running the "
+        "same export again resumes an interrupted export.",
+    )
+    export.add_argument("--server", help="name of the PI Server, defaults to the default")
+    selection = export.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--tags", nargs="+", help="names of the points to export")
+    selection.add_argument(
+        "--tag-file", type=pathlib.Path, help="file with the name of a point on each line"
+    )
+    selection.add_argument("--query", help="search query selecting the points to export")
+    export.add_argument("--start", required=True, type=_time, help="start time, e.g. '*-7d'")
+    export.add_argument("--end", default="*", type=_time, help="end time, defaults to '*'")
+    export.add_argument("--output", required=True, type=pathlib.Path, help="directory")
+    export.add_argument("--partition", choices=["hour", "day", "month"], default="day")
+    export.add_argument("--workers", type=int, default=4, help="concurrent partitions")
+    export.add_argument("--status", action="store_true", help="also export value status")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface with the arguments in `argv`."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    with PI.PIServer(args.server) as server:
+        if args.query:
+            points = server.search(args.query)
+        else:
+            tags = args.tags or [
+                line.strip() for line in args.tag_file.read_text().splitlines() if line.strip()
+            ]
+            points = server.search(tags)
+            missing = set(tags) - {point.name for point in points}
+            if missing:
+                parser.error(f"points not found: {', '.join(sorted(missing))}")
+        result = PIExport.export(
+            points,
+            args.start,
+            args.end,
+            args.output,
+            partition=args.partition,
+            max_workers=args.workers,
+            include_status=args.status,
+        )
+    print(
+        f"Wrote {result.rows} values to {result.files} files, "
+        f"skipped {result.skipped} partitions that were already exported"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Adaptive admission control for calls to PI and PI AF servers.
+
+Every data, search and write call to a server passes through the
+:class:`AdmissionController` of that server. The controller limits the number
+of calls in flight, adapting the limit to the observed latency and errors
+(additive increase, multiplicative decrease), opens a circuit breaker to fail
+fast while the server is unhealthy, and retries transient errors after a
+jittered backoff.
+"""
+
+import dataclasses
+import random
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from PIconnect import _profile
+from PIconnect.config import PIConfig
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionPolicy",
+    "ServerUnavailableError",
+    "call",
+]
+
+_Result = TypeVar("_Result")
+
+#: Names of the exception types that indicate a transient failure of the server.
+TRANSIENT_ERRORS = frozenset(
+    {
+        "CommunicationException",
+        "PIConnectionException",
+        "PITimeoutException",
+        "SocketException",
+        "TimeoutException",
+        "ConnectionError",
+        "TimeoutError",
+    }
+)
+
+
+class ServerUnavailableError(ConnectionError):
+    """Raised without calling the server while its circuit breaker is open."""
+
+
+@dataclasses.dataclass(frozen=True)
+class AdmissionPolicy:
+    """Tuning of the admission control, see :data:`PIConfig.ADMISSION_POLICY`.
+
+    Parameters
+    ----------
+        initial_limit (float): Number of concurrent calls allowed at the start.
+        min_limit (float): Lower bound of the concurrency limit.
+        max_limit (float): Upper bound of the concurrency limit.
+        target_latency (float): Calls slower than this many seconds are
+            counted as a sign of congestion.
+        decrease_factor (float): Factor applied to the limit on congestion.
+        failure_threshold (int): Number of consecutive transient failures
+            after which the circuit breaker opens.
+        reset_timeout (float): Seconds the circuit breaker stays open before a
+            single trial call is allowed.
+        max_retries (int): Number of retries of a call that failed with a
+            transient error.
+        backoff (float): Base of the exponential backoff between retries, in
+            seconds. The actual delay is drawn uniformly up to the backoff.
+        max_backoff (float): Upper bound of the backoff, in seconds.
+    """
+
+    initial_limit: float = 4.0
+    min_limit: float = 1.0
+    max_limit: float = 64.0
+    target_latency: float = 10.0
+    decrease_factor: float = 0.5
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    max_retries: int = 2
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+
+
+def _policy() -> AdmissionPolicy:
+    return PIConfig.ADMISSION_POLICY or AdmissionPolicy()
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return whether the error is a transient failure worth retrying."""
+    return any(cls.__name__ in TRANSIENT_ERRORS for cls in type(error).__mro__)
+
+
+class AdmissionController:
+    """Concurrency limit and circuit breaker of a single server."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self.limit = _policy().initial_limit
+        self.in_flight = 0
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the circuit breaker rejects calls."""
+        return self.opened_at is not None
+
+    def acquire(self) -> None:
+        """Wait for a free slot, or raise if the circuit breaker is open."""
+        with self._condition:
+            while True:
+                if self.opened_at is not None:
+                    if time.monotonic() - self.opened_at < _policy().reset_timeout:
+                        raise ServerUnavailableError(
+                            "Server is unavailable after repeated failures"
+                        )
+                    if not self._probing:
+                        # Half open: let a single trial call through
+                        self._probing = True
+                        self.in_flight += 1
+                        return
+                elif self.in_flight < max(1, int(self.limit)):
+                    self.in_flight += 1
+                    return
+                self._condition.wait()
+
+    def release(self, latency: float, error: BaseException | None = None) -> None:
+        """Free the slot and adapt the limit to the outcome of the call."""
+        policy = _policy()
+        with self._condition:
+            self.in_flight -= 1
+            transient = error is not None and is_transient(error)
+            if transient or latency > policy.target_latency:
+                self.limit = max(policy.min_limit, self.limit * policy.decrease_factor)
+            elif error is None:
+                self.limit = min(policy.max_limit, self.limit + 1 / self.limit)
+            if transient:
+                self.failures += 1
+                if self._probing or self.failures >= policy.failure_threshold:
+                    self.opened_at = time.monotonic()
+            elif error is None:
+                self.failures = 0
+                self.opened_at = None
+            self._probing = False
+            self._condition.notify_all()
+
+    def call(self, method: Callable[..., _Result], *args: Any, retry: bool = True) -> _Result:
+        """Call `method` within the limit, retrying transient errors if `retry` is set."""
+        policy = _policy()
+        attempt = 0
+        while True:
+            self.acquire()
+            start = time.monotonic()
+            try:
+                result = _profile.sdk_call(method, *args)
+            except Exception as error:
+                self.release(time.monotonic() - start, error)
+                if not (retry and is_transient(error) and attempt < policy.max_retries):
+                    raise
+            else:
+                self.release(time.monotonic() - start)
+                return result
+            delay = min(policy.max_backoff, policy.backoff * 2**attempt)
+            time.sleep(random.uniform(0, delay))
+            attempt += 1
+
+
+_controllers: dict[Hashable, AdmissionController] = {}
+_controllers_lock = threading.Lock()
+
+
+def controller(server: Hashable) -> AdmissionController:
+    """Return the admission controller of `server`."""
+    with _controllers_lock:
+        if server not in _controllers:
+            _controllers[server] = AdmissionController()
+        return _controllers[server]
+
+
+def call(
+    server: Hashable, method: Callable[..., _Result], *args: Any, retry: bool = True
+) -> _Result:
+    """Call `method` through the admission controller of `server`.
+
+    Parameters
+    ----------
+        server (hashable): Key of the server that handles the call.
+        method (callable): SDK call to make.
+        *args: Arguments passed to `method`.
+        retry (bool, optional): Defaults to True. Retry transient errors, this
+            should be disabled for calls that are not safe to repeat.
+
+    Raises
+    ------
+        ServerUnavailableError: If the circuit breaker of the server is open.
+    """
+    if not PIConfig.ADMISSION_CONTROL:
+        return _profile.sdk_call(method, *args)
+    return controller(server).call(method, *args, retry=retry)
@@ -0,0 +1,67 @@
+"""Deadlines and cancellation of queries."""
+
+import threading
+import time
+
+__all__ = ["CancellationToken", "QueryCancelledError", "token"]
+
+
+class QueryCancelledError(TimeoutError):
+    """Raised when a query is cancelled, or its deadline passes, before it is made."""
+
+
+class CancellationToken:
+    """Token to cancel running queries, from another thread or after a deadline.
+
+    Queries check the token before each call to the server, so a query that
+    is split in chunks stops after the chunk that is running when the token is
+    cancelled, and returns the chunks that were already fetched.
+
+    Parameters
+    ----------
+        timeout (float, optional): Defaults to None. Number of seconds after
+            which the token is cancelled automatically.
+        parent (CancellationToken, optional): Defaults to None. The token is
+            also cancelled when its parent is cancelled.
+
+    Example
+    -------
+        >>> cancel = CancellationToken()
+        >>> threading.Timer(60, cancel.cancel).start()
+        >>> data = point.recorded_values("*-1y", "*", chunk_size="7d", cancel=cancel)
+        >>> data.attrs["partial"]
+    """
+
+    def __init__(
+        self, timeout: float | None = None, parent: "CancellationToken | None" = None
+    ) -> None:
+        self._event = threading.Event()
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.parent = parent
+
+    def cancel(self) -> None:
+        """Cancel all queries using this token."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether the token was cancelled or its deadline has passed."""
+        return (
+            self._event.is_set()
+            or (self.deadline is not None and time.monotonic() >= self.deadline)
+            or (self.parent is not None and self.parent.cancelled)
+        )
+
+    def raise_if_cancelled(self) -> None:
+        """Raise :class:`QueryCancelledError` if the token was cancelled."""
+        if self.cancelled:
+            raise QueryCancelledError("Query was cancelled or passed its deadline")
+
+
+def token(
+    timeout: float | None = None, cancel: CancellationToken | None = None
+) -> CancellationToken | None:
+    """Combine a per-call `timeout` and a `cancel` token into a single token."""
+    if timeout is None:
+        return cancel
+    return CancellationToken(timeout, parent=cancel)
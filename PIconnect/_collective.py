@@ -0,0 +1,270 @@
+"""Hedged reads and fan-out of bulk reads across the members of a PI collective.
+
+A PI collective consists of several PI Data Archive servers with the same
+data. The SDK connects a :class:`~PIconnect.PI.PIServer` to a single member of
+the collective. The :class:`Collective` of a server additionally connects
+directly to the other members on demand, so that
+
+- a read that has not been answered within a percentile of the recent
+  latencies is re-issued to another member, using the first answer that
+  arrives (a hedged read), and
+- the points of a bulk read are spread over the members, which are read
+  concurrently.
+
+Writes are always sent through the connection of the server itself.
+"""
+
+import collections
+import concurrent.futures
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any, TypeVar
+
+import numpy as np
+
+from PIconnect import AF, _admission
+
+__all__ = ["BulkResults", "Collective", "collective"]
+
+_Result = TypeVar("_Result")
+
+#: Minimum number of latency samples before reads are hedged.
+MIN_SAMPLES = 20
+
+_executor = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="PIconnect-collective")
+_member = threading.local()
+
+
+class Collective:
+    """Direct connections to the members of the collective behind a PI Server.
+
+    Parameters
+    ----------
+        server (AF.PI.PIServer): Connection of the server, as returned by
+            :attr:`PIServer.connection <PIconnect.PI.PIServer.connection>`.
+        window (int, optional): Defaults to 200. Number of recent read latencies
+            used to compute the hedging delay.
+
+    Attributes
+    ----------
+        hedge_percentile (float or None): Percentile of the recent read latencies
+            after which a read is re-issued to another member. Reads are not
+            hedged if None, which is the default.
+        spread (bool): Spread the points of bulk reads over the members.
+    """
+
+    def __init__(self, server: AF.PI.PIServer, window: int = 200) -> None:
+        self.server = server
+        self.hedge_percentile: float | None = None
+        self.spread = False
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._connections: dict[str, AF.PI.PIServer] = {}
+        self._points: dict[tuple[str, str], AF.PI.PIPoint] = {}
+
+    @property
+    def members(self) -> list[str]:
+        """Return the names of the members, in order of priority.
+
+        A server that is not part of a collective has no members.
+        """
+        sdk_collective = self.server.Collective
+        if sdk_collective is None:
+            return []
+        members = sorted(sdk_collective.Members, key=lambda member: member.Priority)
+        return [member.Name for member in members]
+
+    @property
+    def backups(self) -> list[str]:
+        """Return the members other than the member the server is connected to."""
+        sdk_collective = self.server.Collective
+        if sdk_collective is None:
+            return []
+        current = sdk_collective.CurrentMember
+        current_name = None if current is None else current.Name
+        return [name for name in self.members if name != current_name]
+
+    def hedge_delay(self) -> float | None:
+        """Return the number of seconds after which a read is hedged, if any."""
+        if self.hedge_percentile is None or not self.backups:
+            return None
+        with self._lock:
+            if len(self._latencies) < MIN_SAMPLES:
+                return None
+            return float(np.percentile(self._latencies, self.hedge_percentile))
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a read through the server connection."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def connection(self, member: str) -> AF.PI.PIServer:
+        """Return a direct connection to `member`, connecting on first use."""
+        with self._lock:
+            if member not in self._connections:
+                sdk_member = next(
+                    m for m in self.server.Collective.Members if m.Name == member
+                )
+                self._connections[member] = sdk_member.ConnectDirect()
+            return self._connections[member]
+
+    def point(self, member: str, pi_point: AF.PI.PIPoint) -> AF.PI.PIPoint:
+        """Return the copy of `pi_point` that reads directly from `member`."""
+        key = (member, pi_point.Name)
+        with self._lock:
+            point = self._points.get(key)
+        if point is None:
+            point = AF.PI.PIPoint.FindPIPoint(self.connection(member), pi_point.Name)
+            with self._lock:
+                self._points[key] = point
+        return point
+
+    def _key(self, member: str | None = None) -> Hashable:
+        if member is None:
+            return ("PI", self.server.Name)
+        return ("PI", self.server.Name, member)
+
+    def hedged(self, method: Callable[..., _Result], *args: Any) -> _Result:
+        """Call the read `method`, re-issuing it to another member if it is slow.
+
+        The read is first sent through the connection of the server. If it has
+        not completed within :meth:`hedge_delay` seconds, the same read is sent
+        to the member with the highest priority among the :attr:`backups`, and
+        the first successful answer is returned. The SDK calls cannot be
+        interrupted, so the slower read still runs to completion in the
+        background.
+        """
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(method, *args)
+        primary = _executor.submit(self._timed, method, *args)
+        try:
+            return primary.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            pass
+        backup = _executor.submit(self._on_member, self.backups[0], method, *args)
+        pending = {primary, backup}
+        while True:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+            if not pending:
+                return primary.result()
+
+    def _timed(self, method: Callable[..., _Result], *args: Any) -> _Result:
+        start = time.monotonic()
+        result = _admission.call(self._key(), method, *args)
+        self.record(time.monotonic() - start)
+        return result
+
+    def _on_member(self, member: str, method: Callable[..., _Result], *args: Any) -> _Result:
+        with using_member(self, member):
+            return _admission.call(self._key(member), method, *args)
+
+    def fan_out(
+        self,
+        bulk_call: Callable[[Any], Iterable[_Result]],
+        pi_points: list[AF.PI.PIPoint],
+    ) -> "BulkResults[_Result]":
+        """Make a bulk call, spreading the points evenly over the members.
+
+        Each member receives a contiguous slice of the points in its own
+        :afsdk:`AF.PI.PIPointList <T_OSIsoft_AF_PI_PIPointList.htm>`, the
+        members are read concurrently and the results are returned in the
+        order of `pi_points`, without the points for which the read failed.
+        """
+        members = self.members
+        slices = np.array_split(np.arange(len(pi_points)), len(members))
+        futures: list[concurrent.futures.Future[BulkResults[_Result]]] = []
+        for member, positions in zip(members, slices, strict=True):
+            point_list = AF.PI.PIPointList()
+            for position in positions:
+                point_list.Add(self.point(member, pi_points[position]))
+            futures.append(
+                _executor.submit(
+                    _admission.call, self._key(member), _consume, bulk_call, point_list
+                )
+            )
+        results: BulkResults[_Result] = BulkResults()
+        for future in futures:
+            member_results = future.result()
+            results.extend(member_results)
+            results.errors.extend(member_results.errors)
+        return results
+
+
+class BulkResults(list[_Result]):
+    """Results of a bulk call, with the errors of the items that have no result.
+
+    Attributes
+    ----------
+        errors (list of (object, object) tuples): The SDK point or attribute
+            and the error of each item that was left out of the results.
+    """
+
+    def __init__(self, results: Iterable[_Result] = ()) -> None:
+        super().__init__(results)
+        self.errors: list[tuple[Any, Any]] = []
+
+
+def _consume(
+    bulk_call: Callable[[Any], Iterable[_Result]], bulk_list: Any
+) -> BulkResults[_Result]:
+    """Make the bulk call and read all pages of its results.
+
+    The SDK leaves the items for which the call failed out of the results, and
+    reports them in the `Errors` of the results instead.
+    """
+    results = bulk_call(bulk_list)
+    consumed = BulkResults(results)
+    if getattr(results, "HasErrors", False):
+        consumed.errors.extend((error.Key, error.Value) for error in results.Errors)
+    return consumed
+
+
+@contextlib.contextmanager
+def using_member(collective_: Collective, member: str) -> Iterator[None]:
+    """Direct the reads of the current thread on the server to `member`."""
+    previous = getattr(_member, "target", None)
+    _member.target = (collective_, member)
+    try:
+        yield
+    finally:
+        _member.target = previous
+
+
+def resolve(pi_point: AF.PI.PIPoint) -> AF.PI.PIPoint:
+    """Return the SDK point to read from in the current thread.
+
+    This is `pi_point` itself, unless the thread is re-issuing a hedged read to
+    another member of the collective of its server.
+    """
+    target = getattr(_member, "target", None)
+    if target is None:
+        return pi_point
+    collective_, member = target
+    if collective_.server.Name != pi_point.Server.Name:
+        return pi_point
+    return collective_.point(member, pi_point)
+
+
+_collectives: dict[str, Collective] = {}
+_collectives_lock = threading.Lock()
+
+
+def collective(server: AF.PI.PIServer) -> Collective:
+    """Return the :class:`Collective` of `server`, shared by all its connections."""
+    with _collectives_lock:
+        if server.Name not in _collectives:
+            _collectives[server.Name] = Collective(server)
+        return _collectives[server.Name]
+
+
+def lookup(server: AF.PI.PIServer) -> Collective | None:
+    """Return the :class:`Collective` of `server` if hedging or fan-out was configured."""
+    return _collectives.get(server.Name)
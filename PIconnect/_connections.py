@@ -0,0 +1,188 @@
+"""Shared, reference counted connections to PI and PI AF servers."""
+
+import atexit
+import dataclasses
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from PIconnect.config import PIConfig
+
+#: Connects the connection, the argument forces a new attempt after a recent failure.
+Connect = Callable[[bool], None]
+
+
+@dataclasses.dataclass
+class _Session:
+    connection: Any
+    disconnect: Callable[[], None] | None
+    references: int = 0
+    idle_since: float = 0.0
+
+
+def credentials_fingerprint(*credentials: Any) -> str:
+    """Return a fingerprint of the credentials, to tell connections apart without storing them."""  # noqa: E501
+    digest = hashlib.sha256()
+    for part in credentials:
+        digest.update(repr(part).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def is_connected(connection: Any) -> bool:
+    """Return whether the SDK reports the connection as connected."""
+    try:
+        return bool(connection.ConnectionInfo.IsConnected)
+    except Exception:
+        return False
+
+
+class ConnectionInUseError(ConnectionError):
+    """Raised when a connection is acquired with other credentials while it is in use."""
+
+
+class ConnectionPool:
+    """Reference counted pool of live connections.
+
+    Each connection context acquires the connection for its key, typically the
+    server name and a fingerprint of the credentials, and releases it when the
+    context is closed. A connection is only (re)connected if it was not
+    connected with the same key before, or if the health check shows the
+    connection was lost. Connections that are no longer used are kept open for
+    :data:`PIConfig.CONNECTION_IDLE_TIMEOUT <PIconnect.config.PIConfigContainer.CONNECTION_IDLE_TIMEOUT>`
+    seconds, so consecutive contexts reuse the same session.
+
+    The SDK shares a single connection object per server, so acquiring a server
+    with other credentials reconnects that object with the new credentials.
+    This is refused while the connection is in use with other credentials.
+    Connecting and disconnecting only hold a lock of the connection, so a slow
+    server does not block the contexts of other servers.
+    """  # noqa: E501
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: dict[Hashable, _Session] = {}
+        self._owners: dict[int, Hashable] = {}
+        self._connection_locks: dict[int, threading.Lock] = {}
+
+    def acquire(
+        self,
+        key: Hashable,
+        connection: Any,
+        connect: Connect,
+        disconnect: Callable[[], None] | None = None,
+    ) -> None:
+        """Acquire a reference to the connection, connecting it if needed.
+
+        Parameters
+        ----------
+            key (hashable): Identifier of the session, connections with the
+                same key are shared.
+            connection: SDK object of the connection, used for the health check.
+            connect (callable): Connects the connection, it is called with
+                `True` to force a new attempt if a live connection was lost.
+            disconnect (callable, optional): Defaults to None. Disconnects the
+                connection when it has been idle for too long. If None, idle
+                connections are left open.
+
+        Raises
+        ------
+            ConnectionInUseError: If the connection is in use by a session with
+                another key, such as other credentials for the same server.
+        """
+        with self._lock:
+            closed = self._close_idle()
+            in_use = any(
+                other_key != key and other.connection is connection and other.references
+                for other_key, other in self._sessions.items()
+            )
+            if not in_use:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._sessions[key] = _Session(connection, disconnect)
+                # Reserve the session, so other credentials are refused while connecting
+                session.references += 1
+            connection_lock = self._connection_lock(connection)
+        self._disconnect(closed)
+        if in_use:
+            raise ConnectionInUseError(
+                "The connection is in use with other credentials, close those "
+                "contexts before connecting with these credentials"
+            )
+        try:
+            with connection_lock:
+                with self._lock:
+                    owned = self._owners.get(id(connection)) == key
+                if not owned:
+                    connect(False)
+                    with self._lock:
+                        self._owners[id(connection)] = key
+                elif not is_connected(connection):
+                    connect(True)
+        except BaseException:
+            self.release(key)
+            raise
+
+    def release(self, key: Hashable) -> None:
+        """Release a reference to the connection, keeping it open for reuse."""
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None or session.references == 0:
+                return
+            session.references -= 1
+            if session.references == 0:
+                session.idle_since = time.monotonic()
+
+    def references(self, key: Hashable) -> int:
+        """Return the number of open contexts on the connection for `key`."""
+        session = self._sessions.get(key)
+        return 0 if session is None else session.references
+
+    def close(self, idle_timeout: float = 0.0) -> None:
+        """Disconnect all connections that have been unused for `idle_timeout` seconds."""
+        with self._lock:
+            closed = self._close_idle(idle_timeout)
+        self._disconnect(closed)
+
+    def _connection_lock(self, connection: Any) -> threading.Lock:
+        return self._connection_locks.setdefault(id(connection), threading.Lock())
+
+    def _close_idle(self, idle_timeout: float | None = None) -> list[_Session]:
+        """Remove the idle sessions and return those whose connection should be closed."""
+        if idle_timeout is None:
+            idle_timeout = PIConfig.CONNECTION_IDLE_TIMEOUT
+        now = time.monotonic()
+        closed: list[_Session] = []
+        for key, session in list(self._sessions.items()):
+            if session.references or now - session.idle_since < idle_timeout:
+                continue
+            del self._sessions[key]
+            # Sessions with other credentials share the connection object of the SDK,
+            # which is only disconnected when the last of them is closed
+            if any(
+                other.connection is session.connection for other in self._sessions.values()
+            ):
+                continue
+            self._owners.pop(id(session.connection), None)
+            if session.disconnect is not None:
+                closed.append(session)
+        return closed
+
+    def _disconnect(self, closed: list[_Session]) -> None:
+        """Disconnect the closed sessions, unless their connection was acquired again."""
+        for session in closed:
+            with self._connection_lock(session.connection):
+                with self._lock:
+                    if any(
+                        other.connection is session.connection
+                        for other in self._sessions.values()
+                    ):
+                        continue
+                assert session.disconnect is not None
+                session.disconnect()
+
+
+pool = ConnectionPool()
+atexit.register(pool.close)
@@ -0,0 +1,253 @@
+"""Profiling of the time spent in SDK calls, value conversion and result construction.
+
+While a :class:`Profile` is active, every call to the SDK that passes through
+:func:`PIconnect._admission.call` is timed per SDK method, and the conversion
+of the returned values and the construction of the result are timed per
+function. Profiles cover all threads, so the chunks and bulk reads that run in
+worker threads are included.
+"""
+
+import dataclasses
+import functools
+import json
+import os
+import threading
+import time
+import types
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+__all__ = ["Profile", "Timing", "profile"]
+
+_Result = TypeVar("_Result")
+
+#: Phases of a read, in the order of the report.
+PHASES = ("sdk", "conversion", "result")
+
+_ROW = "{:<11}{:<40}{:>8}{:>11}{:>11}{:>11}"
+
+_profiles: list["Profile"] = []
+_profiles_lock = threading.Lock()
+_local = threading.local()
+
+
+@dataclasses.dataclass
+class Timing:
+    """Number of calls and time spent in a single SDK method or function.
+
+    Attributes
+    ----------
+        phase (str): `'sdk'` for calls to the SDK, `'conversion'` for the
+            conversion of SDK values to arrays, or `'result'` for the
+            construction of the pandas or Arrow result.
+        name (str): Name of the SDK method or function.
+        calls (int): Number of calls.
+        seconds (float): Total time spent in the calls.
+        values (int): Number of values converted.
+    """
+
+    phase: str
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    values: int = 0
+
+
+class Profile:
+    """Breakdown of the time spent within a `with` block, see :func:`profile`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._timings: dict[tuple[str, str], Timing] = {}
+        self._start: float | None = None
+        self.wall = 0.0
+
+    def __enter__(self) -> "Profile":
+        """Start profiling all threads."""
+        self._start = time.perf_counter()
+        with _profiles_lock:
+            _profiles.append(self)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop profiling and record the wall time of the block."""
+        with _profiles_lock:
+            _profiles.remove(self)
+        if self._start is not None:
+            self.wall = time.perf_counter() - self._start
+
+    def record(self, phase: str, name: str, seconds: float, values: int = 0) -> None:
+        """Add a call to the timing of `name`."""
+        with self._lock:
+            timing = self._timings.setdefault((phase, name), Timing(phase, name))
+            timing.calls += 1
+            timing.seconds += seconds
+            timing.values += values
+
+    @property
+    def timings(self) -> list[Timing]:
+        """Return the timings, slowest first."""
+        with self._lock:
+            timings = [dataclasses.replace(timing) for timing in self._timings.values()]
+        return sorted(timings, key=lambda timing: (-timing.seconds, timing.name))
+
+    def totals(self) -> dict[str, float]:
+        """Return the total time spent in each phase, in seconds."""
+        totals = dict.fromkeys(PHASES, 0.0)
+        for timing in self.timings:
+            totals[timing.phase] += timing.seconds
+        return totals
+
+    @property
+    def values(self) -> int:
+        """Return the number of values converted."""
+        return sum(timing.values for timing in self.timings)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the profile as a dictionary of plain types."""
+        return {
+            "wall": self.wall,
+            "totals": self.totals(),
+            "values": self.values,
+            "timings": [dataclasses.asdict(timing) for timing in self.timings],
+        }
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write the profile to a JSON file."""
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def report(self) -> str:
+        """Return a table of the timings, slowest first."""
+        totals = self.totals()
+        lines = [
+            f"Wall time {self.wall:.3f} s, "
+            + ", ".join(f"{phase} {totals[phase]:.3f} s" for phase in PHASES)
+            + f", {self.values} values",
+            "",
+            _ROW.format("phase", "name", "calls", "total s", "mean ms", "values"),
+        ]
+        for timing in self.timings:
+            mean = 1000 * timing.seconds / timing.calls
+            lines.append(
+                _ROW.format(
+                    timing.phase,
+                    timing.name,
+                    timing.calls,
+                    f"{timing.seconds:.3f}",
+                    f"{mean:.3f}",
+                    timing.values,
+                )
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Return the report of the profile."""
+        return self.report()
+
+
+def profile() -> Profile:
+    """Profile the reads within a `with` block.
+
+    The profile counts the calls to each SDK method and the time spent in
+    them, separately from the time spent converting the values returned by
+    the SDK and the time spent constructing the pandas or Arrow result. Only
+    the time of the outermost timed call of each thread is counted, so the
+    phases do not overlap. Reads that run in worker threads are included, so
+    the total time of a phase can exceed the wall time of the block.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with PIconnect.profile() as profile:
+            data = point.recorded_values("*-7d", "*")
+        print(profile.report())
+        profile.dump("profile.json")
+    """
+    return Profile()
+
+
+def _record(phase: str, name: str, seconds: float, values: int = 0) -> None:
+    with _profiles_lock:
+        profiles = list(_profiles)
+    for active_profile in profiles:
+        active_profile.record(phase, name, seconds, values)
+
+
+def _timed_call(
+    phase: str,
+    name: str,
+    method: Callable[..., _Result],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    values: Callable[[_Result], int] | None = None,
+) -> _Result:
+    """Call `method` and record its time, unless it is nested in another timed call."""
+    if getattr(_local, "timing", False):
+        return method(*args, **kwargs)
+    _local.timing = True
+    start = time.perf_counter()
+    try:
+        result = method(*args, **kwargs)
+    finally:
+        _local.timing = False
+        seconds = time.perf_counter() - start
+    _record(phase, name, seconds, values(result) if values is not None else 0)
+    return result
+
+
+def timed(
+    phase: str, values: Callable[[Any], int] | None = None
+) -> Callable[[Callable[..., _Result]], Callable[..., _Result]]:
+    """Decorate a function to record its time in `phase` while a profile is active.
+
+    Parameters
+    ----------
+        phase (str): Phase to record the time in.
+        values (callable, optional): Defaults to None. Return the number of
+            values converted from the result of the function.
+    """
+
+    def decorator(function: Callable[..., _Result]) -> Callable[..., _Result]:
+        name = function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> _Result:
+            if not _profiles:
+                return function(*args, **kwargs)
+            return _timed_call(phase, name, function, args, kwargs, values)
+
+        return wrapper
+
+    return decorator
+
+
+def call_name(method: Callable[..., Any], args: tuple[Any, ...] = ()) -> str:
+    """Return the name under which a call to the SDK is reported.
+
+    Bulk calls are named by the type of the bulk list and the SDK method
+    called on it, such as `PIPointList.RecordedValues`. Other calls are named
+    by the class of the point, attribute or SDK object and the method, such as
+    `PIPoint.recorded_values` for the function defined in that method.
+    """
+    if method.__name__ == "_consume" and len(args) == 2:
+        names = args[0].__code__.co_names
+        return f"{type(args[1]).__name__}.{names[-1] if names else '<bulk call>'}"
+    name = getattr(method, "__name__", type(method).__name__)
+    owner = getattr(method, "__self__", None)
+    if isinstance(method, types.FunctionType):
+        name = method.__qualname__.split(".<locals>")[0].rsplit(".", 1)[-1]
+        code = method.__code__
+        if "self" in code.co_freevars and method.__closure__ is not None:
+            owner = method.__closure__[code.co_freevars.index("self")].cell_contents
+    if owner is None or isinstance(owner, types.ModuleType):
+        return name
+    return f"{type(owner).__name__}.{name.lstrip('_')}"
+
+
+def sdk_call(method: Callable[..., _Result], *args: Any) -> _Result:
+    """Call the SDK, recording the time of the call while a profile is active."""
+    if not _profiles:
+        return method(*args)
+    return _timed_call("sdk", call_name(method, args), method, args, {})
@@ -0,0 +1,265 @@
+"""Conversion of read results to numpy, pandas, Arrow or Polars.
+
+All reads first collect their results as typed numpy arrays in a
+:class:`Columns` object, which is converted to the requested result format as
+the last step. The numpy and Arrow formats do not require pandas, and the
+conversion to Arrow, and from there to Polars, reuses the numpy buffers where
+the types allow it.
+"""
+
+import dataclasses
+import importlib
+import importlib.util
+import typing
+from typing import Any, Literal
+
+import numpy as np
+
+from PIconnect import _profile
+from PIconnect.config import PIConfig
+
+__all__ = ["Categorical", "Columns", "ResultFormat", "convert"]
+
+#: Formats in which read results can be returned, see :ref:`result_formats`.
+ResultFormat = Literal["numpy", "pandas", "arrow", "record_batch", "polars"]
+FORMATS: tuple[str, ...] = typing.get_args(ResultFormat)
+
+#: Extra of the PIconnect package that installs each optional dependency.
+_EXTRAS = {"pandas": "pandas", "pyarrow": "arrow", "polars": "polars"}
+
+
+def available(module: str) -> bool:
+    """Return whether an optional dependency is installed."""
+    return importlib.util.find_spec(module) is not None
+
+
+def import_optional(module: str) -> Any:
+    """Import an optional dependency, or explain which extra installs it."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required for this result format, install it with "
+            f"`pip install PIconnect[{_EXTRAS[module]}]`"
+        ) from None
+
+
+@dataclasses.dataclass
+class Categorical:
+    """Digital values as integer codes into a list of category names.
+
+    Missing values have code -1, like :class:`pandas.Categorical`.
+    """
+
+    codes: "np.ndarray[Any, np.dtype[np.int64]]"
+    categories: list[str]
+
+    def __len__(self) -> int:
+        """Return the number of values."""
+        return len(self.codes)
+
+    def __getitem__(self, key: Any) -> "Categorical":
+        """Return a selection of the values, with the same categories."""
+        return Categorical(self.codes[key], self.categories)
+
+    @classmethod
+    def from_values(cls, values: list[str]) -> "Categorical":
+        """Encode a list of names, using the sorted unique names as categories."""
+        categories, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+        return cls(codes.astype(np.int64), [str(category) for category in categories])
+
+    def to_numpy(self) -> "np.ndarray[Any, Any]":
+        """Return the category names as an object array, with None for missing values."""
+        names = np.array([*self.categories, None], dtype=object)
+        return names[self.codes]
+
+
+@dataclasses.dataclass
+class Columns:
+    """Columnar result of a read, returned as is by the `numpy` result format.
+
+    Parameters
+    ----------
+        columns (dict): Arrays by column name. Numeric columns with missing
+            values are :class:`numpy.ma.MaskedArray`, digital values are
+            :class:`Categorical`.
+        index (str, optional): Name of the column used as index by pandas.
+        times (tuple of str): Names of the `datetime64[ns]` columns in UTC,
+            these are converted to the configured timezone.
+        attrs (dict): Metadata of the result, such as the `tag` and `uom`.
+    """
+
+    columns: dict[str, Any]
+    index: str | None = None
+    times: tuple[str, ...] = ()
+    attrs: dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the array of a column."""
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(next(iter(self.columns.values()), ()))
+
+    def take(self, rows: Any) -> "Columns":
+        """Return the selected rows, given as a boolean mask or positions."""
+        return dataclasses.replace(
+            self, columns={name: column[rows] for name, column in self.columns.items()}
+        )
+
+    @property
+    def timezone(self) -> str:
+        """Return the timezone in which the time columns are presented."""
+        return "UTC" if PIConfig.UTC_NATIVE else PIConfig.DEFAULT_TIMEZONE
+
+
+def align(column: Any, positions: "np.ndarray[Any, Any]", length: int) -> Any:
+    """Place the values of a column at `positions` in a column of `length` rows.
+
+    The other rows are missing: a masked value for numeric columns, code -1
+    for :class:`Categorical` columns and None for object columns.
+    """
+    if isinstance(column, Categorical):
+        codes = np.full(length, -1, dtype=np.int64)
+        codes[positions] = column.codes
+        return Categorical(codes, column.categories)
+    if column.dtype == object:
+        values = np.full(length, None, dtype=object)
+        values[positions] = column
+        return values
+    data = np.zeros(length, dtype=column.dtype)
+    mask = np.ones(length, dtype=bool)
+    data[positions] = np.ma.getdata(column)
+    mask[positions] = np.ma.getmaskarray(column)
+    return np.ma.MaskedArray(data, mask)
+
+
+def resolve(result_format: str | None) -> str:
+    """Return the result format to use, defaulting to :data:`PIConfig.RESULT_FORMAT`."""
+    result_format = result_format or PIConfig.RESULT_FORMAT
+    if result_format not in FORMATS:
+        raise ValueError(
+            f"Unknown result format {result_format!r}, expected one of {', '.join(FORMATS)}"
+        )
+    return result_format
+
+
+def convert(columns: Columns, result_format: str | None = None, series: bool = False) -> Any:
+    """Convert a columnar result to the requested format.
+
+    Parameters
+    ----------
+        columns (Columns): Result to convert.
+        result_format (str, optional): Defaults to
+            :data:`PIConfig.RESULT_FORMAT <PIconnect.config.PIConfigContainer.RESULT_FORMAT>`.
+            One of `'numpy'`, `'pandas'`, `'arrow'`, `'record_batch'` or `'polars'`.
+        series (bool, optional): Defaults to False. Return a
+            :class:`~PIconnect.PIData.PISeries` of the `value` column instead of
+            a dataframe when the format is pandas.
+    """  # noqa: E501
+    result_format = resolve(result_format)
+    if result_format == "numpy":
+        return columns
+    if result_format == "pandas":
+        return to_pandas(columns, series)
+    batch = to_record_batch(columns)
+    if result_format == "record_batch":
+        return batch
+    pa = import_optional("pyarrow")
+    if result_format == "arrow":
+        return pa.Table.from_batches([batch])
+    return import_optional("polars").from_arrow(batch)
+
+
+@_profile.timed("result")
+def to_pandas(columns: Columns, series: bool = False) -> Any:
+    """Convert a columnar result to a pandas dataframe, or a PISeries."""
+    pd = import_optional("pandas")
+    data = {
+        name: _pandas_array(pd, column, name in columns.times, columns.timezone)
+        for name, column in columns.columns.items()
+    }
+    index = None if columns.index is None else data.pop(columns.index)
+    if series:
+        from PIconnect.PIData import PISeries
+
+        result = PISeries(  # type: ignore
+            tag=columns.attrs.get("tag"),
+            timestamp=index,
+            value=data["value"],
+            uom=columns.attrs.get("uom"),
+        )
+    elif not data and index is not None and not len(index):
+        result = pd.DataFrame()
+    else:
+        result = pd.DataFrame(data, index=index)
+        if index is not None:
+            result.index.name = None if columns.index == "timestamp" else columns.index
+    result.attrs.update(columns.attrs)
+    return result
+
+
+def _pandas_array(pd: Any, column: Any, is_time: bool, timezone: str) -> Any:
+    if isinstance(column, Categorical):
+        return pd.Categorical.from_codes(column.codes, categories=column.categories)
+    if is_time:
+        return pd.DatetimeIndex(column, tz="UTC").tz_convert(timezone)
+    if isinstance(column, np.ma.MaskedArray):
+        if column.dtype.kind == "f":
+            return column.filled(np.nan)
+        data, mask = column.data, np.ma.getmaskarray(column)
+        if column.dtype.kind == "b":
+            return pd.arrays.BooleanArray(data, mask)
+        if column.dtype.kind in "iu":
+            return pd.arrays.IntegerArray(data, mask)
+        return _filled_objects(column)
+    return column
+
+
+def _filled_objects(column: "np.ma.MaskedArray[Any, Any]") -> "np.ndarray[Any, Any]":
+    """Return a masked array of other values as an object array, with None where masked."""
+    values = np.array(column.data, dtype=object)
+    values[np.ma.getmaskarray(column)] = None
+    return values
+
+
+@_profile.timed("result")
+def to_record_batch(columns: Columns) -> Any:
+    """Convert a columnar result to an Arrow record batch.
+
+    Numeric and timestamp columns without missing values share their buffers
+    with the numpy arrays. The `attrs` are stored in the schema metadata.
+    """
+    pa = import_optional("pyarrow")
+    arrays = [
+        _arrow_array(pa, column, name in columns.times, columns.timezone)
+        for name, column in columns.columns.items()
+    ]
+    metadata = {key: str(value) for key, value in columns.attrs.items() if value is not None}
+    return pa.RecordBatch.from_arrays(
+        arrays, names=list(columns.columns), metadata=metadata or None
+    )
+
+
+def _arrow_array(pa: Any, column: Any, is_time: bool, timezone: str) -> Any:
+    if isinstance(column, Categorical):
+        codes = pa.array(column.codes.astype(np.int32), mask=column.codes < 0)
+        return pa.DictionaryArray.from_arrays(codes, pa.array(column.categories))
+    if is_time:
+        nanoseconds = np.asarray(column).view(np.int64)
+        return pa.array(
+            nanoseconds,
+            type=pa.timestamp("ns", tz=timezone),
+            mask=nanoseconds == np.iinfo(np.int64).min,
+        )
+    if isinstance(column, np.ma.MaskedArray):
+        if column.dtype.kind in "biuf":
+            return pa.array(column.data, mask=np.ma.getmaskarray(column))
+        column = _filled_objects(column)
+    if column.dtype == object:
+        try:
+            return pa.array(column, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return pa.array([None if value is None else str(value) for value in column])
+    return pa.array(column)
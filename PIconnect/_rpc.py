@@ -0,0 +1,157 @@
+"""Client RPC metrics of PI and PI AF servers, per block of code.
+
+The SDK counts the remote procedure calls that the client makes to a server,
+per RPC, together with the total time spent in them. :class:`RpcMetrics`
+takes a snapshot of these cumulative metrics before and after a block or a
+single call, and reports the difference.
+"""
+
+import dataclasses
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+import numpy as np
+
+from PIconnect import AF, _results
+
+__all__ = ["RpcMetric", "RpcMetrics"]
+
+_Result = TypeVar("_Result")
+
+_ROW = "{:<50}{:>8}{:>12}{:>12}"
+
+
+@dataclasses.dataclass(frozen=True)
+class RpcMetric:
+    """Calls to a single RPC and the time spent in them.
+
+    Attributes
+    ----------
+        name (str): Name of the RPC.
+        calls (int): Number of calls.
+        milliseconds (float): Total time of the calls, in milliseconds.
+    """
+
+    name: str
+    calls: int
+    milliseconds: float
+
+
+def _snapshot(system: AF.PISystem | AF.PI.PIServer) -> dict[str, tuple[int, float]]:
+    return {
+        str(metric.Name): (int(metric.Count), float(metric.Milliseconds))
+        for metric in system.GetClientRpcMetrics()
+    }
+
+
+class RpcMetrics:
+    """Difference of the client RPC metrics of a server before and after a block.
+
+    The metrics are kept by the SDK per server for the whole process, so
+    calls made by other threads while the block runs are included.
+
+    Parameters
+    ----------
+        system (AF.PISystem or AF.PI.PIServer): SDK server whose metrics are
+            read, see :meth:`PIServer.rpc_metrics
+            <PIconnect.PI.PIServer.rpc_metrics>` and
+            :meth:`PIAFDatabase.rpc_metrics <PIconnect.PIAF.PIAFDatabase.rpc_metrics>`.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with PI.PIAFDatabase() as database, database.rpc_metrics() as metrics:
+            database.search("Plant1|Flow")
+        print(metrics.report())
+    """
+
+    def __init__(self, system: AF.PISystem | AF.PI.PIServer) -> None:
+        self.system = system
+        self.metrics: list[RpcMetric] = []
+        self._before: dict[str, tuple[int, float]] | None = None
+
+    def __enter__(self) -> "RpcMetrics":
+        """Take the snapshot of the metrics before the block."""
+        self._before = _snapshot(self.system)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Take the snapshot after the block and store the difference."""
+        after = _snapshot(self.system)
+        before = self._before or {}
+        metrics = []
+        for name, (count, milliseconds) in after.items():
+            count_before, milliseconds_before = before.get(name, (0, 0.0))
+            if count > count_before or milliseconds > milliseconds_before:
+                metrics.append(
+                    RpcMetric(name, count - count_before, milliseconds - milliseconds_before)
+                )
+        self.metrics = sorted(metrics, key=lambda metric: (-metric.milliseconds, metric.name))
+        self._before = None
+
+    def measure(self, function: Callable[..., _Result], *args: Any, **kwargs: Any) -> _Result:
+        """Call `function` and store the RPC metrics of the call.
+
+        Returns
+        -------
+            The result of `function`.
+        """
+        with self:
+            return function(*args, **kwargs)
+
+    @property
+    def calls(self) -> int:
+        """Return the total number of RPCs made."""
+        return sum(metric.calls for metric in self.metrics)
+
+    @property
+    def milliseconds(self) -> float:
+        """Return the total time spent in RPCs, in milliseconds."""
+        return sum(metric.milliseconds for metric in self.metrics)
+
+    def table(self, result_format: _results.ResultFormat | None = None) -> Any:
+        """Return the calls and time per RPC, slowest first.
+
+        Parameters
+        ----------
+            result_format (str, optional): Defaults to None, which uses
+                `PIConfig.RESULT_FORMAT`. Format of the result, see
+                :ref:`result_formats`.
+
+        Returns
+        -------
+            pandas.DataFrame: Dataframe indexed by the RPC `name`, with the
+                number of `calls` and the total time in `milliseconds`.
+        """
+        columns = {
+            "name": np.array([metric.name for metric in self.metrics], dtype=object),
+            "calls": np.array([metric.calls for metric in self.metrics], dtype=np.int64),
+            "milliseconds": np.array(
+                [metric.milliseconds for metric in self.metrics], dtype=np.float64
+            ),
+        }
+        return _results.convert(
+            _results.Columns(columns, index="name", attrs={"server": self.system.Name}),
+            result_format,
+        )
+
+    def report(self) -> str:
+        """Return a table of the calls and time per RPC, slowest first."""
+        lines = [
+            f"{self.calls} RPCs to {self.system.Name} in {self.milliseconds:.1f} ms",
+            "",
+            _ROW.format("rpc", "calls", "total ms", "mean ms"),
+        ]
+        for metric in self.metrics:
+            mean = metric.milliseconds / metric.calls if metric.calls else 0.0
+            lines.append(
+                _ROW.format(
+                    metric.name, metric.calls, f"{metric.milliseconds:.1f}", f"{mean:.2f}"
+                )
+            )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Return the report of the metrics."""
+        return self.report()
@@ -2,20 +2,53 @@
 
 # pyright: strict
 import datetime
-import zoneinfo
+import functools
+import re
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, TypeAlias
 
-from PIconnect import AF, PIConfig
+import numpy as np
+
+from PIconnect import AF, PIConfig, _profile, _results
 from PIconnect.AFSDK import System
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 TimeLike = str | datetime.datetime
+TimesLike: TypeAlias = "pd.DatetimeIndex | np.ndarray[Any, Any] | Iterable[datetime.datetime]"
+
+#: Number of .NET ticks (100 ns) between 0001-01-01 and the unix epoch.
+_EPOCH_TICKS = 621_355_968_000_000_000
+#: Range of .NET ticks that can be represented as `datetime64[ns]`, the minimum
+#: int64 value is reserved for `NaT`.
+_MIN_TICKS = (np.iinfo(np.int64).min + 1) // 100 + _EPOCH_TICKS + 1
+_MAX_TICKS = np.iinfo(np.int64).max // 100 + _EPOCH_TICKS
+#: Fixed length units of time, in ticks.
+_UNIT_TICKS = {
+    "w": 7 * 24 * 3600 * 10**7,
+    "d": 24 * 3600 * 10**7,
+    "h": 3600 * 10**7,
+    "m": 60 * 10**7,
+    "min": 60 * 10**7,
+    "s": 10**7,
+    "ms": 10**4,
+}
+_LENGTH = re.compile(r"^\s*(\d+(?:\.\d*)?)\s*(w|d|h|min|m|s|ms)\s*$")
+#: Tick value that is converted to `NaT`.
+NAT_TICKS = 0
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
 
-def to_af_time_range(start_time: TimeLike, end_time: TimeLike) -> AF.Time.AFTimeRange:
+def to_af_time_range(
+    start_time: TimeLike, end_time: TimeLike, time_query: "TimeQuery | None" = None
+) -> AF.Time.AFTimeRange:
     """Convert a combination of start and end time to a time range.
 
     Both `start_time` and `end_time` can be either a :any:`datetime.datetime` object or
     a string.
-    `datetime` objects are first converted to a string, before being passed to
+    If both are `datetime` objects, they are converted exactly using :func:`to_af_time`.
+    Otherwise `datetime` objects are first converted to a string, before being passed to
     :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`.
     It is also possible to specify either end as a `datetime` object,
     and then specify the other boundary as a relative string.
@@ -24,12 +57,18 @@ def to_af_time_range(start_time: TimeLike, end_time: TimeLike) -> AF.Time.AFTime
     ----------
         start_time (str | datetime): Start time of the time range.
         end_time (str | datetime): End time of the time range.
+        time_query (TimeQuery, optional): Defaults to None. If given, the time
+            range is parsed, and cached, by this :class:`TimeQuery`.
 
     Returns
     -------
         :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`:
             Time range covered by the start and end time.
     """
+    if time_query is not None:
+        return time_query.time_range(start_time, end_time)
+    if isinstance(start_time, datetime.datetime) and isinstance(end_time, datetime.datetime):
+        return AF.Time.AFTimeRange(to_af_time(start_time), to_af_time(end_time))
     if isinstance(start_time, datetime.datetime):
         start_time = start_time.isoformat()
     if isinstance(end_time, datetime.datetime):
@@ -38,24 +77,264 @@ def to_af_time_range(start_time: TimeLike, end_time: TimeLike) -> AF.Time.AFTime
     return AF.Time.AFTimeRange.Parse(start_time, end_time)
 
 
-def to_af_time(time: TimeLike) -> AF.Time.AFTime:
+def to_af_time(time: TimeLike, time_query: "TimeQuery | None" = None) -> AF.Time.AFTime:
     """Convert a time to a AFTime value.
 
     Parameters
     ----------
         time (str | datetime): Time to convert to AFTime.
+        time_query (TimeQuery, optional): Defaults to None. If given, the time
+            is parsed, and cached, by this :class:`TimeQuery`.
 
     Returns
     -------
         :afsdk:`AF.Time.AFTime <M_OSIsoft_AF_Time_AFTime__ctor_7.htm>`:
             AFTime version of time.
     """
+    if time_query is not None:
+        return time_query.time(time)
     if isinstance(time, datetime.datetime):
-        time = time.isoformat()
+        return to_af_times([time])[0]
 
     return AF.Time.AFTime(time)
 
 
+def to_af_times(times: TimesLike) -> list[AF.Time.AFTime]:
+    """Convert an array of timestamps to AFTime values.
+
+    The timestamps are converted to UTC .NET ticks in a single vectorised step,
+    and each AFTime is then created directly from its ticks instead of parsing
+    a string representation of the timestamp.
+
+    Parameters
+    ----------
+        times (pandas.DatetimeIndex, numpy.ndarray or iterable of datetime):
+            Timestamps to convert. Naive timestamps are interpreted in
+            :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`,
+            timezone aware timestamps keep their own timezone.
+
+    Returns
+    -------
+        list of :afsdk:`AF.Time.AFTime <M_OSIsoft_AF_Time_AFTime__ctor.htm>`:
+            AFTime versions of the timestamps.
+    """  # noqa: E501
+    return [ticks_to_af_time(tick) for tick in datetimes_to_ticks(times).tolist()]
+
+
+def ticks_to_af_time(ticks: int) -> AF.Time.AFTime:
+    """Convert UTC .NET ticks to a AFTime value."""
+    return AF.Time.AFTime(System.DateTime(ticks, System.DateTimeKind.Utc))
+
+
+def split_time_range(
+    time_range: AF.Time.AFTimeRange,
+    chunk_size: str | datetime.timedelta,
+    interval: str | None = None,
+) -> list[tuple[int, int]]:
+    """Split a time range in consecutive chunks of at most `chunk_size`.
+
+    Parameters
+    ----------
+        time_range (AFTimeRange): Time range to split.
+        chunk_size (str or timedelta): Maximum length of each chunk, e.g. `'7d'`,
+            see :func:`length_to_ticks`.
+        interval (str, optional): Defaults to None. If given, the chunks are
+            aligned to whole multiples of this interval from the start time, so
+            the intervals of the query are not split. The interval must have a
+            fixed length, e.g. `'1h'`, calendar intervals such as `'1mo'` are
+            not supported.
+
+    Returns
+    -------
+        list of (int, int): UTC ticks of the start and end time of each chunk.
+            A time range that runs backwards in time is not split.
+
+    Raises
+    ------
+        ValueError: If the chunk size or interval is not a fixed length of time.
+    """
+    step = length_to_ticks(chunk_size)
+    if interval is not None:
+        interval_ticks = length_to_ticks(interval)
+        if interval_ticks <= 0:
+            raise ValueError(f"Interval {interval!r} must be a positive fixed length")
+        step = max(1, step // interval_ticks) * interval_ticks
+    if step <= 0:
+        raise ValueError(f"Chunk size {chunk_size!r} must be a positive length of time")
+    start = time_range.StartTime.UtcTime.Ticks
+    end = time_range.EndTime.UtcTime.Ticks
+    if end <= start:
+        return [(start, end)]
+    bounds = list(range(start, end, step)) + [end]
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
+
+
+def even_chunk_size(time_range: AF.Time.AFTimeRange, parts: int) -> datetime.timedelta:
+    """Return the chunk size that splits a time range in `parts` chunks of equal length."""
+    span = abs(time_range.EndTime.UtcTime.Ticks - time_range.StartTime.UtcTime.Ticks)
+    return datetime.timedelta(microseconds=-(-span // (10 * parts)))
+
+
+def length_to_ticks(length: str | datetime.timedelta) -> int:
+    """Convert a fixed length of time to a number of ticks.
+
+    Strings consist of a number and a unit, `w`, `d`, `h`, `m` or `min`, `s`
+    or `ms`, such as `'7d'` or `'15m'`. Other strings are parsed by
+    :class:`pandas.Timedelta` if pandas is installed.
+
+    Raises
+    ------
+        ValueError: If the string is not a fixed length of time.
+    """
+    if isinstance(length, datetime.timedelta):
+        return length // datetime.timedelta(microseconds=1) * 10
+    match = _LENGTH.match(length)
+    if match is not None:
+        return int(float(match.group(1)) * _UNIT_TICKS[match.group(2)])
+    pd = _results.import_optional("pandas")
+    return pd.Timedelta(length).value // 100
+
+
+def ticks_to_af_time_range(start: int, end: int) -> AF.Time.AFTimeRange:
+    """Convert the UTC .NET ticks of a start and end time to a time range."""
+    return AF.Time.AFTimeRange(ticks_to_af_time(start), ticks_to_af_time(end))
+
+
+def datetimes_to_ticks(times: TimesLike) -> "np.ndarray[Any, np.dtype[np.int64]]":
+    """Convert an array of timestamps to UTC .NET ticks.
+
+    This is the inverse of :func:`ticks_to_index`. Naive timestamps, including
+    `datetime64` arrays, are interpreted in
+    :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+    Naive timestamps that are ambiguous or do not exist at a daylight saving
+    time transition are resolved like naive :class:`datetime.datetime` objects,
+    using the offset before the transition.
+
+    Without pandas only lists of :class:`datetime.datetime` objects can be
+    converted, one at a time.
+    """  # noqa: E501
+    if not _results.available("pandas") and isinstance(times, list | tuple):
+        return np.array([_datetime_to_ticks(time) for time in times], dtype=np.int64)
+    pd = _results.import_optional("pandas")
+    index = pd.DatetimeIndex(times).as_unit("ns")
+    if index.tz is not None:
+        return index.tz_convert("UTC").asi8 // 100 + _EPOCH_TICKS
+    localized = index.tz_localize(
+        PIConfig.DEFAULT_TIMEZONE, ambiguous="NaT", nonexistent="NaT"
+    )
+    nanoseconds = localized.tz_convert("UTC").asi8
+    for position in np.flatnonzero(localized.isna() & ~index.isna()):
+        offset = PIConfig.timezone.utcoffset(index[position].to_pydatetime(warn=False))
+        assert offset is not None
+        nanoseconds[position] = (
+            index.asi8[position] - offset // datetime.timedelta(microseconds=1) * 1000
+        )
+    return nanoseconds // 100 + _EPOCH_TICKS
+
+
+def _datetime_to_ticks(time: datetime.datetime) -> int:
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=PIConfig.timezone)
+    return (time - _EPOCH) // datetime.timedelta(microseconds=1) * 10 + _EPOCH_TICKS
+
+
+@functools.lru_cache(maxsize=256)
+def to_af_time_span(interval: str | None) -> AF.Time.AFTimeSpan:
+    """Convert an interval to a AFTimeSpan value.
+
+    Intervals do not depend on the current time, so the parsed spans are cached
+    for the lifetime of the process.
+
+    Parameters
+    ----------
+        interval (str): Interval to convert to AFTimeSpan.
+
+    Returns
+    -------
+        :afsdk:`AF.Time.AFTimeSpan <M_OSIsoft_AF_Time_AFTimeSpan_Parse_1.htm>`:
+            AFTimeSpan version of the interval.
+    """
+    return AF.Time.AFTimeSpan.Parse(interval)
+
+
+def _is_offset(time: TimeLike) -> bool:
+    """Return whether the time is an offset without a reference, such as `-1d`."""
+    return isinstance(time, str) and time.lstrip().startswith(("+", "-"))
+
+
+class TimeQuery:
+    """Parse times relative to a single reference time, caching the results.
+
+    Relative times, such as `'*-1d'`, are normally resolved against the current
+    time at the moment each request is made, so a loop over many points covers
+    a slightly different time range for each point. A TimeQuery pins `'*'` to
+    a single reference time for a whole batch of requests, and keeps the parsed
+    times and time ranges so every distinct combination is parsed only once.
+
+    All methods of :class:`PIPoint <PIconnect.PIPoint.PIPoint>` and
+    :class:`PIAFAttribute <PIconnect.PIAFAttribute.PIAFAttribute>` that take a
+    time accept a TimeQuery as their `time_query` argument.
+
+    Parameters
+    ----------
+        now (str or datetime, optional): Defaults to None. Reference time for
+            relative times, if None the current time when the query is created
+            is used.
+
+    Example
+    -------
+        >>> query = TimeQuery()
+        >>> data = [point.recorded_values("*-1d", "*", time_query=query) for point in points]
+    """
+
+    def __init__(self, now: TimeLike | None = None) -> None:
+        self.now: AF.Time.AFTime = AF.Time.AFTime.Now if now is None else to_af_time(now)
+        self._times: dict[TimeLike, AF.Time.AFTime] = {}
+        self._time_ranges: dict[tuple[TimeLike, TimeLike], AF.Time.AFTimeRange] = {}
+
+    def time(self, time: TimeLike) -> AF.Time.AFTime:
+        """Return the AFTime of `time`, with relative times resolved against `now`."""
+        _time = self._times.get(time)
+        if _time is None:
+            _time = self._parse(time, self.now)
+            self._times[time] = _time
+        return _time
+
+    def time_range(self, start_time: TimeLike, end_time: TimeLike) -> AF.Time.AFTimeRange:
+        """Return the time range between `start_time` and `end_time`.
+
+        As with :afsdk:`AF.Time.AFTimeRange <M_OSIsoft_AF_Time_AFTimeRange__ctor_1.htm>`,
+        a bare offset such as `'-1d'` for one of the boundaries is resolved
+        relative to the other boundary.
+        """
+        key = (start_time, end_time)
+        time_range = self._time_ranges.get(key)
+        if time_range is None:
+            if _is_offset(start_time):
+                _end_time = self.time(end_time)
+                _start_time = self._parse(start_time, _end_time)
+            else:
+                _start_time = self.time(start_time)
+                if _is_offset(end_time):
+                    _end_time = self._parse(end_time, _start_time)
+                else:
+                    _end_time = self.time(end_time)
+            time_range = AF.Time.AFTimeRange(_start_time, _end_time)
+            self._time_ranges[key] = time_range
+        return time_range
+
+    def time_span(self, interval: str | None) -> AF.Time.AFTimeSpan:
+        """Return the AFTimeSpan of `interval`, see :func:`to_af_time_span`."""
+        return to_af_time_span(interval)
+
+    @staticmethod
+    def _parse(time: TimeLike, relative_time: AF.Time.AFTime) -> AF.Time.AFTime:
+        if isinstance(time, datetime.datetime):
+            return to_af_time(time)
+        return AF.Time.AFTime(time, relative_time)
+
+
+@_profile.timed("conversion")
 def timestamp_to_index(timestamp: System.DateTime) -> datetime.datetime:
     """Convert AFTime object to datetime in local timezone.
 
@@ -65,19 +344,61 @@ def timestamp_to_index(timestamp: System.DateTime) -> datetime.datetime:
 
     Returns
     -------
-        `datetime`: Datetime with the timezone info from :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+        `datetime`: Datetime with the timezone info from :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`,
+            or in UTC if :data:`PIConfig.UTC_NATIVE <PIconnect.config.PIConfigContainer.UTC_NATIVE>` is set.
     """  # noqa: E501
-    local_tz = zoneinfo.ZoneInfo(PIConfig.DEFAULT_TIMEZONE)
-    return (
-        datetime.datetime(
-            timestamp.Year,
-            timestamp.Month,
-            timestamp.Day,
-            timestamp.Hour,
-            timestamp.Minute,
-            timestamp.Second,
-            timestamp.Millisecond * 1000,
-        )
-        .replace(tzinfo=datetime.timezone.utc)
-        .astimezone(local_tz)
+    utc_time = _EPOCH + datetime.timedelta(microseconds=(timestamp.Ticks - _EPOCH_TICKS) // 10)
+    if PIConfig.UTC_NATIVE:
+        return utc_time
+    return utc_time.astimezone(PIConfig.timezone)
+
+
+def timestamps_to_index(timestamps: Iterable[System.DateTime]) -> "pd.DatetimeIndex":
+    """Convert a sequence of .NET timestamps to an index in the local timezone.
+
+    This is the vectorised counterpart of :func:`timestamp_to_index`. Only the
+    `Ticks` of each timestamp are read from .NET, the conversion to the
+    configured timezone is done on the complete array at once. Timestamps that
+    fall outside the range supported by pandas, such as the `AFTime.MaxValue`
+    end time of an event frame that is still in progress, are returned as `NaT`.
+
+    Parameters
+    ----------
+        timestamps (iterable of `System.DateTime`): UTC timestamps in .NET format.
+
+    Returns
+    -------
+        `pandas.DatetimeIndex`: Index with the timezone from :data:`PIConfig.DEFAULT_TIMEZONE <PIconnect.config.PIConfigContainer.DEFAULT_TIMEZONE>`.
+    """  # noqa: E501
+    return ticks_to_index(
+        np.fromiter((timestamp.Ticks for timestamp in timestamps), dtype=np.int64)
     )
+
+
+@_profile.timed("conversion")
+def ticks_to_index(ticks: "np.ndarray[Any, np.dtype[np.int64]]") -> "pd.DatetimeIndex":
+    """Convert an array of UTC .NET ticks to an index in the local timezone.
+
+    If :data:`PIConfig.UTC_NATIVE <PIconnect.config.PIConfigContainer.UTC_NATIVE>`
+    is set the index is returned in UTC, without any timezone conversion.
+    """
+    pd = _results.import_optional("pandas")
+    index = pd.DatetimeIndex(ticks_to_datetime64(ticks), tz="UTC")
+    if PIConfig.UTC_NATIVE:
+        return index
+    return index.tz_convert(PIConfig.DEFAULT_TIMEZONE)
+
+
+@_profile.timed("conversion")
+def ticks_to_datetime64(
+    ticks: "np.ndarray[Any, np.dtype[np.int64]]",
+) -> "np.ndarray[Any, Any]":
+    """Convert an array of .NET ticks to a `datetime64[ns]` array.
+
+    Ticks outside the range supported by pandas are converted to `NaT`. The
+    result carries no timezone, so it is in the same timezone as the ticks.
+    """
+    valid = (ticks >= _MIN_TICKS) & (ticks <= _MAX_TICKS)
+    nanoseconds = (np.where(valid, ticks, _EPOCH_TICKS) - _EPOCH_TICKS) * 100
+    nanoseconds[~valid] = np.iinfo(np.int64).min  # NaT
+    return nanoseconds.view("datetime64[ns]")
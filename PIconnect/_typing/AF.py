@@ -1,8 +1,9 @@
 """Mock classes for the AF namespace of the OSIsoft PI-AF SDK."""
 
+import enum
 from collections.abc import Iterator
 
-from . import PI, Asset, Data, EventFrame, Time, UnitsOfMeasure
+from . import PI, Asset, Data, EventFrame, Time, UnitsOfMeasure, _values
 
 __all__ = [
     "Asset",
@@ -13,6 +14,9 @@ __all__ = [
     "UnitsOfMeasure",
     "AFDatabase",
     "AFCategory",
+    "AFPlugIn",
+    "AFSortField",
+    "AFSortOrder",
     "PISystem",
     "PISystems",
 ]
@@ -22,6 +26,30 @@ class AFCategory:
     """Mock class of the AF.AFCategory class."""
 
 
+class AFPlugIn:
+    """Mock class of the AF.AFPlugIn class."""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+class AFSortField(enum.IntEnum):
+    """Mock class of the AF.AFSortField enumeration."""
+
+    ID = 0
+    Name = 1
+    Type = 2
+    StartTime = 3
+    EndTime = 4
+
+
+class AFSortOrder(enum.IntEnum):
+    """Mock class of the AF.AFSortOrder enumeration."""
+
+    Ascending = 0
+    Descending = 1
+
+
 class AFCategories(list[AFCategory]):
     def __init__(self, elements: list[AFCategory]) -> None:
         self.Count: int
@@ -37,6 +65,22 @@ class AFDatabase:
             [Asset.AFElement("TestElement"), Asset.AFElement("BaseElement")]
         )
         self.Tables = Asset.AFTables([Asset.AFTable("TestTable")])
+        self.ElementTemplates = Asset.AFElementTemplates(
+            [Asset.AFElementTemplate("TestTemplate", list(self.Elements))]
+        )
+        for table in self.Tables._values:
+            table.Database = self
+
+    def Refresh(self) -> None:
+        """Stub for refreshing the database with the changes of other users."""
+        pass
+
+
+class AFConnectionInfo:
+    """Mock class of the AF.AFConnectionInfo class."""
+
+    def __init__(self) -> None:
+        self.IsConnected = False
 
 
 class PISystem:
@@ -54,15 +98,24 @@ class PISystem:
     def __init__(self, name: str) -> None:
         self.Name = name
         self.Databases = PISystem.InternalDatabases()
+        self.ConnectionInfo = AFConnectionInfo()
+        self.RpcMetrics: list[_values.AFRpcMetric] = []
         self._connected = False
 
     def Connect(self) -> None:
         """Stub to connect to the testing system."""
-        self._connected = True
+        self._connected = self.ConnectionInfo.IsConnected = True
 
     def Disconnect(self) -> None:
         """Stub to disconnect from the testing system."""
-        self._connected = False
+        self._connected = self.ConnectionInfo.IsConnected = False
+
+    def GetClientRpcMetrics(self) -> list[_values.AFRpcMetric]:
+        """Stub returning a snapshot of the cumulative RPC metrics of the client."""
+        return [
+            _values.AFRpcMetric(metric.Name, metric.Count, metric.Milliseconds)
+            for metric in self.RpcMetrics
+        ]
 
 
 class PISystems:
@@ -1,20 +1,24 @@
 """Mock classes for the AF module."""
 
 from collections.abc import Iterator
-from typing import cast
+from typing import Any, cast
 
-from . import AF, Data, Generic
+from . import AF, Data, Generic, Time
 from . import UnitsOfMeasure as UOM
 from . import dotnet as System
-from ._values import AFValue, AFValues
+from ._values import AFEnumerationSet, AFEnumerationValue, AFValue, AFValues
 
 __all__ = [
     "AFAttribute",
+    "AFAttributeList",
     "AFAttributes",
     "AFBaseElement",
     "AFElement",
     "AFElements",
     "AFElementTemplate",
+    "AFElementTemplates",
+    "AFEnumerationSet",
+    "AFEnumerationValue",
     "AFTable",
     "AFTables",
     "AFValue",
@@ -35,15 +39,37 @@ class AFAttribute:
         self.Data: Data.AFData
         self.DataReference: AFDataReference
         self.Description: str = f"Description of {name}"
+        self.Element: AFBaseElement | None = None
+        self.DataReferencePlugIn: AF.AFPlugIn | None = None
         self.DefaultUOM = UOM.UOM()
         self.Name = name
         self.Parent = parent
+        self.Type: System.Type | None = System.Type("Int32")
+        self.TypeQualifier: AFEnumerationSet | None = None
+
+    @property
+    def PISystem(self) -> "AF.PISystem":
+        """Stub for the PI System the attribute belongs to."""
+        return AF.PISystem("Testing")
 
     @staticmethod
-    def GetValue() -> AFValue:
+    def GetValue(time: Time.AFTime | None = None, /) -> AFValue:
         """Stub for getting a value."""
         return AFValue(0)
 
+    def GetPath(self) -> str:
+        """Stub for the full path of the attribute, including the path of its element."""
+        root, names = self, [self.Name]
+        while root.Parent is not None:
+            root = root.Parent
+            names.append(root.Name)
+        element, elements = getattr(root, "Element", None), []
+        while element is not None:
+            elements.append(element.Name)
+            element = element.Parent
+        path = "\\".join([f"\\\\{self.PISystem.Name}", *reversed(elements)])
+        return path + "|" + "|".join(reversed(names))
+
 
 class AFAttributes(list[AFAttribute]):
     def __init__(self, elements: list[AFAttribute]) -> None:
@@ -53,6 +79,37 @@ class AFAttributes(list[AFAttribute]):
     def __iter__(self) -> Iterator[AFAttribute]:
         yield from self._values
 
+    def get_Item(self, name: str | int) -> AFAttribute | None:
+        """Stub for the indexer, returns None for unknown names like the SDK."""
+        if isinstance(name, int):
+            return self._values[name]
+        for attribute in self._values:
+            if attribute.Name == name:
+                return attribute
+        return None
+
+
+class AFAttributeList(list[AFAttribute]):
+    """Mock class of the AF.Asset.AFAttributeList class."""
+
+    @property
+    def Data(self) -> Data.AFListData:
+        """Return the bulk data methods for the attributes in the list."""
+        return Data.AFListData(self)
+
+    def Add(self, attribute: AFAttribute) -> None:
+        """Stub for adding an attribute to the list."""
+        self.append(attribute)
+
+    def GetValue(self, time: Time.AFTime | None = None, /) -> AFValues:
+        """Stub for retrieving the values of all attributes in a single call."""
+        values = AFValues()
+        if time is None:
+            values.extend(attribute.GetValue() for attribute in self)
+        else:
+            values.extend(attribute.GetValue(time) for attribute in self)
+        return values
+
 
 class AFBaseElement:
     def __init__(self, name: str, parent: "AFElement | None" = None) -> None:
@@ -62,6 +119,8 @@ class AFBaseElement:
                 AFAttribute("Attribute2"),
             ]
         )
+        for attribute in self.Attributes:
+            attribute.Element = self
         self.Categories: AF.AFCategories
         self.Description: str
         self.Elements: AFElements
@@ -99,6 +158,35 @@ class AFElements(list[AFElement]):
 class AFElementTemplate:
     """Mock class of the AF.Asset.AFElementTemplate class."""
 
+    def __init__(self, name: str, elements: list[AFElement] | None = None) -> None:
+        self.Name = name
+        self._elements = elements or []
+
+    def FindInstantiatedElements(
+        self,
+        include_derived: bool,
+        sort_field: "AF.AFSortField",
+        sort_order: "AF.AFSortOrder",
+        max_count: int,
+        /,
+    ) -> list[AFElement]:
+        """Stub for finding the elements based on the template, sorted by name."""
+        elements = sorted(self._elements, key=lambda element: element.Name)
+        return elements[:max_count]
+
+
+class AFElementTemplates(list[AFElementTemplate]):
+    def __init__(self, elements: list[AFElementTemplate]) -> None:
+        self.Count: int
+        self._values = elements
+
+    def get_Item(self, name: str) -> AFElementTemplate | None:
+        """Stub for the indexer, returns None for unknown names like the SDK."""
+        return next((template for template in self._values if template.Name == name), None)
+
+    def __iter__(self) -> Iterator[AFElementTemplate]:
+        yield from self._values
+
 
 class AFDataReference:
     from . import PI
@@ -114,6 +202,8 @@ class AFDataReference:
 class AFTable:
     def __init__(self, name: str) -> None:
         self.Name = name
+        self.Database: Any = None
+        self.ModifyDate: Time.AFTime
         self.Table: System.Data.DataTable
 
 
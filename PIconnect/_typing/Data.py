@@ -4,10 +4,15 @@ Contains various enumerations and classes for data retrieval.
 """
 
 import enum
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from . import Generic, Time
 from . import UnitsOfMeasure as UOM
-from ._values import AFValue, AFValues
+from ._values import AFListResults, AFValue, AFValues
+
+if TYPE_CHECKING:
+    from . import PI
 
 
 class AFBoundaryType(enum.IntEnum):
@@ -54,8 +59,8 @@ class AFSampleType(enum.IntEnum):
     Interval = 1
 
 
-class AFSummaryTypes(enum.IntEnum):
-    """Mock class of the AF.Data.AFSummaryTypes enumeration."""
+class AFSummaryTypes(enum.IntFlag):
+    """Mock class of the AF.Data.AFSummaryTypes flags enumeration."""
 
     None_ = 0
     Total = 1
@@ -131,6 +136,15 @@ class AFData:
     ) -> AFValues:
         return AFValues()
 
+    @staticmethod
+    def PlotValues(
+        time_range: Time.AFTimeRange,
+        intervals: int,
+        uom: UOM.UOM,
+        /,
+    ) -> AFValues:
+        return AFValues()
+
     @staticmethod
     def RecordedValue(
         time: Time.AFTime,
@@ -180,3 +194,87 @@ class AFData:
         /,
     ) -> None:
         pass
+
+    @staticmethod
+    def UpdateValues(
+        values: AFValues,
+        update_option: AFUpdateOption,
+        buffer_option: AFBufferOption,
+        /,
+    ) -> Any:
+        return None
+
+
+class AFListData:
+    """Mock class of the AF.Data.AFListData class.
+
+    The bulk calls are emulated by calling the corresponding method on the
+    :class:`AFData` object of each attribute in the list.
+    """
+
+    def __init__(self, attributes: Iterable[Any]) -> None:
+        self._attributes = attributes
+
+    def Summary(
+        self,
+        time_range: Time.AFTimeRange,
+        summary_type: AFSummaryTypes,
+        calculation_basis: AFCalculationBasis,
+        time_type: AFTimestampCalculation,
+        paging_config: "PI.PIPagingConfiguration",
+        /,
+    ) -> list[SummaryDict]:
+        return AFListResults(
+            self._attributes,
+            lambda attribute: attribute.Data.Summary(
+                time_range, summary_type, calculation_basis, time_type
+            ),
+            "Attribute",
+        )
+
+    def InterpolatedValues(
+        self,
+        time_range: Time.AFTimeRange,
+        interval: Time.AFTimeSpan,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: "PI.PIPagingConfiguration",
+        /,
+    ) -> list[AFValues]:
+        return AFListResults(
+            self._attributes,
+            lambda attribute: attribute.Data.InterpolatedValues(
+                time_range, interval, None, filter_expression, include_filtered_values
+            ),
+            "Attribute",
+        )
+
+    def PlotValues(
+        self,
+        time_range: Time.AFTimeRange,
+        intervals: int,
+        paging_config: "PI.PIPagingConfiguration",
+        /,
+    ) -> list[AFValues]:
+        return AFListResults(
+            self._attributes,
+            lambda attribute: attribute.Data.PlotValues(time_range, intervals, None),
+            "Attribute",
+        )
+
+    def RecordedValues(
+        self,
+        time_range: Time.AFTimeRange,
+        boundary_type: AFBoundaryType,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: "PI.PIPagingConfiguration",
+        /,
+    ) -> list[AFValues]:
+        return AFListResults(
+            self._attributes,
+            lambda attribute: attribute.Data.RecordedValues(
+                time_range, boundary_type, None, filter_expression, include_filtered_values
+            ),
+            "Attribute",
+        )
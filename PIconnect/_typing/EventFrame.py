@@ -4,6 +4,7 @@ import enum
 from collections.abc import Iterable
 
 from . import AF, Asset, Time
+from . import dotnet as System
 
 
 class AFEventFrameSearchMode(enum.IntEnum):
@@ -22,7 +23,11 @@ class AFEventFrame(Asset.AFBaseElement):
     def __init__(self, name: str, parent: "AFEventFrame | None" = None) -> None:
         self.Name = name
         self.Parent = parent
+        self.AreValuesCaptured = False
+        self.Attributes = Asset.AFAttributes([])
+        self.EndTime: Time.AFTime
         self.EventFrames: AFEventFrames
+        self.StartTime: Time.AFTime
 
     @staticmethod
     def FindEventFrames(
@@ -41,6 +46,13 @@ class AFEventFrame(Asset.AFBaseElement):
     ) -> Iterable["AFEventFrame"]:
         return []
 
+    @staticmethod
+    def LoadEventFrames(
+        event_frames: "System.Collections.Generic.List[AFEventFrame]", /
+    ) -> None:
+        """Stub for fully loading a list of event frames in a single call."""
+        pass
+
 
 class AFEventFrames(list[AFEventFrame]):
     def __init__(self, elements: list[AFEventFrame]) -> None:
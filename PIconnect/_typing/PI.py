@@ -1,12 +1,23 @@
 """Mock classes of the AF.PI namespace of the OSIsoft PI-AF SDK."""
 
 import enum
+import fnmatch
 from collections.abc import Iterable, Iterator
+from typing import Any
 
 from . import Data, Generic, Time, _values
 from . import dotnet as System
 
-__all__ = ["PIPoint", "PIServer", "PIServers"]
+__all__ = [
+    "PICollective",
+    "PICollectiveMember",
+    "PIPageType",
+    "PIPagingConfiguration",
+    "PIPoint",
+    "PIPointList",
+    "PIServer",
+    "PIServers",
+]
 
 
 class PIConnectionInfo:
@@ -14,6 +25,7 @@ class PIConnectionInfo:
 
     def __init__(self) -> None:
         self.OperationTimeOut: System.TimeSpan
+        self.IsConnected = False
 
 
 class PIAuthenticationMode(enum.IntEnum):
@@ -23,12 +35,85 @@ class PIAuthenticationMode(enum.IntEnum):
     PIUserAuthentication = 1
 
 
+class PIPageType(enum.IntEnum):
+    """Mock class of the AF.PI.PIPageType enumeration."""
+
+    TagCount = 0
+    EventCount = 1
+
+
+class PIPagingConfiguration:
+    """Mock class of the AF.PI.PIPagingConfiguration class."""
+
+    def __init__(self, page_type: PIPageType, page_size: int, /) -> None:
+        self.PageType = page_type
+        self.PageSize = page_size
+
+
+class PIStateSets:
+    """Mock class of the AF.PI.PIStateSets collection."""
+
+    def __init__(self, state_sets: list[_values.AFEnumerationSet]) -> None:
+        self._values = state_sets
+
+    def get_Item(self, name: str) -> _values.AFEnumerationSet:
+        """Stub for the indexer by name."""
+        for state_set in self._values:
+            if state_set.Name == name:
+                return state_set
+        raise KeyError(name)
+
+
+class PICollectiveMember:
+    """Mock class of the AF.PI.PICollectiveMember class."""
+
+    def __init__(self, name: str, priority: int, collective_name: str) -> None:
+        self.Name = name
+        self.Priority = priority
+        self._collective_name = collective_name
+
+    def ConnectDirect(self) -> "PIServer":
+        """Stub for connecting directly to this member, bypassing the collective."""
+        server = PIServer(self._collective_name)
+        server.Connect(False)
+        return server
+
+
+class PICollective:
+    """Mock class of the AF.PI.PICollective class.
+
+    The first member is reported as the member the server is connected to.
+    """
+
+    def __init__(self, name: str, members: list[str]) -> None:
+        self.Name = name
+        self.Members = [
+            PICollectiveMember(member, priority, name)
+            for priority, member in enumerate(members, start=1)
+        ]
+        self.CurrentMember: PICollectiveMember | None = (
+            self.Members[0] if self.Members else None
+        )
+
+
 class PIServer:
-    """Mock class of the AF.PI.PIServer class."""
+    """Mock class of the AF.PI.PIServer class.
+
+    Pass the names of `members` to mock a server that is a collective. The
+    points in `_points` are found by :meth:`PIPoint.FindPIPoint` and
+    :meth:`PIPoint.FindPIPoints`, the server has no points by default. The
+    names of the points found by a query and source in `_searches` are
+    returned as is.
+    """
 
-    def __init__(self, name: str) -> None:
+    def __init__(self, name: str, members: list[str] | None = None) -> None:
         self.ConnectionInfo = PIConnectionInfo()
         self.Name = name
+        self.Collective = None if members is None else PICollective(name, members)
+        self.StateSets = PIStateSets([_values.AFEnumerationSet("Modes", ["Off", "On"])])
+        self.RpcMetrics: list[_values.AFRpcMetric] = []
+        self._points: dict[str, PIPoint] = {}
+        self._searches: dict[tuple[str, str | None], list[str]] = {}
         self._connected = False
 
     def Connect(
@@ -37,11 +122,18 @@ class PIServer:
         authentication_mode: PIAuthenticationMode | None = None,
     ) -> None:
         """Stub for connecting to test server."""
-        self._connected = True
+        self._connected = self.ConnectionInfo.IsConnected = True
 
     def Disconnect(self) -> None:
         """Stub for disconnecting from test server."""
-        self._connected = False
+        self._connected = self.ConnectionInfo.IsConnected = False
+
+    def GetClientRpcMetrics(self) -> list[_values.AFRpcMetric]:
+        """Stub returning a snapshot of the cumulative RPC metrics of the client."""
+        return [
+            _values.AFRpcMetric(metric.Name, metric.Count, metric.Milliseconds)
+            for metric in self.RpcMetrics
+        ]
 
 
 class PIServers:
@@ -59,6 +151,8 @@ class PIPoint:
 
     Name: str = "TestPIPoint"
     """This property identifies the name of the PIPoint"""
+    Server: PIServer = PIServer("Testing")
+    """This property identifies the server on which the PIPoint is defined"""
 
     @staticmethod
     def CurrentValue() -> _values.AFValue:
@@ -78,6 +172,17 @@ class PIPoint:
     ) -> Data.SummariesDict:
         return Data.SummariesDict([])
 
+    @staticmethod
+    def FindPIPoint(connection: PIServer, name: str, /) -> "PIPoint":
+        """Stub to mock looking up a single PIPoint by name."""
+        points: dict[str, PIPoint] = getattr(connection, "_points", {})
+        if name in points:
+            return points[name]
+        point = PIPoint()
+        point.Name = name
+        point.Server = connection
+        return point
+
     @staticmethod
     def FindPIPoints(
         connection: PIServer,
@@ -85,8 +190,18 @@ class PIPoint:
         source: str | None,
         attribute_names: Iterable[str] | None,
     ) -> Iterable["PIPoint"]:
-        """Stub to mock querying PIPoints."""
-        return []
+        """Stub to mock querying PIPoints, by a wildcard pattern on the name."""
+        points: dict[str, PIPoint] = getattr(connection, "_points", {})
+        searches: dict[tuple[str, str | None], list[str]] = getattr(
+            connection, "_searches", {}
+        )
+        if (query, source) in searches:
+            return [points[name] for name in searches[query, source]]
+        return [
+            point
+            for name, point in points.items()
+            if fnmatch.fnmatchcase(name.lower(), query.lower())
+        ]
 
     @staticmethod
     def GetAttributes(names: list[str], /) -> Generic.PropertyDict:
@@ -110,6 +225,10 @@ class PIPoint:
     def LoadAttributes(params: list[str], /) -> None:
         pass
 
+    @staticmethod
+    def PlotValues(time_range: Time.AFTimeRange, intervals: int, /) -> _values.AFValues:
+        return _values.AFValues()
+
     @staticmethod
     def RecordedValue(
         time: Time.AFTime, retrieval_mode: Data.AFRetrievalMode, /
@@ -155,3 +274,94 @@ class PIPoint:
         /,
     ) -> None:
         pass
+
+    @staticmethod
+    def UpdateValues(
+        values: list[_values.AFValue],
+        update_mode: Data.AFUpdateOption,
+        buffer_option: Data.AFBufferOption,
+        /,
+    ) -> Any:
+        return None
+
+
+class PIPointList(list[PIPoint]):
+    """Mock class of the AF.PI.PIPointList class.
+
+    The bulk calls are emulated by calling the corresponding method on each
+    point in the list.
+    """
+
+    def Add(self, point: PIPoint) -> None:
+        """Stub for adding a point to the list."""
+        self.append(point)
+
+    def CurrentValue(self) -> list[_values.AFValue]:
+        return _values.AFListResults(self, lambda point: point.CurrentValue(), "PIPoint")
+
+    def InterpolatedValue(self, time: Time.AFTime, /) -> list[_values.AFValue]:
+        return _values.AFListResults(
+            self, lambda point: point.InterpolatedValue(time), "PIPoint"
+        )
+
+    def InterpolatedValues(
+        self,
+        time_range: Time.AFTimeRange,
+        interval: Time.AFTimeSpan,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: PIPagingConfiguration,
+        /,
+    ) -> list[_values.AFValues]:
+        return _values.AFListResults(
+            self,
+            lambda point: point.InterpolatedValues(
+                time_range, interval, filter_expression, include_filtered_values
+            ),
+            "PIPoint",
+        )
+
+    def Summary(
+        self,
+        time_range: Time.AFTimeRange,
+        summary_type: Data.AFSummaryTypes,
+        calculation_basis: Data.AFCalculationBasis,
+        time_type: Data.AFTimestampCalculation,
+        paging_config: PIPagingConfiguration,
+        /,
+    ) -> list[Data.SummaryDict]:
+        return _values.AFListResults(
+            self,
+            lambda point: point.Summary(
+                time_range, summary_type, calculation_basis, time_type
+            ),
+            "PIPoint",
+        )
+
+    def PlotValues(
+        self,
+        time_range: Time.AFTimeRange,
+        intervals: int,
+        paging_config: PIPagingConfiguration,
+        /,
+    ) -> list[_values.AFValues]:
+        return _values.AFListResults(
+            self, lambda point: point.PlotValues(time_range, intervals), "PIPoint"
+        )
+
+    def RecordedValues(
+        self,
+        time_range: Time.AFTimeRange,
+        boundary_type: Data.AFBoundaryType,
+        filter_expression: str,
+        include_filtered_values: bool,
+        paging_config: PIPagingConfiguration,
+        /,
+    ) -> list[_values.AFValues]:
+        return _values.AFListResults(
+            self,
+            lambda point: point.RecordedValues(
+                time_range, boundary_type, filter_expression, include_filtered_values
+            ),
+            "PIPoint",
+        )
@@ -1,22 +1,70 @@
 """Mock classes for the AF.Time module."""
 
+from collections.abc import Callable
+
 from . import dotnet as System
 
+#: Parser of the times given as a string, such as the simulator of
+#: :mod:`PIconnect.PISimulator`. Without a parser these times have no `UtcTime`.
+time_parser: "Callable[[AFTime], System.DateTime] | None" = None
+
+
+def _is_offset(time: str) -> bool:
+    return time.strip().startswith(("+", "-"))
+
 
 class AFTime:
-    """Mock class of the AF.Time.AFTime class."""
+    """Mock class of the AF.Time.AFTime class.
+
+    Times given as a string are kept in `expression`, together with the
+    `relative_time` they are relative to, and are only converted to a
+    `UtcTime` by the :data:`time_parser`, each time it is read.
+    """
+
+    def __init__(
+        self, time: "str | System.DateTime", relative_time: "AFTime | None" = None
+    ) -> None:
+        self.expression = time if isinstance(time, str) else None
+        self.relative_time = relative_time
+        self._utc_time = time if isinstance(time, System.DateTime) else None
 
-    def __init__(self, time: str) -> None:
-        self.UtcTime: System.DateTime
+    @property
+    def UtcTime(self) -> System.DateTime:
+        """Return the time in UTC, parsing the expression if there is a parser."""
+        if self._utc_time is not None:
+            return self._utc_time
+        if time_parser is None:
+            raise AttributeError("Times given as a string are not parsed without a parser")
+        return time_parser(self)
 
-    Now: System.DateTime
+    @UtcTime.setter
+    def UtcTime(self, value: System.DateTime) -> None:
+        self._utc_time = value
+
+    Now: "AFTime"
+
+
+AFTime.Now = AFTime("*")
 
 
 class AFTimeRange:
-    """Mock class of the AF.Time.AFTimeRange class."""
+    """Mock class of the AF.Time.AFTimeRange class.
 
-    def __init__(self, start_time: str, end_time: str):
-        pass
+    As with the SDK, a start or end time that is a bare offset, such as
+    `'-1d'`, is relative to the other end of the range.
+    """
+
+    def __init__(self, start_time: "str | AFTime", end_time: "str | AFTime"):
+        if isinstance(start_time, str) and _is_offset(start_time):
+            self.EndTime = end_time if isinstance(end_time, AFTime) else AFTime(end_time)
+            self.StartTime = AFTime(start_time, self.EndTime)
+            return
+        self.StartTime = start_time if isinstance(start_time, AFTime) else AFTime(start_time)
+        if isinstance(end_time, str):
+            relative_time = self.StartTime if _is_offset(end_time) else None
+            self.EndTime = AFTime(end_time, relative_time)
+        else:
+            self.EndTime = end_time
 
     @staticmethod
     def Parse(start_time: str, end_time: str) -> "AFTimeRange":
@@ -24,12 +72,15 @@ class AFTimeRange:
 
 
 class AFTimeSpan:
-    """Mock class of the AF.Time.AFTimeSpan class."""
+    """Mock class of the AF.Time.AFTimeSpan class, keeping the unparsed `expression`."""
+
+    def __init__(self, expression: str | None = None):
+        self.expression = expression
 
-    def __init__(self):
-        pass
+    def __str__(self) -> str:
+        return self.expression or ""
 
     @staticmethod
     def Parse(interval: str | None, /) -> "AFTimeSpan":
         """Stub for parsing strings that should return a AFTimeSpan."""
-        return AFTimeSpan()
+        return AFTimeSpan(interval)
@@ -1,22 +1,115 @@
-"""Typing for AFValues and AFValue classes.
+"""Typing for AFValues, AFValue and AFEnumeration classes.
 
 These classes are in a separate file to avoid circular imports.
 """
 
+import contextlib
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
-from . import Time
+from . import Generic, Time
 
 _DEFAULT_TIME = Time.AFTime("MinValue")
 
 
 class AFValue:
+    Annotated: bool = False
+    Attribute: Any = None
+    PIPoint: Any = None
+    IsGood: bool = True
+    Questionable: bool = False
+    Substituted: bool = False
+
     def __init__(self, value: Any, timestamp: Time.AFTime = _DEFAULT_TIME) -> None:
         self.Value = value
         self.Timestamp = timestamp
 
 
 class AFValues(list[AFValue]):
+    Attribute: Any = None
+    PIPoint: Any = None
+
     def __init__(self):
         self.Count: int
         self.Value: list[AFValue]
+
+    def Add(self, value: AFValue) -> None:
+        self.append(value)
+
+
+class AFListResults(list[Any]):
+    """Mock class of the AF.AFListResults class, the results of a bulk call.
+
+    The bulk call is emulated by calling `read` on each item of the list. The
+    results are tagged with their item in the `owner` property, like the
+    `PIPoint` and `Attribute` properties of the values returned by the SDK.
+    Items for which `read` raises are left out of the results and reported in
+    `Errors` instead.
+    """
+
+    def __init__(self, items: Iterable[Any], read: Callable[[Any], Any], owner: str) -> None:
+        super().__init__()
+        errors: list[tuple[Any, Exception]] = []
+        for item in items:
+            try:
+                result = read(item)
+            except Exception as exc:
+                errors.append((item, exc))
+                continue
+            values = (
+                [entry.Value for entry in result]
+                if isinstance(result, Generic.Dictionary)
+                else [result]
+            )
+            for value in values:
+                with contextlib.suppress(AttributeError):
+                    setattr(value, owner, item)
+            self.append(result)
+        self.Errors = Generic.Dictionary(errors)
+        self.HasErrors = bool(errors)
+
+
+class AFEnumerationValue:
+    """Mock class of the AF.Asset.AFEnumerationValue class."""
+
+    def __init__(self, name: str, value: int) -> None:
+        self.Name = name
+        self.Value = value
+
+    def __str__(self) -> str:
+        return self.Name
+
+
+class AFEnumerationSet:
+    """Mock class of the AF.Asset.AFEnumerationSet class."""
+
+    def __init__(self, name: str, states: list[str]) -> None:
+        self.ID = f"{{{name}}}"
+        self.Name = name
+        self._values = [AFEnumerationValue(state, code) for code, state in enumerate(states)]
+
+    def __iter__(self) -> Iterator[AFEnumerationValue]:
+        yield from self._values
+
+    def get_Item(self, name: str) -> AFEnumerationValue:
+        """Stub for the indexer by name."""
+        for value in self._values:
+            if value.Name == name:
+                return value
+        raise KeyError(name)
+
+    def GetByValue(self, value: int, /) -> AFEnumerationValue:
+        """Stub for looking up a state by its code."""
+        for state in self._values:
+            if state.Value == value:
+                return state
+        raise KeyError(value)
+
+
+class AFRpcMetric:
+    """Mock class of the AF.Diagnostics.AFRpcMetric class."""
+
+    def __init__(self, name: str, count: int, milliseconds: float) -> None:
+        self.Name = name
+        self.Count = count
+        self.Milliseconds = milliseconds
@@ -0,0 +1,20 @@
+"""Mock classes for the System.Collections.Generic namespace."""
+
+from typing import TypeVar
+
+__all__ = ["List"]
+
+_T = TypeVar("_T")
+
+
+class List(list[_T]):
+    """Mock class of the System.Collections.Generic.List class."""
+
+    def Add(self, item: _T) -> None:
+        """Stub for adding an item to the list."""
+        self.append(item)
+
+    @property
+    def Count(self) -> int:
+        """Return the number of items in the list."""
+        return len(self)
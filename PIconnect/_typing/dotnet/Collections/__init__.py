@@ -0,0 +1,5 @@
+"""Mock classes for the System.Collections namespace."""
+
+from . import Generic
+
+__all__ = ["Generic"]
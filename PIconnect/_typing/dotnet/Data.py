@@ -18,6 +18,11 @@ class DataRow:
     def __getitem__(self, key: str) -> Any:
         return self.__fields[key]
 
+    @property
+    def ItemArray(self) -> list[Any]:
+        """Return the values of all columns of the row in a single call."""
+        return list(self.__fields.values())
+
 
 class DataRowCollection:
     rows: list[DataRow]
@@ -25,10 +30,22 @@ class DataRowCollection:
     def __iter__(self) -> Iterator[DataRow]:
         yield from self.rows
 
+    @property
+    def Count(self) -> int:
+        return len(self.rows)
+
+
+class DataType:
+    """Mock for the System.Type of a column."""
 
-class DataColumn:
     def __init__(self, name: str) -> None:
+        self.Name = name
+
+
+class DataColumn:
+    def __init__(self, name: str, data_type: str = "String") -> None:
         self.ColumnName = name
+        self.DataType = DataType(data_type)
 
 
 class DataColumnCollection:
@@ -40,5 +57,5 @@ class DataColumnCollection:
 
 class DataTable:
     Name: str
-    Rows: list[DataRow]
-    Columns: list[DataColumn]
+    Rows: DataRowCollection
+    Columns: DataColumnCollection
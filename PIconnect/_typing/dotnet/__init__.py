@@ -1,15 +1,20 @@
 """Mock for System.* classes."""
 
-from typing import Protocol
+import enum
 
-from . import Data, Net, Security
+from . import Collections, Data, Net, Security
 
 __all__ = [
+    "Collections",
     "Data",
+    "DBNull",
+    "DateTime",
+    "DateTimeKind",
     "Exception",
     "Net",
     "Security",
     "TimeSpan",
+    "Type",
 ]
 
 
@@ -17,6 +22,19 @@ class Exception:
     pass
 
 
+class DBNull:
+    """Mock for System.DBNull, the value of empty cells in a System.Data.DataTable."""
+
+    Value: "DBNull"
+
+
+class Type:
+    """Mock for System.Type."""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+
 class TimeSpan:
     def __init__(self, /, hours: int, minutes: int, seconds: int) -> None:
         self.Hours = hours
@@ -24,7 +42,15 @@ class TimeSpan:
         self.Seconds = seconds
 
 
-class DateTime(Protocol):
+class DateTimeKind(enum.IntEnum):
+    """Mock for the System.DateTimeKind enumeration."""
+
+    Unspecified = 0
+    Utc = 1
+    Local = 2
+
+
+class DateTime:
     """Mock for System.DateTime."""
 
     Year: int
@@ -34,3 +60,7 @@ class DateTime(Protocol):
     Minute: int
     Second: int
     Millisecond: int
+
+    def __init__(self, ticks: int, kind: DateTimeKind = DateTimeKind.Unspecified) -> None:
+        self.Ticks = ticks
+        self.Kind = kind
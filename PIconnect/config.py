@@ -1,5 +1,11 @@
 """Configuration for PIconnect package."""
 
+import zoneinfo
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIconnect._admission import AdmissionPolicy
+
 
 class PIConfigContainer:
     """Configuration for PIconnect package.
@@ -8,6 +14,33 @@ class PIConfigContainer:
     """
 
     _default_timezone: str = ""
+    _timezone: zoneinfo.ZoneInfo
+
+    #: Return timestamps in UTC, regardless of :attr:`DEFAULT_TIMEZONE`. Conversion to
+    #: the local timezone is then left to the caller, e.g. using
+    #: :meth:`pandas.Series.tz_convert` on the complete result at once.
+    UTC_NATIVE: bool = False
+
+    #: Number of seconds an unused connection is kept open for reuse by a next
+    #: :class:`~PIconnect.PI.PIServer` context, before it is disconnected.
+    CONNECTION_IDLE_TIMEOUT: float = 300.0
+
+    #: Pass all data, search and write calls through the adaptive concurrency limit
+    #: and circuit breaker of their server, see :mod:`PIconnect._admission`.
+    ADMISSION_CONTROL: bool = True
+
+    #: Tuning of the admission control, None uses the defaults of
+    #: :class:`~PIconnect._admission.AdmissionPolicy`.
+    ADMISSION_POLICY: "AdmissionPolicy | None" = None
+
+    #: Chunk size of reads with a `timeout` or `cancel` token but no `chunk_size`, so
+    #: they can be stopped between chunks, see :ref:`cancelling_queries`. None reads
+    #: them in a single call, which cannot be stopped once it is sent.
+    CANCEL_CHUNK_SIZE: str | None = "7d"
+
+    #: Default format of read results: `'pandas'`, `'numpy'`, `'arrow'`,
+    #: `'record_batch'` or `'polars'`, see :ref:`result_formats`.
+    RESULT_FORMAT: str = "pandas"
 
     def __init__(self) -> None:
         self.DEFAULT_TIMEZONE = "UTC"
@@ -19,11 +52,18 @@ class PIConfigContainer:
 
     @DEFAULT_TIMEZONE.setter
     def DEFAULT_TIMEZONE(self, value: str) -> None:
-        import zoneinfo
-
-        if value not in zoneinfo.available_timezones():
-            raise ValueError("{v!r} not found in pytz.all_timezones".format(v=value))
+        try:
+            timezone = zoneinfo.ZoneInfo(value)
+        except (ValueError, OSError, zoneinfo.ZoneInfoNotFoundError):
+            # A key that names a directory of the database, such as 'America', raises OSError
+            raise ValueError("{v!r} not found in pytz.all_timezones".format(v=value)) from None
         self._default_timezone = value
+        self._timezone = timezone
+
+    @property
+    def timezone(self) -> zoneinfo.ZoneInfo:
+        """Timezone object of :attr:`DEFAULT_TIMEZONE`, resolved once when it is set."""
+        return self._timezone
 
 
 PIConfig = PIConfigContainer()
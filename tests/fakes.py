@@ -2,13 +2,14 @@
 
 import dataclasses
 import datetime
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Any, Generic, TypeVar
 
 import pytest
 import pytz
 
 import PIconnect._typing.AF as AF
+import PIconnect._typing.dotnet as System
 import PIconnect.PI as PI
 
 
@@ -22,8 +23,22 @@ class _UTCTime:
     Second: int
     Millisecond: int
 
-
-class FakeAFTime(object):
+    @property
+    def Ticks(self) -> int:
+        """Return the number of 100 ns ticks since 0001-01-01, like System.DateTime."""
+        delta = datetime.datetime(
+            self.Year,
+            self.Month,
+            self.Day,
+            self.Hour,
+            self.Minute,
+            self.Second,
+            self.Millisecond * 1000,
+        ) - datetime.datetime(1, 1, 1)
+        return (delta // datetime.timedelta(microseconds=1)) * 10
+
+
+class FakeAFTime(AF.Time.AFTime):
     """Fake AFTime to mask away SDK complexity."""
 
     def __init__(self, timestamp: datetime.datetime):
@@ -91,6 +106,8 @@ class FakePIPoint(AF.PI.PIPoint, Generic[_a]):
         self.pi_point = pi_point
         self.call_stack = ["%s created" % self.__class__.__name__]
         self.Name = pi_point.Name
+        self.updates: list[AF.Asset.AFValue] = []
+        self.time_ranges: list[AF.Time.AFTimeRange] = []
 
     def CurrentValue(self) -> FakeAFValue[_a]:
         """Return the current value of the PI Point."""
@@ -106,9 +123,12 @@ class FakePIPoint(AF.PI.PIPoint, Generic[_a]):
         self.call_stack.append("GetAttributes called")
         return self.pi_point.attributes
 
-    def RecordedValues(self, *args: Any, **kwargs: Any) -> list[FakeAFValue[_a]]:
+    def RecordedValues(
+        self, time_range: AF.Time.AFTimeRange, *args: Any, **kwargs: Any
+    ) -> list[FakeAFValue[_a]]:
         """Return the recorded values of the PI Point."""
         self.call_stack.append("RecordedValues called")
+        self.time_ranges.append(time_range)
         return self.pi_point.values
 
     def InterpolatedValues(self, *args: Any, **kwargs: Any) -> list[FakeAFValue[_a]]:
@@ -116,6 +136,194 @@ class FakePIPoint(AF.PI.PIPoint, Generic[_a]):
         self.call_stack.append("InterpolatedValues called")
         return self.pi_point.values
 
+    def PlotValues(self, *args: Any, **kwargs: Any) -> list[FakeAFValue[_a]]:
+        """Return the plot values of the PI Point, which are all recorded values."""
+        self.call_stack.append("PlotValues called")
+        return self.pi_point.values
+
+    def InterpolatedValue(self, *args: Any, **kwargs: Any) -> FakeAFValue[_a]:
+        """Return the interpolated value of the PI Point, the first value is used."""
+        self.call_stack.append("InterpolatedValue called")
+        return self.pi_point.values[0]
+
+    def UpdateValue(self, value: AF.Asset.AFValue, *args: Any, **kwargs: Any) -> None:
+        """Record the value written to the PI Point."""
+        self.call_stack.append("UpdateValue called")
+        self.updates.append(value)
+
+    def UpdateValues(self, values: AF.Asset.AFValues, *args: Any, **kwargs: Any) -> None:
+        """Record the values written to the PI Point."""
+        self.call_stack.append("UpdateValues called")
+        self.updates.extend(values)
+
+    def Summary(self, *args: Any, **kwargs: Any) -> list[FakeKeyValue[int, FakeAFValue[_a]]]:
+        """Return the maximum of the PI Point as its summary."""
+        self.call_stack.append("Summary called")
+        maximum = max(self.pi_point.values, key=lambda value: value.Value)  # type: ignore
+        return [FakeKeyValue(int(AF.Data.AFSummaryTypes.Maximum), maximum)]
+
+
+class RangedFakePIPoint(FakePIPoint[_a]):
+    """Fake PI Point that only returns the recorded values within the time range."""
+
+    def RecordedValues(
+        self, time_range: AF.Time.AFTimeRange, *args: Any, **kwargs: Any
+    ) -> list[FakeAFValue[_a]]:
+        """Return the recorded values between the start and end of the time range."""
+        values = super().RecordedValues(time_range, *args, **kwargs)
+        start = time_range.StartTime.UtcTime.Ticks
+        end = time_range.EndTime.UtcTime.Ticks
+        return [value for value in values if start <= value.Timestamp.UtcTime.Ticks <= end]
+
+
+class FakeAFAttribute:
+    """Fake AF Attribute to mask away SDK complexity."""
+
+    def __init__(self, name: str, value: Any, timestamp: datetime.datetime) -> None:
+        self.Name = name
+        self.value = FakeAFValue(value, timestamp)
+        self.call_stack = ["%s created" % self.__class__.__name__]
+
+    def GetValue(self) -> FakeAFValue[Any]:
+        """Return the (captured) value of the attribute."""
+        self.call_stack.append("GetValue called")
+        return self.value
+
+
+class FakeAFData:
+    """Fake AFData of an attribute, returning the same values for all reads."""
+
+    def __init__(self, values: list[FakeAFValue[Any]]) -> None:
+        self.values = values
+
+    def RecordedValues(self, *args: Any, **kwargs: Any) -> list[FakeAFValue[Any]]:
+        """Return the recorded values of the attribute."""
+        return self.values
+
+    def InterpolatedValues(self, *args: Any, **kwargs: Any) -> list[FakeAFValue[Any]]:
+        """Return the interpolated values of the attribute."""
+        return self.values
+
+
+class FakeTimeSeriesAttribute(FakeAFAttribute):
+    """Fake AF Attribute with a data reference, or a static value if `values` is None."""
+
+    def __init__(
+        self, name: str, values: list[Any] | None, timestamps: list[datetime.datetime]
+    ) -> None:
+        super().__init__(name, None, timestamps[-1])
+        self.Data = FakeAFData(
+            [FakeAFValue(v, t) for v, t in zip(values or [], timestamps, strict=False)]
+        )
+        self.DataReferencePlugIn = None if values is None else AF.AFPlugIn("PI Point")
+        self.DefaultUOM = None
+        self.PISystem = AF.PISystem("Testing")
+        self.Type = None
+        self.TypeQualifier = None
+
+
+class FakeAFElement:
+    """Fake AF Element with a collection of attributes."""
+
+    def __init__(self, name: str, attributes: list[FakeAFAttribute]) -> None:
+        self.Name = name
+        self.Attributes = FakeAFAttributes(attributes)
+
+
+class FakeAFAttributes(list[FakeAFAttribute]):
+    """Fake AF Attributes collection to mask away SDK complexity."""
+
+    def get_Item(self, name: str) -> FakeAFAttribute | None:
+        """Return the attribute with the given name, or None if it does not exist."""
+        return next((a for a in self if a.Name == name), None)
+
+
+class FakeAFEventFrame:
+    """Fake AF Event Frame to mask away SDK complexity."""
+
+    def __init__(
+        self,
+        name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        attributes: dict[str, Any],
+        captured: bool = False,
+    ) -> None:
+        self.Name = name
+        self.StartTime = FakeAFTime(start_time)
+        self.EndTime = FakeAFTime(end_time)
+        self.AreValuesCaptured = captured
+        self.Attributes = FakeAFAttributes(
+            FakeAFAttribute(key, value, end_time) for key, value in attributes.items()
+        )
+
+
+@dataclasses.dataclass
+class _FakeDataType:
+    Name: str
+
+
+class FakeDataColumn:
+    """Fake System.Data.DataColumn to mask away SDK complexity."""
+
+    def __init__(self, name: str, data_type: str) -> None:
+        self.ColumnName = name
+        self.DataType = _FakeDataType(data_type)
+
+
+class FakeDataRow:
+    """Fake System.Data.DataRow to mask away SDK complexity."""
+
+    def __init__(self, values: list[Any]) -> None:
+        self.ItemArray = [System.DBNull() if value is None else value for value in values]
+
+
+class FakeDataRows(list[FakeDataRow]):
+    """Fake System.Data.DataRowCollection to mask away SDK complexity."""
+
+    @property
+    def Count(self) -> int:
+        """Return the number of rows."""
+        return len(self)
+
+
+class FakeDataTable:
+    """Fake System.Data.DataTable that counts the number of schema lookups."""
+
+    def __init__(self, columns: dict[str, str], rows: list[list[Any]]) -> None:
+        self._columns = [FakeDataColumn(name, dtype) for name, dtype in columns.items()]
+        self.Rows = FakeDataRows(FakeDataRow(row) for row in rows)
+        self.column_calls = 0
+
+    @property
+    def Columns(self) -> list[FakeDataColumn]:
+        """Return the columns of the table."""
+        self.column_calls += 1
+        return self._columns
+
+
+class FakeAFDatabase:
+    """Fake AF Database that applies the changes of other users when refreshed."""
+
+    def __init__(self) -> None:
+        self.pending: list[Callable[[], None]] = []
+
+    def Refresh(self) -> None:
+        """Apply the pending changes."""
+        for change in self.pending:
+            change()
+        self.pending.clear()
+
+
+class FakeAFTable:
+    """Fake AF Table to mask away SDK complexity."""
+
+    def __init__(self, name: str, table: FakeDataTable) -> None:
+        self.Name = name
+        self.Table = table
+        self.ModifyDate = FakeAFTime(datetime.datetime(2024, 1, 1))
+        self.Database = FakeAFDatabase()
+
 
 class VirtualTestCase(object):
     """Test VirtualPIPoint addition."""
@@ -1,16 +1,45 @@
 """Test communication with the PI System."""
 
 import datetime
+import threading
+import time
+from typing import Any
 
+import numpy as np
+import pandas as pd
 import pytest
 import pytz
 
 import PIconnect as PI
 import PIconnect.PI as PI_
+from PIconnect import PIConsts, PIData, _cancellation, _connections, _results, _time
+from PIconnect._typing import AF
 
-from .fakes import VirtualTestCase, pi_point
+from .fakes import (
+    FakeAFValue,
+    FakeKeyValue,
+    FakePIPoint,
+    FakePIPoint_,
+    VirtualTestCase,
+    pi_point,
+)
 
-__all__ = ["TestServer", "TestSearchPIPoints", "TestPIPoint", "pi_point"]
+__all__ = [
+    "TestServer",
+    "TestSearchPIPoints",
+    "TestPIPoint",
+    "TestTypedValues",
+    "TestDigitalStates",
+    "TestValueStatus",
+    "TestTimeQuery",
+    "TestResultFormats",
+    "TestCancellation",
+    "TestShardedSummaries",
+    "TestWriteValues",
+    "TestTimezones",
+    "TestConnectionPool",
+    "pi_point",
+]
 
 
 class TestServer:
@@ -135,3 +164,563 @@ class TestPIPoint:
         """Test retrieving some interpolated data from the server."""
         data = pi_point.point.interpolated_values("01-07-2017", "02-07-2017", "1h")
         assert list(data.index) == pi_point.timestamps
+
+    def test_plot_values(self, pi_point: VirtualTestCase):
+        """Test retrieving values for plotting from the server."""
+        data = pi_point.point.plot_values("01-07-2017", "02-07-2017", 640)
+        assert list(data.values) == pi_point.values
+        assert list(data.index) == pi_point.timestamps
+
+    def test_plot_values_intervals(self, pi_point: VirtualTestCase):
+        """Test that at least one interval is required for plotting."""
+        with pytest.raises(ValueError, match="intervals"):
+            pi_point.point.plot_values("01-07-2017", "02-07-2017", 0)
+
+
+class TestTypedValues:
+    """Test that returned series are typed after the point type."""
+
+    @staticmethod
+    def _point(
+        point_type: str | None, values: list[object], **extra_attributes: str
+    ) -> PI_.PIPoint:
+        attributes = {"engunits": "m3/h", "descriptor": "Flow", **extra_attributes}
+        if point_type is not None:
+            attributes["pointtype"] = point_type
+        timestamps = [
+            datetime.datetime(2017, 8, 13, hour, tzinfo=datetime.timezone.utc)
+            for hour in range(len(values))
+        ]
+        return PI_.PIPoint(
+            FakePIPoint(FakePIPoint_("TYPED", values, timestamps, attributes))  # type: ignore
+        )
+
+    def test_float(self):
+        """Test that values of float points are returned as float64."""
+        data = self._point("Float32", [1, 2, 3]).recorded_values("*-1d", "*")
+        assert data.dtype == "float64"
+
+    def test_integer(self):
+        """Test that values of integer points are returned as int32."""
+        data = self._point("Int16", [1, 2, 3]).recorded_values("*-1d", "*")
+        assert data.dtype == "int32"
+
+    def test_system_states(self):
+        """Test that system states in numeric series are returned as missing values."""
+        data = self._point("Float64", [1.0, "I/O Timeout", 3.0]).recorded_values("*-1d", "*")
+        assert data.dtype == "float64"
+        assert data.isna().tolist() == [False, True, False]
+
+    @pytest.mark.parametrize(
+        ("value_type", "values", "expected"),
+        [
+            ("Boolean", [True, "I/O Timeout", None, False], [True, None, None, False]),
+            ("Int32", [1, "I/O Timeout", None, 2.7], [1, None, None, None]),
+            ("Int32", [1, 2**40], [1, None]),
+            ("Float64", [1.5, None, 10**400], [1.5, None, None]),
+        ],
+    )
+    def test_bad_values_missing(
+        self, value_type: str, values: list[object], expected: list[object]
+    ):
+        """Test that values numpy would coerce or truncate are returned as missing values."""
+        state = AF.Asset.AFEnumerationValue("I/O Timeout", 246)
+        typed = PIData._typed_values(
+            [state if value == "I/O Timeout" else value for value in values], value_type
+        )
+        assert [
+            None if isinstance(value, float) and np.isnan(value) else value
+            for value in typed.tolist()
+        ] == expected
+
+    def test_digital(self):
+        """Test that values of digital points are returned as categorical."""
+        data = self._point("Digital", ["On", "Off", "On"]).recorded_values("*-1d", "*")
+        assert data.dtype == "category"
+        assert set(data.cat.categories) == {"On", "Off"}
+
+    def test_unknown_type(self):
+        """Test that values of points with an unknown type are returned as objects."""
+        data = self._point(None, ["a", 1]).recorded_values("*-1d", "*")
+        assert data.dtype == object
+
+    def test_metadata(self):
+        """Test that the tag and unit of measurement are kept in the series metadata."""
+        data = self._point("Float32", [1, 2]).recorded_values("*-1d", "*")
+        assert data.tag == "TYPED"
+        assert data.uom == "m3/h"
+        assert data.attrs == {"tag": "TYPED", "uom": "m3/h"}
+
+
+class TestDigitalStates:
+    """Test decoding and writing values of digital points."""
+
+    def _point(self) -> PI_.PIPoint:
+        values = [
+            AF.Asset.AFEnumerationValue("On", 1),
+            AF.Asset.AFEnumerationValue("Off", 0),
+            AF.Asset.AFEnumerationValue("Shutdown", 254),
+            AF.Asset.AFEnumerationValue("On", 1),
+        ]
+        return TestTypedValues._point("Digital", values, digitalset="Modes")  # type: ignore
+
+    def test_state_set(self):
+        """Test that the state set of the point is read from the server."""
+        states = self._point().digital_states
+        assert states is not None
+        assert states.name == "Modes"
+        assert states.names == ["Off", "On"]
+        assert list(states.codes) == [0, 1]
+
+    def test_state_set_cached(self):
+        """Test that the state set is shared between points on the same server."""
+        assert self._point().digital_states is self._point().digital_states
+
+    def test_decode(self):
+        """Test that values are decoded with the state names as categories."""
+        data = self._point().recorded_values("*-1d", "*")
+        assert data.dtype == "category"
+        assert list(data.cat.categories) == ["Off", "On", "Shutdown"]
+        assert list(data) == ["On", "Off", "Shutdown", "On"]
+
+    @pytest.mark.parametrize("value", [1, "On"])
+    def test_write_code_or_name(self, value: int | str):
+        """Test that digital values can be written as state code or name."""
+        point = self._point()
+        point.update_value(value)
+        written = point.pi_point.updates[-1].Value  # type: ignore
+        assert isinstance(written, AF.Asset.AFEnumerationValue)
+        assert written.Name == "On"
+
+
+class TestValueStatus:
+    """Test returning the status of values."""
+
+    def test_status_column(self, pi_point: VirtualTestCase):
+        """Test that the status is returned as a compact column next to the values."""
+        fake_values = pi_point.point.pi_point.pi_point.values  # type: ignore
+        fake_values[1].IsGood = False
+        fake_values[2].Questionable = True
+        fake_values[2].Annotated = True
+        data = pi_point.point.recorded_values("*-1d", "*", include_status=True)
+        assert list(data.columns) == ["value", "status"]
+        assert data["status"].dtype == "uint8"
+        assert list(data["value"]) == pi_point.values
+        assert list(data["status"][:3]) == [
+            PIConsts.ValueStatus.GOOD,
+            PIConsts.ValueStatus.BAD,
+            PIConsts.ValueStatus.QUESTIONABLE | PIConsts.ValueStatus.ANNOTATED,
+        ]
+
+    def test_interpolated_status(self, pi_point: VirtualTestCase):
+        """Test that the status is also available for interpolated values."""
+        data = pi_point.point.interpolated_values("*-1d", "*", "1h", include_status=True)
+        assert (data["status"] == PIConsts.ValueStatus.GOOD).all()
+        assert data.attrs["tag"] == pi_point.tag
+
+    def test_no_status_by_default(self, pi_point: VirtualTestCase):
+        """Test that a plain series is returned without status."""
+        data = pi_point.point.recorded_values("*-1d", "*")
+        assert isinstance(data, PI.PIData.PISeries)
+
+
+class TestTimeQuery:
+    """Test parsing times once for a batch of requests."""
+
+    def test_time_range_cached(self):
+        """Test that a time range is only parsed once per query."""
+        query = PI.TimeQuery()
+        assert query.time_range("*-1d", "*") is query.time_range("*-1d", "*")
+        assert query.time_range("*-1d", "*") is not query.time_range("*-2d", "*")
+
+    def test_shared_reference_time(self):
+        """Test that relative times are resolved against the same reference time."""
+        query = PI.TimeQuery()
+        assert query.time("*") is query.time("*")
+        assert query.time_range("*-1d", "*").EndTime is query.time("*")
+
+    def test_time_span_cached(self):
+        """Test that intervals are only parsed once."""
+        assert _time.to_af_time_span("1h") is _time.to_af_time_span("1h")
+
+    def test_container_methods(self):
+        """Test that all points in a batch receive the same time range."""
+        points = [VirtualTestCase().point for _ in range(3)]
+        query = PI.TimeQuery()
+        for point in points:
+            point.recorded_values("*-1d", "*", time_query=query)
+        time_ranges = [point.pi_point.time_ranges[-1] for point in points]  # type: ignore
+        assert all(time_range is time_ranges[0] for time_range in time_ranges)
+
+
+class TestCancellation:
+    """Test deadlines, cancellation and chunked queries."""
+
+    start = datetime.datetime(2017, 8, 13, tzinfo=pytz.utc)
+    end = datetime.datetime(2017, 8, 15, tzinfo=pytz.utc)
+
+    def test_chunks_without_duplicates(self, pi_point: VirtualTestCase):
+        """Test that each value is returned once when a query is split in chunks."""
+        data = pi_point.point.recorded_values(self.start, self.end, chunk_size="6h")
+        assert list(data.values) == pi_point.values
+        assert data.attrs["partial"] is False
+        assert len(pi_point.point.pi_point.time_ranges) == 8  # type: ignore
+
+    def test_split_aligned(self):
+        """Test that chunks are aligned to whole intervals."""
+        time_range = _time.to_af_time_range(self.start, self.end)
+        chunks = _time.split_time_range(time_range, "5h", "2h")
+        lengths = {end - start for start, end in chunks[:-1]}
+        assert lengths == {4 * 60 * 60 * 10**7}
+        assert chunks[-1][1] == time_range.EndTime.UtcTime.Ticks
+
+    def test_cancelled_returns_partial(self, pi_point: VirtualTestCase):
+        """Test that a cancelled chunked query returns the chunks fetched so far."""
+        cancel = PI.CancellationToken()
+        fetch = pi_point.point._recorded_values
+
+        def cancel_after_first(*args: object) -> object:
+            cancel.cancel()
+            return fetch(*args)  # type: ignore
+
+        pi_point.point._recorded_values = cancel_after_first  # type: ignore
+        data = pi_point.point.recorded_values(
+            self.start, self.end, chunk_size="1d", cancel=cancel
+        )
+        assert data.attrs["partial"] is True
+        assert list(data.values) == pi_point.values[:1]
+
+    def test_timeout_chunks(self, pi_point: VirtualTestCase, monkeypatch: pytest.MonkeyPatch):
+        """Test that a query with a timeout is split in chunks, so it can be stopped."""
+        monkeypatch.setattr(PI.PIConfig, "CANCEL_CHUNK_SIZE", "1d")
+        cancel = PI.CancellationToken()
+        fetch = pi_point.point._recorded_values
+
+        def cancel_after_first(*args: object) -> object:
+            cancel.cancel()
+            return fetch(*args)  # type: ignore
+
+        data = pi_point.point.recorded_values(self.start, self.end, timeout=60)
+        assert list(data.values) == pi_point.values
+        assert data.attrs["partial"] is False
+        assert len(pi_point.point.pi_point.time_ranges) == 2  # type: ignore
+        pi_point.point._recorded_values = cancel_after_first  # type: ignore
+        data = pi_point.point.recorded_values(self.start, self.end, cancel=cancel)
+        assert data.attrs["partial"] is True
+
+    def test_deadline_passed(self, pi_point: VirtualTestCase):
+        """Test that a query is not sent after its deadline."""
+        with pytest.raises(_cancellation.QueryCancelledError):
+            pi_point.point.recorded_values("*-1d", "*", timeout=0)
+        assert pi_point.point.pi_point.time_ranges == []  # type: ignore
+
+    def test_cancelled_search(self):
+        """Test that a search with a cancelled token is not sent."""
+        cancel = PI.CancellationToken()
+        cancel.cancel()
+        with PI.PIServer() as server, pytest.raises(_cancellation.QueryCancelledError):
+            server.search(["L_140_053*", "M_127*"], cancel=cancel)
+
+
+class HourlyMaxima:
+    """Fake summaries that return a maximum at the start of each hour in the time range."""
+
+    hour = 60 * 60 * 10**7
+
+    def __init__(self, edge: bool = False) -> None:
+        self.edge = edge
+        self.threads: set[int] = set()
+        self.time_ranges: list[AF.Time.AFTimeRange] = []
+
+    def __call__(self, time_range: AF.Time.AFTimeRange, *args: Any) -> Any:
+        """Return the summaries of the time range, including the end if `edge` is set."""
+        self.threads.add(threading.get_ident())
+        self.time_ranges.append(time_range)
+        time.sleep(0.01)
+        start, end = time_range.StartTime.UtcTime.Ticks, time_range.EndTime.UtcTime.Ticks
+        epoch = datetime.datetime(1, 1, 1, tzinfo=pytz.utc)
+        values = [
+            FakeAFValue(
+                ticks // self.hour, epoch + datetime.timedelta(microseconds=ticks // 10)
+            )
+            for ticks in range(start, end + self.edge, self.hour)
+        ]
+        return [FakeKeyValue(int(AF.Data.AFSummaryTypes.Maximum), values)]
+
+
+class TestShardedSummaries:
+    """Test evaluating summaries in concurrent chunks."""
+
+    start = datetime.datetime(2017, 8, 13, tzinfo=pytz.utc)
+    end = datetime.datetime(2017, 8, 15, tzinfo=pytz.utc)
+
+    def _summaries(self, point: PI_.PIPoint, **kwargs: Any) -> pd.DataFrame:
+        return point.summaries(
+            self.start, self.end, "1h", PIConsts.SummaryType.MAXIMUM, **kwargs
+        )
+
+    def test_same_as_single_call(self, pi_point: VirtualTestCase):
+        """Test that concurrent chunks return the same summaries as a single call."""
+        single = HourlyMaxima()
+        pi_point.point._summaries = single  # type: ignore
+        expected = self._summaries(pi_point.point)
+        sharded = HourlyMaxima()
+        pi_point.point._summaries = sharded  # type: ignore
+        result = self._summaries(pi_point.point, chunk_size="5h", max_workers=4)
+        assert len(result) == 48
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+        assert len(sharded.time_ranges) == 10
+        assert len(sharded.threads) > 1
+
+    def test_even_shards(self, pi_point: VirtualTestCase):
+        """Test that without a chunk size the range is split in a chunk per worker."""
+        summaries = HourlyMaxima()
+        pi_point.point._summaries = summaries  # type: ignore
+        assert len(self._summaries(pi_point.point, max_workers=4)) == 48
+        assert len(summaries.time_ranges) == 4
+
+    def test_edges_counted_once(self, pi_point: VirtualTestCase):
+        """Test that an interval returned by two adjacent chunks is kept once."""
+        pi_point.point._summaries = HourlyMaxima(edge=True)  # type: ignore
+        result = self._summaries(pi_point.point, max_workers=4)
+        assert result.index.is_unique
+        assert len(result) == 49
+
+
+class TestResultFormats:
+    """Test returning read results in other formats than pandas."""
+
+    def test_numpy(self, pi_point: VirtualTestCase):
+        """Test that the numpy format returns the typed columns."""
+        data = pi_point.point.recorded_values("*-1d", "*", result_format="numpy")
+        assert list(data["value"]) == pi_point.values
+        assert data["timestamp"].dtype == np.dtype("datetime64[ns]")
+        assert data.attrs == {"tag": pi_point.tag, "uom": "m3/h"}
+
+    def test_default_format(self, pi_point: VirtualTestCase, monkeypatch: pytest.MonkeyPatch):
+        """Test that the default format is taken from the configuration."""
+        monkeypatch.setattr(PI.PIConfig, "RESULT_FORMAT", "numpy")
+        data = pi_point.point.summary("*-1d", "*", PIConsts.SummaryType.MAXIMUM)
+        assert list(data["MAXIMUM"]) == [10]
+
+    def test_summaries_with_states(self):
+        """Test that summaries with system states and other timestamps convert to pandas."""
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        hour = datetime.timedelta(hours=1)
+        columns = PI.PIData._summaries_columns(
+            [
+                (1, [FakeAFValue(1.0, start), FakeAFValue("Calc Failed", start + hour)]),
+                (2, [FakeAFValue(2.0, start + 2 * hour)]),
+            ]
+        )
+        frame = _results.convert(columns, "pandas")
+        assert list(frame["TOTAL"]) == [1.0, "Calc Failed", None]
+        assert list(frame["AVERAGE"].isna()) == [True, True, False]
+
+    def test_unknown_format(self, pi_point: VirtualTestCase):
+        """Test that an unknown format is rejected."""
+        with pytest.raises(ValueError, match="Unknown result format"):
+            pi_point.point.recorded_values("*-1d", "*", result_format="csv")  # type: ignore
+
+    def test_arrow(self, pi_point: VirtualTestCase):
+        """Test that the Arrow format keeps the timezone and metadata."""
+        pa = pytest.importorskip("pyarrow")
+        table = pi_point.point.recorded_values("*-1d", "*", result_format="arrow")
+        assert table.schema.field("timestamp").type == pa.timestamp("ns", tz="UTC")
+        assert table.schema.metadata[b"tag"] == pi_point.tag.encode()
+        assert table.column("value").to_pylist() == pi_point.values
+
+    def test_polars(self, pi_point: VirtualTestCase):
+        """Test that the Polars format is created from the Arrow data."""
+        pytest.importorskip("polars")
+        frame = pi_point.point.recorded_values("*-1d", "*", result_format="polars")
+        assert frame["value"].to_list() == pi_point.values
+
+
+class TestWriteValues:
+    """Test converting timestamps to AFTime and writing values."""
+
+    def test_aware_timestamps(self):
+        """Test that timezone aware timestamps are converted via their UTC ticks."""
+        times = pd.date_range("2024-01-01", periods=3, freq="h", tz="Europe/Amsterdam")
+        ticks = [time.UtcTime.Ticks for time in _time.to_af_times(times)]
+        assert _time.ticks_to_index(np.array(ticks)).equals(times.tz_convert("UTC"))
+
+    def test_naive_timestamps(self):
+        """Test that naive timestamps are interpreted in the default timezone."""
+        default_timezone = PI.PIConfig.DEFAULT_TIMEZONE
+        PI.PIConfig.DEFAULT_TIMEZONE = "Europe/Amsterdam"
+        try:
+            ticks = _time.datetimes_to_ticks(np.array(["2024-01-01T01:00"], "datetime64[s]"))
+        finally:
+            PI.PIConfig.DEFAULT_TIMEZONE = default_timezone
+        assert list(ticks) == list(
+            _time.datetimes_to_ticks([datetime.datetime(2024, 1, 1, tzinfo=pytz.utc)])
+        )
+
+    @pytest.mark.parametrize(
+        "time",
+        [datetime.datetime(2024, 10, 27, 2, 30), datetime.datetime(2024, 3, 31, 2, 30)],
+        ids=["ambiguous", "nonexistent"],
+    )
+    def test_daylight_saving_time(
+        self, time: datetime.datetime, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that naive timestamps at a DST transition are converted like datetimes."""
+        monkeypatch.setattr(PI.PIConfig, "DEFAULT_TIMEZONE", "Europe/Amsterdam")
+        times = [time - datetime.timedelta(hours=1), time]
+        ticks = _time.datetimes_to_ticks(np.array(times, dtype="datetime64[ns]"))
+        assert list(ticks) == [_time._datetime_to_ticks(t) for t in times]
+
+    def test_update_values(self, pi_point: VirtualTestCase):
+        """Test that a series of values is written in a single call."""
+        times = pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC")
+        pi_point.point.update_values(pd.Series([1.0, 2.0, 3.0], index=times))
+        fake = pi_point.point.pi_point
+        assert fake.call_stack[-1] == "UpdateValues called"  # type: ignore
+        assert [value.Value for value in fake.updates] == [1.0, 2.0, 3.0]  # type: ignore
+        ticks = [value.Timestamp.UtcTime.Ticks for value in fake.updates]  # type: ignore
+        assert list(ticks) == list(_time.datetimes_to_ticks(times))
+
+
+class TestTimezones:
+    """Test the timezone of the returned timestamps."""
+
+    @pytest.mark.parametrize("timezone", ["Not/A_Timezone", "America"])
+    def test_invalid_timezone(self, timezone: str):
+        """Test that an unknown timezone, or a region without a timezone, is rejected."""
+        with pytest.raises(ValueError, match="not found"):
+            PI.PIConfig.DEFAULT_TIMEZONE = timezone
+        assert PI.PIConfig.DEFAULT_TIMEZONE != timezone
+
+    def test_timezone_resolved_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the timezone object is resolved when the timezone is set."""
+        monkeypatch.setattr(PI.PIConfig, "DEFAULT_TIMEZONE", "Europe/Amsterdam")
+        assert PI.PIConfig.timezone.key == "Europe/Amsterdam"
+        assert PI.PIConfig.timezone is PI.PIConfig.timezone
+
+    def test_local_timezone(self, pi_point: VirtualTestCase, monkeypatch: pytest.MonkeyPatch):
+        """Test that timestamps are returned in the default timezone."""
+        monkeypatch.setattr(PI.PIConfig, "DEFAULT_TIMEZONE", "Europe/Amsterdam")
+        data = pi_point.point.recorded_values("*-1d", "*")
+        assert str(data.index.tz) == "Europe/Amsterdam"
+        assert pi_point.point.last_update.utcoffset() == datetime.timedelta(hours=2)
+
+    def test_utc_native(self, pi_point: VirtualTestCase, monkeypatch: pytest.MonkeyPatch):
+        """Test that timestamps stay in UTC in the UTC native mode."""
+        monkeypatch.setattr(PI.PIConfig, "DEFAULT_TIMEZONE", "Europe/Amsterdam")
+        monkeypatch.setattr(PI.PIConfig, "UTC_NATIVE", True)
+        data = pi_point.point.recorded_values("*-1d", "*")
+        assert str(data.index.tz) == "UTC"
+        assert list(data.index) == pi_point.timestamps
+        assert pi_point.point.last_update.utcoffset() == datetime.timedelta(0)
+
+    def test_summary(self, pi_point: VirtualTestCase):
+        """Test that summaries are returned with a column per summary type."""
+        data = pi_point.point.summary("*-1d", "*", PIConsts.SummaryType.MAXIMUM)
+        assert list(data.columns) == ["MAXIMUM"]
+        assert list(data["MAXIMUM"]) == [max(pi_point.values)]
+        assert str(data.index.tz) == PI.PIConfig.DEFAULT_TIMEZONE
+
+
+class TestConnectionPool:
+    """Test sharing connections between server contexts."""
+
+    @pytest.fixture
+    def connects(self, monkeypatch: pytest.MonkeyPatch) -> list[tuple[object, ...]]:
+        """Record the connection attempts on the default server in a fresh pool."""
+        monkeypatch.setattr(_connections, "pool", _connections.ConnectionPool())
+        server = PI.PIServer().connection
+        server.Disconnect()
+        calls: list[tuple[object, ...]] = []
+        connect = server.Connect
+
+        def record(*args: object) -> None:
+            calls.append(args)
+            connect(*args)  # type: ignore
+
+        monkeypatch.setattr(server, "Connect", record)
+        return calls
+
+    def test_reuse_connection(self, connects: list[tuple[object, ...]]):
+        """Test that consecutive contexts reuse the same connection."""
+        for _ in range(3):
+            with PI.PIServer() as server:
+                assert server.connection.ConnectionInfo.IsConnected
+        assert connects == [(False,)]
+
+    def test_reference_count(self, connects: list[tuple[object, ...]]):
+        """Test that nested contexts are reference counted."""
+        with PI.PIServer() as outer:
+            with PI.PIServer():
+                assert _connections.pool.references(outer._session_key) == 2
+            assert _connections.pool.references(outer._session_key) == 1
+        assert _connections.pool.references(outer._session_key) == 0
+        assert outer.connection.ConnectionInfo.IsConnected
+
+    def test_reconnect_lost_connection(self, connects: list[tuple[object, ...]]):
+        """Test that a lost connection is reconnected, forcing a new attempt."""
+        with PI.PIServer() as server:
+            pass
+        server.connection.ConnectionInfo.IsConnected = False
+        with PI.PIServer():
+            pass
+        assert connects == [(False,), (True,)]
+
+    def test_credentials_separate(self, connects: list[tuple[object, ...]]):
+        """Test that other credentials do not reuse the existing session."""
+        with PI.PIServer():
+            pass
+        with PI.PIServer(username="user", password="secret"):
+            pass
+        assert len(connects) == 2
+
+    def test_close_idle(self, connects: list[tuple[object, ...]]):
+        """Test that idle connections are disconnected when the pool is closed."""
+        with PI.PIServer() as server:
+            pass
+        _connections.pool.close()
+        assert not server.connection.ConnectionInfo.IsConnected
+
+    def test_shared_connection(self, connects: list[tuple[object, ...]]):
+        """Test that a connection shared by other credentials stays open while in use."""
+        with PI.PIServer(username="user", password="secret"):
+            pass
+        with PI.PIServer() as server:
+            _connections.pool.close()
+            assert server.connection.ConnectionInfo.IsConnected
+        _connections.pool.close()
+        assert not server.connection.ConnectionInfo.IsConnected
+
+    def test_credentials_in_use(self, connects: list[tuple[object, ...]]):
+        """Test that a connection in use is not reconnected with other credentials."""
+        with PI.PIServer() as server:
+            with pytest.raises(_connections.ConnectionInUseError):
+                with PI.PIServer(username="user", password="secret"):
+                    pass
+            assert server.connection.ConnectionInfo.IsConnected
+        assert connects == [(False,)]
+        with PI.PIServer(username="user", password="secret"):
+            pass
+        assert len(connects) == 2
+
+    def test_slow_connect(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a slow connect does not block the contexts of other servers."""
+        pool = _connections.ConnectionPool()
+        started, finish = threading.Event(), threading.Event()
+
+        def slow_connect(force: bool) -> None:
+            started.set()
+            finish.wait(5)
+
+        slow = threading.Thread(target=pool.acquire, args=("slow", object(), slow_connect))
+        slow.start()
+        try:
+            assert started.wait(5)
+            pool.acquire("fast", object(), lambda force: None)
+            pool.release("fast")
+            assert pool.references("fast") == 0
+        finally:
+            finish.set()
+            slow.join()
+        assert pool.references("slow") == 1
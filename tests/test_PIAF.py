@@ -1,14 +1,26 @@
 """Test communication with the PI AF system."""
 
+import datetime
 from typing import cast
 
+import pandas as pd
 import pytest
 
 import PIconnect as PI
 import PIconnect.AFSDK as AFSDK
 import PIconnect.PIAF as PIAF
+from PIconnect import PIBulk
 from PIconnect._typing import AF
 
+from .fakes import (
+    FakeAFElement,
+    FakeAFEventFrame,
+    FakeAFTable,
+    FakeAFTime,
+    FakeDataTable,
+    FakeTimeSeriesAttribute,
+)
+
 AFSDK.AF, AFSDK.System, AFSDK.AF_SDK_VERSION = AFSDK.__fallback()
 PI.AF = PIAF.AF = AFSDK.AF
 PI.PIAFDatabase.servers = PIAF._lookup_servers()
@@ -76,3 +88,196 @@ class TestDatabaseSearch:
         with PI.PIAFDatabase() as db:
             attributes = db.search(r"BaseElement|Attribute1|Attribute2")
         assert attributes[0].name == "Attribute2"
+
+
+class TestElementFrames:
+    """Test reading the attributes of elements as a wide frame."""
+
+    @staticmethod
+    def _times(*hours: int) -> list[datetime.datetime]:
+        return [
+            datetime.datetime(2024, 1, 1, hour, tzinfo=datetime.timezone.utc) for hour in hours
+        ]
+
+    def _element(self, name: str, offset: int = 0) -> PIAF.PIAFElement:
+        attributes = [
+            FakeTimeSeriesAttribute("Flow", [1.0 + offset, 2.0 + offset], self._times(0, 2)),
+            FakeTimeSeriesAttribute("Level", [5.0 + offset], self._times(1)),
+            FakeTimeSeriesAttribute("Capacity", None, self._times(0)),
+        ]
+        return PIAF.PIAFElement(FakeAFElement(name, attributes))  # type: ignore
+
+    def test_element_columns(self):
+        """Test that the attributes of an element are columns on the union of timestamps."""
+        data = self._element("Pump1").recorded_values("*-1d", "*", result_format="pandas")
+        assert list(data.columns) == ["Flow", "Level"]
+        assert len(data) == 3
+        assert list(data["Flow"].isna()) == [False, True, False]
+        assert list(data["Level"].isna()) == [True, False, True]
+
+    def test_static_attribute_skipped(self):
+        """Test that attributes without a data reference are not read."""
+        data = self._element("Pump1").recorded_values(
+            "*-1d", "*", attributes=["Capacity", "Flow", "Unknown"], result_format="pandas"
+        )
+        assert list(data.columns) == ["Flow"]
+
+    def test_multiple_elements(self):
+        """Test that the columns of multiple elements are labelled by element and attribute."""
+        elements = [self._element("Pump1"), self._element("Pump2", offset=10)]
+        data = PIBulk.element_interpolated_values(
+            elements, "*-1d", "*", "1h", attributes=["Flow"], result_format="pandas"
+        )
+        assert list(data.columns) == [("Pump1", "Flow"), ("Pump2", "Flow")]
+        assert list(data.columns.names) == ["element", "attribute"]
+        assert list(data[("Pump2", "Flow")]) == [11.0, 12.0]
+
+    def test_numpy_labels(self):
+        """Test that numpy columns are labelled element|attribute."""
+        elements = [self._element("Pump1"), self._element("Pump2")]
+        data = PIBulk.element_recorded_values(elements, "*-1d", "*", result_format="numpy")
+        assert list(data.columns) == [
+            "timestamp",
+            "Pump1|Flow",
+            "Pump1|Level",
+            "Pump2|Flow",
+            "Pump2|Level",
+        ]
+
+    def test_duplicate_element_names(self):
+        """Test that elements with the same name are rejected."""
+        elements = [self._element("Pump1"), self._element("Pump1")]
+        with pytest.raises(ValueError, match="not unique"):
+            PIBulk.element_recorded_values(elements, "*-1d", "*")
+
+    def test_template_elements(self):
+        """Test finding the elements based on a template."""
+        with PI.PIAFDatabase() as db:
+            elements = db.template_elements("TestTemplate")
+            assert [element.name for element in elements] == sorted(db.children)
+            with pytest.raises(KeyError):
+                db.template_elements("UnknownTemplate")
+
+
+class TestEventFramesTable:
+    """Test building a table of event frames and their attribute values."""
+
+    def _frames(self) -> list[PIAF.PIAFEventFrame]:
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        return [
+            PIAF.PIAFEventFrame(
+                FakeAFEventFrame(  # type: ignore
+                    "Batch1",
+                    start,
+                    start + datetime.timedelta(hours=1),
+                    {"Product": "A", "Yield": 0.9},
+                    captured=True,
+                )
+            ),
+            PIAF.PIAFEventFrame(
+                FakeAFEventFrame(  # type: ignore
+                    "Batch2",
+                    start + datetime.timedelta(hours=2),
+                    datetime.datetime(9999, 12, 31, 23, 59, 59),
+                    {"Product": "B"},
+                )
+            ),
+        ]
+
+    def test_columns(self):
+        """Test that the table has the frame columns followed by the attributes."""
+        with PI.PIAFDatabase() as db:
+            table = db.event_frames_table(self._frames())
+        assert list(table.columns) == ["name", "start", "end", "duration", "Product", "Yield"]
+        assert list(table["name"]) == ["Batch1", "Batch2"]
+
+    def test_times(self):
+        """Test that frames in progress have a missing end time and duration."""
+        with PI.PIAFDatabase() as db:
+            table = db.event_frames_table(self._frames())
+        assert table["duration"].iloc[0] == pd.Timedelta(hours=1)
+        assert pd.isna(table["end"].iloc[1])
+        assert pd.isna(table["duration"].iloc[1])
+
+    def test_selected_attribute_values(self):
+        """Test that selected attributes are returned, missing ones as empty values."""
+        with PI.PIAFDatabase() as db:
+            table = db.event_frames_table(
+                {f.name: f for f in self._frames()}, attributes=["Yield"]
+            )
+        assert list(table.columns)[4:] == ["Yield"]
+        assert table["Yield"].iloc[0] == 0.9
+        assert pd.isna(table["Yield"].iloc[1])
+
+
+class TestAFTable:
+    """Test reading PI AF tables."""
+
+    def _table(self) -> tuple[FakeAFTable, PIAF.PIAFTable]:
+        fake = FakeAFTable(
+            "Products",
+            FakeDataTable(
+                {"Code": "String", "Density": "Double", "Batches": "Int32"},
+                [["A", 1.1, 3], ["B", 0.9, None], ["C", 1.0, 7]],
+            ),
+        )
+        return fake, PIAF.PIAFTable(fake)  # type: ignore
+
+    def test_typed_columns(self):
+        """Test that columns are converted using their .NET data type."""
+        _, table = self._table()
+        data = table.data
+        assert table.shape == (3, 3)
+        assert data["Density"].dtype == "float64"
+        assert data["Batches"].dtype == "Int32"
+        assert pd.isna(data["Batches"].iloc[1])
+
+    def test_schema_cached(self):
+        """Test that the schema is only read once from the SDK."""
+        fake, table = self._table()
+        for _ in range(3):
+            assert table.columns == ["Code", "Density", "Batches"]
+            table.data  # noqa: B018
+        assert fake.Table.column_calls == 1
+
+    def test_lookup(self):
+        """Test looking up a row by key."""
+        _, table = self._table()
+        assert table.lookup("Code", "B")["Density"] == 0.9
+        with pytest.raises(KeyError):
+            table.lookup("Code", "D")
+        with pytest.raises(KeyError, match="Column"):
+            table.lookup("Name", "A")
+
+    def test_data_copy(self):
+        """Test that changes to the returned data do not affect the cached table."""
+        _, table = self._table()
+        data = table.data
+        data.loc[1, "Code"] = "D"
+        data.loc[0, "Batches"] = 5
+        data.drop(columns="Density", inplace=True)
+        assert table.columns == list(table.data.columns)
+        assert table.data["Batches"].iloc[0] == 3
+        assert table.lookup("Code", "B")["Density"] == 0.9
+        row = table.lookup("Code", "C")
+        row["Density"] = 2.0
+        assert table.lookup("Code", "C")["Density"] == 1.0
+
+    def test_refresh(self):
+        """Test that the cache is only dropped after the table was modified."""
+        fake, table = self._table()
+        table.data  # noqa: B018
+        assert not table.refresh()
+        fake.ModifyDate = FakeAFTime(datetime.datetime(2024, 1, 2))
+        assert table.refresh()
+        assert table.refresh(force=True)
+
+    def test_refresh_remote_change(self):
+        """Test that changes by other users are detected after refreshing the database."""
+        fake, table = self._table()
+        table.data  # noqa: B018
+        fake.Database.pending.append(
+            lambda: setattr(fake, "ModifyDate", FakeAFTime(datetime.datetime(2024, 1, 2)))
+        )
+        assert table.refresh()
+        assert not fake.Database.pending
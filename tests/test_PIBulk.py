@@ -0,0 +1,149 @@
+"""Test bulk data retrieval for lists of PI Points and PI AF Attributes."""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+import PIconnect as PI
+import PIconnect.PIAF as PIAF
+import PIconnect.PIBulk as PIBulk
+from PIconnect import PIConsts, PISimulator
+from PIconnect._typing import AF
+
+from .fakes import FakeAFEventFrame, VirtualTestCase, pi_point
+
+__all__ = ["TestSnapshot", "TestWindowSummaries", "TestPlotValues", "pi_point"]
+
+
+def _event_frames() -> list[PIAF.PIAFEventFrame]:
+    start = datetime.datetime(2017, 8, 13, tzinfo=datetime.timezone.utc)
+    return [
+        PIAF.PIAFEventFrame(
+            FakeAFEventFrame(  # type: ignore
+                f"Batch{i}",
+                start + datetime.timedelta(days=i),
+                start + datetime.timedelta(days=i, hours=12),
+                {},
+            )
+        )
+        for i in range(3)
+    ]
+
+
+class TestSnapshot:
+    """Test retrieving the values of many points at once."""
+
+    def test_current_values(self, pi_point: VirtualTestCase):
+        """Test that the snapshot contains the current value, timestamp and flags."""
+        result = PIBulk.snapshot([pi_point.point])
+        assert list(result.index) == [pi_point.tag]
+        assert list(result.columns) == ["value", "timestamp", "status"]
+        assert result.loc[pi_point.tag, "value"] == pi_point.values[-1]
+        assert result.loc[pi_point.tag, "timestamp"] == pi_point.timestamps[-1]
+        assert result.loc[pi_point.tag, "status"] == PIConsts.ValueStatus.GOOD
+
+    def test_single_bulk_call(self, pi_point: VirtualTestCase):
+        """Test that the values are requested through the bulk list."""
+        PIBulk.snapshot([pi_point.point])
+        assert pi_point.point.pi_point.call_stack[-1] == "CurrentValue called"  # type: ignore
+
+    def test_interpolated_values(self, pi_point: VirtualTestCase):
+        """Test that passing a time returns interpolated values."""
+        result = PIBulk.snapshot([pi_point.point], time="2017-08-14")
+        assert result.loc[pi_point.tag, "value"] == pi_point.values[0]
+
+    def test_failed_point(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that a point left out of the bulk results is reported, not misaligned."""
+        simulator = PISimulator.Simulator(
+            now=datetime.datetime(2024, 1, 10, tzinfo=datetime.timezone.utc)
+        )
+        simulator.add_tags([PISimulator.TagSpec("Flow"), PISimulator.TagSpec("Level")])
+
+        def fail() -> None:
+            raise PISimulator.PIException("Point was deleted")
+
+        with simulator.install(), PI.PIServer() as server:
+            points = [server.search("Flow")[0], server.search("Level")[0]]
+            monkeypatch.setattr(points[0].pi_point, "CurrentValue", fail)
+            level = points[1].current_value
+            with pytest.warns(UserWarning, match="Flow: Point was deleted"):
+                result = PIBulk.snapshot(points)
+        assert list(result.index) == ["Flow", "Level"]
+        assert pd.isna(result.loc["Flow", "value"])
+        assert pd.isna(result.loc["Flow", "timestamp"])
+        assert result.loc["Flow", "status"] == PIConsts.ValueStatus.BAD
+        assert result.loc["Level", "value"] == level
+
+    def test_same_tag_on_two_servers(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that each server is read with its own bulk list, matching results by server."""
+        cases = [VirtualTestCase(), VirtualTestCase()]
+        for case, server in zip(cases, ["A", "B"], strict=True):
+            case.point.pi_point.Server = AF.PI.PIServer(server)  # type: ignore
+
+        def fail() -> None:
+            raise PISimulator.PIException("Point was deleted")
+
+        monkeypatch.setattr(cases[0].point.pi_point, "CurrentValue", fail)
+        with pytest.warns(UserWarning, match="1 of 2"):
+            result = PIBulk.snapshot([case.point for case in cases])
+        assert pd.isna(result["value"].iloc[0])
+        assert result["value"].iloc[1] == cases[1].values[-1]
+
+
+class TestWindowSummaries:
+    """Test summarising points over a set of windows."""
+
+    def test_tidy_frame(self, pi_point: VirtualTestCase):
+        """Test that one row is returned per window, container and summary."""
+        frames = _event_frames()
+        result = PIBulk.window_summaries(
+            [pi_point.point, pi_point.point], frames, PIConsts.SummaryType.MAXIMUM
+        )
+        assert list(result.columns) == [
+            "window",
+            "start",
+            "end",
+            "name",
+            "summary",
+            "timestamp",
+            "value",
+        ]
+        assert len(result) == 2 * len(frames)
+        assert list(result["window"].unique()) == [f.name for f in frames]
+        assert set(result["summary"]) == {"MAXIMUM"}
+        assert set(result["value"]) == {max(pi_point.values)}
+        assert "status" not in result
+
+    def test_include_status(self, pi_point: VirtualTestCase):
+        """Test that the status of the summary values can be included."""
+        result = PIBulk.window_summaries(
+            [pi_point.point],
+            _event_frames(),
+            PIConsts.SummaryType.MAXIMUM,
+            include_status=True,
+        )
+        assert result["status"].dtype == "uint8"
+
+    def test_window_times(self, pi_point: VirtualTestCase):
+        """Test that the window boundaries are taken from the event frames."""
+        result = PIBulk.window_summaries(
+            [pi_point.point], _event_frames(), PIConsts.SummaryType.MAXIMUM, max_workers=1
+        )
+        assert list(result["end"] - result["start"]) == [datetime.timedelta(hours=12)] * 3
+
+    def test_unsupported_container(self):
+        """Test that only points and attributes are accepted."""
+        with pytest.raises(TypeError, match="Bulk calls only support"):
+            PIBulk.window_summaries([object()], [], PIConsts.SummaryType.MAXIMUM)  # type: ignore
+
+
+class TestPlotValues:
+    """Test retrieving values for plotting for many points at once."""
+
+    def test_tidy_frame(self, pi_point: VirtualTestCase):
+        """Test that the values of all points are returned in a single tidy frame."""
+        result = PIBulk.plot_values([pi_point.point, pi_point.point], "*-1d", "*", 640)
+        assert list(result.columns) == ["name", "timestamp", "value"]
+        assert list(result["value"]) == pi_point.values * 2
+        assert pi_point.point.pi_point.call_stack[-1] == "PlotValues called"  # type: ignore
@@ -0,0 +1,116 @@
+"""Test the export of recorded values to partitioned Parquet files."""
+
+import datetime
+import json
+import pathlib
+
+import pytest
+
+import PIconnect as PI
+from PIconnect import PIExport, PISimulator, _time
+from PIconnect import __main__ as cli
+from PIconnect._typing import Time as _mock_Time
+
+from .fakes import FakePIPoint_, RangedFakePIPoint, VirtualTestCase
+
+__all__ = ["TestExport", "TestCommandLine"]
+
+parquet = pytest.importorskip("pyarrow.parquet")
+
+START = datetime.datetime(2017, 8, 13, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2017, 8, 15, tzinfo=datetime.timezone.utc)
+END_TICKS = _time._datetime_to_ticks(END)
+
+
+def _points(case: VirtualTestCase, *tags: str) -> list[PI.PI.PIPoint]:
+    return [
+        PI.PI.PIPoint(
+            RangedFakePIPoint(
+                FakePIPoint_(
+                    tag=tag,
+                    values=case.values,
+                    timestamps=case.timestamps,
+                    attributes=case.attributes,
+                )
+            )
+        )
+        for tag in tags
+    ]
+
+
+def _rows(path: pathlib.Path) -> int:
+    return sum(parquet.read_table(file).num_rows for file in path.rglob("*.parquet"))
+
+
+class TestExport:
+    """Test exporting recorded values to partitioned Parquet files."""
+
+    def test_partitions(self, tmp_path: pathlib.Path):
+        """Test that each point is written to one file per day, with all values."""
+        points = _points(VirtualTestCase(), "A/1", "B")
+        result = PIExport.export(points, START, END, tmp_path, max_workers=2)
+        assert (result.files, result.rows, result.skipped) == (4, 20, 0)
+        assert (tmp_path / "tag=A%2F1" / "day=2017-08-13" / "data.parquet").exists()
+        assert _rows(tmp_path / "tag=B") == 10
+        table = parquet.read_table(tmp_path / "tag=B" / "day=2017-08-14" / "data.parquet")
+        assert table.column_names == ["timestamp", "value"]
+
+    def test_resume(self, tmp_path: pathlib.Path):
+        """Test that partitions that were exported before are skipped."""
+        case = VirtualTestCase()
+        PIExport.export(_points(case, "A"), START, END, tmp_path, partition="hour")
+        manifest = json.loads((tmp_path / PIExport.MANIFEST).read_text())
+        del manifest["done"]["A/2017-08-14T09"]
+        (tmp_path / PIExport.MANIFEST).write_text(json.dumps(manifest))
+        result = PIExport.export(_points(case, "A"), START, END, tmp_path, partition="hour")
+        assert (result.files, result.skipped) == (1, 47)
+        assert _rows(tmp_path) == 10
+
+    def test_resume_relative(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that an export with relative times resumes with the range of the first run."""
+        now = iter(range(END_TICKS, END_TICKS + 10**12, 10**9))
+        monkeypatch.setattr(
+            _mock_Time, "time_parser", lambda time: PISimulator._parse_time(time, next(now))
+        )
+        case = VirtualTestCase()
+        PIExport.export(_points(case, "A"), "*-2d", "*", tmp_path, partition="hour")
+        manifest = json.loads((tmp_path / PIExport.MANIFEST).read_text())
+        assert manifest["parameters"]["start"] == "*-2d"
+        result = PIExport.export(_points(case, "A"), "*-2d", "*", tmp_path, partition="hour")
+        assert (result.files, result.skipped) == (0, len(manifest["done"]))
+        assert (
+            json.loads((tmp_path / PIExport.MANIFEST).read_text())["range"]
+            == manifest["range"]
+        )
+
+    def test_other_parameters(self, tmp_path: pathlib.Path):
+        """Test that a directory with an export of other points is not overwritten."""
+        case = VirtualTestCase()
+        PIExport.export(_points(case, "A"), START, END, tmp_path)
+        with pytest.raises(ValueError, match="other parameters"):
+            PIExport.export(_points(case, "B"), START, END, tmp_path)
+
+
+class TestCommandLine:
+    """Test the `piconnect export` command."""
+
+    def test_export(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, capsys):
+        """Test that the command exports the points found on the server."""
+        points = _points(VirtualTestCase(), "A", "B")
+        monkeypatch.setattr(PI.PIServer, "search", lambda self, query, source=None: points)
+        code = cli.main(
+            ["export", "--tags", "A", "B", "--start", START.isoformat(), "--end",
+             END.isoformat(), "--output", str(tmp_path)]
+        )  # fmt: skip
+        assert code == 0
+        assert "Wrote 20 values to 4 files" in capsys.readouterr().out
+        assert _rows(tmp_path) == 20
+
+    def test_missing_tag(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that the command fails if a tag does not exist."""
+        points = _points(VirtualTestCase(), "A")
+        monkeypatch.setattr(PI.PIServer, "search", lambda self, query, source=None: points)
+        with pytest.raises(SystemExit):
+            cli.main(
+                ["export", "--tags", "A", "C", "--start", "*-1d", "--output", str(tmp_path)]
+            )
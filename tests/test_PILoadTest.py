@@ -0,0 +1,127 @@
+"""Test load tests with many concurrent clients."""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+import PIconnect as PI
+from PIconnect import PILoadTest, PISimulator, _admission
+
+__all__ = ["TestRun", "TestResult", "simulator"]
+
+NOW = datetime.datetime(2024, 1, 10, tzinfo=datetime.timezone.utc)
+WEIGHTS = {"search": 1, "snapshot": 1, "recorded": 1, "summaries": 1, "write": 1}
+
+
+@pytest.fixture
+def simulator() -> PISimulator.Simulator:
+    """Return a simulator with ten tags, which is installed by the load test."""
+    simulator = PISimulator.Simulator(now=NOW)
+    simulator.add_tags(PISimulator.TagSpec(f"Tag{number}") for number in range(10))
+    return simulator
+
+
+class TestRun:
+    """Test running workloads from concurrent clients."""
+
+    @pytest.mark.parametrize("mode", ["threads", "async"])
+    def test_mixed_workload(self, simulator: PISimulator.Simulator, mode: PILoadTest.Mode):
+        """Test that all operations of the mixed workload are run against the backend."""
+        result = PILoadTest.run(
+            PILoadTest.mixed_workload("Tag*", weights=WEIGHTS),
+            clients=8,
+            requests=200,
+            mode=mode,
+            backend=simulator,
+        )
+        assert result.requests == 200
+        assert result.errors == {}
+        assert set(result.latencies) == {
+            "search",
+            "snapshot",
+            "recorded",
+            "summaries",
+            "write",
+        }
+        assert all(len(latencies) > 0 for latencies in result.latencies.values())
+        assert simulator.calls["UpdateValue"] == len(result.latencies["write"])
+        assert result.peak_memory is not None
+        assert result.peak_memory > 0
+
+    def test_reads_only(self, simulator: PISimulator.Simulator):
+        """Test that the mixed workload only writes if the writes are given a weight."""
+        result = PILoadTest.run(
+            PILoadTest.mixed_workload("Tag*"),
+            requests=50,
+            backend=simulator,
+            trace_memory=False,
+        )
+        assert "write" not in result.latencies
+        assert simulator.calls["UpdateValue"] == 0
+
+    def test_errors(self, simulator: PISimulator.Simulator, monkeypatch: pytest.MonkeyPatch):
+        """Test that failed requests are counted, and do not stop the load test."""
+        monkeypatch.setattr(
+            PI.PIConfig, "ADMISSION_POLICY", _admission.AdmissionPolicy(backoff=0.0)
+        )
+        with simulator.install():
+            with PI.PIServer() as server:
+                points = server.search("Tag*")
+            simulator.failure_rate = 0.5
+
+            def write(rng: random.Random) -> None:
+                rng.choice(points).update_value(1)
+
+            result = PILoadTest.run(
+                [PILoadTest.Operation("write", write)],
+                clients=4,
+                requests=100,
+                trace_memory=False,
+            )
+        assert result.requests == 100
+        assert result.errors["write"] >= simulator.failures > 0
+        assert len(result.latencies["write"]) + result.errors["write"] == 100
+        assert result.peak_memory is None
+
+    def test_duration(self):
+        """Test that a load test with a duration stops after the duration."""
+        operation = PILoadTest.Operation("noop", lambda rng: None)
+        result = PILoadTest.run([operation], clients=2, duration=0.05, trace_memory=False)
+        assert 0.05 <= result.seconds < 1.0
+        assert result.requests > 0
+
+    def test_invalid(self):
+        """Test that a load test needs a number of requests or a duration, and operations."""
+        operation = PILoadTest.Operation("noop", lambda rng: None)
+        with pytest.raises(ValueError, match="requests or the duration"):
+            PILoadTest.run([operation])
+        with pytest.raises(ValueError, match="no operations"):
+            PILoadTest.run([], requests=1)
+        with pytest.raises(ValueError, match="Unknown operations"):
+            PILoadTest.mixed_workload(weights={"delete": 1.0})
+
+
+class TestResult:
+    """Test the report of the throughput and latency percentiles."""
+
+    def test_percentiles(self):
+        """Test the percentiles per operation and combined, in milliseconds."""
+        result = PILoadTest.LoadTestResult(
+            clients=2,
+            seconds=2.0,
+            latencies={
+                "read": np.linspace(0.001, 0.1, 100),
+                "write": np.array([]),
+            },
+            errors={"write": 2},
+        )
+        assert result.requests == 102
+        assert result.throughput == 51.0
+        assert result.percentiles("read")[50] == pytest.approx(50.5)
+        assert np.isnan(result.percentiles("write")[99])
+        table = result.table(result_format="pandas")
+        assert list(table.index) == ["read", "write", "total"]
+        assert table.loc["write", "errors"] == 2
+        assert "102 requests from 2 clients" in result.report()
@@ -0,0 +1,106 @@
+"""Test recording the responses of servers and replaying them offline."""
+
+import datetime
+import pathlib
+
+import pytest
+
+import PIconnect as PI
+import PIconnect.PIBulk as PIBulk
+from PIconnect import PIReplay, PISimulator
+
+__all__ = ["TestRecord", "TestReplay", "recording"]
+
+NOW = datetime.datetime(2024, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+def _workload() -> dict[str, object]:
+    """Read points and attributes of the installed servers."""
+    with PI.PIServer() as server:
+        flow, mode = server.search("Flow")[0], server.search("Mode")[0]
+        results: dict[str, object] = {
+            "recorded": flow.recorded_values("*-1h", "*"),
+            "interpolated": flow.interpolated_values("*-1h", "*", "10m"),
+            "summaries": flow.summaries("*-1d", "*", "6h", PI.PIConsts.SummaryType.MAXIMUM),
+            "digital": mode.interpolated_values("*-1d", "*", "6h"),
+            "current": flow.current_value,
+        }
+    with PI.PIAFDatabase(database="Plant") as database:
+        element = database.descendant("Element_1\\Element_1_2")
+        results["attribute"] = element.attributes["Level"].interpolated_values(
+            "*-1h", "*", "10m"
+        )
+    return results
+
+
+@pytest.fixture
+def recording(tmp_path: pathlib.Path) -> tuple[pathlib.Path, dict[str, object]]:
+    """Record the workload against a simulator, and return the file and the results."""
+    simulator = PISimulator.Simulator(now=NOW)
+    simulator.add_tags(
+        [
+            PISimulator.TagSpec("Flow", interval="10s", amplitude=10.0),
+            PISimulator.TagSpec("Mode", point_type="Digital", period="1h"),
+        ]
+    )
+    simulator.add_database("Plant", levels=(2, 3))
+    path = tmp_path / "workload.json.gz"
+    with simulator.install(), PIReplay.record(path):
+        results = _workload()
+    return path, results
+
+
+class TestRecord:
+    """Test recording the responses to the reads."""
+
+    def test_recorded(self, recording: tuple[pathlib.Path, dict[str, object]]):
+        """Test that the reads, searches and visited elements are recorded."""
+        path, _ = recording
+        replay = PIReplay.Replay(path)
+        assert set(replay.pi_servers["Simulated"]._points) == {"Flow", "Mode"}
+        database = replay.af_servers["Simulated"].Databases.DefaultDatabase
+        assert database is not None
+        assert database.Name == "Plant"
+        assert database.Elements.get_Item("Element_1\\Element_1_2") is not None
+        assert PIReplay.HOOKS["_recorded_values"] == "values"
+
+    def test_nested(self):
+        """Test that only a single recording can be active."""
+        with PIReplay.record(), pytest.raises(RuntimeError):
+            with PIReplay.record():
+                pass
+
+
+class TestReplay:
+    """Test replaying the recorded responses without a server."""
+
+    def test_same_results(self, recording: tuple[pathlib.Path, dict[str, object]]):
+        """Test that the replayed workload returns the recorded results."""
+        path, recorded = recording
+        replay = PIReplay.Replay(path)
+        with replay.install():
+            replayed = _workload()
+        for key, value in recorded.items():
+            if hasattr(value, "equals"):
+                assert value.equals(replayed[key]), key
+            else:
+                assert value == replayed[key], key
+        assert replay.misses == {}
+        assert replay.calls["_interpolated_values"] == 3
+
+    def test_bulk(self, recording: tuple[pathlib.Path, dict[str, object]]):
+        """Test that bulk reads are served by the recorded reads of the points."""
+        path, recorded = recording
+        with PIReplay.Replay(path).install(), PI.PIServer() as server:
+            frame = PIBulk.snapshot(server.search("Flow"))
+        assert list(frame["value"]) == [recorded["current"]]
+
+    def test_miss(self, recording: tuple[pathlib.Path, dict[str, object]]):
+        """Test that a read that was not recorded raises a ReplayError."""
+        path, _ = recording
+        replay = PIReplay.Replay(path, tolerance="1s")
+        with replay.install(), PI.PIServer() as server:
+            point = server.search("Flow")[0]
+            with pytest.raises(PIReplay.ReplayError):
+                point.recorded_values("*-2h", "*")
+        assert replay.misses["_recorded_values"] == 1
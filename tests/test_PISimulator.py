@@ -0,0 +1,148 @@
+"""Test the simulated PI and PI AF servers for offline load tests."""
+
+import datetime
+from collections.abc import Iterator
+
+import pytest
+
+import PIconnect as PI
+import PIconnect.PIBulk as PIBulk
+from PIconnect import PISimulator, _admission
+from PIconnect._typing import AF as _mock_AF
+
+__all__ = ["TestArchive", "TestServer", "TestDatabase", "simulator"]
+
+NOW = datetime.datetime(2024, 1, 10, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def simulator() -> Iterator[PISimulator.Simulator]:
+    """Install a simulator with a fixed current time and two tags."""
+    simulator = PISimulator.Simulator(now=NOW, arc_max_collect=10_000)
+    simulator.add_tags(
+        [
+            PISimulator.TagSpec("Flow", interval="10s", jitter=0.5, amplitude=10.0),
+            PISimulator.TagSpec("Mode", point_type="Digital", period="1h"),
+        ]
+    )
+    simulator.add_database("Plant", levels=(2, 3))
+    with simulator.install():
+        yield simulator
+
+
+class TestArchive:
+    """Test the synthetic archives of the simulated tags."""
+
+    def test_deterministic(self, simulator: PISimulator.Simulator):
+        """Test that reads return the same values, independent of the order of the reads."""
+        with PI.PIServer() as server:
+            point = server.search("Flow")[0]
+            whole = point.recorded_values("*-1h", "*")
+            later = point.recorded_values("*-30m", "*")
+        assert whole.index.is_monotonic_increasing
+        assert len(whole) == pytest.approx(360, abs=1)
+        assert later.equals(whole[whole.index >= later.index[0]])
+        other = PISimulator.Simulator(now=NOW)
+        other.add_tags(
+            [PISimulator.TagSpec("Flow", interval="10s", jitter=0.5, amplitude=10.0)]
+        )
+        with other.install(), PI.PIServer() as server:
+            assert server.search("Flow")[0].recorded_values("*-1h", "*").equals(whole)
+
+    def test_digital(self, simulator: PISimulator.Simulator):
+        """Test that digital tags switch between the states of their digital set."""
+        with PI.PIServer() as server:
+            values = server.search("Mode")[0].interpolated_values("t-1d", "t", "30m")
+        assert list(values.cat.categories) == ["Off", "On"]
+        assert list(values[:4]) == ["On", "Off", "On", "Off"]
+
+    def test_arc_max_collect(self, simulator: PISimulator.Simulator):
+        """Test that large reads fail like the SDK, and succeed when read in chunks."""
+        with PI.PIServer() as server:
+            point = server.search("Flow")[0]
+            with pytest.raises(PISimulator.PIException, match="ArcMaxCollect"):
+                point.recorded_values("*-2d", "*")
+            values = point.recorded_values("*-2d", "*", chunk_size="12h")
+        assert len(values) == pytest.approx(2 * 8640, abs=1)
+        assert values.index.is_unique
+
+    def test_summaries(self, simulator: PISimulator.Simulator):
+        """Test that summaries are evaluated per interval over the events."""
+        with PI.PIServer() as server:
+            summaries = server.search("Flow")[0].summaries(
+                "t-1d",
+                "t",
+                "6h",
+                PI.PIConsts.SummaryType.MAXIMUM | PI.PIConsts.SummaryType.COUNT,
+            )
+        assert list(summaries["COUNT"]) == [2160] * 4
+        assert (summaries["MAXIMUM"] <= 10.1).all()
+
+
+class TestServer:
+    """Test the simulated RPCs, their latency and failures."""
+
+    def test_failures_are_retried(
+        self, simulator: PISimulator.Simulator, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that injected failures are retried by the admission control."""
+        monkeypatch.setattr(
+            PI.PIConfig, "ADMISSION_POLICY", _admission.AdmissionPolicy(backoff=0.0)
+        )
+        with PI.PIServer() as server:
+            point = server.search("Flow")[0]
+            assert point.units_of_measurement == ""
+            simulator.failure_rate = 0.3
+            for _ in range(10):
+                point.recorded_values("*-1h", "*")
+        assert simulator.failures > 0
+        assert simulator.calls["RecordedValues"] == 10 + simulator.failures
+        simulator.failure_rate = 1.0
+        with pytest.raises(PISimulator.PIConnectionException):
+            point.recorded_values("*-1h", "*")
+
+    def test_bulk_calls_per_page(self, simulator: PISimulator.Simulator):
+        """Test that a bulk call is a single RPC, which takes the latency once."""
+        simulator.latency = 0.01
+        with PI.PIServer() as server, server.rpc_metrics() as metrics:
+            points = server.search("*")
+            PIBulk.snapshot(points)
+        assert simulator.calls["PIPointList.CurrentValue"] == 1
+        assert "CurrentValue" not in simulator.calls
+        assert metrics.milliseconds >= 10.0
+
+    def test_install_restores(self):
+        """Test that the servers, time parser and bulk lists are restored after the block."""
+        simulator = PISimulator.Simulator(name="Restored")
+        servers = PI.PIServer.servers
+        point_list = _mock_AF.PI.PIPointList
+        with simulator.install():
+            assert PI.PIServer().server_name == "Restored"
+            assert _mock_AF.Time.AFTime("*").UtcTime.Ticks > 0
+        assert PI.PIServer.servers is servers
+        assert _mock_AF.PI.PIPointList is point_list
+        with pytest.raises(AttributeError):
+            _mock_AF.Time.AFTime("*").UtcTime  # noqa: B018
+
+
+class TestDatabase:
+    """Test the simulated PI AF databases."""
+
+    def test_hierarchy(self, simulator: PISimulator.Simulator):
+        """Test that the elements form a hierarchy, with tags referenced by the leaves."""
+        with PI.PIAFDatabase(database="Plant") as database:
+            assert list(database.children) == ["Element_1", "Element_2"]
+            element = database.descendant("Element_2\\Element_2_3")
+            assert element.parent.name == "Element_2"
+            attribute = database.search("Element_2\\Element_2_3|Level")[0]
+            assert attribute.data_reference.pi_point.name == "Plant.Element_2_3.Level"
+            assert len(attribute.recorded_values("*-1h", "*")) == 60
+
+    def test_element_frames(self, simulator: PISimulator.Simulator):
+        """Test that the attributes of the template elements are read in a bulk call."""
+        with PI.PIAFDatabase() as database:
+            elements = database.template_elements("Asset")
+            frame = PIBulk.element_interpolated_values(elements, "*-1h", "*", "10m")
+        assert [element.name for element in elements][:2] == ["Element_1_1", "Element_1_2"]
+        assert frame.shape == (7, 18)
+        assert simulator.calls["AFListData.InterpolatedValues"] == 1
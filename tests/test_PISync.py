@@ -0,0 +1,123 @@
+"""Test incremental reads of recorded values with persisted high-water marks."""
+
+import datetime
+import pathlib
+from typing import Any
+
+import pytest
+
+import PIconnect
+import PIconnect.PI as PI
+from PIconnect import PISimulator, PISync
+
+from .fakes import FakeAFValue, FakePIPoint_, RangedFakePIPoint, VirtualTestCase
+
+__all__ = ["TestSync"]
+
+START = datetime.datetime(2017, 8, 13, tzinfo=datetime.timezone.utc)
+END = datetime.datetime(2017, 8, 15, tzinfo=datetime.timezone.utc)
+
+
+class Points:
+    """Fake points of which the recorded values can be changed between pulls."""
+
+    def __init__(self, *tags: str) -> None:
+        case = VirtualTestCase()
+        self.timestamps = case.timestamps
+        self.points = [
+            PI.PIPoint(RangedFakePIPoint(FakePIPoint_(tag, case.values, case.timestamps, {})))
+            for tag in tags
+        ]
+
+    def values(self, position: int = 0) -> list[FakeAFValue[Any]]:
+        """Return the archive of a point."""
+        return self.points[position].pi_point.pi_point.values  # type: ignore
+
+    def add(self, value: Any, timestamp: datetime.datetime, position: int = 0) -> None:
+        """Add a value to the archive of a point."""
+        self.values(position).append(FakeAFValue(value, timestamp))
+
+
+@pytest.fixture
+def points() -> Points:
+    """Return two fake points."""
+    return Points("A", "B")
+
+
+@pytest.fixture
+def sync(tmp_path: pathlib.Path) -> PISync.Sync:
+    """Return a sync that starts at the first day of the test values."""
+    return PISync.Sync(tmp_path / "sync.db", lookback="2h", start_time=START)
+
+
+class TestSync:
+    """Test pulling only the new values of points."""
+
+    def test_first_pull(self, points: Points, sync: PISync.Sync):
+        """Test that the first pull returns all values since the start time."""
+        data = sync.pull(points.points, END)
+        assert list(data.columns) == ["name", "timestamp", "value"]
+        assert list(data["name"]) == ["A"] * 10 + ["B"] * 10
+        last = points.timestamps[-1].replace(microsecond=13000)
+        assert sync.marks() == {"A": last, "B": last}
+
+    def test_unchanged(self, points: Points, sync: PISync.Sync):
+        """Test that a pull without changes to the archive returns no values."""
+        sync.pull(points.points, END)
+        assert sync.pull(points.points, END).empty
+
+    def test_delta(self, points: Points, sync: PISync.Sync):
+        """Test that only new, late and edited values are returned."""
+        sync.pull(points.points, END)
+        last = points.timestamps[-1]
+        points.add(11, last + datetime.timedelta(minutes=5))
+        points.add(12, last - datetime.timedelta(hours=1))
+        points.values(1)[-1].Value = 100
+        data = sync.pull(points.points, END)
+        assert sorted(zip(data["name"], data["value"], strict=True)) == [
+            ("A", 11),
+            ("A", 12),
+            ("B", 100),
+        ]
+
+    def test_outside_lookback(self, points: Points, sync: PISync.Sync):
+        """Test that values arriving later than the lookback are not picked up."""
+        sync.pull(points.points, END)
+        points.add(12, points.timestamps[-1] - datetime.timedelta(hours=3))
+        assert sync.pull(points.points, END).empty
+
+    def test_uncommitted(self, points: Points, sync: PISync.Sync):
+        """Test that the values of a pull are returned again until it is committed."""
+        sync.pull(points.points, END)
+        points.add(11, points.timestamps[-1] + datetime.timedelta(minutes=5))
+        assert len(sync.pull(points.points, END, commit=False)) == 1
+        assert len(sync.pull(points.points, END, commit=False)) == 1
+        sync.commit()
+        assert sync.pull(points.points, END).empty
+
+    def test_persisted(self, points: Points, tmp_path: pathlib.Path):
+        """Test that the high-water marks are kept when the database is reopened."""
+        with PISync.Sync(tmp_path / "sync.db", start_time=START) as sync:
+            sync.pull(points.points, END)
+        with PISync.Sync(tmp_path / "sync.db", start_time=START) as sync:
+            assert sync.pull(points.points, END).empty
+            sync.reset(["B"])
+            assert set(sync.pull(points.points, END)["name"]) == {"B"}
+
+    def test_attributes(self, tmp_path: pathlib.Path):
+        """Test that attributes with the same name on other elements have their own mark."""
+        simulator = PISimulator.Simulator(now=END)
+        simulator.add_database("Plant", levels=(1, 2), attributes=("Level",))
+        with simulator.install(), PIconnect.PIAFDatabase(database="Plant") as database:
+            elements = database.template_elements("Asset")
+            attributes = [element.attributes["Level"] for element in elements]
+            with PISync.Sync(tmp_path / "sync.db", start_time="*-1h") as sync:
+                delta = sync.pull(attributes)
+                with pytest.raises(ValueError, match="more than once"):
+                    sync.pull([attributes[0], attributes[0]])
+                marks = sync.marks()
+        assert sorted(marks) == [
+            "\\\\Simulated\\Element_1\\Element_1_1|Level",
+            "\\\\Simulated\\Element_1\\Element_1_2|Level",
+        ]
+        assert set(delta["name"]) == set(marks)
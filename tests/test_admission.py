@@ -0,0 +1,113 @@
+"""Test the adaptive admission control of calls to the servers."""
+
+import pytest
+
+import PIconnect as PI
+from PIconnect import _admission
+
+from .fakes import VirtualTestCase, pi_point
+
+__all__ = ["TestAdmissionController", "TestAdmissionCalls", "pi_point"]
+
+
+class TimeoutException(Exception):
+    """Stand-in for the System.TimeoutException raised by the SDK."""
+
+
+@pytest.fixture
+def policy(monkeypatch: pytest.MonkeyPatch) -> _admission.AdmissionPolicy:
+    """Use a policy without backoff delays and a short reset timeout."""
+    policy = _admission.AdmissionPolicy(
+        initial_limit=2.0, failure_threshold=2, reset_timeout=60.0, backoff=0.0
+    )
+    monkeypatch.setattr(PI.PIConfig, "ADMISSION_POLICY", policy)
+    return policy
+
+
+class TestAdmissionController:
+    """Test the concurrency limit and circuit breaker of a single server."""
+
+    def test_additive_increase(self, policy: _admission.AdmissionPolicy):
+        """Test that the limit grows while calls succeed."""
+        controller = _admission.AdmissionController()
+        controller.call(lambda: None)
+        assert controller.limit == 2.5
+        assert controller.in_flight == 0
+
+    def test_multiplicative_decrease(self, policy: _admission.AdmissionPolicy):
+        """Test that the limit shrinks on transient errors."""
+        controller = _admission.AdmissionController()
+        controller.acquire()
+        controller.release(0.1, TimeoutException())
+        assert controller.limit == 1.0
+
+    def test_retry_transient(self, policy: _admission.AdmissionPolicy):
+        """Test that transient errors are retried."""
+        attempts: list[int] = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise TimeoutException()
+            return "ok"
+
+        assert _admission.AdmissionController().call(flaky) == "ok"
+        assert len(attempts) == 2
+
+    @pytest.mark.parametrize(
+        ("error", "retry"), [(ValueError(), True), (TimeoutException(), False)]
+    )
+    def test_no_retry(self, policy: _admission.AdmissionPolicy, error: Exception, retry: bool):
+        """Test that other errors, and calls that are unsafe to repeat, are not retried."""
+        attempts: list[int] = []
+
+        def failing() -> None:
+            attempts.append(1)
+            raise error
+
+        with pytest.raises(type(error)):
+            _admission.AdmissionController().call(failing, retry=retry)
+        assert len(attempts) == 1
+
+    def test_circuit_breaker(
+        self, policy: _admission.AdmissionPolicy, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that the breaker fails fast and closes after a successful trial call."""
+        controller = _admission.AdmissionController()
+        for _ in range(policy.failure_threshold):
+            controller.acquire()
+            controller.release(0.1, TimeoutException())
+        assert controller.is_open
+        with pytest.raises(_admission.ServerUnavailableError):
+            controller.call(lambda: None)
+
+        opened_at = controller.opened_at
+        assert opened_at is not None
+        monkeypatch.setattr(_admission.time, "monotonic", lambda: opened_at + 61)
+        controller.call(lambda: None)
+        assert not controller.is_open
+
+
+class TestAdmissionCalls:
+    """Test that container calls pass through the controller of their server."""
+
+    def test_container_calls(self, pi_point: VirtualTestCase, monkeypatch: pytest.MonkeyPatch):
+        """Test that reads and writes are admitted per server."""
+        servers: list[object] = []
+        call = _admission.call
+
+        def record(server: object, *args: object, **kwargs: bool) -> object:
+            servers.append(server)
+            return call(server, *args, **kwargs)  # type: ignore
+
+        monkeypatch.setattr(_admission, "call", record)
+        pi_point.point.recorded_values("*-1d", "*")
+        pi_point.point.update_value(1.0)
+        assert servers == [("PI", "Testing")] * 2
+
+    def test_disabled(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that admission control can be switched off."""
+        monkeypatch.setattr(PI.PIConfig, "ADMISSION_CONTROL", False)
+        monkeypatch.setattr(_admission, "_controllers", {})
+        assert _admission.call("server", lambda: 1) == 1
+        assert _admission._controllers == {}
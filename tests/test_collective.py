@@ -0,0 +1,157 @@
+"""Test hedged reads and fan-out across the members of a PI collective."""
+
+import time
+from typing import Any
+
+import pytest
+
+import PIconnect as PI
+import PIconnect.PI as PI_
+from PIconnect import PIBulk, _collective
+from PIconnect._typing import AF
+
+from .fakes import FakePIPoint, FakePIPoint_, VirtualTestCase
+
+__all__ = ["TestCollective", "TestHedgedReads", "TestFanOut"]
+
+
+class SlowFakePIPoint(FakePIPoint[Any]):
+    """Fake PI Point that answers reads after a delay."""
+
+    delay = 0.5
+
+    def RecordedValues(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the recorded values after a delay."""
+        time.sleep(self.delay)
+        return super().RecordedValues(*args, **kwargs)
+
+    def CurrentValue(self) -> Any:
+        """Return the current value after a delay."""
+        time.sleep(self.delay)
+        return super().CurrentValue()
+
+
+class Members:
+    """Fake points of the members of a collective, with different values per member."""
+
+    def __init__(self) -> None:
+        self.server = AF.PI.PIServer("Collective", ["A", "B"])
+        self.case = VirtualTestCase()
+        self.points: dict[str, FakePIPoint[Any]] = {}
+
+    def point(self, cls: type[FakePIPoint[Any]] = FakePIPoint) -> PI_.PIPoint:
+        """Return a PIPoint on the collective."""
+        fake = cls(self._fake_point(0))
+        fake.Server = self.server
+        return PI_.PIPoint(fake)
+
+    def find(self, connection: AF.PI.PIServer, name: str) -> FakePIPoint[Any]:
+        """Return the fake point on a member, with its values offset by 100."""
+        if name not in self.points:
+            self.points[name] = FakePIPoint(self._fake_point(100, name))
+        return self.points[name]
+
+    def _fake_point(self, offset: int, tag: str | None = None) -> FakePIPoint_[int]:
+        return FakePIPoint_(
+            tag=tag or self.case.tag,
+            values=[value + offset for value in self.case.values],
+            timestamps=self.case.timestamps,
+            attributes=self.case.attributes,
+        )
+
+
+@pytest.fixture
+def members(monkeypatch: pytest.MonkeyPatch) -> Members:
+    """Return the fake members, with a clean registry of collectives."""
+    members = Members()
+    monkeypatch.setattr(_collective, "_collectives", {})
+    monkeypatch.setattr(AF.PI.PIPoint, "FindPIPoint", members.find)
+    return members
+
+
+class TestCollective:
+    """Test the members of a collective."""
+
+    def test_members(self, members: Members):
+        """Test that members are ordered by priority, excluding the connected one as backup."""
+        collective = _collective.collective(members.server)
+        assert collective.members == ["A", "B"]
+        assert collective.backups == ["B"]
+
+    def test_not_a_collective(self, members: Members):
+        """Test that a single server has no members to hedge to."""
+        server = PI.PIServer(hedge_percentile=95)
+        assert server.collective.members == []
+        assert server.collective.hedge_delay() is None
+
+    def test_delay_needs_samples(self, members: Members):
+        """Test that reads are only hedged after enough latencies are recorded."""
+        collective = _collective.collective(members.server)
+        collective.hedge_percentile = 50
+        assert collective.hedge_delay() is None
+        for latency in range(_collective.MIN_SAMPLES + 1):
+            collective.record(latency)
+        assert collective.hedge_delay() == _collective.MIN_SAMPLES / 2
+
+
+class TestHedgedReads:
+    """Test re-issuing slow reads to another member."""
+
+    @staticmethod
+    def _hedge(members: Members, latency: float) -> None:
+        collective = _collective.collective(members.server)
+        collective.hedge_percentile = 95
+        for _ in range(_collective.MIN_SAMPLES):
+            collective.record(latency)
+
+    def test_slow_read_hedged(self, members: Members):
+        """Test that the first answer, from the backup member, is used."""
+        self._hedge(members, 0.001)
+        data = members.point(SlowFakePIPoint).recorded_values("*-1d", "*")
+        assert list(data.values) == [value + 100 for value in members.case.values]
+
+    def test_current_value_hedged(self, members: Members):
+        """Test that a slow read of the current value is answered by the backup member."""
+        self._hedge(members, 0.001)
+        assert members.point(SlowFakePIPoint).current_value == members.case.values[-1] + 100
+
+    def test_fast_read_not_hedged(self, members: Members):
+        """Test that a read answered within the delay is not re-issued."""
+        self._hedge(members, 5.0)
+        data = members.point().recorded_values("*-1d", "*")
+        assert list(data.values) == members.case.values
+        assert members.points == {}
+
+    def test_writes_not_hedged(self, members: Members):
+        """Test that writes are sent through the server connection only."""
+        self._hedge(members, 0.0)
+        point = members.point()
+        point.update_value(1.0)
+        assert len(point.pi_point.updates) == 1  # type: ignore
+        assert members.points == {}
+
+
+class TestFanOut:
+    """Test spreading bulk reads over the members."""
+
+    def test_snapshot(self, members: Members):
+        """Test that each member reads its share of the points, in the original order."""
+        _collective.collective(members.server).spread = True
+        points = [members.point() for _ in range(3)]
+        for position, point in enumerate(points):
+            point.pi_point.Name = point.tag = f"point{position}"
+        data = PIBulk.snapshot(points)
+        assert list(data.index) == ["point0", "point1", "point2"]
+        assert sorted(members.points) == ["point0", "point1", "point2"]
+        assert list(data["value"]) == [110, 110, 110]
+
+    def test_other_server_not_spread(self, members: Members):
+        """Test that only the points of the collective are spread over its members."""
+        _collective.collective(members.server).spread = True
+        spread = members.point()
+        spread.pi_point.Name = spread.tag = "spread"
+        other = VirtualTestCase()
+        data = PIBulk.snapshot([spread, other.point])
+        assert list(data.index) == ["spread", other.tag]
+        assert list(members.points) == ["spread"]
+        assert data["value"].iloc[1] == other.values[-1]
@@ -0,0 +1,50 @@
+"""Test profiling the time spent in SDK calls, conversion and result construction."""
+
+import json
+import pathlib
+
+import PIconnect as PI
+import PIconnect.PIBulk as PIBulk
+
+from .fakes import VirtualTestCase, pi_point
+
+__all__ = ["TestProfile", "pi_point"]
+
+
+class TestProfile:
+    """Test the breakdown of a profile."""
+
+    def test_phases(self, pi_point: VirtualTestCase):
+        """Test that SDK calls, conversion and pandas construction are timed separately."""
+        with PI.profile() as profile:
+            pi_point.point.recorded_values("01-01-2017", "01-01-2018", result_format="pandas")
+        timings = {(timing.phase, timing.name): timing for timing in profile.timings}
+        assert timings["sdk", "PIPoint.recorded_values"].calls == 1
+        assert timings["conversion", "_unpack_values"].values == len(pi_point.values)
+        assert timings["result", "to_pandas"].calls == 1
+        assert profile.values == len(pi_point.values)
+        assert profile.wall >= sum(profile.totals().values())
+
+    def test_bulk_call_name(self, pi_point: VirtualTestCase):
+        """Test that bulk calls are named by the bulk list and the SDK method."""
+        with PI.profile() as profile:
+            PIBulk.snapshot([pi_point.point])
+        names = [timing.name for timing in profile.timings if timing.phase == "sdk"]
+        assert names == ["PIPointList.CurrentValue"]
+
+    def test_inactive(self, pi_point: VirtualTestCase):
+        """Test that nothing is recorded outside of the block."""
+        with PI.profile() as profile:
+            pass
+        pi_point.point.recorded_values("01-01-2017", "01-01-2018")
+        assert profile.timings == []
+
+    def test_dump(self, pi_point: VirtualTestCase, tmp_path: pathlib.Path):
+        """Test that the report lists the timings and the dump is machine readable."""
+        with PI.profile() as profile:
+            pi_point.point.recorded_values("01-01-2017", "01-01-2018")
+        assert "PIPoint.recorded_values" in profile.report()
+        profile.dump(tmp_path / "profile.json")
+        dump = json.loads((tmp_path / "profile.json").read_text())
+        assert set(dump["totals"]) == {"sdk", "conversion", "result"}
+        assert dump["values"] == len(pi_point.values)
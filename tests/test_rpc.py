@@ -0,0 +1,61 @@
+"""Test reporting the client RPC metrics of PI and PI AF servers."""
+
+from typing import Any
+
+import PIconnect as PI
+from PIconnect._typing._values import AFRpcMetric
+
+__all__ = ["TestRpcMetrics"]
+
+
+def _call(system: Any, name: str, milliseconds: float) -> None:
+    """Add a call to the cumulative RPC metrics of a mocked server."""
+    for metric in system.RpcMetrics:
+        if metric.Name == name:
+            metric.Count += 1
+            metric.Milliseconds += milliseconds
+            return
+    system.RpcMetrics.append(AFRpcMetric(name, 1, milliseconds))
+
+
+class TestRpcMetrics:
+    """Test the difference of the RPC metrics before and after a block."""
+
+    def test_difference(self):
+        """Test that only the RPCs made within the block are reported, slowest first."""
+        database = PI.PIAFDatabase()
+        database.server.RpcMetrics = [AFRpcMetric("GetElements", 10, 100.0)]
+        with database.rpc_metrics() as metrics:
+            _call(database.server, "GetElements", 5.0)
+            _call(database.server, "GetElements", 5.0)
+            _call(database.server, "FindAttributes", 20.0)
+        assert [(m.name, m.calls, m.milliseconds) for m in metrics.metrics] == [
+            ("FindAttributes", 1, 20.0),
+            ("GetElements", 2, 10.0),
+        ]
+        assert metrics.calls == 3
+        assert "3 RPCs" in metrics.report()
+
+    def test_measure(self):
+        """Test measuring a single call on a PI server."""
+        server = PI.PIServer()
+        server.connection.RpcMetrics = []
+
+        def search() -> int:
+            _call(server.connection, "GetPoints", 4.0)
+            return 42
+
+        metrics = server.rpc_metrics()
+        assert metrics.measure(search) == 42
+        table = metrics.table(result_format="pandas")
+        assert list(table.index) == ["GetPoints"]
+        assert table.loc["GetPoints", "calls"] == 1
+        assert table.attrs["server"] == server.server_name
+
+    def test_no_calls(self):
+        """Test that a block without RPCs reports an empty table."""
+        server = PI.PIServer()
+        with server.rpc_metrics() as metrics:
+            pass
+        assert metrics.metrics == []
+        assert len(metrics.table(result_format="numpy")) == 0